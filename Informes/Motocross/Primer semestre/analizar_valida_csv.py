@@ -9,6 +9,7 @@ import csv
 import os
 import re
 import json
+import sys
 from collections import defaultdict
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -27,25 +28,12 @@ FILES_DIR = os.path.normpath(
 )
 OUTPUT_JSON = os.path.join(SCRIPT_DIR, "datos_informe_valida.json")
 
-# Variantes de nombre de club -> nombre canónico (mismo club, distinta escritura en CSV)
-CLUB_CANONICAL = {
-    "carasucias": "Carasucias",
-    "club motocross de yarumal": "Club Motocross Yarumal",
-    "club motocross yarumal": "Club Motocross Yarumal",
-    "club valle": "Club Valle",
-    "villavicencio racing club": "Villavicencio Racing Club",
-}
-
-
-def normalizar_club(raw):
-    """Unifica nombres de club: variantes conocidas a canónico, resto a formato título."""
-    if not raw:
-        return ""
-    s = " ".join(str(raw).strip().split())
-    key = s.lower()
-    if key in CLUB_CANONICAL:
-        return CLUB_CANONICAL[key]
-    return s.title()
+sys.path.insert(0, os.path.normpath(os.path.join(SCRIPT_DIR, "..", "..", "..", "Resultados_validas")))
+import normalizacion
+
+# Unifica nombres de club: variantes conocidas (normalizacion.CLUB_CANONICAL) a canónico,
+# resto a formato título.
+normalizar_club = normalizacion.club_canonico
 
 
 def parse_filename(filename):
@@ -6,230 +6,42 @@ Ejecutar después de analizar_valida_csv.py para actualizar el informe.
 
 import json
 import os
+import sys
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 JSON_PATH = os.path.join(SCRIPT_DIR, "datos_informe_valida.json")
 OUTPUT_HTML = os.path.join(SCRIPT_DIR, "informe_valida_girardota.html")
+ROOT_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "..", ".."))
+
+sys.path.insert(0, os.path.join(ROOT_DIR, "Resultados_validas"))
+import plantillas
+import recursos_estaticos
+
+ROOT_REL = os.path.relpath(ROOT_DIR, SCRIPT_DIR).replace(os.sep, "/") + "/"
+
+INTRO = (
+    "            <p>A continuación se presentan las estadísticas generadas a partir de los datos recolectados en la <strong>I Válida Nacional de Motocross</strong>, realizada en Girardota, Antioquia, los días <strong>31 de enero y 1.º de febrero</strong>. La información fue consignada por los pilotos en el momento del registro.</p>\n"
+    "            <p>Les recordamos la importancia de mantener los datos actualizados. Si en algún momento desean modificar su información, comuníquense con su liga para realizar el respectivo trámite.</p>\n"
+)
+
 
 def main():
     with open(JSON_PATH, "r", encoding="utf-8") as f:
         datos = json.load(f)
     datos_js = json.dumps(datos, ensure_ascii=False)
 
-    html = """<!DOCTYPE html>
-<html lang="es">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Informe I Válida MX - Girardota, Antioquia | FEDEMOTO</title>
-    <link rel="icon" type="image/png" href="../../../fedemoto-logo.png">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Bebas+Neue&family=Roboto+Condensed:wght@300;400;700&family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { font-family: 'Inter', sans-serif; background: #f5f5f5; color: #000; line-height: 1.6; padding: 20px; padding-top: 120px; min-height: 100vh; }
-        .fixed-header { position: fixed; top: 0; left: 0; right: 0; background: #123E92; color: white; z-index: 1000; box-shadow: 0 4px 10px rgba(0,0,0,0.2); }
-        .header-content { max-width: 1400px; margin: 0 auto; display: flex; align-items: center; justify-content: space-between; padding: 15px 30px; }
-        .logo-container { display: flex; align-items: center; gap: 15px; }
-        .logo-container a { display: flex; align-items: center; gap: 15px; text-decoration: none; color: inherit; }
-        .logo-container img { height: 50px; width: auto; }
-        .logo-container h1 { font-family: 'Bebas Neue', sans-serif; font-size: 1.8em; margin: 0; text-shadow: 2px 2px 4px rgba(0,0,0,0.2); letter-spacing: 1px; }
-        .logo-container a:hover h1 { opacity: 0.9; }
-        .nav-menu { display: flex; gap: 0; list-style: none; margin: 0; padding: 0; }
-        .nav-menu li { margin: 0; position: relative; }
-        .nav-menu > li > a { display: block; padding: 12px 25px; color: white; text-decoration: none; font-family: 'Roboto Condensed', sans-serif; font-weight: 400; font-size: 1.1em; transition: all 0.2s ease; border-radius: 8px; position: relative; cursor: pointer; }
-        .nav-menu > li > a:hover { background: rgba(255,255,255,0.1); transform: translateY(-2px); }
-        .nav-menu > li > a.active { background: #F7C31D; color: #123E92; font-weight: 700; }
-        .dropdown { position: relative; }
-        .dropdown > a::after { content: ' ▼'; font-size: 0.8em; margin-left: 5px; }
-        .nav-menu > .dropdown::before, .dropdown::before { content: ''; position: absolute; top: 100%; left: 0; right: 0; height: 5px; background: transparent; z-index: 1001; }
-        .dropdown-menu .dropdown::before { content: ''; position: absolute; top: 0; left: 100%; width: 10px; height: 100%; background: transparent; z-index: 10004; }
-        .dropdown-menu { display: none; position: absolute; top: calc(100% + 5px); left: 0; background: white; min-width: 200px; width: 220px; box-shadow: 0 8px 16px rgba(0,0,0,0.2); border-radius: 8px; z-index: 10001; list-style: none; padding: 0; margin: 0; overflow: visible; border: 1px solid #d1d5db; }
-        .dropdown-menu .dropdown { position: relative; }
-        .dropdown-menu .dropdown > a { position: relative; padding-right: 35px; }
-        .dropdown-menu .dropdown > a::after { content: ' ▶'; position: absolute; right: 15px; top: 50%; transform: translateY(-50%); font-size: 0.8em; margin: 0; }
-        .dropdown-menu .dropdown .dropdown-menu { display: none !important; position: absolute; left: 100%; top: 0; margin-left: 5px; z-index: 10003; min-width: 180px; background: white; box-shadow: 0 8px 16px rgba(0,0,0,0.2); border-radius: 8px; overflow: visible; border: 1px solid #d1d5db; }
-        .nav-menu > .dropdown:nth-child(3) .dropdown-menu .dropdown .dropdown-menu, .nav-menu > .dropdown:nth-child(4) .dropdown-menu .dropdown .dropdown-menu, .nav-menu > .dropdown:nth-child(5) .dropdown-menu .dropdown .dropdown-menu { left: auto !important; right: 100% !important; margin-left: 0 !important; margin-right: 5px !important; }
-        .dropdown-menu .dropdown:hover > .dropdown-menu { display: block !important; }
-        .nav-menu > .dropdown:hover > .dropdown-menu, .nav-menu > .dropdown.active > .dropdown-menu { display: block; animation: fadeInDown 0.3s ease; }
-        @keyframes fadeInDown { from { opacity: 0; transform: translateY(-10px); } to { opacity: 1; transform: translateY(0); } }
-        .dropdown-menu li { margin: 0; position: relative; }
-        .dropdown-menu a { display: block; padding: 12px 20px; color: #000; text-decoration: none; font-family: 'Inter', sans-serif; font-size: 1em; font-weight: 400; transition: all 0.2s ease; border-bottom: 1px solid #f0f0f0; }
-        .dropdown-menu a:last-child { border-bottom: none; }
-        .dropdown-menu a:hover { background: #f8f9fa; color: #123E92; }
-        .dropdown-menu .dropdown > a:hover { padding-left: 20px; }
-        .dropdown-menu a.active { background: #F7C31D; color: #123E92; font-weight: 600; }
-        .dropdown.active > a { background: rgba(255,255,255,0.15); }
-        .container { max-width: 1400px; margin: 0 auto; background: white; border-radius: 12px; box-shadow: 0 20px 60px rgba(0,0,0,0.15); overflow: hidden; margin-bottom: 40px; }
-        .container > header { background: linear-gradient(135deg, #123E92 0%, #0f3377 100%); color: white; padding: 40px; text-align: center; }
-        .container > header h1 { font-family: 'Bebas Neue', sans-serif; font-size: 2.2em; margin-bottom: 10px; letter-spacing: 2px; }
-        .container > header p { font-family: 'Roboto Condensed', sans-serif; font-size: 1.2em; opacity: 0.95; }
-        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 20px; padding: 30px 40px; background: #f8f9fa; border-bottom: 1px solid #e0e0e0; }
-        .stat-card { background: white; padding: 24px; border-radius: 8px; box-shadow: 0 4px 12px rgba(0,0,0,0.08); text-align: center; transition: transform 0.2s ease, box-shadow 0.2s ease; }
-        .stat-card:hover { transform: translateY(-4px); box-shadow: 0 8px 24px rgba(18, 62, 146, 0.2); }
-        .stat-card .number { font-family: 'Bebas Neue', sans-serif; font-size: 2.5em; color: #123E92; margin-bottom: 8px; letter-spacing: 2px; }
-        .stat-card .label { font-family: 'Roboto Condensed', sans-serif; font-size: 0.95em; color: #374151; text-transform: uppercase; letter-spacing: 0.5px; }
-        .section { padding: 35px 40px; border-bottom: 1px solid #e0e0e0; }
-        .section:last-child { border-bottom: none; }
-        .section h2 { font-family: 'Bebas Neue', sans-serif; font-size: 1.8em; color: #123E92; margin-bottom: 22px; padding-bottom: 12px; border-bottom: 3px solid #F7C31D; letter-spacing: 1px; }
-        .data-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr)); gap: 14px; }
-        .data-item { background: #f8f9fa; padding: 14px 18px; border-radius: 8px; border-left: 4px solid #123E92; display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap; gap: 8px; }
-        .data-item .name { font-weight: 600; color: #111; }
-        .data-item .value { font-family: 'Bebas Neue', sans-serif; font-size: 1.4em; color: #123E92; letter-spacing: 1px; }
-        .section.suggested .data-item { border-left-color: #F7C31D; }
-        .section.suggested .data-item .value { color: #0f3377; }
-        .chart-columns { display: flex; flex-direction: column; gap: 12px; }
-        .chart-row { display: flex; align-items: center; gap: 12px; min-height: 36px; }
-        .chart-row .label { flex: 0 0 220px; font-size: 0.95em; font-weight: 500; color: #111; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
-        .chart-row .bar-wrap { flex: 1 1 200px; height: 28px; background: #e5e7eb; border-radius: 6px; overflow: hidden; min-width: 0; }
-        .chart-row .bar { height: 100%; background: linear-gradient(90deg, #123E92 0%, #1a52b8 100%); border-radius: 6px; transition: width 0.4s ease; min-width: 4px; }
-        .chart-row .value { flex: 0 0 42px; font-family: 'Bebas Neue', sans-serif; font-size: 1.2em; color: #123E92; text-align: right; letter-spacing: 1px; }
-        .intro-message { padding: 28px 40px; background: #f0f4fc; border-left: 5px solid #123E92; border-radius: 0 8px 8px 0; font-size: 1em; line-height: 1.75; color: #1f2937; margin-bottom: 8px; }
-        .intro-message p { margin-bottom: 14px; }
-        .intro-message p:last-child { margin-bottom: 0; }
-        .footer-informe { background: #f8f9fa; padding: 24px 40px; text-align: center; color: #666; font-size: 0.9em; border-top: 1px solid #e0e0e0; }
-        .footer-informe .developer { font-family: 'Roboto Condensed', sans-serif; font-weight: 700; color: #123E92; }
-        @media (max-width: 1024px) {
-            body { padding: 12px; padding-top: 105px; }
-            .header-content { padding: 10px 14px; gap: 10px; }
-            .nav-menu > li > a { padding: 10px 14px; font-size: 1em; }
-            .container > header { padding: 28px 20px; }
-            .stats-grid { grid-template-columns: repeat(2, minmax(0, 1fr)); padding: 20px; gap: 12px; }
-            .section { padding: 24px 20px; }
-            .intro-message { padding: 20px; margin: 0 10px 8px; }
-        }
-        @media (max-width: 768px) {
-            body { padding: 8px; padding-top: 96px; }
-            .header-content { align-items: flex-start; flex-direction: column; }
-            .logo-container img { height: 42px; }
-            .nav-menu { width: 100%; overflow-x: auto; white-space: nowrap; padding-bottom: 4px; }
-            .nav-menu > li > a { padding: 9px 12px; font-size: 0.95em; }
-            .dropdown-menu { min-width: 180px; width: 190px; }
-            .container > header h1 { font-size: 1.7em; letter-spacing: 1px; }
-            .container > header p { font-size: 1em; }
-            .stats-grid { grid-template-columns: 1fr; }
-            .stat-card { padding: 16px; }
-            .stat-card .number { font-size: 2em; }
-            .section h2 { font-size: 1.5em; margin-bottom: 14px; }
-            .chart-row { align-items: flex-start; flex-direction: column; gap: 6px; }
-            .chart-row .label { flex: 0 0 auto; width: 100%; white-space: normal; }
-            .chart-row .bar-wrap { width: 100%; }
-            .chart-row .value { flex: 0 0 auto; width: 100%; text-align: left; }
-        }
-        @media (max-width: 480px) {
-            .container > header { padding: 22px 14px; }
-            .intro-message { padding: 14px; margin: 0 6px 8px; font-size: 0.92em; }
-            .section { padding: 18px 14px; }
-            .footer-informe { padding: 18px 14px; }
-        }
-    </style>
-</head>
-<body>
-    <div id="menu-container"></div>
-    <div class="container">
-        <header>
-            <h1>Informe I Válida Nacional de Motocross</h1>
-            <p>Girardota, Antioquia — Estadísticas de la válida</p>
-        </header>
-        <div class="stats-grid" id="statsGrid"></div>
-        <div class="intro-message">
-            <p>A continuación se presentan las estadísticas generadas a partir de los datos recolectados en la <strong>I Válida Nacional de Motocross</strong>, realizada en Girardota, Antioquia, los días <strong>31 de enero y 1.º de febrero</strong>. La información fue consignada por los pilotos en el momento del registro.</p>
-            <p>Les recordamos la importancia de mantener los datos actualizados. Si en algún momento desean modificar su información, comuníquense con su liga para realizar el respectivo trámite.</p>
-        </div>
-        <div class="section suggested">
-            <h2>Destacados</h2>
-            <div class="data-grid" id="destacados"></div>
-        </div>
-        <div class="section">
-            <h2>Pilotos únicos por liga</h2>
-            <div class="chart-columns" id="porLiga"></div>
-        </div>
-        <div class="section">
-            <h2>Participaciones por categoría</h2>
-            <div class="chart-columns" id="porCategoria"></div>
-        </div>
-        <div class="section">
-            <h2>Inscripciones por marca</h2>
-            <div class="chart-columns" id="porMarca"></div>
-        </div>
-        <div class="section">
-            <h2>Pilotos únicos por club</h2>
-            <div class="chart-columns" id="porClub"></div>
-        </div>
-        <div class="footer-informe">
-            <p><span class="developer">Developed by Mauricio Sánchez Aguilar - Fedemoto</span></p>
-            <p>Este proyecto es de uso interno de FEDEMOTO.</p>
-        </div>
-    </div>
-    <script src="../../../load-menu.js"></script>
-    <script>
-        (function() {
-            var datos = """ + datos_js + """;
-            var stats = [
-                { num: datos.participaciones_totales, label: 'Participaciones totales' },
-                { num: datos.pilotos_unicos, label: 'Pilotos participantes' },
-                { num: Object.keys(datos.pilotos_por_liga).length, label: 'Ligas' },
-                { num: Object.keys(datos.pilotos_por_club).length, label: 'Clubes' },
-                { num: Object.keys(datos.inscripciones_por_marca).length, label: 'Marcas' }
-            ];
-            var grid = document.getElementById('statsGrid');
-            stats.forEach(function(s) {
-                var card = document.createElement('div');
-                card.className = 'stat-card';
-                card.innerHTML = '<div class="number">' + s.num + '</div><div class="label">' + s.label + '</div>';
-                grid.appendChild(card);
-            });
-            function escapeHtml(t) { return (t+'').replace(/&/g,'&amp;').replace(/</g,'&lt;').replace(/>/g,'&gt;').replace(/"/g,'&quot;'); }
-            function fillChart(id, obj) {
-                var el = document.getElementById(id);
-                var entries = Object.keys(obj).map(function(k) { return [k, obj[k]]; }).sort(function(a, b) { return b[1] - a[1]; });
-                var maxVal = entries.length ? Math.max.apply(null, entries.map(function(e) { return e[1]; })) : 1;
-                entries.forEach(function(e) {
-                    var row = document.createElement('div');
-                    row.className = 'chart-row';
-                    var pct = maxVal > 0 ? (e[1] / maxVal * 100) : 0;
-                    row.innerHTML = '<span class="label" title="' + escapeHtml(e[0]) + '">' + escapeHtml(e[0]) + '</span><div class="bar-wrap"><div class="bar" style="width:' + pct + '%"></div></div><span class="value">' + e[1] + '</span>';
-                    el.appendChild(row);
-                });
-            }
-            var cat = datos.participaciones_por_categoria;
-            function keysWithMax(obj) {
-                var keys = Object.keys(obj);
-                if (!keys.length) return [];
-                var maxVal = Math.max.apply(null, keys.map(function(k) { return obj[k]; }));
-                return keys.filter(function(k) { return obj[k] === maxVal; });
-            }
-            var catMaxList = keysWithMax(cat);
-            var liga = datos.pilotos_por_liga;
-            var ligaMaxList = keysWithMax(liga);
-            var marca = datos.inscripciones_por_marca;
-            var marcaMaxList = keysWithMax(marca);
-            var club = datos.pilotos_por_club;
-            var clubMaxList = keysWithMax(club);
-            var destacados = [
-                'Categoría más concurrida: ' + catMaxList.join(', ') + ' (' + (cat[catMaxList[0]] || 0) + ' participantes)',
-                'Liga con más pilotos: ' + ligaMaxList.join(', ') + ' (' + (liga[ligaMaxList[0]] || 0) + ' pilotos únicos)',
-                'Marca líder: ' + marcaMaxList.join(', ') + ' (' + (marca[marcaMaxList[0]] || 0) + ' inscripciones)',
-                'Club con más pilotos: ' + clubMaxList.join(', ') + ' (' + (club[clubMaxList[0]] || 0) + ' pilotos)',
-                'Promedio participantes por categoría: ' + (datos.participaciones_totales / Object.keys(cat).length).toFixed(1)
-            ];
-            var destEl = document.getElementById('destacados');
-            destacados.forEach(function(t) {
-                var item = document.createElement('div');
-                item.className = 'data-item';
-                item.innerHTML = '<span class="name">' + escapeHtml(t) + '</span>';
-                destEl.appendChild(item);
-            });
-            fillChart('porLiga', datos.pilotos_por_liga);
-            fillChart('porCategoria', datos.participaciones_por_categoria);
-            fillChart('porMarca', datos.inscripciones_por_marca);
-            fillChart('porClub', datos.pilotos_por_club);
-        })();
-    </script>
-</body>
-</html>
-"""
+    html = plantillas.render(
+        "informe_valida.html",
+        title="Informe I Válida MX - Girardota, Antioquia | FEDEMOTO",
+        root=ROOT_REL,
+        estilos=recursos_estaticos.estilos_head(("fuentes_sitio.html", "informe_destacados.css"), ROOT_REL),
+        heading="Informe I Válida Nacional de Motocross",
+        subtitle="Girardota, Antioquia — Estadísticas de la válida",
+        intro=INTRO,
+        secciones_extra=plantillas.bloque("informe_seccion_destacados.html"),
+        datos_js=datos_js,
+        script=recursos_estaticos.url("informe.js", ROOT_REL),
+    )
     with open(OUTPUT_HTML, "w", encoding="utf-8") as f:
         f.write(html)
     print("Informe generado:", OUTPUT_HTML)
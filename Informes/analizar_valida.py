@@ -5,207 +5,188 @@ Asegura el manejo correcto de caracteres UTF-8 (acentos, ñ, etc.)
 """
 
 import pandas as pd
-import unicodedata
 import json
-from collections import defaultdict
 import os
 from datetime import datetime
+import sys
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Resultados_validas")))
+import libro_excel
+import normalizacion
 
 def normalizar_liga(nombre):
     """
     Normaliza el nombre de la liga: quita tildes, convierte a mayúsculas,
-    y limpia espacios extra.
+    y limpia espacios extra. Memorizada por valor (normalizacion.sin_tildes).
     """
     if pd.isna(nombre) or nombre == '':
         return None
-    
-    # Convertir a string y limpiar
-    nombre = str(nombre).strip()
-    
-    # Quitar tildes
-    nombre = unicodedata.normalize('NFD', nombre)
-    nombre = ''.join(c for c in nombre if unicodedata.category(c) != 'Mn')
-    
-    # Convertir a mayúsculas para unificar
-    nombre = nombre.upper()
-    
-    return nombre
+    return normalizacion.sin_tildes(str(nombre).strip()).upper()
+
+RANGOS_EDAD = [
+    "0 años", "1-5 años", "6-10 años", "11-15 años", "16-20 años", "21-25 años", "26-30 años",
+    "31-35 años", "36-40 años", "41-45 años", "46-50 años", "51-55 años", "56-60 años",
+    "61-65 años", "66+ años",
+]
+# Límites (inclusive a la derecha) de RANGOS_EDAD: <= 0, 1-5, 6-10, ..., 61-65, 66+.
+LIMITES_EDAD = [float('-inf')] + list(range(0, 66, 5)) + [float('inf')]
+
+def _es_x(serie):
+    """Celdas marcadas con "x" (sin importar mayúsculas ni espacios)."""
+    return serie.notna() & (serie.astype(str).str.upper().str.strip() == 'X')
+
+def _fecha_texto(texto):
+    """Fecha escrita como texto; NaT si no se puede leer."""
+    try:
+        return pd.Timestamp(pd.to_datetime(texto))
+    except Exception:
+        return pd.NaT
+
+def fechas_nacimiento(serie):
+    """
+    Columna FN como fechas: las celdas fecha se convierten de una vez; los textos, cada texto
+    distinto una sola vez. Lo demás (números, vacíos, textos ilegibles) queda NaT.
+    """
+    es_texto = serie.map(lambda v: isinstance(v, str))
+    es_fecha = serie.map(lambda v: not isinstance(v, str) and hasattr(v, 'year'))
+    fechas = pd.Series(pd.NaT, index=serie.index, dtype='datetime64[ns]')
+    if es_fecha.any():
+        fechas[es_fecha] = pd.to_datetime(serie[es_fecha], errors='coerce')
+    if es_texto.any():
+        textos = serie[es_texto]
+        leidas = {t: _fecha_texto(t) for t in textos.unique()}
+        fechas[es_texto] = pd.to_datetime(textos.map(leidas), errors='coerce')
+    return fechas
+
+def rangos_edad(serie, fecha_referencia):
+    """Rango de edad (RANGOS_EDAD) a la fecha de referencia, con pd.cut; None sin fecha."""
+    fechas = fechas_nacimiento(serie)
+    cumplidos = (fecha_referencia.month > fechas.dt.month) | (
+        (fecha_referencia.month == fechas.dt.month) & (fecha_referencia.day >= fechas.dt.day)
+    )
+    edad = fecha_referencia.year - fechas.dt.year - (~cumplidos).astype(int)
+    edad = edad.where(fechas.notna())
+    rangos = pd.cut(edad, bins=LIMITES_EDAD, labels=RANGOS_EDAD).astype(object)
+    return rangos.where(rangos.notna(), None)
+
+def licencias_hoja(df):
+    """Licencia de cada fila ('Licencia' o, si está vacía, 'LICEN'); enteros y decimales a int."""
+    licencia = df['Licencia'] if 'Licencia' in df.columns else pd.Series(None, index=df.index, dtype=object)
+    if 'LICEN' in df.columns:
+        licencia = licencia.where(licencia.notna(), df['LICEN'])
+    licencia = licencia.dropna()
+    if pd.api.types.is_numeric_dtype(licencia):
+        return licencia.astype('int64')
+    return licencia.map(lambda v: int(v) if isinstance(v, (int, float)) else v)
+
+def ligas_normalizadas(serie):
+    """normalizar_liga sobre cada valor distinto de la columna (no por fila)."""
+    codigos, unicas = pd.factorize(serie)
+    normalizadas = pd.array([normalizar_liga(v) for v in unicas], dtype=object)
+    return pd.Series(normalizadas[codigos], index=serie.index, dtype=object)
+
+def columnas_categoria(df):
+    """
+    Columnas de categorías: las que tienen alguna "x". Solo se buscan DESPUÉS de la columna
+    "Formatos"; si no existe, en todas las que no son de información del piloto.
+    """
+    # Buscar la posición de la columna "Formatos"
+    indice_formatos = None
+    for i, col in enumerate(df.columns):
+        if str(col).strip().upper() == 'FORMATOS':
+            indice_formatos = i
+            break
+
+    if indice_formatos is not None:
+        print(f"  Columna 'Formatos' encontrada en índice {indice_formatos}")
+        candidatas = list(df.columns[indice_formatos + 1:])
+    else:
+        print(f"  ADVERTENCIA: No se encontró la columna 'Formatos', usando método fallback")
+        columnas_info = ['Consecutivo', 'Licencia', 'LICEN', 'TX', 'Nombre', 'Apellido', 'Liga', 
+                        'Club', 'FN', 'RH', 'MOTO', 'Documento', 'EPS', 'Pago Licencia', 
+                        'Poliza', 'Celular', 'Mail', 'Formatos', 'PRACT']
+        candidatas = [col for col in df.columns if col not in columnas_info]
+    return [col for col in candidatas if str(col) != 'nan' and _es_x(df[col]).any()]
+
+def participaciones_hoja(df, fecha_referencia):
+    """
+    Participaciones de una hoja en formato largo (categoria, licencia, liga, edad): cada
+    columna de categoría aporta las filas marcadas con "x" que tienen licencia y liga.
+    None si la hoja no tiene columna 'Liga'.
+    """
+    columnas_categorias = columnas_categoria(df)
+    print(f"  Categorías encontradas: {columnas_categorias}")
+
+    # Verificar que tenemos la columna Liga
+    if 'Liga' not in df.columns:
+        print(f"  ADVERTENCIA: No se encontró la columna 'Liga'")
+        return None
+
+    licencia = licencias_hoja(df)
+    liga = ligas_normalizadas(df['Liga'].dropna())
+    liga = liga[liga.notna() & (liga != '')]
+    filas = licencia.index.intersection(liga.index, sort=False)
+    pilotos = pd.DataFrame({'licencia': licencia[filas], 'liga': liga[filas]})
+    pilotos['edad'] = rangos_edad(df.loc[pilotos.index, 'FN'], fecha_referencia) if 'FN' in df.columns else None
+
+    partes = []
+    for categoria in columnas_categorias:
+        marcadas = pilotos[_es_x(df.loc[pilotos.index, categoria])]
+        partes.append(marcadas.assign(categoria=pd.Series(categoria, index=marcadas.index, dtype=object)))
+    if not partes:
+        return pd.DataFrame({'categoria': [], 'licencia': [], 'liga': [], 'edad': []}, dtype=object)
+    return pd.concat(partes, ignore_index=True)[['categoria', 'licencia', 'liga', 'edad']]
+
+def _conteos(serie):
+    """Serie de groupby().nunique() → dict ordenado {clave: int}."""
+    return {k: int(v) for k, v in sorted(serie.items())}
+
+def resumir(largo):
+    """
+    Conteos de un conjunto de participaciones con groupby().nunique(): licencias únicas,
+    participaciones (filas), licencias por categoría, por liga, por liga en cada categoría y
+    por rango de edad.
+    """
+    por_liga_categoria = {}
+    for (categoria, liga), n in largo.groupby(['categoria', 'liga'])['licencia'].nunique().items():
+        por_liga_categoria.setdefault(categoria, {})[liga] = int(n)
+    return {
+        'pilotos_unicos': int(largo['licencia'].nunique()),
+        'total_participaciones': len(largo),
+        'pilotos_por_categoria': _conteos(largo.groupby('categoria')['licencia'].nunique()),
+        'deportistas_por_liga': _conteos(largo.groupby('liga')['licencia'].nunique()),
+        'deportistas_por_liga_categoria': {
+            cat: dict(sorted(ligas.items()))
+            for cat, ligas in sorted(por_liga_categoria.items())
+        },
+        'licencias_unicas_por_edad': _conteos(largo.dropna(subset=['edad']).groupby('edad')['licencia'].nunique()),
+    }
 
 def extraer_datos_excel(excel_path):
     """
     Extrae todos los datos del Excel de una válida.
     Estructura: columnas de información del piloto + columnas de categorías con "x"
+    Retorna los conteos totales y por hoja (ver resumir); las hojas sin 'Liga' se omiten.
     """
-    excel_file = pd.ExcelFile(excel_path)
+    # Hojas desde la instantánea del libro (libro_excel): el .xlsx solo se abre si cambió
+    sheet_names = libro_excel.hojas(excel_path)
     
-    resultados = {
-        'modalidades': {},
-        'total_pilotos_unicos': set(),
-        'total_participaciones': 0,
-        'pilotos_por_categoria': defaultdict(set),
-        'deportistas_por_liga_total': defaultdict(set),
-        'deportistas_por_liga_categoria': defaultdict(lambda: defaultdict(set)),
-        'licencias_unicas_por_edad': defaultdict(set)  # Cambiado a set para contar licencias únicas
-    }
-    
-    print(f"Procesando {len(excel_file.sheet_names)} hojas...")
+    print(f"Procesando {len(sheet_names)} hojas...")
     
-    for sheet_name in excel_file.sheet_names:
+    hojas = {}
+    for sheet_name in sheet_names:
         print(f"\nProcesando hoja: {sheet_name}")
-        df = pd.read_excel(excel_file, sheet_name=sheet_name)
-        
-        modalidad_data = {
-            'pilotos_unicos': set(),
-            'total_participaciones': 0,
-            'pilotos_por_categoria': defaultdict(set),
-            'deportistas_por_liga': defaultdict(set),
-            'deportistas_por_liga_categoria': defaultdict(lambda: defaultdict(set)),
-            'licencias_unicas_por_edad': defaultdict(set)  # Cambiado a set para contar licencias únicas
-        }
-        
+        df = libro_excel.leer_hoja(excel_path, sheet_name)
         # Fecha de referencia para calcular edades (año actual)
-        fecha_referencia = datetime.now()
-        
-        # Identificar columnas de categorías: solo las que están DESPUÉS de la columna "Formatos"
-        # Buscar la posición de la columna "Formatos"
-        indice_formatos = None
-        for i, col in enumerate(df.columns):
-            if str(col).strip().upper() == 'FORMATOS':
-                indice_formatos = i
-                break
-        
-        columnas_categorias = []
-        if indice_formatos is not None:
-            print(f"  Columna 'Formatos' encontrada en índice {indice_formatos}")
-            # Solo considerar columnas después de "Formatos"
-            for i in range(indice_formatos + 1, len(df.columns)):
-                col = df.columns[i]
-                if str(col) != 'nan':
-                    # Verificar si esta columna tiene valores "x" (indicando participación)
-                    if df[col].notna().any():
-                        valores_unicos = df[col].dropna().unique()
-                        # Si tiene "x" o valores similares, es una categoría
-                        if any(str(v).upper().strip() in ['X', 'x', 'X ', ' x'] for v in valores_unicos):
-                            columnas_categorias.append(col)
-        else:
-            print(f"  ADVERTENCIA: No se encontró la columna 'Formatos', usando método fallback")
-            # Si no se encuentra "Formatos", usar el método anterior como fallback
-            columnas_info = ['Consecutivo', 'Licencia', 'LICEN', 'TX', 'Nombre', 'Apellido', 'Liga', 
-                            'Club', 'FN', 'RH', 'MOTO', 'Documento', 'EPS', 'Pago Licencia', 
-                            'Poliza', 'Celular', 'Mail', 'Formatos', 'PRACT']
-            for col in df.columns:
-                if col not in columnas_info and str(col) != 'nan':
-                    if df[col].notna().any():
-                        valores_unicos = df[col].dropna().unique()
-                        if any(str(v).upper().strip() in ['X', 'x', 'X ', ' x'] for v in valores_unicos):
-                            columnas_categorias.append(col)
-        
-        print(f"  Categorías encontradas: {columnas_categorias}")
-        
-        # Verificar que tenemos la columna Liga
-        if 'Liga' not in df.columns:
-            print(f"  ADVERTENCIA: No se encontró la columna 'Liga'")
-            continue
-        
-        # Procesar cada fila
-        for idx, row in df.iterrows():
-            # Intentar obtener licencia de 'Licencia' o 'LICEN'
-            licencia = row.get('Licencia', None)
-            if pd.isna(licencia):
-                licencia = row.get('LICEN', None)
-            
-            liga = row.get('Liga', None)
-            
-            # Validar que tenemos licencia y liga
-            if pd.isna(licencia) or pd.isna(liga):
-                continue
-            
-            licencia = int(licencia) if isinstance(licencia, (int, float)) else licencia
-            liga_normalizada = normalizar_liga(liga)
-            
-            if not liga_normalizada:
-                continue
-            
-            # Calcular edad si hay fecha de nacimiento
-            edad_rango = None
-            fecha_nacimiento = row.get('FN', None)
-            if pd.notna(fecha_nacimiento):
-                try:
-                    if isinstance(fecha_nacimiento, str):
-                        fecha_nac = pd.to_datetime(fecha_nacimiento)
-                    else:
-                        fecha_nac = fecha_nacimiento
-                    
-                    edad = fecha_referencia.year - fecha_nac.year
-                    if fecha_referencia.month < fecha_nac.month or (fecha_referencia.month == fecha_nac.month and fecha_referencia.day < fecha_nac.day):
-                        edad -= 1
-                    
-                    # Agrupar en rangos de 5 años, empezando desde 1-5 años
-                    if edad < 1:
-                        edad_rango = "0 años"
-                    elif edad <= 5:
-                        edad_rango = "1-5 años"
-                    elif edad <= 10:
-                        edad_rango = "6-10 años"
-                    elif edad <= 15:
-                        edad_rango = "11-15 años"
-                    elif edad <= 20:
-                        edad_rango = "16-20 años"
-                    elif edad <= 25:
-                        edad_rango = "21-25 años"
-                    elif edad <= 30:
-                        edad_rango = "26-30 años"
-                    elif edad <= 35:
-                        edad_rango = "31-35 años"
-                    elif edad <= 40:
-                        edad_rango = "36-40 años"
-                    elif edad <= 45:
-                        edad_rango = "41-45 años"
-                    elif edad <= 50:
-                        edad_rango = "46-50 años"
-                    elif edad <= 55:
-                        edad_rango = "51-55 años"
-                    elif edad <= 60:
-                        edad_rango = "56-60 años"
-                    elif edad <= 65:
-                        edad_rango = "61-65 años"
-                    else:
-                        edad_rango = "66+ años"
-                except:
-                    pass  # Si no se puede calcular la edad, se omite
-            
-            # Procesar cada categoría
-            for categoria in columnas_categorias:
-                valor_categoria = row.get(categoria, None)
-                
-                # Verificar si el piloto participa en esta categoría (tiene "x")
-                if pd.notna(valor_categoria):
-                    valor_str = str(valor_categoria).upper().strip()
-                    if valor_str in ['X', 'X ', ' X']:
-                        # El piloto participa en esta categoría
-                        resultados['total_pilotos_unicos'].add(licencia)
-                        resultados['total_participaciones'] += 1
-                        resultados['pilotos_por_categoria'][categoria].add(licencia)
-                        resultados['deportistas_por_liga_total'][liga_normalizada].add(licencia)
-                        resultados['deportistas_por_liga_categoria'][categoria][liga_normalizada].add(licencia)
-                        
-                        # Agregar licencia única por edad (no participación)
-                        if edad_rango:
-                            resultados['licencias_unicas_por_edad'][edad_rango].add(licencia)
-                        
-                        # Agregar a modalidad específica
-                        modalidad_data['pilotos_unicos'].add(licencia)
-                        modalidad_data['total_participaciones'] += 1
-                        modalidad_data['pilotos_por_categoria'][categoria].add(licencia)
-                        modalidad_data['deportistas_por_liga'][liga_normalizada].add(licencia)
-                        modalidad_data['deportistas_por_liga_categoria'][categoria][liga_normalizada].add(licencia)
-                        
-                        # Agregar licencia única por edad en modalidad (no participación)
-                        if edad_rango:
-                            modalidad_data['licencias_unicas_por_edad'][edad_rango].add(licencia)
-        
-        resultados['modalidades'][sheet_name] = modalidad_data
-    
+        largo = participaciones_hoja(df, datetime.now())
+        if largo is not None:
+            hojas[sheet_name] = largo
+
+    if hojas:
+        resultados = resumir(pd.concat(list(hojas.values()), ignore_index=True))
+    else:
+        resultados = resumir(pd.DataFrame({'categoria': [], 'licencia': [], 'liga': [], 'edad': []}, dtype=object))
+    resultados['modalidades'] = {sheet_name: resumir(largo) for sheet_name, largo in hojas.items()}
     return resultados
 
 def generar_json(resultados, output_file):
@@ -213,50 +194,20 @@ def generar_json(resultados, output_file):
     Genera un archivo JSON con los datos estructurados para la página web.
     """
     datos_json = {
-        'total_pilotos_unicos': len(resultados['total_pilotos_unicos']),
+        'total_pilotos_unicos': resultados['pilotos_unicos'],
         'total_participaciones': resultados['total_participaciones'],
-        'pilotos_por_categoria': {
-            cat: len(pilotos) 
-            for cat, pilotos in sorted(resultados['pilotos_por_categoria'].items())
-        },
-        'deportistas_por_liga_total': {
-            liga: len(deportistas) 
-            for liga, deportistas in sorted(resultados['deportistas_por_liga_total'].items())
-        },
-        'deportistas_por_liga_categoria': {
-            cat: {
-                liga: len(deportistas)
-                for liga, deportistas in sorted(ligas.items())
-            }
-            for cat, ligas in sorted(resultados['deportistas_por_liga_categoria'].items())
-        },
-        'participaciones_por_edad': {
-            edad: len(licencias) 
-            for edad, licencias in sorted(resultados['licencias_unicas_por_edad'].items())
-        },
+        'pilotos_por_categoria': resultados['pilotos_por_categoria'],
+        'deportistas_por_liga_total': resultados['deportistas_por_liga'],
+        'deportistas_por_liga_categoria': resultados['deportistas_por_liga_categoria'],
+        'participaciones_por_edad': resultados['licencias_unicas_por_edad'],
         'modalidades': {
             modalidad: {
-                'pilotos_unicos': len(data['pilotos_unicos']),
+                'pilotos_unicos': data['pilotos_unicos'],
                 'total_participaciones': data['total_participaciones'],
-                'pilotos_por_categoria': {
-                    cat: len(pilotos)
-                    for cat, pilotos in sorted(data['pilotos_por_categoria'].items())
-                },
-                'deportistas_por_liga': {
-                    liga: len(deportistas)
-                    for liga, deportistas in sorted(data['deportistas_por_liga'].items())
-                },
-                'deportistas_por_liga_categoria': {
-                    cat: {
-                        liga: len(deportistas)
-                        for liga, deportistas in sorted(ligas.items())
-                    }
-                    for cat, ligas in sorted(data['deportistas_por_liga_categoria'].items())
-                },
-                'participaciones_por_edad': {
-                    edad: len(licencias)
-                    for edad, licencias in sorted(data['licencias_unicas_por_edad'].items())
-                }
+                'pilotos_por_categoria': data['pilotos_por_categoria'],
+                'deportistas_por_liga': data['deportistas_por_liga'],
+                'deportistas_por_liga_categoria': data['deportistas_por_liga_categoria'],
+                'participaciones_por_edad': data['licencias_unicas_por_edad'],
             }
             for modalidad, data in resultados['modalidades'].items()
         }
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Genera el informe de la temporada (HTML): pilotos únicos, ligas, clubes, marcas y
+participaciones por categoría en todas las válidas y modalidades del registro
+(temporada_2026.json, bloque `informe_temporada`).
+
+No relee las válidas: combina los bocetos por válida de generar_informes_validas.py
+(`.cache/informes/<válida>.json`). Solo se vuelve a leer la carpeta FILES EXPORTED de una
+válida nueva o que cambió, así que publicar una válida más cuesta leer esa válida.
+
+Los pilotos se unen entre válidas y modalidades por nombre normalizado (la misma llave exacta
+del índice de identidades) o, sin nombre, por modalidad y N°. Pilotos por liga y por club
+cuentan cada piloto una vez en la temporada; inscripciones por marca y participaciones por
+categoría (con su modalidad) suman todas las válidas.
+"""
+
+import os
+import sys
+from collections import Counter, defaultdict
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import generar_informes_validas as informes
+import registro_temporada
+
+
+def combinar(bocetos):
+    """Datos del informe (los que lee informe.js) a partir de los bocetos de varias válidas."""
+    pilotos = set()
+    por_liga = defaultdict(set)
+    por_club = defaultdict(set)
+    por_marca = Counter()
+    por_categoria = Counter()
+    participaciones = 0
+
+    for b in bocetos:
+        clave = b["pilotos"]
+        pilotos.update(clave.values())
+        for liga, numeros in b["por_liga"].items():
+            por_liga[liga].update(clave[n] for n in numeros)
+        for club, numeros in b["por_club"].items():
+            por_club[club].update(clave[n] for n in numeros)
+        for marca, numeros in b["por_marca"].items():
+            por_marca[marca] += len(numeros)
+        for categoria, n in b["por_categoria"].items():
+            por_categoria[f"{b['modalidad']} - {categoria}"] += n
+        participaciones += b["participaciones"]
+
+    return {
+        "participaciones_totales": participaciones,
+        "pilotos_unicos": len(pilotos),
+        "pilotos_por_liga": {k: len(v) for k, v in sorted(por_liga.items())},
+        "pilotos_por_club": {k: len(v) for k, v in sorted(por_club.items())},
+        "inscripciones_por_marca": dict(sorted(por_marca.items())),
+        "participaciones_por_categoria": dict(sorted(por_categoria.items())),
+    }
+
+
+def bocetos_temporada():
+    """Boceto de cada válida del registro con carpeta FILES EXPORTED (del disco si no cambió)."""
+    return [
+        informes.boceto_valida(cfg)
+        for cfg in registro_temporada.lecturas_informe()
+        if os.path.isdir(cfg["files_dir"])
+    ]
+
+
+def generate(config=None):
+    config = config or registro_temporada.informe_temporada()
+    if config is None:
+        raise ValueError("temporada_2026.json no declara `informe_temporada`")
+    output_html = config["output_html"]
+    os.makedirs(os.path.dirname(output_html), exist_ok=True)
+    datos = combinar(bocetos_temporada())
+
+    output_dir = os.path.dirname(output_html)
+    root_rel_prefix = os.path.relpath(informes.ROOT_DIR, output_dir).replace("\\", "/") + "/"
+    html = informes.build_html(
+        datos,
+        config["title"],
+        config["heading"],
+        config["subtitle"],
+        config["intro"],
+        root_rel_prefix,
+    )
+    with open(output_html, "w", encoding="utf-8") as f:
+        f.write(html)
+    print(f"Informe de temporada generado: {output_html}")
+
+
+if __name__ == "__main__":
+    generate()
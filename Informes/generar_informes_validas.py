@@ -1,14 +1,26 @@
 # -*- coding: utf-8 -*-
 """
 Genera informes estadísticos (HTML) para válidas a partir de carpetas FILES EXPORTED.
+
+La carpeta se recorre con escaneo_validas y los CSV se leen con tablas_csv: ambos memorizan
+por proceso, así que en generar_sitio.py el informe comparte la lectura con las tablas
+generales de la misma válida. Las etiquetas (liga, club, marca, categoría) se normalizan con
+normalizacion.py, una vez por valor distinto.
+
+Cada válida se resume primero en un boceto combinable (pilotos por liga, club y marca y
+participaciones por categoría), que se guarda en `.cache/informes/<válida>.json` con la firma
+de su carpeta y del código. El informe de la válida sale del boceto y el de la temporada
+(generar_informe_temporada.py) combina los bocetos sin releer las válidas que no cambiaron.
+`FEDEMOTO_INFORMES_CACHE=0` desactiva la caché en disco.
 """
 
-import csv
+import hashlib
 import json
 import os
 import re
-import unicodedata
+import threading
 from collections import defaultdict
+from functools import lru_cache
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, ".."))
@@ -17,261 +29,29 @@ import sys
 sys.path.insert(0, os.path.join(ROOT_DIR, "Resultados generales"))
 from enduro_categorias import canonical_enduro_categoria
 
+sys.path.insert(0, os.path.join(ROOT_DIR, "Resultados_validas"))
+import escaneo_validas
+import normalizacion
+import plantillas
+import recursos_estaticos
+import registro_temporada
+import tablas_csv
 
-REPORT_CONFIGS = [
-    {
-        "output_html": os.path.join(SCRIPT_DIR, "Enduro", "Primera valida", "informe_valida_i_enduro_2026.html"),
-        "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Enduro", "Primera valida", "FILES EXPORTED"),
-        "title": "Informe I Válida Enduro 2026",
-        "heading": "Informe I Válida Enduro",
-        "subtitle": "Enduro 2026 — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "registrados para la I Válida de Enduro 2026."
-        ),
-    },
-    {
-        "output_html": os.path.join(SCRIPT_DIR, "Enduro", "Segunda valida", "informe_valida_ii_enduro_pasca.html"),
-        "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Enduro", "Segunda valida", "FILES EXPORTED"),
-        "title": "Informe II Válida Enduro - Pasca, Cundinamarca | FEDEMOTO",
-        "heading": "Informe II Válida Nacional de Enduro",
-        "subtitle": "Pasca, Cundinamarca — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "registrados para la II Válida Nacional de Enduro 2026, realizada en Pasca, Cundinamarca."
-        ),
-    },
-    {
-        "output_html": os.path.join(SCRIPT_DIR, "Enduro", "Tercera valida", "informe_valida_iii_enduro_san_jeronimo.html"),
-        "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Enduro", "Tercera valida", "FILES EXPORTED"),
-        "title": "Informe III Válida Enduro - San Jerónimo, Antioquia | FEDEMOTO",
-        "heading": "Informe III Válida Nacional de Enduro",
-        "subtitle": "San Jerónimo, Antioquia — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "registrados para la III Válida Nacional de Enduro 2026, realizada en San Jerónimo, Antioquia."
-        ),
-    },
-    {
-        "output_html": os.path.join(SCRIPT_DIR, "Motocross", "Primer semestre", "informe_valida_ii_mx_barranquilla.html"),
-        "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Motocross", "Primer semestre", "FILES EXPORTED-barranquilla"),
-        "title": "Informe II Válida MX - Barranquilla, Atlántico | FEDEMOTO",
-        "heading": "Informe II Válida Nacional de Motocross",
-        "subtitle": "Barranquilla, Atlántico — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "de la II Válida Nacional de Motocross, realizada en Barranquilla, Atlántico."
-        ),
-    },
-    {
-        "output_html": os.path.join(SCRIPT_DIR, "Motocross", "Primer semestre", "informe_valida_iii_mx_tocancipa.html"),
-        "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Motocross", "Primer semestre", "FILES EXPORTED-tocancipa"),
-        "title": "Informe III Válida MX - Tocancipá, Cundinamarca | FEDEMOTO",
-        "heading": "Informe III Válida Nacional de Motocross",
-        "subtitle": "Tocancipá, Cundinamarca — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "de la III Válida Nacional de Motocross, realizada en Tocancipá, Cundinamarca."
-        ),
-    },
-    {
-        "output_html": os.path.join(SCRIPT_DIR, "Motocross", "Primer semestre", "informe_valida_iv_mx_manizales.html"),
-        "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Motocross", "Primer semestre", "FILES EXPORTED-manizales"),
-        "session_priority": ["final", "carrera", "clasificatoria", "otros"],
-        "title": "Informe IV Válida MX - Manizales, Caldas | FEDEMOTO",
-        "heading": "Informe IV Válida Nacional de Motocross",
-        "subtitle": "Manizales, Caldas — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "de la IV Válida Nacional de Motocross, realizada en Manizales, Caldas."
-        ),
-    },
-    {
-        "output_html": os.path.join(
-            SCRIPT_DIR, "Velocidad", "Primer semestre", "informe_valida_i_velocidad_zarzal.html"
-        ),
-        "files_dir": os.path.join(
-            ROOT_DIR, "Resultados_validas", "Velocidad", "Primer semestre", "FILES EXPORTED_ZARZAL"
-        ),
-        "session_priority": ["final", "carrera", "clasificatoria", "otros"],
-        "title": "Informe I Válida Velocidad - Zarzal, Valle del Cauca | FEDEMOTO",
-        "heading": "Informe I Válida Nacional de Velocidad",
-        "subtitle": "Zarzal, Valle del Cauca — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "de la I Válida Nacional de Velocidad, realizada en Zarzal, Valle del Cauca."
-        ),
-    },
-    {
-        "output_html": os.path.join(
-            SCRIPT_DIR, "Velocidad", "Primer semestre", "informe_valida_ii_velocidad_chachagui.html"
-        ),
-        "files_dir": os.path.join(
-            ROOT_DIR, "Resultados_validas", "Velocidad", "Primer semestre", "FILES EXPORTED_CHACHAGUI"
-        ),
-        "session_priority": ["final", "carrera", "clasificatoria", "otros"],
-        "title": "Informe II Válida Velocidad - Chachagüi, Nariño | FEDEMOTO",
-        "heading": "Informe II Válida Nacional de Velocidad",
-        "subtitle": "Chachagüi, Nariño — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "de la II Válida Nacional de Velocidad, realizada en Chachagüi, Nariño."
-        ),
-    },
-    {
-        "output_html": os.path.join(
-            SCRIPT_DIR, "Velocidad", "Primer semestre", "informe_valida_iii_velocidad_popayan.html"
-        ),
-        "files_dir": os.path.join(
-            ROOT_DIR, "Resultados_validas", "Velocidad", "Primer semestre", "FILES EXPORTED_POPAYAN"
-        ),
-        "session_priority": ["final", "carrera", "clasificatoria", "otros"],
-        "title": "Informe III Válida Velocidad - Popayán, Cauca | FEDEMOTO",
-        "heading": "Informe III Válida Nacional de Velocidad",
-        "subtitle": "Popayán, Cauca — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "de la III Válida Nacional de Velocidad, realizada en Popayán, Cauca."
-        ),
-    },
-    {
-        "output_html": os.path.join(
-            SCRIPT_DIR, "Velocidad", "Segundo semestre", "informe_valida_i_velocidad_manizales.html"
-        ),
-        "files_dir": os.path.join(
-            ROOT_DIR, "Resultados_validas", "Velocidad", "Segundo semestre", "FILES EXPORTED_MANIZALES"
-        ),
-        "session_priority": ["final", "carrera", "clasificatoria", "otros"],
-        "title": "Informe I Válida Velocidad - Manizales, Caldas | FEDEMOTO",
-        "heading": "Informe I Válida Nacional de Velocidad — Segundo semestre",
-        "subtitle": "Manizales, Caldas — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "de la I Válida Nacional de Velocidad del segundo semestre, realizada en Manizales, Caldas."
-        ),
-    },
-    {
-        "output_html": os.path.join(SCRIPT_DIR, "Velotierra", "Primer semestre", "informe_valida_i_vt_tulua.html"),
-        "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Velotierra", "Primer semestre", "FILES EXPORTED_tulua"),
-        "title": "Informe I Válida VT - Tuluá, Valle del Cauca | FEDEMOTO",
-        "heading": "Informe I Válida Nacional Velotierra",
-        "subtitle": "Tuluá, Valle del Cauca — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "de la I Válida Nacional Velotierra, realizada en Tuluá, Valle del Cauca."
-        ),
-    },
-    {
-        "output_html": os.path.join(SCRIPT_DIR, "Velotierra", "Primer semestre", "informe_valida_ii_vt_barcelona.html"),
-        "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Velotierra", "Primer semestre", "FILES EXPORTED_barcelona"),
-        "title": "Informe II Válida VT - Barcelona, Quindío | FEDEMOTO",
-        "heading": "Informe II Válida Nacional Velotierra",
-        "subtitle": "Barcelona, Quindío — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "de la II Válida Nacional Velotierra, realizada en Barcelona, Quindío."
-        ),
-    },
-    {
-        "output_html": os.path.join(SCRIPT_DIR, "Velotierra", "Primer semestre", "informe_valida_iii_vt_ibague.html"),
-        "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Velotierra", "Primer semestre", "FILES EXPORTED_ibague"),
-        "title": "Informe III Válida VT - Ibagué, Tolima | FEDEMOTO",
-        "heading": "Informe III Válida Nacional Velotierra",
-        "subtitle": "Ibagué, Tolima — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "de la III Válida Nacional Velotierra, realizada en Ibagué, Tolima."
-        ),
-    },
-    {
-        "output_html": os.path.join(
-            SCRIPT_DIR, "Velotierra", "Segundo semestre", "informe_valida_i_vt_villa_garzon.html"
-        ),
-        "files_dir": os.path.join(
-            ROOT_DIR,
-            "Resultados_validas",
-            "Velotierra",
-            "Segundo semestre",
-            "FILES EXPORTED_Villa garzón",
-        ),
-        "title": "Informe I Válida VT - Villa Garzón, Putumayo | FEDEMOTO",
-        "heading": "Informe I Válida Nacional Velotierra — Segundo semestre",
-        "subtitle": "Villa Garzón, Putumayo — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "de la I Válida Nacional Velotierra del segundo semestre, realizada en Villa Garzón, Putumayo."
-        ),
-    },
-    {
-        "output_html": os.path.join(SCRIPT_DIR, "GP Colombia", "informe_valida_i_gp_colombia_vitrix.html"),
-        "files_dir": os.path.join(
-            ROOT_DIR,
-            "Resultados_validas",
-            "GP Colombia",
-            "FILES EXPORTED_Gran Premio Vitrix",
-        ),
-        "gp_colombia": True,
-        "title": "Informe I Válida GP Colombia - Gran Premio Vitrix | FEDEMOTO",
-        "heading": "Informe I Válida GP Colombia",
-        "subtitle": "Gran Premio Vitrix — Estadísticas de la válida",
-        "intro": (
-            "A continuación se presentan las estadísticas generadas a partir de los resultados "
-            "de la I Válida GP Colombia 2026, Gran Premio Vitrix."
-        ),
-    },
-]
-
-
-def normalize_text(raw):
-    return " ".join(str(raw).strip().split()) if raw is not None else ""
-
-
-def normalize_chart_label(raw):
-    """Primera letra en mayúscula y el resto en minúsculas (por palabra)."""
-    s = normalize_text(raw)
-    if not s:
-        return ""
-
-    words = []
-    for word in s.split():
-        if not word:
-            continue
-        if "." in word:
-            word = ".".join(
-                (seg[0].upper() + seg[1:].lower()) if seg else ""
-                for seg in word.split(".")
-            )
-        else:
-            word = word[0].upper() + word[1:].lower()
-        words.append(word)
-    out = " ".join(words)
-    out = re.sub(r"(?i)\bGsc\s+R\s+S\b", "GSX R/S", out)
-    out = re.sub(r"(?i)\bGsx\s+R/s\b", "GSX R/S", out)
-    return out
-
-
-def normalize_club(raw):
-    s = normalize_text(raw)
-    return s.title() if s else ""
 
+# Informes por válida declarados en el registro de la temporada (temporada_2026.json).
+REPORT_CONFIGS = registro_temporada.report_configs()
 
-def normalize_liga(raw):
-    s = normalize_text(raw)
-    if not s:
-        return ""
-    upper = s.upper()
-    if upper == "VALLE":
-        return "Valle del Cauca"
-    if upper == "ANTIOQUIA":
-        return "Antioquia"
-    return s
+CACHE_DIR = os.path.join(ROOT_DIR, ".cache", "informes")
+BOCETO_VERSION = 1
 
 
-def normalize_marca(raw):
-    s = normalize_text(raw)
-    if not s:
-        return ""
-    return s.upper().replace("YAMAHA", "Yamaha").title().replace("Yamaha", "Yamaha")
+# Normalización compartida (Resultados_validas/normalizacion.py), memorizada por valor distinto.
+normalize_text = normalizacion.espacios
+normalize_chart_label = normalizacion.etiqueta_grafico
+normalize_club = normalizacion.club
+normalize_liga = normalizacion.liga
+normalize_marca = normalizacion.marca
+normalize_ascii = normalizacion.sin_tildes
 
 
 def parse_filename(filename):
@@ -283,11 +63,6 @@ def parse_filename(filename):
     return (" - ".join(parts[:-1]), parts[-1].strip())
 
 
-def normalize_ascii(text):
-    raw = str(text or "")
-    return "".join(c for c in unicodedata.normalize("NFD", raw) if unicodedata.category(c) != "Mn")
-
-
 def session_bucket(tipo):
     t = normalize_ascii(tipo).lower()
     if "final" in t:
@@ -330,43 +105,31 @@ def find_header_indexes(headers):
 
 def collect_rows_by_category(files_dir, session_priority=None):
     by_categoria = defaultdict(list)
-    files_per_cat = defaultdict(list)
-
-    for filename in os.listdir(files_dir):
-        if not filename.lower().endswith(".csv"):
-            continue
-        filepath = os.path.join(files_dir, filename)
-        if not os.path.isfile(filepath):
-            continue
-        categoria, tipo = parse_filename(filename)
-        categoria = canonical_enduro_categoria(categoria)
-        files_per_cat[categoria].append((tipo, filepath))
+    files_per_cat = escaneo_validas.por_categoria(files_dir, parse_filename, canonical_enduro_categoria)
 
     for categoria, files in files_per_cat.items():
         filepath = choose_main_file(files, session_priority=session_priority)
-        with open(filepath, "r", encoding="utf-8-sig") as f:
-            reader = csv.reader(f)
-            headers = next(reader, [])
-            idx_num, idx_nombre, idx_liga, idx_club, idx_moto = find_header_indexes(headers)
-            required = [i for i in (idx_num, idx_nombre) if i is not None]
-            if not required:
+        table = tablas_csv.read_table(filepath, ",")
+        idx_num, idx_nombre, idx_liga, idx_club, idx_moto = table.indexes(find_header_indexes)
+        required = [i for i in (idx_num, idx_nombre) if i is not None]
+        if not required:
+            continue
+        for row in table.rows():
+            if len(row) <= max(required):
+                continue
+            numero = normalize_text(row[idx_num]) if idx_num is not None and idx_num < len(row) else ""
+            if not numero:
                 continue
-            for row in reader:
-                if len(row) <= max(required):
-                    continue
-                numero = normalize_text(row[idx_num]) if idx_num is not None and idx_num < len(row) else ""
-                if not numero:
-                    continue
-                nombre = normalize_text(row[idx_nombre]) if idx_nombre is not None and idx_nombre < len(row) else ""
-                liga = normalize_liga(row[idx_liga]) if idx_liga is not None and idx_liga < len(row) else ""
-                club = normalize_club(row[idx_club]) if idx_club is not None and idx_club < len(row) else ""
-                moto = normalize_marca(row[idx_moto]) if idx_moto is not None and idx_moto < len(row) else ""
-                by_categoria[categoria].append((numero, nombre, liga, club, moto))
+            nombre = normalize_text(row[idx_nombre]) if idx_nombre is not None and idx_nombre < len(row) else ""
+            liga = normalize_liga(row[idx_liga]) if idx_liga is not None and idx_liga < len(row) else ""
+            club = normalize_club(row[idx_club]) if idx_club is not None and idx_club < len(row) else ""
+            moto = normalize_marca(row[idx_moto]) if idx_moto is not None and idx_moto < len(row) else ""
+            by_categoria[categoria].append((numero, nombre, liga, club, moto))
 
     return by_categoria
 
 
-def analyze_gp_colombia(files_dir):
+def collect_rows_gp_colombia(files_dir):
     gp_dir = os.path.join(ROOT_DIR, "Resultados_validas", "GP Colombia")
     if gp_dir not in sys.path:
         sys.path.insert(0, gp_dir)
@@ -385,39 +148,57 @@ def analyze_gp_colombia(files_dir):
                     normalize_marca(row["moto"]),
                 )
             )
-    return _analyze_from_by_categoria(by_categoria)
+    return by_categoria
 
 
+def analyze_gp_colombia(files_dir):
+    return _analyze_from_by_categoria(collect_rows_gp_colombia(files_dir))
+
+
+@lru_cache(maxsize=4096)
 def _chart_key_liga(raw):
     return normalize_chart_label(normalize_liga(raw))
 
 
+@lru_cache(maxsize=4096)
 def _chart_key_club(raw):
     return normalize_chart_label(normalize_club(raw))
 
 
+@lru_cache(maxsize=4096)
 def _chart_key_marca(raw):
     return normalize_chart_label(normalize_marca(raw))
 
 
+@lru_cache(maxsize=4096)
 def _chart_key_categoria(raw):
     return normalize_chart_label(raw)
 
 
-def _analyze_from_by_categoria(by_categoria):
-    total_participaciones = 0
-    pilotos_unicos = set()
+def clave_piloto(modalidad, numero, nombre):
+    """Llave del piloto en la temporada: nombre normalizado o, sin nombre, modalidad y N°."""
+    return normalizacion.clave(nombre) or f"{modalidad or ''}#{numero}"
+
+
+def boceto(by_categoria, modalidad=None):
+    """
+    Boceto combinable de la válida (serializable a JSON): N° → llave del piloto en la
+    temporada, N° por liga, club y marca, participaciones por categoría y en total.
+    """
+    pilotos = {}
     por_liga = defaultdict(set)
     por_club = defaultdict(set)
     por_marca = defaultdict(set)
     por_categoria = defaultdict(int)
+    participaciones = 0
 
     for categoria, rows in by_categoria.items():
         cat_key = _chart_key_categoria(categoria)
         por_categoria[cat_key] += len(rows)
-        total_participaciones += len(rows)
-        for numero, _nombre, liga, club, moto in rows:
-            pilotos_unicos.add(numero)
+        participaciones += len(rows)
+        for numero, nombre, liga, club, moto in rows:
+            if numero not in pilotos:
+                pilotos[numero] = clave_piloto(modalidad, numero, nombre)
             liga_key = _chart_key_liga(liga)
             if liga_key:
                 por_liga[liga_key].add(numero)
@@ -429,190 +210,123 @@ def _analyze_from_by_categoria(by_categoria):
                 por_marca[marca_key].add(numero)
 
     return {
-        "participaciones_totales": total_participaciones,
-        "pilotos_unicos": len(pilotos_unicos),
-        "pilotos_por_liga": {k: len(v) for k, v in sorted(por_liga.items())},
-        "pilotos_por_club": {k: len(v) for k, v in sorted(por_club.items())},
-        "inscripciones_por_marca": {k: len(v) for k, v in sorted(por_marca.items())},
-        "participaciones_por_categoria": dict(sorted(por_categoria.items())),
+        "modalidad": modalidad,
+        "participaciones": participaciones,
+        "pilotos": pilotos,
+        "por_liga": {k: sorted(v) for k, v in sorted(por_liga.items())},
+        "por_club": {k: sorted(v) for k, v in sorted(por_club.items())},
+        "por_marca": {k: sorted(v) for k, v in sorted(por_marca.items())},
+        "por_categoria": dict(sorted(por_categoria.items())),
     }
 
 
+def datos_boceto(b):
+    """Datos del informe (los que lee informe.js) a partir del boceto de una válida."""
+    return {
+        "participaciones_totales": b["participaciones"],
+        "pilotos_unicos": len(b["pilotos"]),
+        "pilotos_por_liga": {k: len(v) for k, v in sorted(b["por_liga"].items())},
+        "pilotos_por_club": {k: len(v) for k, v in sorted(b["por_club"].items())},
+        "inscripciones_por_marca": {k: len(v) for k, v in sorted(b["por_marca"].items())},
+        "participaciones_por_categoria": dict(sorted(b["por_categoria"].items())),
+    }
+
+
+def _analyze_from_by_categoria(by_categoria):
+    return datos_boceto(boceto(by_categoria))
+
+
 def analyze(files_dir, session_priority=None):
     by_categoria = collect_rows_by_category(files_dir, session_priority=session_priority)
     return _analyze_from_by_categoria(by_categoria)
 
 
+def _cache_habilitada():
+    return os.environ.get("FEDEMOTO_INFORMES_CACHE", "1") != "0"
+
+
+def _firma_boceto(config):
+    """Firma de la carpeta, de la lectura (prioridad de sesión, GP) y del código que arma el boceto."""
+    codigo = [
+        os.path.abspath(__file__),
+        os.path.join(ROOT_DIR, "Resultados generales", "enduro_categorias.py"),
+        os.path.join(ROOT_DIR, "Resultados_validas", "escaneo_validas.py"),
+        os.path.join(ROOT_DIR, "Resultados_validas", "normalizacion.py"),
+        os.path.join(ROOT_DIR, "Resultados_validas", "tablas_csv.py"),
+    ]
+    if config.get("gp_colombia"):
+        codigo += [
+            os.path.join(ROOT_DIR, "Resultados_validas", "GP Colombia", "generar_valida_i_gp_vitrix.py"),
+            os.path.join(ROOT_DIR, "Resultados_validas", "Motocross", "Primer semestre", "generar_valida_girardota.py"),
+        ]
+    firma = (
+        BOCETO_VERSION,
+        config.get("modalidad"),
+        escaneo_validas.firma(config["files_dir"]),
+        config.get("session_priority"),
+        bool(config.get("gp_colombia")),
+        escaneo_validas.firma_archivos(codigo),
+    )
+    return hashlib.sha1(repr(firma).encode("utf-8")).hexdigest()
+
+
+def _boceto_file(valida_id):
+    return os.path.join(CACHE_DIR, f"{valida_id}.json")
+
+
+def boceto_valida(config):
+    """
+    Boceto de la válida de `config` (id, modalidad, files_dir y, si aplica, session_priority y
+    gp_colombia). Se toma de `.cache/informes/` si la firma coincide; si no, se lee la carpeta
+    y se guarda.
+    """
+    firma = _firma_boceto(config)
+    path = _boceto_file(config["id"])
+    if _cache_habilitada():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                guardado = json.load(f)
+            if guardado.get("firma") == firma:
+                return guardado["boceto"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    files_dir = config["files_dir"]
+    if config.get("gp_colombia"):
+        by_categoria = collect_rows_gp_colombia(files_dir)
+    else:
+        by_categoria = collect_rows_by_category(files_dir, session_priority=config.get("session_priority"))
+    b = boceto(by_categoria, config.get("modalidad"))
+    if _cache_habilitada():
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"firma": firma, "boceto": b}, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    return b
+
+
 def build_html(datos, title, heading, subtitle, intro, root_rel_prefix):
-    datos_js = json.dumps(datos, ensure_ascii=False)
-    return f"""<!DOCTYPE html>
-<html lang="es">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <link rel="icon" type="image/png" href="{root_rel_prefix}fedemoto-logo.png">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Bebas+Neue&family=Roboto+Condensed:wght@300;400;700&family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: 'Inter', sans-serif; background: #f5f5f5; color: #000; line-height: 1.6; padding: 20px; padding-top: 120px; min-height: 100vh; }}
-        .fixed-header {{ position: fixed; top: 0; left: 0; right: 0; background: #123E92; color: white; z-index: 1000; box-shadow: 0 4px 10px rgba(0,0,0,0.2); }}
-        .header-content {{ max-width: 1400px; margin: 0 auto; display: flex; align-items: center; justify-content: space-between; padding: 15px 30px; }}
-        .logo-container {{ display: flex; align-items: center; gap: 15px; }}
-        .logo-container a {{ display: flex; align-items: center; gap: 15px; text-decoration: none; color: inherit; }}
-        .logo-container img {{ height: 50px; width: auto; }}
-        .nav-menu {{ display: flex; gap: 0; list-style: none; margin: 0; padding: 0; }}
-        .nav-menu li {{ margin: 0; position: relative; }}
-        .nav-menu > li > a {{ display: block; padding: 12px 25px; color: white; text-decoration: none; font-family: 'Roboto Condensed', sans-serif; font-weight: 400; font-size: 1.1em; transition: all 0.2s ease; border-radius: 8px; position: relative; cursor: pointer; }}
-        .nav-menu > li > a:hover {{ background: rgba(255,255,255,0.1); transform: translateY(-2px); }}
-        .dropdown {{ position: relative; }}
-        .dropdown > a::after {{ content: ' ▼'; font-size: 0.8em; margin-left: 5px; }}
-        .nav-menu > .dropdown::before, .dropdown::before {{ content: ''; position: absolute; top: 100%; left: 0; right: 0; height: 5px; background: transparent; z-index: 1001; }}
-        .dropdown-menu .dropdown::before {{ content: ''; position: absolute; top: 0; left: 100%; width: 10px; height: 100%; background: transparent; z-index: 10004; }}
-        .dropdown-menu {{ display: none; position: absolute; top: calc(100% + 5px); left: 0; background: white; min-width: 200px; width: 220px; box-shadow: 0 8px 16px rgba(0,0,0,0.2); border-radius: 8px; z-index: 10001; list-style: none; padding: 0; margin: 0; overflow: visible; border: 1px solid #d1d5db; }}
-        .dropdown-menu .dropdown {{ position: relative; }}
-        .dropdown-menu .dropdown > a {{ position: relative; padding-right: 35px; }}
-        .dropdown-menu .dropdown > a::after {{ content: ' ▶'; position: absolute; right: 15px; top: 50%; transform: translateY(-50%); font-size: 0.8em; margin: 0; }}
-        .dropdown-menu .dropdown .dropdown-menu {{ display: none !important; position: absolute; left: 100%; top: 0; margin-left: 5px; z-index: 10003; min-width: 180px; background: white; box-shadow: 0 8px 16px rgba(0,0,0,0.2); border-radius: 8px; overflow: visible; border: 1px solid #d1d5db; }}
-        .nav-menu > .dropdown:nth-child(3) .dropdown-menu .dropdown .dropdown-menu, .nav-menu > .dropdown:nth-child(4) .dropdown-menu .dropdown .dropdown-menu, .nav-menu > .dropdown:nth-child(5) .dropdown-menu .dropdown .dropdown-menu {{ left: auto !important; right: 100% !important; margin-left: 0 !important; margin-right: 5px !important; }}
-        .dropdown-menu .dropdown:hover > .dropdown-menu {{ display: block !important; }}
-        .nav-menu > .dropdown:hover > .dropdown-menu, .nav-menu > .dropdown.active > .dropdown-menu {{ display: block; animation: fadeInDown 0.3s ease; }}
-        @keyframes fadeInDown {{ from {{ opacity: 0; transform: translateY(-10px); }} to {{ opacity: 1; transform: translateY(0); }} }}
-        .dropdown-menu li {{ margin: 0; position: relative; }}
-        .dropdown-menu a {{ display: block; padding: 12px 20px; color: #000; text-decoration: none; font-family: 'Inter', sans-serif; font-size: 1em; font-weight: 400; transition: all 0.2s ease; border-bottom: 1px solid #f0f0f0; }}
-        .dropdown-menu a:last-child {{ border-bottom: none; }}
-        .dropdown-menu a:hover {{ background: #f8f9fa; color: #123E92; }}
-        .container {{ max-width: 1400px; margin: 0 auto; background: white; border-radius: 12px; box-shadow: 0 20px 60px rgba(0,0,0,0.15); overflow: hidden; margin-bottom: 40px; }}
-        .container > header {{ background: linear-gradient(135deg, #123E92 0%, #0f3377 100%); color: white; padding: 40px; text-align: center; }}
-        .container > header h1 {{ font-family: 'Bebas Neue', sans-serif; font-size: 2.2em; margin-bottom: 10px; letter-spacing: 2px; }}
-        .container > header p {{ font-family: 'Roboto Condensed', sans-serif; font-size: 1.2em; opacity: 0.95; }}
-        .stats-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 20px; padding: 30px 40px; background: #f8f9fa; border-bottom: 1px solid #e0e0e0; }}
-        .stat-card {{ background: white; padding: 24px; border-radius: 8px; box-shadow: 0 4px 12px rgba(0,0,0,0.08); text-align: center; }}
-        .stat-card .number {{ font-family: 'Bebas Neue', sans-serif; font-size: 2.5em; color: #123E92; margin-bottom: 8px; letter-spacing: 2px; }}
-        .stat-card .label {{ font-family: 'Roboto Condensed', sans-serif; font-size: 0.95em; color: #374151; text-transform: uppercase; letter-spacing: 0.5px; }}
-        .section {{ padding: 35px 40px; border-bottom: 1px solid #e0e0e0; }}
-        .section:last-child {{ border-bottom: none; }}
-        .section h2 {{ font-family: 'Bebas Neue', sans-serif; font-size: 1.8em; color: #123E92; margin-bottom: 22px; padding-bottom: 12px; border-bottom: 3px solid #F7C31D; letter-spacing: 1px; }}
-        .chart-columns {{ display: flex; flex-direction: column; gap: 12px; }}
-        .chart-row {{ display: flex; align-items: center; gap: 12px; min-height: 36px; }}
-        .chart-row .label {{ flex: 0 0 220px; font-size: 0.95em; font-weight: 500; color: #111; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }}
-        .chart-row .bar-wrap {{ flex: 1 1 200px; height: 28px; background: #e5e7eb; border-radius: 6px; overflow: hidden; min-width: 0; }}
-        .chart-row .bar {{ height: 100%; background: linear-gradient(90deg, #123E92 0%, #1a52b8 100%); border-radius: 6px; min-width: 4px; }}
-        .chart-row .value {{ flex: 0 0 42px; font-family: 'Bebas Neue', sans-serif; font-size: 1.2em; color: #123E92; text-align: right; letter-spacing: 1px; }}
-        .intro-message {{ padding: 28px 40px; background: #f0f4fc; border-left: 5px solid #123E92; border-radius: 0 8px 8px 0; font-size: 1em; line-height: 1.75; color: #1f2937; margin-bottom: 8px; }}
-        .footer-informe {{ background: #f8f9fa; padding: 24px 40px; text-align: center; color: #666; font-size: 0.9em; border-top: 1px solid #e0e0e0; }}
-        .footer-informe .developer {{ font-family: 'Roboto Condensed', sans-serif; font-weight: 700; color: #123E92; }}
-        @media (max-width: 1024px) {{
-            body {{ padding: 12px; padding-top: 105px; }}
-            .header-content {{ padding: 10px 14px; gap: 10px; }}
-            .nav-menu > li > a {{ padding: 10px 14px; font-size: 1em; }}
-            .container > header {{ padding: 28px 20px; }}
-            .stats-grid {{ grid-template-columns: repeat(2, minmax(0, 1fr)); padding: 20px; gap: 12px; }}
-            .section {{ padding: 24px 20px; }}
-            .intro-message {{ padding: 20px; margin: 0 10px 8px; }}
-        }}
-        @media (max-width: 768px) {{
-            body {{ padding: 8px; padding-top: 96px; }}
-            .header-content {{ align-items: flex-start; flex-direction: column; }}
-            .logo-container img {{ height: 42px; }}
-            .nav-menu {{ width: 100%; overflow-x: auto; white-space: nowrap; padding-bottom: 4px; }}
-            .nav-menu > li > a {{ padding: 9px 12px; font-size: 0.95em; }}
-            .dropdown-menu {{ min-width: 180px; width: 190px; }}
-            .container {{ border-radius: 10px; }}
-            .container > header h1 {{ font-size: 1.7em; letter-spacing: 1px; }}
-            .container > header p {{ font-size: 1em; }}
-            .stats-grid {{ grid-template-columns: 1fr; }}
-            .stat-card {{ padding: 16px; }}
-            .stat-card .number {{ font-size: 2em; }}
-            .section h2 {{ font-size: 1.5em; margin-bottom: 14px; }}
-            .chart-row {{ align-items: flex-start; flex-direction: column; gap: 6px; }}
-            .chart-row .label {{ flex: 0 0 auto; width: 100%; white-space: normal; }}
-            .chart-row .bar-wrap {{ width: 100%; }}
-            .chart-row .value {{ flex: 0 0 auto; width: 100%; text-align: left; }}
-        }}
-        @media (max-width: 480px) {{
-            .container > header {{ padding: 22px 14px; }}
-            .intro-message {{ padding: 14px; margin: 0 6px 8px; font-size: 0.92em; }}
-            .section {{ padding: 18px 14px; }}
-            .footer-informe {{ padding: 18px 14px; }}
-        }}
-    </style>
-</head>
-<body>
-    <div id="menu-container"></div>
-    <div class="container">
-        <header>
-            <h1>{heading}</h1>
-            <p>{subtitle}</p>
-        </header>
-        <div class="stats-grid" id="statsGrid"></div>
-        <div class="intro-message">
-            <p>{intro}</p>
-            <p>Este informe se basa en las planillas oficiales exportadas para cada categoría.</p>
-        </div>
-        <div class="section">
-            <h2>Pilotos únicos por liga</h2>
-            <div class="chart-columns" id="porLiga"></div>
-        </div>
-        <div class="section">
-            <h2>Participaciones por categoría</h2>
-            <div class="chart-columns" id="porCategoria"></div>
-        </div>
-        <div class="section">
-            <h2>Inscripciones por marca</h2>
-            <div class="chart-columns" id="porMarca"></div>
-        </div>
-        <div class="section">
-            <h2>Pilotos únicos por club</h2>
-            <div class="chart-columns" id="porClub"></div>
-        </div>
-        <div class="footer-informe">
-            <p><span class="developer">Developed by Mauricio Sánchez Aguilar - Fedemoto</span></p>
-            <p>Este proyecto es de uso interno de FEDEMOTO.</p>
-        </div>
-    </div>
-    <script src="{root_rel_prefix}load-menu.js"></script>
-    <script>
-        (function() {{
-            var datos = {datos_js};
-            var stats = [
-                {{ num: datos.participaciones_totales, label: 'Participaciones totales' }},
-                {{ num: datos.pilotos_unicos, label: 'Pilotos participantes' }},
-                {{ num: Object.keys(datos.pilotos_por_liga).length, label: 'Ligas' }},
-                {{ num: Object.keys(datos.pilotos_por_club).length, label: 'Clubes' }},
-                {{ num: Object.keys(datos.inscripciones_por_marca).length, label: 'Marcas' }}
-            ];
-            var grid = document.getElementById('statsGrid');
-            stats.forEach(function(s) {{
-                var card = document.createElement('div');
-                card.className = 'stat-card';
-                card.innerHTML = '<div class="number">' + s.num + '</div><div class="label">' + s.label + '</div>';
-                grid.appendChild(card);
-            }});
-            function escapeHtml(t) {{ return (t+'').replace(/&/g,'&amp;').replace(/</g,'&lt;').replace(/>/g,'&gt;').replace(/"/g,'&quot;'); }}
-            function fillChart(id, obj) {{
-                var el = document.getElementById(id);
-                var entries = Object.keys(obj).map(function(k) {{ return [k, obj[k]]; }}).sort(function(a, b) {{ return b[1] - a[1]; }});
-                var maxVal = entries.length ? Math.max.apply(null, entries.map(function(e) {{ return e[1]; }})) : 1;
-                entries.forEach(function(e) {{
-                    var row = document.createElement('div');
-                    row.className = 'chart-row';
-                    var pct = maxVal > 0 ? (e[1] / maxVal * 100) : 0;
-                    row.innerHTML = '<span class="label" title="' + escapeHtml(e[0]) + '">' + escapeHtml(e[0]) + '</span><div class="bar-wrap"><div class="bar" style="width:' + pct + '%"></div></div><span class="value">' + e[1] + '</span>';
-                    el.appendChild(row);
-                }});
-            }}
-            fillChart('porLiga', datos.pilotos_por_liga);
-            fillChart('porCategoria', datos.participaciones_por_categoria);
-            fillChart('porMarca', datos.inscripciones_por_marca);
-            fillChart('porClub', datos.pilotos_por_club);
-        }})();
-    </script>
-</body>
-</html>
-"""
+    """Página del informe (layout plantillas_html/informe_valida.html)."""
+    return plantillas.render(
+        "informe_valida.html",
+        title=title,
+        root=root_rel_prefix,
+        estilos=recursos_estaticos.estilos_head(("fuentes_sitio.html", "informe.css"), root_rel_prefix),
+        heading=heading,
+        subtitle=subtitle,
+        intro=(
+            f"            <p>{intro}</p>\n"
+            "            <p>Este informe se basa en las planillas oficiales exportadas para cada categoría.</p>\n"
+        ),
+        secciones_extra="",
+        datos_js=json.dumps(datos, ensure_ascii=False),
+        script=recursos_estaticos.url("informe.js", root_rel_prefix),
+    )
 
 
 def generate_report(config):
@@ -621,7 +335,9 @@ def generate_report(config):
     if not os.path.isdir(files_dir):
         raise FileNotFoundError(f"No existe carpeta de entrada: {files_dir}")
     os.makedirs(os.path.dirname(output_html), exist_ok=True)
-    if config.get("gp_colombia"):
+    if config.get("id"):
+        datos = datos_boceto(boceto_valida(config))
+    elif config.get("gp_colombia"):
         datos = analyze_gp_colombia(files_dir)
     else:
         datos = analyze(files_dir, session_priority=config.get("session_priority"))
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Almacén persistente de resultados generales por campeonato.
+
+Por cada campeonato se guarda en `.cache/resultados_generales/<id>.pickle`:
+
+  - las filas y los asistentes por categoría de cada válida ya leídos (`DatosValida`), con
+    la firma de su carpeta FILES EXPORTED (nombre, tamaño y mtime de cada CSV, de
+    escaneo_validas.firma);
+  - la tabla general ya calculada, por categoría.
+
+`build_general_table` (generar_resultados_generales.py) solo relee las válidas cuya firma
+cambió y solo recalcula las categorías cuyas filas cambiaron en alguna válida; el resto se
+toma tal cual del almacén. Publicar los resultados de la última válida del fin de semana
+cuesta leer esa carpeta y recalcular sus categorías, aunque la temporada siga creciendo.
+
+Si cambian el código que arma las filas (firma de `codigo`), la versión del almacén o la
+lectura (modalidad / GP) se descarta todo; si cambian las válidas o el bono, se conservan
+las filas leídas y se recalculan todas las categorías. `FEDEMOTO_GENERALES_CACHE=0`
+desactiva el almacén.
+"""
+from __future__ import annotations
+
+import os
+import pickle
+import threading
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+STORE_DIR = os.path.join(ROOT_DIR, ".cache", "resultados_generales")
+STORE_VERSION = 1
+
+
+def habilitado():
+    return os.environ.get("FEDEMOTO_GENERALES_CACHE", "1") != "0"
+
+
+def _store_file(champ_id):
+    return os.path.join(STORE_DIR, f"{champ_id}.pickle")
+
+
+def vacio(codigo, lectura):
+    return {"version": STORE_VERSION, "codigo": codigo, "lectura": lectura, "config": None, "validas": {}, "tabla": {}}
+
+
+def cargar(champ_id, codigo, lectura):
+    """
+    Almacén del campeonato. Si no existe, está dañado o fue armado con otro código u otra
+    lectura, se devuelve uno vacío.
+    """
+    if not habilitado():
+        return vacio(codigo, lectura)
+    try:
+        with open(_store_file(champ_id), "rb") as f:
+            almacen = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError):
+        return vacio(codigo, lectura)
+    if (
+        not isinstance(almacen, dict)
+        or almacen.get("version") != STORE_VERSION
+        or almacen.get("codigo") != codigo
+        or almacen.get("lectura") != lectura
+    ):
+        return vacio(codigo, lectura)
+    return almacen
+
+
+def guardar(champ_id, almacen):
+    if not habilitado():
+        return
+    path = _store_file(champ_id)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(STORE_DIR, exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump(almacen, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
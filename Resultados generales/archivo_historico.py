@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+"""
+Archivo histórico de resultados entre temporadas (SQLite).
+
+Guarda, sin reescribir nunca lo ya archivado:
+
+  resultados            una fila por piloto y categoría de cada válida (N°, nombre, liga, club,
+                        moto, puntos y puesto por puntos en la categoría; vacío si empata)
+  posiciones_generales  la tabla general de cada campeonato (puesto, total) al archivarla
+  fuentes               de dónde salió cada lote (carpeta FILES EXPORTED, campeonato o hoja del
+                        Excel de inscripciones) con su firma
+
+Cuando una válida se corrige se agrega un lote nuevo y el anterior queda con `vigente = 0`;
+las consultas solo miran lotes vigentes. Los índices por N°, nombre normalizado, categoría,
+liga y modalidad hacen que preguntas como "todos los resultados del #714 desde 2025" o "el
+medallero de ligas por año" se respondan sin volver a leer ningún CSV.
+
+Las válidas de 2026 salen de CHAMPIONSHIPS (generar_resultados_generales.py). Del Excel de
+inscripciones de 2025 solo hay participaciones (N° y liga por categoría, sin puestos ni
+puntos): `importar-excel` las agrega con puesto y puntos vacíos (requiere pandas), con la
+modalidad del registro que corresponde a cada hoja ("Moto GP" → GP Colombia, "Velotierra 2do
+semestre" → Velotierra, campeonato "Segundo semestre").
+
+Uso:
+    python "Resultados generales/archivo_historico.py" actualizar
+    python "Resultados generales/archivo_historico.py" importar-excel "excel para informe general 2025.xlsx" --temporada 2025
+    python "Resultados generales/archivo_historico.py" piloto 714 --desde 2025
+    python "Resultados generales/archivo_historico.py" piloto --nombre "Miguel Angel Lopez"
+    python "Resultados generales/archivo_historico.py" medallero --temporada 2026
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from collections import Counter
+from datetime import datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, ".."))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import generar_resultados_generales as generales
+import escaneo_validas
+import normalizacion
+from identidad_pilotos import clave_nombre
+
+# Fuera de git (.gitignore): el sitio se publica desde el árbol del repositorio y el archivo no
+# se puede rearmar como las cachés de .cache/, así que vive en su propia carpeta.
+DB_PATH = os.path.join(ROOT_DIR, "historico", "historico_resultados.sqlite")
+# Forma de los lotes: va en la firma, así que cambiarla vuelve a archivar (el lote viejo queda
+# con vigente = 0).
+FORMATO_LOTES = 2
+
+# Hojas del Excel de inscripciones: nombres de modalidad distintos a los del registro y sufijo
+# de semestre → campeonato.
+MODALIDADES_EXCEL = {"motogp": "GP Colombia"}
+SEMESTRES_EXCEL = {"1ersemestre": "Primer semestre", "2dosemestre": "Segundo semestre"}
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS fuentes (
+    id INTEGER PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    temporada TEXT NOT NULL,
+    modalidad TEXT NOT NULL,
+    campeonato TEXT NOT NULL,
+    etiqueta TEXT NOT NULL,
+    origen TEXT NOT NULL,
+    firma TEXT NOT NULL,
+    importado TEXT NOT NULL,
+    vigente INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS resultados (
+    fuente INTEGER NOT NULL REFERENCES fuentes(id),
+    temporada TEXT NOT NULL,
+    modalidad TEXT NOT NULL,
+    categoria TEXT NOT NULL,
+    posicion INTEGER,
+    numero TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    nombre_clave TEXT NOT NULL,
+    liga TEXT NOT NULL,
+    liga_clave TEXT NOT NULL,
+    club TEXT NOT NULL,
+    moto TEXT NOT NULL,
+    clase TEXT NOT NULL,
+    puntos REAL
+);
+CREATE TABLE IF NOT EXISTS posiciones_generales (
+    fuente INTEGER NOT NULL REFERENCES fuentes(id),
+    temporada TEXT NOT NULL,
+    modalidad TEXT NOT NULL,
+    categoria TEXT NOT NULL,
+    posicion INTEGER NOT NULL,
+    numero TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    nombre_clave TEXT NOT NULL,
+    liga TEXT NOT NULL,
+    liga_clave TEXT NOT NULL,
+    total REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fuentes_origen ON fuentes (tipo, origen, vigente);
+CREATE INDEX IF NOT EXISTS resultados_fuente ON resultados (fuente);
+CREATE INDEX IF NOT EXISTS resultados_numero ON resultados (numero, temporada);
+CREATE INDEX IF NOT EXISTS resultados_nombre ON resultados (nombre_clave, temporada);
+CREATE INDEX IF NOT EXISTS resultados_categoria ON resultados (categoria, temporada);
+CREATE INDEX IF NOT EXISTS resultados_liga ON resultados (liga_clave, temporada);
+CREATE INDEX IF NOT EXISTS resultados_modalidad ON resultados (modalidad, temporada);
+CREATE INDEX IF NOT EXISTS generales_fuente ON posiciones_generales (fuente);
+CREATE INDEX IF NOT EXISTS generales_podio ON posiciones_generales (temporada, posicion, liga_clave);
+CREATE INDEX IF NOT EXISTS generales_numero ON posiciones_generales (numero, temporada);
+"""
+
+
+def clave_liga(liga):
+    """Liga para agrupar entre temporadas: mayúsculas, sin tildes ni espacios repetidos."""
+    return normalizacion.mayusculas(liga)
+
+
+def conectar(path=DB_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    con = sqlite3.connect(path)
+    con.row_factory = sqlite3.Row
+    con.executescript(ESQUEMA)
+    return con
+
+
+def _firma(valor):
+    valor = [FORMATO_LOTES, valor]
+    return hashlib.sha1(json.dumps(valor, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _rel(path):
+    return os.path.relpath(path, ROOT_DIR).replace("\\", "/")
+
+
+def _lote_vigente(con, tipo, origen):
+    return con.execute(
+        "SELECT id, firma FROM fuentes WHERE tipo = ? AND origen = ? AND vigente = 1", (tipo, origen)
+    ).fetchone()
+
+
+def _nuevo_lote(con, tipo, temporada, modalidad, campeonato, etiqueta, origen, firma):
+    """Agrega un lote (y deja de usar el anterior del mismo origen). Retorna su id."""
+    con.execute("UPDATE fuentes SET vigente = 0 WHERE tipo = ? AND origen = ? AND vigente = 1", (tipo, origen))
+    cur = con.execute(
+        "INSERT INTO fuentes (tipo, temporada, modalidad, campeonato, etiqueta, origen, firma, importado) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (tipo, temporada, modalidad, campeonato, etiqueta, origen, firma, datetime.now().isoformat(timespec="seconds")),
+    )
+    return cur.lastrowid
+
+
+def puestos_por_puntos(rows):
+    """
+    Puesto de cada fila por puntos en la categoría. Las filas no traen el desempate de la
+    válida, así que las empatadas en puntos quedan sin puesto (None).
+    """
+    puntos = [float(r["puntos"] or 0) for r in rows]
+    cuantos = Counter(puntos)
+    mejores = 0
+    puesto_de = {}
+    for p in sorted(cuantos, reverse=True):
+        puesto_de[p] = mejores + 1 if cuantos[p] == 1 else None
+        mejores += cuantos[p]
+    return [puesto_de[p] for p in puntos]
+
+
+def modalidad_hoja(sheet_name, temporada):
+    """
+    (modalidad, campeonato) de una hoja del Excel de inscripciones según las modalidades del
+    registro: "Velotierra 2do semestre" → ("Velotierra", "Segundo semestre"), "Moto GP" →
+    ("GP Colombia", "Campeonato <temporada>"). ValueError si la hoja no es de una modalidad.
+    """
+    clave = clave_nombre(sheet_name)
+    modalidades = {clave_nombre(c["modalidad"]): c["modalidad"] for c in generales.CHAMPIONSHIPS}
+    modalidades.update(MODALIDADES_EXCEL)
+    for prefijo in sorted(modalidades, key=len, reverse=True):
+        resto = clave[len(prefijo):]
+        if clave.startswith(prefijo) and (not resto or resto in SEMESTRES_EXCEL):
+            return modalidades[prefijo], SEMESTRES_EXCEL.get(resto, f"Campeonato {temporada}")
+    raise ValueError(f"Hoja '{sheet_name}' sin modalidad del registro ({', '.join(sorted(set(modalidades.values())))})")
+
+
+def archivar_campeonato(con, champ, temporada=None):
+    """
+    Archiva las válidas nuevas o corregidas del campeonato y su tabla general. Retorna
+    (válidas archivadas, si se archivó la tabla general).
+    """
+    temporada = str(temporada or champ.get("temporada", generales.TEMPORADA))
+    modalidad = champ["modalidad"]
+    archivadas = 0
+    firmas = []
+    for v in champ["validas"]:
+        origen = _rel(v["files_dir"])
+        firma = _firma(escaneo_validas.firma(v["files_dir"]))
+        firmas.append(firma)
+        previo = _lote_vigente(con, "valida", origen)
+        if previo is not None and previo["firma"] == firma:
+            continue
+        datos = generales.load_valida_data(champ, v["files_dir"])
+        lote = _nuevo_lote(con, "valida", temporada, modalidad, champ["campeonato"], v["label"], origen, firma)
+        filas = []
+        for categoria, rows in datos.filas.items():
+            for row, puesto in zip(rows, puestos_por_puntos(rows)):
+                filas.append((
+                    lote, temporada, modalidad, categoria, puesto,
+                    row["numero"], row["nombre"], clave_nombre(row["nombre"]),
+                    row["liga"], clave_liga(row["liga"]), row["club"], row["moto"], row.get("clase", ""),
+                    row["puntos"],
+                ))
+        con.executemany("INSERT INTO resultados VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", filas)
+        archivadas += 1
+
+    origen = champ.get("id") or _rel(champ["output_html"])
+    firma = _firma([firmas, champ.get("final_valida_bonus", 0)])
+    previo = _lote_vigente(con, "general", origen)
+    general = previo is None or previo["firma"] != firma
+    if general:
+        tabla = generales.build_general_table(champ)
+        lote = _nuevo_lote(
+            con, "general", temporada, modalidad, champ["campeonato"],
+            f"Resultados generales {modalidad} - {champ['campeonato']}", origen, firma,
+        )
+        filas = []
+        for categoria, rows in tabla.items():
+            for puesto, row in enumerate(rows, start=1):
+                filas.append((
+                    lote, temporada, modalidad, categoria, puesto,
+                    row["numero"], row["nombre"], clave_nombre(row["nombre"]),
+                    row["liga"], clave_liga(row["liga"]), row["total"],
+                ))
+        con.executemany("INSERT INTO posiciones_generales VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", filas)
+    con.commit()
+    return archivadas, general
+
+
+def importar_excel(con, excel_path, temporada):
+    """
+    Participaciones del Excel de inscripciones (una hoja por modalidad, pares de columnas
+    N° + liga por categoría, como en analizar_excel_completo.py). Retorna hojas importadas.
+    """
+    import pandas as pd
+    import libro_excel
+
+    firma = _firma(libro_excel.firma(excel_path))
+    importadas = 0
+    hojas = [(sheet_name, *modalidad_hoja(sheet_name, temporada)) for sheet_name in libro_excel.hojas(excel_path)]
+    for sheet_name, modalidad, campeonato in hojas:
+        origen = f"{_rel(os.path.abspath(excel_path))}#{sheet_name}"
+        previo = _lote_vigente(con, "inscripciones", origen)
+        if previo is not None and previo["firma"] == firma:
+            continue
+        df = libro_excel.leer_hoja(excel_path, sheet_name)
+        columnas = list(df.columns)
+        filas = []
+        lote = _nuevo_lote(con, "inscripciones", str(temporada), modalidad, campeonato, sheet_name, origen, firma)
+        i = 0
+        while i < len(columnas):
+            if str(columnas[i]).startswith("Unnamed"):
+                i += 1
+                continue
+            categoria = str(columnas[i])
+            if i + 1 < len(columnas):
+                for numero, liga in zip(df[columnas[i]], df[columnas[i + 1]]):
+                    if pd.isna(numero) or pd.isna(liga) or not clave_liga(liga):
+                        continue
+                    numero = str(int(numero)) if isinstance(numero, float) and numero.is_integer() else str(numero).strip()
+                    filas.append((
+                        lote, str(temporada), modalidad, categoria, None,
+                        numero, "", "", str(liga).strip(), clave_liga(liga), "", "", "", None,
+                    ))
+            i += 2
+        con.executemany("INSERT INTO resultados VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", filas)
+        importadas += 1
+    con.commit()
+    return importadas
+
+
+def resultados_piloto(con, numero=None, nombre=None, desde=None, modalidad=None):
+    """Resultados vigentes de un piloto por N° y/o nombre, del más antiguo al más reciente."""
+    where, params = ["f.vigente = 1"], []
+    if numero:
+        where.append("r.numero = ?")
+        params.append(str(numero).strip())
+    if nombre:
+        where.append("r.nombre_clave = ?")
+        params.append(clave_nombre(nombre))
+    if desde:
+        where.append("r.temporada >= ?")
+        params.append(str(desde))
+    if modalidad:
+        where.append("r.modalidad = ?")
+        params.append(modalidad)
+    return con.execute(
+        "SELECT r.temporada, r.modalidad, f.campeonato, f.etiqueta AS valida, r.categoria, r.posicion, "
+        "r.numero, r.nombre, r.liga, r.puntos "
+        "FROM resultados r JOIN fuentes f ON f.id = r.fuente "
+        f"WHERE {' AND '.join(where)} ORDER BY r.temporada, f.id, r.categoria",
+        params,
+    ).fetchall()
+
+
+def medallero_ligas(con, temporada=None):
+    """1°, 2° y 3° puestos de las tablas generales vigentes por liga y temporada."""
+    where, params = ["f.vigente = 1", "p.posicion <= 3", "p.liga_clave != ''"], []
+    if temporada:
+        where.append("p.temporada = ?")
+        params.append(str(temporada))
+    return con.execute(
+        "SELECT p.temporada, p.liga_clave AS liga, "
+        "SUM(p.posicion = 1) AS primeros, SUM(p.posicion = 2) AS segundos, SUM(p.posicion = 3) AS terceros "
+        "FROM posiciones_generales p JOIN fuentes f ON f.id = p.fuente "
+        f"WHERE {' AND '.join(where)} "
+        "GROUP BY p.temporada, p.liga_clave "
+        "ORDER BY p.temporada, primeros DESC, segundos DESC, terceros DESC, liga",
+        params,
+    ).fetchall()
+
+
+def _fmt(v):
+    if v is None:
+        return "-"
+    if isinstance(v, float):
+        return generales.fmt_points(v)
+    return str(v)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Archivo histórico de resultados (SQLite).")
+    parser.add_argument("--db", default=DB_PATH, help="Archivo SQLite (por defecto historico/historico_resultados.sqlite).")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    sub.add_parser("actualizar", help="Archiva las válidas nuevas o corregidas y las tablas generales de CHAMPIONSHIPS.")
+    p_excel = sub.add_parser("importar-excel", help="Agrega las participaciones del Excel de inscripciones (requiere pandas).")
+    p_excel.add_argument("excel")
+    p_excel.add_argument("--temporada", required=True)
+    p_piloto = sub.add_parser("piloto", help="Resultados de un piloto por N° y/o nombre.")
+    p_piloto.add_argument("numero", nargs="?")
+    p_piloto.add_argument("--nombre")
+    p_piloto.add_argument("--desde", help="Temporada inicial (p. ej. 2025).")
+    p_piloto.add_argument("--modalidad")
+    p_medallero = sub.add_parser("medallero", help="Podios de las tablas generales por liga y temporada.")
+    p_medallero.add_argument("--temporada")
+    args = parser.parse_args(argv)
+
+    con = conectar(args.db)
+    if args.comando == "actualizar":
+        for champ in generales.CHAMPIONSHIPS:
+            archivadas, general = archivar_campeonato(con, champ)
+            print(f"{champ['id']}: {archivadas} válida(s) archivada(s)" + (", tabla general archivada" if general else ""))
+    elif args.comando == "importar-excel":
+        try:
+            print(f"{importar_excel(con, args.excel, args.temporada)} hoja(s) importada(s)")
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.comando == "piloto":
+        if not args.numero and not args.nombre:
+            parser.error("indicar N° y/o --nombre")
+        for r in resultados_piloto(con, args.numero, args.nombre, args.desde, args.modalidad):
+            print(" | ".join(_fmt(r[k]) for k in r.keys()))
+    elif args.comando == "medallero":
+        print("temporada | liga | 1° | 2° | 3°")
+        for r in medallero_ligas(con, args.temporada):
+            print(f"{r['temporada']} | {r['liga']} | {r['primeros']} | {r['segundos']} | {r['terceros']}")
+    con.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,18 @@
 # -*- coding: utf-8 -*-
 """
 Unifica nombres de categoría entre archivos exportados (p. ej. 'e1' vs 'enduro 1').
+
+_BY_NORM está indexado por la clave normalizada (normalizacion.clave) y cada nombre de
+categoría se resuelve una sola vez por proceso.
 """
-import re
-import unicodedata
+import os
+import sys
+from functools import lru_cache
+
+_RV_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Resultados_validas")
+if _RV_ROOT not in sys.path:
+    sys.path.insert(0, _RV_ROOT)
+import normalizacion
 
 _BY_NORM = {
     "e1": "Enduro 1",
@@ -37,16 +46,9 @@ _BY_NORM = {
 }
 
 
-def _normalize_key(text):
-    s = str(text or "").strip().lower()
-    s = "".join(c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn")
-    s = re.sub(r"[^a-z0-9]+", "", s)
-    return s
-
-
+@lru_cache(maxsize=1024, typed=True)
 def canonical_enduro_categoria(cat):
     """Devuelve el nombre canónico de categoría (como en la I válida) o el mismo texto si no aplica."""
     if not cat or not str(cat).strip():
         return cat
-    k = _normalize_key(cat)
-    return _BY_NORM.get(k, cat)
+    return _BY_NORM.get(normalizacion.clave(cat), cat)
@@ -3,182 +3,40 @@
 Generador de resultados generales por modalidad/campeonato.
 """
 
-import csv
 import html
 import json
 import os
 import re
 import sys
-import unicodedata
 from datetime import datetime
-from collections import defaultdict
 
 ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+_RV_ROOT = os.path.join(ROOT_DIR, "Resultados_validas")
+if _RV_ROOT not in sys.path:
+    sys.path.insert(0, _RV_ROOT)
+import almacen_posiciones
+import identidad_pilotos
 from enduro_categorias import canonical_enduro_categoria
+import escaneo_validas
+import normalizacion
+import plantillas
+import recursos_estaticos
+import registro_temporada
+import tabla_puntos
+import tablas_csv
 
 
-CHAMPIONSHIPS = [
-    {
-        "id": "enduro_2026",
-        "modalidad": "Enduro",
-        "campeonato": "Campeonato 2026",
-        "validas": [
-            {
-                "label": "I Válida Enduro 2026",
-                "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Enduro", "Primera valida", "FILES EXPORTED"),
-            },
-            {
-                "label": "II Válida Enduro - Pasca",
-                "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Enduro", "Segunda valida", "FILES EXPORTED"),
-            },
-            {
-                "label": "III Válida Enduro - San Jerónimo",
-                "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Enduro", "Tercera valida", "FILES EXPORTED"),
-            },
-        ],
-        "output_html": os.path.join(SCRIPT_DIR, "Enduro", "resultado_general_enduro_2026.html"),
-    },
-    {
-        "id": "motocross_1s",
-        "modalidad": "Motocross",
-        "campeonato": "Primer semestre",
-        "validas": [
-            {
-                "label": "I Válida MX - Girardota",
-                "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Motocross", "Primer semestre", "FILES EXPORTED-girardota"),
-            },
-            {
-                "label": "II Válida MX - Barranquilla",
-                "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Motocross", "Primer semestre", "FILES EXPORTED-barranquilla"),
-            },
-            {
-                "label": "III Válida MX - Tocancipá",
-                "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Motocross", "Primer semestre", "FILES EXPORTED-tocancipa"),
-            },
-            {
-                "label": "IV Válida MX - Manizales",
-                "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Motocross", "Primer semestre", "FILES EXPORTED-manizales"),
-            },
-        ],
-        "final_valida_bonus": 8,
-        "output_html": os.path.join(SCRIPT_DIR, "Motocross", "Primer semestre", "resultado_general_mx_primer_semestre.html"),
-    },
-    {
-        "id": "velocidad_1s",
-        "modalidad": "Velocidad",
-        "campeonato": "Primer semestre",
-        "validas": [
-            {
-                "label": "I Válida Velocidad - Zarzal",
-                "files_dir": os.path.join(
-                    ROOT_DIR, "Resultados_validas", "Velocidad", "Primer semestre", "FILES EXPORTED_ZARZAL"
-                ),
-            },
-            {
-                "label": "II Válida Velocidad - Chachagüi",
-                "files_dir": os.path.join(
-                    ROOT_DIR, "Resultados_validas", "Velocidad", "Primer semestre", "FILES EXPORTED_CHACHAGUI"
-                ),
-            },
-            {
-                "label": "III Válida Velocidad - Popayán",
-                "files_dir": os.path.join(
-                    ROOT_DIR, "Resultados_validas", "Velocidad", "Primer semestre", "FILES EXPORTED_POPAYAN"
-                ),
-            },
-        ],
-        "final_valida_bonus": 8,
-        "output_html": os.path.join(
-            SCRIPT_DIR, "Velocidad", "Primer semestre", "resultado_general_velocidad_primer_semestre.html"
-        ),
-    },
-    {
-        "id": "velocidad_2s",
-        "modalidad": "Velocidad",
-        "campeonato": "Segundo semestre",
-        "validas": [
-            {
-                "label": "I Válida Velocidad - Manizales",
-                "files_dir": os.path.join(
-                    ROOT_DIR, "Resultados_validas", "Velocidad", "Segundo semestre", "FILES EXPORTED_MANIZALES"
-                ),
-            },
-        ],
-        "final_valida_bonus": 8,
-        "output_html": os.path.join(
-            SCRIPT_DIR, "Velocidad", "Segundo semestre", "resultado_general_velocidad_segundo_semestre.html"
-        ),
-    },
-    {
-        "id": "velotierra_1s",
-        "modalidad": "Velotierra",
-        "campeonato": "Primer semestre",
-        "validas": [
-            {
-                "label": "I Válida VT - Tuluá",
-                "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Velotierra", "Primer semestre", "FILES EXPORTED_tulua"),
-            },
-            {
-                "label": "II Válida VT - Barcelona",
-                "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Velotierra", "Primer semestre", "FILES EXPORTED_barcelona"),
-            },
-            {
-                "label": "III Válida VT - Ibagué",
-                "files_dir": os.path.join(ROOT_DIR, "Resultados_validas", "Velotierra", "Primer semestre", "FILES EXPORTED_ibague"),
-            },
-        ],
-        "final_valida_bonus": 8,
-        "output_html": os.path.join(SCRIPT_DIR, "Velotierra", "Primer semestre", "resultado_general_vt_primer_semestre.html"),
-    },
-    {
-        "id": "velotierra_2s",
-        "modalidad": "Velotierra",
-        "campeonato": "Segundo semestre",
-        "validas": [
-            {
-                "label": "I Válida VT - Villa Garzón",
-                "files_dir": os.path.join(
-                    ROOT_DIR,
-                    "Resultados_validas",
-                    "Velotierra",
-                    "Segundo semestre",
-                    "FILES EXPORTED_Villa garzón",
-                ),
-            },
-        ],
-        "final_valida_bonus": 8,
-        "output_html": os.path.join(
-            SCRIPT_DIR, "Velotierra", "Segundo semestre", "resultado_general_vt_segundo_semestre.html"
-        ),
-    },
-    {
-        "id": "gp_colombia_2026",
-        "modalidad": "GP Colombia",
-        "campeonato": "Campeonato 2026",
-        "gp_colombia": True,
-        "validas": [
-            {
-                "label": "I Válida GP Colombia - Gran Premio Vitrix",
-                "files_dir": os.path.join(
-                    ROOT_DIR,
-                    "Resultados_validas",
-                    "GP Colombia",
-                    "FILES EXPORTED_Gran Premio Vitrix",
-                ),
-            },
-        ],
-        "output_html": os.path.join(SCRIPT_DIR, "GP Colombia", "resultado_general_gp_colombia_2026.html"),
-    },
-]
-
-
-def normalize_key(text):
-    s = str(text or "").strip().lower()
-    s = "".join(c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn")
-    s = re.sub(r"[^a-z0-9]+", "", s)
-    return s
+# Campeonatos de la temporada (registro_temporada: temporada_2026.json). TEMPORADA es también
+# la del índice de identidades de pilotos (identidad_pilotos) que comparten los campeonatos.
+TEMPORADA = registro_temporada.temporada()
+
+CHAMPIONSHIPS = registro_temporada.championships()
+
+
+# Clave sin tildes, minúsculas, solo letras y números (normalizacion.py, memorizada).
+normalize_key = normalizacion.clave
 
 
 def normalize_rider_name(nombre):
@@ -296,12 +154,6 @@ def is_mx_inicio(categoria, modalidad):
     return modalidad == "Motocross" and normalize_key(categoria) == "inicio"
 
 
-def parse_points_int(value):
-    s = str(value or "").strip()
-    m = re.search(r"-?\d+", s)
-    return int(m.group(0)) if m else 0
-
-
 def aggregate_mx_inicio_from_sessions(files):
     """
     Construye puntos de INICIO por válida sumando Clasificatoria + Carrera 1 + Carrera 2.
@@ -321,29 +173,20 @@ def aggregate_mx_inicio_from_sessions(files):
     def load_one(path, key):
         if not path:
             return
-        with open(path, "r", encoding="utf-8-sig", newline="") as f:
-            raw = f.read()
-        lines = raw.splitlines()
-        if not lines:
-            return
-        delim = csv_delimiter_from_first_line(lines[0])
-        rows = list(csv.reader(lines, delimiter=delim))
-        if not rows:
-            return
-        headers = rows[0]
-        body = rows[1:]
-        idx = find_indexes(headers)
+        table = tablas_csv.read_table(path)
+        idx = table.indexes(find_indexes)
         if idx["numero"] is None or idx["puntos"] is None:
             return
         required = [idx["numero"], idx["puntos"]]
         max_ix = max(required)
-        for r in body:
+        pts_col = tabla_puntos.puntos_entero_columna(table.column(idx["puntos"]) or ())
+        for k, r in enumerate(table.rows()):
             if len(r) <= max_ix:
                 continue
             numero = str(r[idx["numero"]]).strip()
             if not numero:
                 continue
-            pts = parse_points_int(r[idx["puntos"]])
+            pts = pts_col[k]
             if numero not in riders:
                 riders[numero] = {
                     "numero": numero,
@@ -427,86 +270,86 @@ def find_indexes(headers):
     return idx
 
 
-def row_points_from_indexes(row, idx):
-    if idx["puntos"] is not None and idx["puntos"] < len(row):
-        return parse_points(row[idx["puntos"]])
+def points_column(table, idx):
+    """
+    Puntos de cada fila de la tabla (columna Puntos o suma de Q + R1 + R2), convertidos por
+    columna; None si la tabla no tiene ninguna de las dos.
+    """
+    if idx["puntos"] is not None:
+        return tabla_puntos.puntos_columna(table.column(idx["puntos"]) or ())
     session_keys = ("q", "r1", "r2")
     if all(idx[k] is not None for k in session_keys):
-        total = 0.0
-        for k in session_keys:
-            if idx[k] < len(row):
-                total += parse_points(row[idx[k]])
-        return total
+        q, r1, r2 = (tabla_puntos.puntos_columna(table.column(idx[k]) or ()) for k in session_keys)
+        return [a + b + c for a, b, c in zip(q, r1, r2)]
     return None
 
 
-def parse_points(value):
-    s = str(value or "").strip().replace(",", ".")
-    if not s:
-        return 0.0
-    m = re.search(r"-?\d+(\.\d+)?", s)
-    return float(m.group(0)) if m else 0.0
+class DatosValida:
+    """
+    Lectura de una válida en una sola pasada por sus CSV: `filas` (categoría → filas con
+    puntos, para la tabla general) y `asistentes` (categoría → números presentes, para el bono
+    de la última válida). `asistentes` es None cuando el cargador no los entrega (GP Colombia).
+    """
 
+    __slots__ = ("files_dir", "filas", "asistentes")
 
-def parse_position_int(value):
-    """Primera cifra entera en la celda de posición (p. ej. '1' o '12')."""
-    s = str(value or "").strip()
-    m = re.search(r"\d+", s)
-    return int(m.group(0)) if m else 0
+    def __init__(self, files_dir, filas, asistentes=None):
+        self.files_dir = files_dir
+        self.filas = filas
+        self.asistentes = asistentes
 
 
-def puntos_fedemoto_carrera_por_posicion(pos):
-    """Tabla Fedemoto carrera: posición → puntos (Scratch sin columna Puntos)."""
-    if pos <= 0:
-        return 0.0
-    tabla = {
-        1: 15, 2: 13, 3: 11, 4: 10, 5: 9, 6: 8, 7: 7, 8: 6, 9: 5, 10: 4, 11: 3, 12: 2,
-    }
-    if pos in tabla:
-        return float(tabla[pos])
-    if 13 <= pos <= 15:
-        return 1.0
-    return 0.0
+def list_valida_files(files_dir, modalidad=None):
+    """
+    CSV de la carpeta agrupados por categoría: categoría → [(tipo de sesión, ruta)]. Sale del
+    recorrido compartido de la carpeta (escaneo_validas), el mismo del informe de la válida.
+    """
+    canonical = canonical_enduro_categoria if modalidad == "Enduro" else None
+    return escaneo_validas.por_categoria(files_dir, parse_filename, canonical)
+
+
+def table_numeros(table):
+    """Números (N°) no vacíos de una tabla ya leída."""
+    numeros = set()
+    i = table.indexes(find_indexes)["numero"]
+    column = table.column(i)
+    if column is None:
+        return numeros
+    for value, largo in zip(column, table.lengths):
+        if largo <= i:
+            continue
+        numero = value.strip()
+        if numero:
+            numeros.add(numero)
+    return numeros
 
 
-def csv_delimiter_from_first_line(first_line):
-    if not first_line:
-        return ","
-    return ";" if first_line.count(";") > first_line.count(",") else ","
+def inicio_attendees(files):
+    """Asistentes de INICIO (MX): presentes en Clasificatoria, Carrera 1 o Carrera 2."""
+    nums = set()
+    for tipo, path in files:
+        t = normalize_key(tipo)
+        if "clasific" in t or "1carrera" in t or "2carrera" in t:
+            nums.update(table_numeros(tablas_csv.read_table(path)))
+    return nums
 
 
 def load_valida_category_rows(files_dir, modalidad=None):
-    by_cat_files = defaultdict(list)
-    for filename in os.listdir(files_dir):
-        if not filename.lower().endswith(".csv"):
-            continue
-        path = os.path.join(files_dir, filename)
-        if not os.path.isfile(path):
-            continue
-        categoria, tipo = parse_filename(filename)
-        if modalidad == "Enduro":
-            categoria = canonical_enduro_categoria(categoria)
-        by_cat_files[categoria].append((tipo, path))
-
+    """Filas por categoría y asistentes de la válida (`DatosValida`), leyendo cada CSV una vez."""
     out = {}
-    for categoria, files in by_cat_files.items():
+    attendees = {}
+    for categoria, files in list_valida_files(files_dir, modalidad).items():
         if is_mx_inicio(categoria, modalidad):
             inicio_rows = aggregate_mx_inicio_from_sessions(files)
             out[categoria] = inicio_rows
+            attendees[categoria] = inicio_attendees(files)
             continue
         _tipo, main_path = choose_main_file(files)
-        with open(main_path, "r", encoding="utf-8-sig", newline="") as f:
-            raw = f.read()
-        lines = raw.splitlines()
-        if not lines:
-            continue
-        delim = csv_delimiter_from_first_line(lines[0])
-        rows = list(csv.reader(lines, delimiter=delim))
-        if not rows:
+        table = tablas_csv.read_table(main_path)
+        attendees[categoria] = table_numeros(table)
+        if not table.headers:
             continue
-        headers = rows[0]
-        body = rows[1:]
-        idx = find_indexes(headers)
+        idx = table.indexes(find_indexes)
         scratch = modalidad == "Enduro" and categoria == "Scratch"
         if scratch:
             if idx["numero"] is None or idx["nombre"] is None or idx["pos"] is None:
@@ -527,25 +370,28 @@ def load_valida_category_rows(files_dir, modalidad=None):
                 if idx[k] is not None:
                     needed.append(idx[k])
             max_ix = max(needed)
+        if scratch:
+            # Scratch no trae columna Puntos: posición → tabla de la modalidad, por columna.
+            pts_col = tabla_puntos.puntos_posiciones_columna(
+                table.column(idx["pos"]) or (), tabla_puntos.tabla_modalidad(modalidad)
+            )
+        else:
+            pts_col = points_column(table, idx)
         cat_rows = []
-        for r in body:
+        for k, r in enumerate(table.rows()):
             if len(r) <= max_ix:
                 continue
             numero = str(r[idx["numero"]]).strip()
             if not numero:
                 continue
+            pts = pts_col[k]
             if scratch:
-                pos = parse_position_int(r[idx["pos"]])
-                pts = puntos_fedemoto_carrera_por_posicion(pos)
                 clase_v = (
                     str(r[idx["clase"]]).strip()
                     if idx["clase"] is not None and idx["clase"] < len(r)
                     else ""
                 )
             else:
-                pts = row_points_from_indexes(r, idx)
-                if pts is None:
-                    continue
                 clase_v = ""
             cat_rows.append({
                 "numero": numero,
@@ -557,113 +403,21 @@ def load_valida_category_rows(files_dir, modalidad=None):
                 "puntos": pts,
             })
         out[categoria] = cat_rows
-    return out
-
-
-def read_numeros_from_csv(path):
-    numeros = set()
-    with open(path, "r", encoding="utf-8-sig", newline="") as f:
-        raw = f.read()
-    lines = raw.splitlines()
-    if not lines:
-        return numeros
-    delim = csv_delimiter_from_first_line(lines[0])
-    rows = list(csv.reader(lines, delimiter=delim))
-    if not rows:
-        return numeros
-    idx = find_indexes(rows[0])
-    if idx["numero"] is None:
-        return numeros
-    for r in rows[1:]:
-        if len(r) <= idx["numero"]:
-            continue
-        numero = str(r[idx["numero"]]).strip()
-        if numero:
-            numeros.add(numero)
-    return numeros
+    return DatosValida(files_dir, out, attendees)
 
 
 def load_valida_attendees(files_dir, modalidad=None):
-    by_cat_files = defaultdict(list)
-    for filename in os.listdir(files_dir):
-        if not filename.lower().endswith(".csv"):
-            continue
-        path = os.path.join(files_dir, filename)
-        if not os.path.isfile(path):
-            continue
-        categoria, tipo = parse_filename(filename)
-        if modalidad == "Enduro":
-            categoria = canonical_enduro_categoria(categoria)
-        by_cat_files[categoria].append((tipo, path))
-
+    """Asistentes por categoría cuando el cargador de la válida no los entrega (GP Colombia)."""
     attendees = {}
-    for categoria, files in by_cat_files.items():
-        nums = set()
+    for categoria, files in list_valida_files(files_dir, modalidad).items():
         if is_mx_inicio(categoria, modalidad):
-            for tipo, path in files:
-                t = normalize_key(tipo)
-                if "clasific" in t or "1carrera" in t or "2carrera" in t:
-                    nums.update(read_numeros_from_csv(path))
+            attendees[categoria] = inicio_attendees(files)
         else:
             _tipo, main_path = choose_main_file(files)
-            nums.update(read_numeros_from_csv(main_path))
-        attendees[categoria] = nums
+            attendees[categoria] = table_numeros(tablas_csv.read_table(main_path))
     return attendees
 
 
-def apply_final_valida_bonus(champ, result, data_by_valida):
-    bonus = champ.get("final_valida_bonus", 0)
-    if not bonus:
-        return result
-
-    validas = champ["validas"]
-    last_idx = len(validas) - 1
-    modalidad = champ.get("modalidad")
-    attendees = load_valida_attendees(validas[last_idx]["files_dir"], modalidad=modalidad)
-    last_data = data_by_valida[last_idx] if data_by_valida else {}
-
-    categorias = set(result.keys())
-    categorias.update(attendees.keys())
-    categorias.update(last_data.keys())
-
-    updated = {}
-    for categoria in categorias:
-        att = attendees.get(categoria, set())
-        by_num = {r["numero"]: dict(r) for r in result.get(categoria, [])}
-
-        for row in last_data.get(categoria, []):
-            key = row["numero"]
-            if key not in by_num:
-                by_num[key] = {
-                    "numero": key,
-                    "nombre": row["nombre"],
-                    "liga": row["liga"],
-                    "club": row["club"],
-                    "moto": row["moto"],
-                    "clase": row.get("clase", ""),
-                    "por_valida": [None] * len(validas),
-                }
-                by_num[key]["por_valida"][last_idx] = row["puntos"]
-
-        for numero in att:
-            if numero not in by_num:
-                continue
-            by_num[numero]["bonificacion_asistencia"] = float(bonus)
-
-        rows = []
-        for rider in by_num.values():
-            bonif = rider.get("bonificacion_asistencia")
-            total = sum_valida_points(rider["por_valida"]) + (bonif if bonif is not None else 0.0)
-            rows.append({
-                **rider,
-                "bonificacion_asistencia": bonif,
-                "total": total,
-            })
-        rows.sort(key=standings_sort_key)
-        updated[categoria] = rows
-    return updated
-
-
 def merge_por_valida_lists(por_valida_lists):
     if not por_valida_lists:
         return []
@@ -690,98 +444,240 @@ def rider_at_latest_valida(group, merged_por_valida):
     return group[-1]
 
 
-def merge_riders_by_name(rows):
-    groups = defaultdict(list)
-    for rider in rows:
-        name_key = normalize_rider_name(rider.get("nombre", ""))
-        if not name_key:
-            name_key = f"__num_{rider.get('numero', '')}"
-        groups[name_key].append(rider)
+def merge_rider_group(group):
+    """Fila única para las filas de un mismo piloto con distinto N° dentro de la categoría."""
+    merged_pv = merge_por_valida_lists([r["por_valida"] for r in group])
+    latest = rider_at_latest_valida(group, merged_pv)
+
+    bonif = None
+    for rider in group:
+        b = rider.get("bonificacion_asistencia")
+        if b is not None:
+            bonif = b
+            break
+
+    total = sum_valida_points(merged_pv) + (bonif if bonif is not None else 0.0)
+    return {
+        "numero": latest["numero"],
+        "nombre": latest["nombre"],
+        "liga": latest["liga"],
+        "club": latest["club"],
+        "moto": latest["moto"],
+        "clase": latest.get("clase", ""),
+        "por_valida": merged_pv,
+        "bonificacion_asistencia": bonif,
+        "total": total,
+    }
 
-    merged_rows = []
-    for group in groups.values():
-        if len(group) == 1:
-            merged_rows.append(group[0])
-            continue
 
-        merged_pv = merge_por_valida_lists([r["por_valida"] for r in group])
-        latest = rider_at_latest_valida(group, merged_pv)
+def rider_group_key(numero, nombre, indice=None, modalidad=None):
+    """
+    Llave con la que se unen las filas de un mismo piloto dentro de la categoría: id del índice
+    de identidades (nombre, alias y N° de la modalidad) o, sin índice, nombre normalizado.
+    """
+    pid = indice.piloto(modalidad, numero, nombre) if indice is not None else None
+    if pid is not None:
+        return ("id", pid)
+    name_key = normalize_rider_name(nombre)
+    if not name_key:
+        name_key = f"__num_{numero}"
+    return name_key
 
-        bonif = None
-        for rider in group:
-            b = rider.get("bonificacion_asistencia")
-            if b is not None:
-                bonif = b
-                break
-
-        total = sum_valida_points(merged_pv) + (bonif if bonif is not None else 0.0)
-        merged_rows.append({
-            "numero": latest["numero"],
-            "nombre": latest["nombre"],
-            "liga": latest["liga"],
-            "club": latest["club"],
-            "moto": latest["moto"],
-            "clase": latest.get("clase", ""),
-            "por_valida": merged_pv,
-            "bonificacion_asistencia": bonif,
-            "total": total,
-        })
 
-    merged_rows.sort(key=standings_sort_key)
-    return merged_rows
+def load_valida_data(champ, files_dir):
+    """Lectura de una válida del campeonato (`DatosValida`)."""
+    if champ.get("gp_colombia"):
+        return DatosValida(files_dir, load_gp_valida_category_rows(files_dir))
+    return load_valida_category_rows(files_dir, modalidad=champ.get("modalidad"))
+
+
+PERFIL = ("nombre", "liga", "club", "moto", "clase")
+
+
+def categoria_standings(champ, categoria, data_by_valida, attendees, indice=None):
+    """
+    Posiciones de una categoría. Solo depende de las filas de esta categoría en cada válida,
+    de sus asistentes y del índice de identidades.
+
+    Se arma por columnas: una fila de la matriz pilotos × válidas por N°, totales y bono de
+    asistencia a la última válida (`final_valida_bonus`) por columna, y un solo ordenamiento con
+    llaves planas (`standings_key`). Las filas de un mismo piloto con distinto N° se unen al
+    final y solo esos grupos se vuelven a ubicar.
+
+    Todo con listas; no hay ruta vectorizada. Con numpy se probó por categoría (más lento) y en
+    lote, con las válidas guardadas por columnas y todas las categorías en un solo lexsort: 1.5 a
+    1.8× aquí, pero pasar cada válida a columnas al leerla cuesta más de lo que ahorra. Las filas
+    salen como dicts y cada piloto pasa por el índice de identidades: eso solo ya es un tercio
+    del tiempo actual.
+    """
+    n = len(champ["validas"])
+    bonus = champ.get("final_valida_bonus", 0)
+    slot = {}
+    numeros, puntos, historial = [], [], []
+    for i, d in enumerate(data_by_valida):
+        for row in d.get(categoria, ()):
+            numero = row["numero"]
+            r = slot.get(numero)
+            if r is None:
+                r = slot[numero] = len(numeros)
+                numeros.append(numero)
+                puntos.append([None] * n)
+                historial.append([row])
+            else:
+                historial[r].append(row)
+            puntos[r][i] = row["puntos"]
+
+    # Perfil: valor más reciente no vacío de cada campo (si ninguno, el de la primera fila).
+    perfiles = []
+    for filas in historial:
+        perfil = {f: filas[-1].get(f, "") for f in PERFIL}
+        if len(filas) > 1:
+            for f in PERFIL:
+                if not perfil[f]:
+                    perfil[f] = next((x[f] for x in reversed(filas) if x.get(f)), filas[0].get(f, ""))
+        perfiles.append(perfil)
+
+    totales = [sum_valida_points(pv) for pv in puntos]
+    if bonus:
+        att = attendees.get(categoria, ())
+        bonos = [float(bonus) if numero in att else None for numero in numeros]
+        totales = [t + (b if b is not None else 0.0) for t, b in zip(totales, bonos)]
+    llaves = [standings_key(t, pv, p["nombre"]) for t, pv, p in zip(totales, puntos, perfiles)]
+    orden = sorted(range(len(numeros)), key=llaves.__getitem__)
+
+    def fila(r):
+        row = {"numero": numeros[r], **perfiles[r], "por_valida": puntos[r], "total": totales[r]}
+        if bonus:
+            row["bonificacion_asistencia"] = bonos[r]
+        return row
+
+    modalidad = champ.get("modalidad")
+    grupos = {}
+    for r in orden:
+        grupos.setdefault(rider_group_key(numeros[r], perfiles[r]["nombre"], indice, modalidad), []).append(r)
+    rows, row_keys = [], []
+    for grupo in grupos.values():
+        if len(grupo) == 1:
+            rows.append(fila(grupo[0]))
+            row_keys.append(llaves[grupo[0]])
+        else:
+            merged = merge_rider_group([fila(r) for r in grupo])
+            rows.append(merged)
+            row_keys.append(standings_sort_key(merged))
+    return [rows[k] for k in sorted(range(len(rows)), key=row_keys.__getitem__)]
+
+
+def _code_files(champ):
+    """Módulos que arman las filas de las válidas (firma de código del almacén)."""
+    paths = [
+        os.path.abspath(__file__),
+        os.path.join(SCRIPT_DIR, "enduro_categorias.py"),
+        os.path.join(SCRIPT_DIR, "identidad_pilotos.py"),
+        os.path.join(_RV_ROOT, "escaneo_validas.py"),
+        os.path.join(_RV_ROOT, "normalizacion.py"),
+        os.path.join(_RV_ROOT, "tablas_csv.py"),
+        os.path.join(_RV_ROOT, "tabla_puntos.py"),
+    ]
+    if champ.get("gp_colombia"):
+        paths += [
+            os.path.join(_RV_ROOT, "GP Colombia", "generar_valida_i_gp_vitrix.py"),
+            os.path.join(_RV_ROOT, "Motocross", "Primer semestre", "generar_valida_girardota.py"),
+        ]
+    return paths
 
 
-def merge_result_by_rider_name(result):
-    return {categoria: merge_riders_by_name(rows) for categoria, rows in result.items()}
+def _fuente_indice(files_dir):
+    """Nombre de la válida en el índice de identidades: carpeta relativa a la raíz."""
+    return os.path.relpath(files_dir, ROOT_DIR).replace("\\", "/")
 
 
-def build_general_table(champ):
+def build_general_table(champ, stats=None):
+    """
+    Tabla general del campeonato: categoría → filas ordenadas.
+
+    Incremental sobre el almacén del campeonato (almacen_posiciones): solo se releen las
+    válidas cuya carpeta cambió y solo se recalculan las categorías cuyas filas (o asistentes
+    de la última válida) cambiaron. Cada válida releída actualiza el índice de identidades de
+    la temporada (identidad_pilotos), con el que se unen las filas de un mismo piloto; las
+    fuentes del índice que ya no son válidas del registro se quitan. Si se pasa `stats` (dict),
+    se llena con lo releído y lo recalculado.
+    """
     validas = champ["validas"]
     modalidad = champ.get("modalidad")
+    bonus = champ.get("final_valida_bonus", 0)
+    champ_id = champ.get("id") or os.path.splitext(os.path.basename(champ["output_html"]))[0]
+    almacen = almacen_posiciones.cargar(
+        champ_id,
+        escaneo_validas.firma_archivos(_code_files(champ)),
+        (modalidad, bool(champ.get("gp_colombia"))),
+    )
+    temporada = champ.get("temporada", TEMPORADA)
+    indice = identidad_pilotos.indice(temporada)
+    previas = almacen["validas"]
+    vigentes = {}
     data_by_valida = []
+    cambiadas = set()
+    releidas = 0
     for v in validas:
-        if champ.get("gp_colombia"):
-            data_by_valida.append(load_gp_valida_category_rows(v["files_dir"]))
-        else:
-            data_by_valida.append(load_valida_category_rows(v["files_dir"], modalidad=modalidad))
+        files_dir = v["files_dir"]
+        firma = escaneo_validas.firma(files_dir)
+        entry = vigentes.get(files_dir) or previas.get(files_dir)
+        if entry is None or entry["firma"] != firma:
+            previa = entry or {"datos": {}, "asistentes": None}
+            datos = load_valida_data(champ, files_dir)
+            entry = {"firma": firma, "datos": datos.filas, "asistentes": datos.asistentes}
+            releidas += 1
+            for campo in ("datos", "asistentes"):
+                old, new = previa[campo] or {}, entry[campo] or {}
+                cambiadas.update(c for c in set(old) | set(new) if old.get(c) != new.get(c))
+        vigentes[files_dir] = entry
+        data_by_valida.append(entry["datos"])
+        indice.actualizar_fuente(_fuente_indice(files_dir), firma, modalidad, entry["datos"])
+    if str(temporada) == str(TEMPORADA):
+        registradas = {_fuente_indice(v["files_dir"]) for v in registro_temporada.validas()}
+        registradas.update(_fuente_indice(v["files_dir"]) for v in validas)
+        indice.quitar_fuentes([f for f in indice.fuentes if f not in registradas])
+    indice.guardar()
+    # Si el índice unió o separó pilotos de la modalidad, cualquier categoría puede cambiar.
+    config = (tuple(v["files_dir"] for v in validas), bonus, indice.revision(modalidad))
+    recalcular_todo = almacen["config"] != config
 
-    categorias = set()
+    attendees = {}
+    if bonus and validas:
+        last = vigentes[validas[-1]["files_dir"]]
+        if last["asistentes"] is None:
+            # Cargadores que no entregan asistentes (GP Colombia).
+            last["asistentes"] = load_valida_attendees(validas[-1]["files_dir"], modalidad=modalidad)
+            cambiadas.update(last["asistentes"])
+        attendees = last["asistentes"]
+
+    # En orden de aparición (no un set): la tabla y el medallero salen igual en cada corrida.
+    categorias = {}
     for d in data_by_valida:
-        categorias.update(d.keys())
+        categorias.update(dict.fromkeys(d))
+    if bonus:
+        categorias.update(dict.fromkeys(attendees))
 
-    result = {}
+    previa_tabla = {} if recalcular_todo else almacen["tabla"]
+    tabla = {}
+    recalculadas = 0
     for categoria in categorias:
-        riders = {}
-        for i, d in enumerate(data_by_valida):
-            for row in d.get(categoria, []):
-                key = row["numero"]
-                if key not in riders:
-                    riders[key] = {
-                        "numero": key,
-                        "nombre": row["nombre"],
-                        "liga": row["liga"],
-                        "club": row["club"],
-                        "moto": row["moto"],
-                        "clase": row.get("clase", ""),
-                        "por_valida": [None] * len(validas),
-                    }
-                riders[key]["por_valida"][i] = row["puntos"]
-                # Prefer latest valida values for profile fields when present
-                for f in ("nombre", "liga", "club", "moto", "clase"):
-                    if row.get(f):
-                        riders[key][f] = row[f]
-
-        rows = []
-        for rider in riders.values():
-            total = sum_valida_points(rider["por_valida"])
-            rows.append({
-                **rider,
-                "total": total,
-            })
-        rows.sort(key=standings_sort_key)
-        result[categoria] = rows
-    result = apply_final_valida_bonus(champ, result, data_by_valida)
-    return merge_result_by_rider_name(result)
+        if categoria in previa_tabla and categoria not in cambiadas:
+            tabla[categoria] = previa_tabla[categoria]
+            continue
+        tabla[categoria] = categoria_standings(champ, categoria, data_by_valida, attendees, indice)
+        recalculadas += 1
+
+    almacen.update(config=config, validas=vigentes, tabla=tabla)
+    almacen_posiciones.guardar(champ_id, almacen)
+    if stats is not None:
+        stats.update(
+            validas=len(validas),
+            releidas=releidas,
+            categorias=len(categorias),
+            recalculadas=recalculadas,
+        )
+    return tabla
 
 
 def esc(t):
@@ -805,17 +701,24 @@ def latest_valida_points(por_valida):
     return 0.0
 
 
+_SIN_PUNTOS = float("inf")
+
+
+def standings_key(total, por_valida, nombre):
+    """
+    Llave de orden plana: total (mayor primero), luego cada válida de la más reciente a la más
+    antigua (con puntos antes que ausente, más puntos primero) y por último el nombre.
+    """
+    return (
+        -float(total),
+        *(-float(p) if p is not None else _SIN_PUNTOS for p in reversed(por_valida)),
+        nombre.lower(),
+    )
+
+
 def standings_sort_key(rider):
     """Desempate: total, luego por válida más reciente (puntos y asistencia)."""
-    por_valida = rider.get("por_valida") or []
-    tiebreak = []
-    for i in range(len(por_valida) - 1, -1, -1):
-        p = por_valida[i]
-        if p is None:
-            tiebreak.append((1, 0))
-        else:
-            tiebreak.append((0, -float(p)))
-    return (-float(rider.get("total", 0)), tuple(tiebreak), rider.get("nombre", "").lower())
+    return standings_key(rider.get("total", 0), rider.get("por_valida") or [], rider.get("nombre", ""))
 
 
 def fmt_valida_cell(v):
@@ -824,7 +727,89 @@ def fmt_valida_cell(v):
     return fmt_points(v)
 
 
-def render_html(champ, table_by_categoria):
+def medallero_path(champ):
+    """JSON con el detalle del medallero, junto a la página (se carga al abrir un detalle)."""
+    return os.path.splitext(champ["output_html"])[0] + ".medallero.json"
+
+
+def medallero_ligas(table_by_categoria):
+    """
+    Podios por liga del campeonato: `ligas` (conteos ordenados por 1ros, 2dos, 3ros y nombre)
+    y `detalles` por liga y puesto como [categoría, piloto, puntos].
+    """
+    puestos = ("first", "second", "third")
+    conteo = {}
+    detalles = {}
+    for cat, rows in table_by_categoria.items():
+        for puesto, rr in zip(puestos, rows[:3]):
+            liga = (rr.get("liga") or "").strip()
+            if not liga:
+                continue
+            if liga not in conteo:
+                conteo[liga] = {"liga": liga, "first": 0, "second": 0, "third": 0}
+                detalles[liga] = {"first": [], "second": [], "third": []}
+            conteo[liga][puesto] += 1
+            detalles[liga][puesto].append([cat, rr.get("nombre", ""), rr.get("total", 0)])
+    ligas = sorted(conteo.values(), key=lambda c: (-c["first"], -c["second"], -c["third"], c["liga"].lower()))
+    return {"ligas": ligas, "detalles": detalles}
+
+
+def write_medallero(champ, medallero):
+    with open(medallero_path(champ), "w", encoding="utf-8") as f:
+        json.dump(medallero["detalles"], f, ensure_ascii=False, separators=(",", ":"))
+
+
+def categoria_id(cat):
+    return re.sub(r"[^a-z0-9]+", "-", normalize_key(cat)).strip("-")
+
+
+def categorias_dir(champ):
+    """Carpeta con un JSON por categoría, junto a la página (se carga al ver cada categoría)."""
+    return os.path.splitext(champ["output_html"])[0] + ".categorias"
+
+
+def categorias_url(champ, sid):
+    return f"{os.path.basename(categorias_dir(champ))}/{sid}.json"
+
+
+def columnas_categoria(champ):
+    return 7 + len(champ["validas"]) + (1 if champ.get("final_valida_bonus") else 0)
+
+
+def categoria_filas(champ, cat, rows):
+    """
+    Filas de la tabla de una categoría ya formateadas, sin la posición (la pone la página):
+    N°, nombre, liga, clase (Scratch) o club, moto, puntos por válida, bono final y total.
+    """
+    bono = bool(champ.get("final_valida_bonus"))
+    filas = []
+    for r in rows:
+        fila = [r["numero"], r["nombre"], r["liga"], r.get("clase", "") if cat == "Scratch" else r["club"], r["moto"]]
+        fila.extend(fmt_valida_cell(p) for p in r["por_valida"])
+        if bono:
+            fila.append(fmt_valida_cell(r.get("bonificacion_asistencia")))
+        fila.append(fmt_points(r["total"]))
+        filas.append(fila)
+    return filas
+
+
+def write_categorias(champ, table_by_categoria):
+    """Un JSON por categoría en categorias_dir; borra los de categorías que ya no están."""
+    out_dir = categorias_dir(champ)
+    os.makedirs(out_dir, exist_ok=True)
+    vigentes = set()
+    for cat, rows in table_by_categoria.items():
+        name = f"{categoria_id(cat)}.json"
+        vigentes.add(name)
+        with open(os.path.join(out_dir, name), "w", encoding="utf-8") as f:
+            json.dump(categoria_filas(champ, cat, rows), f, ensure_ascii=False, separators=(",", ":"))
+    for name in os.listdir(out_dir):
+        if name.endswith(".json") and name not in vigentes:
+            os.remove(os.path.join(out_dir, name))
+
+
+def render_html(champ, table_by_categoria, medallero=None):
+    """Página de resultados generales (layout plantillas_html/resultado_general.html)."""
     validas = champ["validas"]
     rel_to_root = os.path.relpath(ROOT_DIR, os.path.dirname(champ["output_html"])).replace("\\", "/") + "/"
 
@@ -836,38 +821,8 @@ def render_html(champ, table_by_categoria):
     h1 = f"Resultados generales {champ['modalidad']}"
     subtitle = champ["campeonato"]
     generated_at = datetime.now().strftime("%d/%m/%Y")
-    liga_podium = defaultdict(
-        lambda: {
-            "first": 0,
-            "second": 0,
-            "third": 0,
-            "details": {"first": [], "second": [], "third": []},
-        }
-    )
-    for _cat, rows in table_by_categoria.items():
-        for pos, rr in enumerate(rows[:3], start=1):
-            liga = (rr.get("liga") or "").strip()
-            if not liga:
-                continue
-            if pos == 1:
-                liga_podium[liga]["first"] += 1
-                liga_podium[liga]["details"]["first"].append(
-                    {"categoria": _cat, "piloto": rr.get("nombre", ""), "puntos": rr.get("total", 0)}
-                )
-            elif pos == 2:
-                liga_podium[liga]["second"] += 1
-                liga_podium[liga]["details"]["second"].append(
-                    {"categoria": _cat, "piloto": rr.get("nombre", ""), "puntos": rr.get("total", 0)}
-                )
-            elif pos == 3:
-                liga_podium[liga]["third"] += 1
-                liga_podium[liga]["details"]["third"].append(
-                    {"categoria": _cat, "piloto": rr.get("nombre", ""), "puntos": rr.get("total", 0)}
-                )
-    liga_rows = sorted(
-        liga_podium.items(),
-        key=lambda kv: (-kv[1]["first"], -kv[1]["second"], -kv[1]["third"], kv[0].lower()),
-    )
+    if medallero is None:
+        medallero = medallero_ligas(table_by_categoria)
 
     roman_map = [
         "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X",
@@ -879,102 +834,13 @@ def render_html(champ, table_by_categoria):
             return roman_map[index]
         return str(index + 1)
 
-    html_parts = [f"""<!DOCTYPE html>
-<html lang="es">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{esc(title)}</title>
-    <link rel="icon" type="image/png" href="{rel_to_root}fedemoto-logo.png">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Bebas+Neue&family=Roboto+Condensed:wght@300;400;700&family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: 'Inter', sans-serif; background: #f5f5f5; color: #000; line-height: 1.6; padding: 20px; padding-top: 120px; min-height: 100vh; }}
-        .container {{ max-width: 1400px; margin: 0 auto; background: white; border-radius: 12px; box-shadow: 0 20px 60px rgba(0,0,0,0.18); overflow: hidden; margin-bottom: 40px; }}
-        .container > header {{ background: linear-gradient(135deg, #123E92 0%, #0f3377 100%); color: white; padding: 40px; text-align: center; }}
-        .container > header h1 {{ font-family: 'Bebas Neue', sans-serif; font-size: 2.2em; margin-bottom: 10px; letter-spacing: 2px; }}
-        .container > header p {{ font-family: 'Roboto Condensed', sans-serif; font-size: 1.2em; opacity: 0.95; }}
-        .toolbar {{ padding: 25px 40px; background: #f8f9fa; border-bottom: 1px solid #c0c0c0; }}
-        .search-box {{ width: 100%; padding: 12px 20px; font-family: 'Inter', sans-serif; font-size: 1em; border: 2px solid #d1d5db; border-radius: 8px; }}
-        .search-box:focus {{ outline: none; border-color: #123E92; box-shadow: 0 0 0 3px rgba(18, 62, 146, 0.2); }}
-        .intro-message {{ padding: 22px 40px; background: #f0f4fc; border-left: 5px solid #123E92; color: #1f2937; border-bottom: 1px solid #c0c0c0; }}
-        .index-cards {{ display: flex; flex-wrap: wrap; gap: 12px; padding: 25px 40px; background: #f8f9fa; border-bottom: 1px solid #c0c0c0; }}
-        .index-card {{ display: inline-block; padding: 10px 20px; background: white; color: #123E92; border: 2px solid #123E92; border-radius: 8px; font-family: 'Roboto Condensed', sans-serif; font-weight: 700; text-decoration: none; }}
-        .index-card.search-match {{ background: #F7C31D; color: #123E92; border-color: #F7C31D; }}
-        .index-card.search-no-results {{ display: none !important; }}
-        .content-section {{ padding: 40px; }}
-        .categoria-section {{ margin-bottom: 38px; border: 2px solid #e0e0e0; border-radius: 12px; overflow: hidden; scroll-margin-top: 115px; }}
-        .categoria-section.search-match {{ border-color: #F7C31D; box-shadow: 0 0 0 3px rgba(247, 195, 29, 0.4); }}
-        .categoria-section.search-no-results {{ display: none !important; }}
-        .categoria-header {{ background: linear-gradient(135deg, #123E92 0%, #0f3377 100%); color: white; padding: 20px 26px; display: flex; align-items: center; justify-content: space-between; gap: 12px; }}
-        .categoria-header h2 {{ font-family: 'Bebas Neue', sans-serif; font-size: 1.9em; letter-spacing: 1px; }}
-        .btn-top {{ display: inline-flex; align-items: center; justify-content: center; width: 34px; height: 34px; background: rgba(255,255,255,0.2); color: white; border: 2px solid rgba(255,255,255,0.6); border-radius: 8px; cursor: pointer; transition: all 0.2s ease; flex-shrink: 0; }}
-        .btn-top:hover {{ background: #F7C31D; color: #123E92; border-color: #F7C31D; }}
-        .btn-top svg {{ width: 16px; height: 16px; }}
-        .table-wrapper {{ overflow-x: auto; margin: 0; border-top: 1px solid #d1d5db; }}
-        table {{ width: 100%; border-collapse: collapse; font-size: 0.92em; }}
-        th, td {{ padding: 10px 12px; text-align: left; border-bottom: 1px solid #e0e0e0; white-space: nowrap; }}
-        th {{ background: #123E92; color: white; font-family: 'Roboto Condensed', sans-serif; font-weight: 700; position: sticky; top: 0; }}
-        tr:nth-child(odd) {{ background: #fafafa; }}
-        tr:hover {{ background: #f0f4fc; }}
-        tr.pos-1 {{ background: rgba(247, 195, 29, 0.15) !important; }}
-        tr.pos-2 {{ background: rgba(192, 192, 192, 0.20) !important; }}
-        tr.pos-3 {{ background: rgba(184, 115, 51, 0.16) !important; }}
-        tr.search-hidden {{ display: none !important; }}
-        .col-total {{ font-weight: 700; color: #123E92; }}
-        .liga-summary {{ padding: 22px 40px; background: #f8f9fa; border-bottom: 1px solid #c0c0c0; }}
-        .liga-summary h3 {{ font-family: 'Bebas Neue', sans-serif; font-size: 1.6em; color: #123E92; letter-spacing: 1px; margin-bottom: 10px; }}
-        .liga-summary table {{ width: 100%; border-collapse: collapse; font-size: 0.92em; }}
-        .liga-summary th, .liga-summary td {{ padding: 8px 10px; border-bottom: 1px solid #e5e7eb; text-align: left; }}
-        .liga-summary th {{ background: #123E92; color: white; font-family: 'Roboto Condensed', sans-serif; }}
-        .liga-summary .num {{ font-family: 'Bebas Neue', sans-serif; font-size: 1.2em; color: #123E92; }}
-        .liga-summary tr.pos-1 {{ background: rgba(247, 195, 29, 0.15); }}
-        .liga-summary tr.pos-2 {{ background: rgba(192, 192, 192, 0.20); }}
-        .liga-summary tr.pos-3 {{ background: rgba(184, 115, 51, 0.16); }}
-        .info-btn {{ display: inline-flex; align-items: center; justify-content: center; width: 22px; height: 22px; margin-left: 6px; border: 1px solid #123E92; border-radius: 999px; background: #e8eef8; color: #123E92; font-size: 12px; font-weight: 700; cursor: pointer; }}
-        .info-btn:hover {{ background: #123E92; color: #fff; }}
-        .modal-overlay {{ display: none; position: fixed; inset: 0; background: rgba(0,0,0,0.5); z-index: 10020; align-items: center; justify-content: center; }}
-        .modal-overlay.open {{ display: flex; }}
-        .modal-box {{ background: #fff; border-radius: 12px; padding: 24px; max-width: 680px; width: 92%; max-height: 80vh; overflow-y: auto; box-shadow: 0 20px 60px rgba(0,0,0,0.3); }}
-        .modal-box h3 {{ font-family: 'Bebas Neue', sans-serif; font-size: 1.6em; color: #123E92; margin-bottom: 14px; }}
-        .modal-box ul {{ margin-left: 18px; }}
-        .modal-box li {{ margin-bottom: 6px; }}
-        .modal-close {{ margin-top: 14px; padding: 10px 16px; border: 0; border-radius: 8px; background: #123E92; color: #fff; font-family: 'Roboto Condensed', sans-serif; cursor: pointer; }}
-        footer {{ background: #f8f9fa; padding: 30px 40px; text-align: center; border-top: 1px solid #c0c0c0; color: #000; font-family: 'Inter', sans-serif; font-size: 0.9em; }}
-        footer .developer {{ font-family: 'Roboto Condensed', sans-serif; font-weight: 700; color: #123E92; }}
-    </style>
-</head>
-<body>
-    <div id="menu-container"></div>
-    <div class="container">
-        <header>
-            <h1>{esc(h1)}</h1>
-            <p>{esc(subtitle)}</p>
-        </header>
-        <div class="intro-message">
-            <p>Los resultados generales presentados en esta página están actualizados hasta la fecha <strong>{generated_at}</strong>.</p>
-        </div>
-        <div class="toolbar">
-            <input type="text" id="buscador" class="search-box" placeholder="Buscar por nombre o N° del piloto..." />
-        </div>
-        <div class="index-cards">
-"""]
-
+    index_cards = []
     for cat in categorias:
-        sid = re.sub(r"[^a-z0-9]+", "-", normalize_key(cat)).strip("-")
-        html_parts.append(f'            <a href="#{sid}" class="index-card">{esc(cat)}</a>\n')
-
-    html_parts.append("""        </div>
-        <div class="liga-summary">
-            <h3>Resumen de ligas (podios)</h3>
-            <div class="table-wrapper">
-                <table>
-                    <thead><tr><th>Liga</th><th>1ros</th><th>2dos</th><th>3ros</th></tr></thead>
-                    <tbody>
-""")
-    for i, (liga, cnt) in enumerate(liga_rows, start=1):
+        sid = categoria_id(cat)
+        index_cards.append(f'            <a href="#{sid}" class="index-card">{esc(cat)}</a>\n')
+
+    liga_parts = []
+    for i, cnt in enumerate(medallero["ligas"], start=1):
         row_class = ""
         if i == 1:
             row_class = ' class="pos-1"'
@@ -982,29 +848,20 @@ def render_html(champ, table_by_categoria):
             row_class = ' class="pos-2"'
         elif i == 3:
             row_class = ' class="pos-3"'
-        first_d = html.escape(json.dumps(cnt["details"]["first"], ensure_ascii=False))
-        second_d = html.escape(json.dumps(cnt["details"]["second"], ensure_ascii=False))
-        third_d = html.escape(json.dumps(cnt["details"]["third"], ensure_ascii=False))
-        first_info = f'<button type="button" class="info-btn" data-title="1ros puestos - {esc(liga)}" data-details="{first_d}">i</button>' if cnt["first"] else ""
-        second_info = f'<button type="button" class="info-btn" data-title="2dos puestos - {esc(liga)}" data-details="{second_d}">i</button>' if cnt["second"] else ""
-        third_info = f'<button type="button" class="info-btn" data-title="3ros puestos - {esc(liga)}" data-details="{third_d}">i</button>' if cnt["third"] else ""
-        html_parts.append(
-            f'<tr{row_class}><td>{esc(liga)}</td>'
-            f'<td class="num">{cnt["first"]}{first_info}</td>'
-            f'<td class="num">{cnt["second"]}{second_info}</td>'
-            f'<td class="num">{cnt["third"]}{third_info}</td></tr>'
-        )
-    if not liga_rows:
-        html_parts.append('<tr><td colspan="4">Sin datos de podio por liga.</td></tr>')
-    html_parts.append("""                    </tbody>
-                </table>
-            </div>
-        </div>
-        <div class="content-section">
-""")
-
+        liga = cnt["liga"]
+        cells = []
+        for puesto, titulo in (("first", "1ros"), ("second", "2dos"), ("third", "3ros")):
+            info = ""
+            if cnt[puesto]:
+                info = f'<button type="button" class="info-btn" data-title="{titulo} puestos - {esc(liga)}" data-liga="{esc(liga)}" data-puesto="{puesto}">i</button>'
+            cells.append(f'<td class="num">{cnt[puesto]}{info}</td>')
+        liga_parts.append(f'<tr{row_class}><td>{esc(liga)}</td>{"".join(cells)}</tr>')
+    if not medallero["ligas"]:
+        liga_parts.append('<tr><td colspan="4">Sin datos de podio por liga.</td></tr>')
+
+    html_parts = []
     for cat in categorias:
-        sid = re.sub(r"[^a-z0-9]+", "-", normalize_key(cat)).strip("-")
+        sid = categoria_id(cat)
         rows = table_by_categoria.get(cat, [])
         is_scratch = cat == "Scratch"
         html_parts.append(f"""            <div class="categoria-section" id="{sid}" data-categoria-id="{sid}">
@@ -1021,126 +878,48 @@ def render_html(champ, table_by_categoria):
             html_parts.append(f"<th>{esc(valida_col_label(i))}</th>")
         if champ.get("final_valida_bonus"):
             html_parts.append("<th>Bono final</th>")
-        html_parts.append("<th>Total</th></tr></thead><tbody>")
-        for i, r in enumerate(rows, start=1):
-            pos_class = ""
-            if i == 1:
-                pos_class = "pos-1"
-            elif i == 2:
-                pos_class = "pos-2"
-            elif i == 3:
-                pos_class = "pos-3"
-            html_parts.append(f'<tr class="{pos_class}" data-numero="{esc(r["numero"])}" data-nombre="{esc(r["nombre"])}">')
-            html_parts.append(f"<td>{i}</td><td>{esc(r['numero'])}</td><td>{esc(r['nombre'])}</td><td>{esc(r['liga'])}</td>")
-            if is_scratch:
-                html_parts.append(f"<td>{esc(r.get('clase', ''))}</td>")
-            if not is_scratch:
-                html_parts.append(f"<td>{esc(r['club'])}</td>")
-            html_parts.append(f"<td>{esc(r['moto'])}</td>")
-            for p in r["por_valida"]:
-                html_parts.append(f"<td>{fmt_valida_cell(p)}</td>")
-            if champ.get("final_valida_bonus"):
-                html_parts.append(f"<td>{fmt_valida_cell(r.get('bonificacion_asistencia'))}</td>")
-            html_parts.append(f'<td class="col-total">{fmt_points(r["total"])}</td></tr>')
-        html_parts.append("</tbody></table></div></div>\n")
-
-    html_parts.append(f"""        </div>
-        <footer>
-            <p><span class="developer">Developed by Mauricio Sánchez Aguilar - Fedemoto</span></p>
-            <p>Este proyecto es de uso interno de FEDEMOTO.</p>
-        </footer>
-    </div>
-    <div id="modalLigaDetalle" class="modal-overlay">
-        <div class="modal-box">
-            <h3 id="modalLigaDetalleTitle">Detalle</h3>
-            <div id="modalLigaDetalleBody"></div>
-            <button type="button" id="modalLigaDetalleClose" class="modal-close">Cerrar</button>
-        </div>
-    </div>
-    <script src="{rel_to_root}load-menu.js"></script>
-    <script>
-        function escapeHtml(t) {{
-            return (t + '').replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
-        }}
-        function renderLigaDetails(raw) {{
-            var list = [];
-            try {{ list = JSON.parse(raw); }} catch (e) {{ list = []; }}
-            if (!Array.isArray(list) || list.length === 0) return '<p>Sin detalles disponibles.</p>';
-            var html = '<ul>';
-            list.forEach(function(item) {{
-                var cat = (item.categoria || '');
-                var pil = (item.piloto || '');
-                var pts = (item.puntos || 0);
-                html += '<li><strong>' + escapeHtml(cat) + '</strong> — ' + escapeHtml(pil) + ' (' + pts + ' pts)</li>';
-            }});
-            html += '</ul>';
-            return html;
-        }}
-        var modal = document.getElementById('modalLigaDetalle');
-        var modalTitle = document.getElementById('modalLigaDetalleTitle');
-        var modalBody = document.getElementById('modalLigaDetalleBody');
-        document.querySelectorAll('.info-btn').forEach(function(btn) {{
-            btn.addEventListener('click', function() {{
-                modalTitle.textContent = this.getAttribute('data-title') || 'Detalle';
-                modalBody.innerHTML = renderLigaDetails(this.getAttribute('data-details') || '[]');
-                modal.classList.add('open');
-            }});
-        }});
-        document.getElementById('modalLigaDetalleClose').addEventListener('click', function() {{
-            modal.classList.remove('open');
-        }});
-        modal.addEventListener('click', function(e) {{
-            if (e.target === this) this.classList.remove('open');
-        }});
-        document.querySelectorAll('.btn-top').forEach(function(btn) {{
-            btn.addEventListener('click', function() {{ window.scrollTo({{ top: 0, behavior: 'smooth' }}); }});
-        }});
-        var buscador = document.getElementById('buscador');
-        buscador.addEventListener('input', function() {{
-            var q = this.value.trim().toLowerCase();
-            var sections = document.querySelectorAll('.categoria-section');
-            var cards = document.querySelectorAll('.index-card');
-            cards.forEach(function(c){{ c.classList.remove('search-match', 'search-no-results'); }});
-            sections.forEach(function(s){{ s.classList.remove('search-match', 'search-no-results'); }});
-            if (!q) {{
-                document.querySelectorAll('.search-hidden').forEach(function(tr){{ tr.classList.remove('search-hidden'); }});
-                return;
-            }}
-            sections.forEach(function(section) {{
-                var rows = section.querySelectorAll('tbody tr[data-numero], tbody tr[data-nombre]');
-                var visible = 0;
-                rows.forEach(function(tr) {{
-                    var num = (tr.getAttribute('data-numero') || '').toLowerCase();
-                    var nom = (tr.getAttribute('data-nombre') || '').toLowerCase();
-                    var match = num.indexOf(q) >= 0 || nom.indexOf(q) >= 0;
-                    tr.classList.toggle('search-hidden', !match);
-                    if (match) visible++;
-                }});
-                var id = section.getAttribute('data-categoria-id');
-                var card = document.querySelector('.index-card[href="#' + id + '"]');
-                if (visible > 0) {{
-                    section.classList.add('search-match');
-                    if (card) card.classList.add('search-match');
-                }} else {{
-                    section.classList.add('search-no-results');
-                    if (card) card.classList.add('search-no-results');
-                }}
-            }});
-        }});
-    </script>
-</body>
-</html>""")
-    return "".join(html_parts)
+        html_parts.append(
+            f'<th>Total</th></tr></thead><tbody data-src="{esc(categorias_url(champ, sid))}">'
+            f'<tr class="cargando"><td colspan="{columnas_categoria(champ)}">{len(rows)} pilotos</td></tr>'
+            "</tbody></table></div></div>\n"
+        )
+
+    return plantillas.render(
+        "resultado_general.html",
+        title=esc(title),
+        root=rel_to_root,
+        estilos=recursos_estaticos.estilos_head(("fuentes_sitio.html", "resultado_general.css"), rel_to_root),
+        heading=esc(h1),
+        subtitle=esc(subtitle),
+        generated_at=generated_at,
+        index_cards="".join(index_cards),
+        liga_rows="".join(liga_parts),
+        medallero=esc(os.path.basename(medallero_path(champ))),
+        sections="".join(html_parts),
+        script=recursos_estaticos.url("resultado_general.js", rel_to_root),
+    )
+
+
+def generate_championship(champ):
+    stats = {}
+    table = build_general_table(champ, stats=stats)
+    out = champ["output_html"]
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    medallero = medallero_ligas(table)
+    with open(out, "w", encoding="utf-8") as f:
+        f.write(render_html(champ, table, medallero))
+    write_medallero(champ, medallero)
+    write_categorias(champ, table)
+    print(
+        "Resultado general generado:", out,
+        f"(válidas releídas {stats['releidas']}/{stats['validas']}, "
+        f"categorías recalculadas {stats['recalculadas']}/{stats['categorias']})",
+    )
 
 
 def generate():
     for champ in CHAMPIONSHIPS:
-        table = build_general_table(champ)
-        out = champ["output_html"]
-        os.makedirs(os.path.dirname(out), exist_ok=True)
-        with open(out, "w", encoding="utf-8") as f:
-            f.write(render_html(champ, table))
-        print("Resultado general generado:", out)
+        generate_championship(champ)
 
 
 if __name__ == "__main__":
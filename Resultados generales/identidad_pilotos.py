@@ -0,0 +1,430 @@
+# -*- coding: utf-8 -*-
+"""
+Índice persistente de identidades de pilotos de una temporada.
+
+Cada fila de resultados (modalidad, N°, nombre y, si la fuente la trae, licencia) se resuelve a
+un id de piloto. Las llaves exactas viven en diccionarios — licencia, nombre normalizado (sin
+tildes, solo letras y números) y (modalidad, N°) — así que unir pilotos en tablas generales,
+informes o estadísticas cuesta una búsqueda por fila. El N° solo identifica dentro de la
+modalidad; nombre y licencia, en toda la temporada.
+
+Las variantes de nombre (errores de digitación, apellidos omitidos) se reconocen por
+coincidencia aproximada solo la primera vez que aparecen, y quedan como alias del piloto:
+
+  - mismo N° en la modalidad y nombre compatible: uno es prefijo del otro, o similitud ≥ 0.8
+    con los mismos apellidos (palabras después de la primera, ver `apellidos_coinciden`);
+  - sin N° en común, nombre muy parecido (similitud ≥ 0.92, mismos dígitos), con candidatos
+    buscados por trigramas.
+
+Se guarda en `.cache/identidad_pilotos/<temporada>.json` con las observaciones de cada fuente
+(carpeta FILES EXPORTED, con su firma) y el id asignado a cada una: cargarlo no recalcula nada.
+Agregar una válida, o una que cambió conservando sus filas anteriores, solo resuelve las filas
+de esa fuente; una firma nueva con las mismas filas (p. ej. solo cambió el mtime) no resuelve
+nada. Solo si una fuente pierde filas o se quita (`quitar_fuentes`) el índice se rearma
+reproduciendo las fuentes en orden, para que sus alias viejos no sigan uniendo pilotos.
+
+`revision(modalidad)` aumenta solo cuando cambia cómo se agrupan pilotos que ya existían en
+esa modalidad: dos identidades con filas en ella se unen, o un rearmado une o separa sus
+filas. Las tablas de los campeonatos de otras modalidades (y las de la misma si nada se unió)
+siguen vigentes. `FEDEMOTO_GENERALES_CACHE=0` lo mantiene solo en memoria.
+
+Uso (resumen del índice y pilotos con variantes de nombre):
+    python "Resultados generales/identidad_pilotos.py"
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import threading
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+_RV_ROOT = os.path.join(ROOT_DIR, "Resultados_validas")
+if _RV_ROOT not in sys.path:
+    sys.path.insert(0, _RV_ROOT)
+import normalizacion
+
+INDEX_DIR = os.path.join(ROOT_DIR, ".cache", "identidad_pilotos")
+INDEX_VERSION = 3
+
+SIMILITUD_MISMO_NUMERO = 0.8
+SIMILITUD_SOLO_NOMBRE = 0.92
+LARGO_MINIMO_APROXIMADO = 10
+TRIGRAMAS_EN_COMUN = 0.6
+
+_INDICES = {}
+_RE_NO_ALFANUM = re.compile(r"[^a-z0-9]+")
+
+
+def clave_nombre(nombre):
+    """Nombre normalizado: minúsculas, sin tildes, solo letras y números (memorizado)."""
+    return normalizacion.clave(nombre)
+
+
+@lru_cache(maxsize=8192)
+def palabras_nombre(nombre):
+    """Nombre normalizado con sus palabras separadas por un espacio ('José PÉREZ-Gómez' → 'jose perez gomez')."""
+    texto = normalizacion.sin_tildes(str(nombre or "").strip().lower())
+    return " ".join(p for p in _RE_NO_ALFANUM.split(texto) if p)
+
+
+def _similitud(a, b):
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _digitos(clave):
+    return re.sub(r"\D", "", clave)
+
+
+def apellidos_coinciden(a, b):
+    """
+    Cada palabra del nombre más corto (listas de palabras), salvo la primera, está entre las del
+    otro salvo su primera, igual o con similitud ≥ 0.8: 'gomez'/'gomes' sí, 'ulloa'/'urrutia' no.
+    """
+    corto, largo = sorted((a, b), key=len)
+    return all(any(p == q or _similitud(p, q) >= SIMILITUD_MISMO_NUMERO for q in largo[1:]) for p in corto[1:])
+
+
+def nombres_compatibles(a, b):
+    """
+    Dos nombres (palabras_nombre) del mismo N° que pueden ser la misma persona: uno es prefijo
+    del otro o, con similitud ≥ 0.8, los mismos apellidos.
+    """
+    if not a or not b or a == b:
+        return True
+    ca, cb = a.replace(" ", ""), b.replace(" ", "")
+    if min(len(ca), len(cb)) >= 8 and (ca.startswith(cb) or cb.startswith(ca)):
+        return True
+    return _similitud(ca, cb) >= SIMILITUD_MISMO_NUMERO and apellidos_coinciden(a.split(), b.split())
+
+
+def _trigramas(clave):
+    return {clave[i:i + 3] for i in range(len(clave) - 2)}
+
+
+def _habilitado():
+    return os.environ.get("FEDEMOTO_GENERALES_CACHE", "1") != "0"
+
+
+class IndicePilotos:
+    """Identidades de pilotos de una temporada (ver docstring del módulo)."""
+
+    def __init__(self, temporada):
+        self.temporada = temporada
+        # fuente → {"firma", "observaciones": [[modalidad, numero, palabras, licencia], ...], "ids": [...]}
+        # (palabras: palabras_nombre; la clave del nombre es la misma sin espacios)
+        self.fuentes = {}
+        # modalidad → revisión (ver revision()).
+        self.revisiones = {}
+        self.modificado = False
+        self._limpiar()
+
+    def _limpiar(self):
+        self._padre = []
+        self._nombres = []
+        self._modalidades = []
+        # Ids creados antes de la actualización en curso (solo unir dos de ellos cambia revisiones).
+        self._existentes = 0
+        self._por_licencia = {}
+        self._por_nombre = {}
+        self._por_numero = {}
+        self._trigramas = defaultdict(set)
+
+    # --- union-find ---------------------------------------------------------------------
+
+    def _nuevo(self, pid=None):
+        if pid is None:
+            pid = len(self._padre)
+        while len(self._padre) <= pid:
+            self._padre.append(len(self._padre))
+            self._nombres.append(set())
+            self._modalidades.append(set())
+        return pid
+
+    def _raiz(self, pid):
+        padre = self._padre
+        raiz = pid
+        while padre[raiz] != raiz:
+            raiz = padre[raiz]
+        while padre[pid] != raiz:
+            padre[pid], pid = raiz, padre[pid]
+        return raiz
+
+    def _unir(self, a, b):
+        a, b = self._raiz(a), self._raiz(b)
+        if a == b:
+            return a
+        if b < a:
+            a, b = b, a
+        if b < self._existentes:
+            # Dos pilotos que ya existían: cambian las tablas de las modalidades donde ambos corren.
+            for modalidad in self._modalidades[a] & self._modalidades[b]:
+                self._subir_revision(modalidad)
+        self._padre[b] = a
+        self._nombres[a] |= self._nombres[b]
+        self._nombres[b] = set()
+        self._modalidades[a] |= self._modalidades[b]
+        self._modalidades[b] = set()
+        return a
+
+    def _subir_revision(self, modalidad):
+        self.revisiones[modalidad] = self.revisiones.get(modalidad, 0) + 1
+
+    def revision(self, modalidad):
+        """Revisión de la agrupación de pilotos de la modalidad (parte de la firma de las tablas)."""
+        return self.revisiones.get(modalidad, 0)
+
+    # --- resolución ---------------------------------------------------------------------
+
+    def _registrar(self, pid, modalidad, numero, palabras, licencia):
+        clave = palabras.replace(" ", "")
+        self._modalidades[self._raiz(pid)].add(modalidad)
+        if licencia:
+            self._por_licencia.setdefault(licencia, pid)
+        if clave and clave not in self._por_nombre:
+            self._por_nombre[clave] = pid
+            self._nombres[self._raiz(pid)].add(palabras)
+            for t in _trigramas(clave):
+                self._trigramas[t].add(clave)
+        if numero:
+            self._por_numero.setdefault((modalidad, numero), pid)
+
+    def _aproximado(self, clave):
+        """Piloto con un nombre muy parecido a `clave` (None si no hay o es ambiguo)."""
+        if len(clave) < LARGO_MINIMO_APROXIMADO:
+            return None
+        propios = _trigramas(clave)
+        conteo = Counter()
+        for t in propios:
+            conteo.update(self._trigramas.get(t, ()))
+        minimo = TRIGRAMAS_EN_COMUN * len(propios)
+        digitos = _digitos(clave)
+        mejor, mejor_ids = 0.0, set()
+        for candidato, n in conteo.items():
+            if n < minimo or _digitos(candidato) != digitos:
+                continue
+            sim = _similitud(clave, candidato)
+            if sim < SIMILITUD_SOLO_NOMBRE or sim < mejor:
+                continue
+            pid = self._raiz(self._por_nombre[candidato])
+            if sim > mejor:
+                mejor, mejor_ids = sim, {pid}
+            else:
+                mejor_ids.add(pid)
+        return next(iter(mejor_ids)) if len(mejor_ids) == 1 else None
+
+    def resolver(self, modalidad, numero, nombre, licencia=None):
+        """Id del piloto de la fila; lo crea si es nuevo y registra sus llaves como alias."""
+        numero = str(numero or "").strip()
+        licencia = str(licencia or "").strip()
+        palabras = palabras_nombre(nombre)
+        clave = palabras.replace(" ", "")
+        ids = []
+        if licencia and licencia in self._por_licencia:
+            ids.append(self._raiz(self._por_licencia[licencia]))
+        if clave and clave in self._por_nombre:
+            ids.append(self._raiz(self._por_nombre[clave]))
+        if numero and (modalidad, numero) in self._por_numero:
+            pid = self._raiz(self._por_numero[(modalidad, numero)])
+            nombres = self._nombres[pid]
+            if not clave or not nombres or any(nombres_compatibles(palabras, n) for n in nombres):
+                ids.append(pid)
+        if not ids and clave:
+            pid = self._aproximado(clave)
+            if pid is not None:
+                ids.append(pid)
+        if ids:
+            pid = ids[0]
+            for otro in ids[1:]:
+                pid = self._unir(pid, otro)
+        else:
+            pid = self._nuevo()
+        self._registrar(pid, modalidad, numero, palabras, licencia)
+        return pid
+
+    def piloto(self, modalidad, numero, nombre, licencia=None):
+        """Id de un piloto ya indexado (solo búsquedas exactas; None si no está)."""
+        licencia = str(licencia or "").strip()
+        if licencia and licencia in self._por_licencia:
+            return self._raiz(self._por_licencia[licencia])
+        clave = clave_nombre(nombre)
+        if clave and clave in self._por_nombre:
+            return self._raiz(self._por_nombre[clave])
+        numero = str(numero or "").strip()
+        if numero and (modalidad, numero) in self._por_numero:
+            return self._raiz(self._por_numero[(modalidad, numero)])
+        return None
+
+    def nombres(self, pid):
+        """Nombres normalizados (variantes) del piloto."""
+        return set(self._nombres[self._raiz(pid)])
+
+    def identidades(self):
+        return {self._raiz(p) for p in range(len(self._padre))}
+
+    # --- fuentes ------------------------------------------------------------------------
+
+    def actualizar_fuente(self, fuente, firma, modalidad, filas_por_categoria):
+        """
+        Registra las filas (dicts con numero, nombre y opcionalmente licencia) de una fuente.
+        Si la firma no cambió no hace nada; con las mismas filas solo guarda la firma nueva; si
+        conserva todas sus filas anteriores solo se resuelven las de esta fuente y, si perdió
+        alguna, el índice se rearma. Retorna True si el índice cambió.
+        """
+        firma = json.loads(json.dumps(firma))
+        previa = self.fuentes.get(fuente)
+        if previa is not None and previa["firma"] == firma:
+            return False
+        observaciones = [
+            [modalidad, str(r.get("numero") or "").strip(), palabras_nombre(r.get("nombre")),
+             str(r.get("licencia") or "").strip()]
+            for rows in filas_por_categoria.values()
+            for r in rows
+        ]
+        self.modificado = True
+        if previa is not None and previa["observaciones"] == observaciones:
+            previa["firma"] = firma
+            return True
+        anteriores = {tuple(o) for o in previa["observaciones"]} if previa is not None else set()
+        self.fuentes[fuente] = {"firma": firma, "observaciones": observaciones, "ids": []}
+        if anteriores <= {tuple(o) for o in observaciones}:
+            self._existentes = len(self._padre)
+            self.fuentes[fuente]["ids"] = [self.resolver(*o) for o in observaciones]
+        else:
+            self.rearmar()
+        return True
+
+    def quitar_fuentes(self, fuentes):
+        """Quita fuentes (p. ej. válidas que ya no están en el registro) y rearma el índice."""
+        quitadas = [f for f in fuentes if f in self.fuentes]
+        if not quitadas:
+            return False
+        for fuente in quitadas:
+            del self.fuentes[fuente]
+        self.rearmar()
+        self.modificado = True
+        return True
+
+    def quitar_fuente(self, fuente):
+        return self.quitar_fuentes([fuente])
+
+    def _particion(self):
+        """modalidad → {(numero, palabras, licencia): id} de todas las observaciones."""
+        particion = defaultdict(dict)
+        for entry in self.fuentes.values():
+            for (modalidad, numero, palabras, licencia), pid in zip(entry["observaciones"], entry["ids"]):
+                particion[modalidad][(numero, palabras, licencia)] = self._raiz(pid)
+        return particion
+
+    def rearmar(self):
+        """
+        Vuelve a resolver todas las observaciones, fuente por fuente, en orden. Sube la revisión
+        de las modalidades cuyas observaciones, antes y después, quedan agrupadas distinto.
+        """
+        antes = self._particion()
+        self._limpiar()
+        for entry in self.fuentes.values():
+            entry["ids"] = [self.resolver(*o) for o in entry["observaciones"]]
+        despues = self._particion()
+        for modalidad in set(antes) & set(despues):
+            comunes = antes[modalidad].keys() & despues[modalidad].keys()
+            if _grupos(antes[modalidad], comunes) != _grupos(despues[modalidad], comunes):
+                self._subir_revision(modalidad)
+
+    # --- persistencia -------------------------------------------------------------------
+
+    def estado(self):
+        fuentes = {}
+        for fuente, entry in self.fuentes.items():
+            fuentes[fuente] = {
+                "firma": entry["firma"],
+                "observaciones": [o + [self._raiz(pid)] for o, pid in zip(entry["observaciones"], entry["ids"])],
+            }
+        return {"version": INDEX_VERSION, "temporada": self.temporada, "revisiones": self.revisiones, "fuentes": fuentes}
+
+    @classmethod
+    def desde_estado(cls, estado):
+        """Reconstruye los diccionarios con los ids guardados, sin volver a resolver."""
+        indice = cls(estado["temporada"])
+        indice.revisiones = dict(estado["revisiones"])
+        for fuente, entry in estado["fuentes"].items():
+            observaciones, ids = [], []
+            for modalidad, numero, palabras, licencia, pid in entry["observaciones"]:
+                indice._nuevo(pid)
+                indice._registrar(pid, modalidad, numero, palabras, licencia)
+                observaciones.append([modalidad, numero, palabras, licencia])
+                ids.append(pid)
+            indice.fuentes[fuente] = {"firma": entry["firma"], "observaciones": observaciones, "ids": ids}
+        return indice
+
+    def guardar(self):
+        if not self.modificado or not _habilitado():
+            return
+        path = _index_file(self.temporada)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(INDEX_DIR, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.estado(), f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        self.modificado = False
+
+
+def _grupos(mapa, claves):
+    """Agrupación de `claves` según su id en `mapa` (conjunto de grupos, sin importar los ids)."""
+    grupos = defaultdict(set)
+    for clave in claves:
+        grupos[mapa[clave]].add(clave)
+    return {frozenset(g) for g in grupos.values()}
+
+
+def _index_file(temporada):
+    return os.path.join(INDEX_DIR, f"{temporada}.json")
+
+
+def indice(temporada):
+    """Índice de la temporada, cargado una vez por proceso (vacío si no existe o no es válido)."""
+    temporada = str(temporada)
+    if temporada in _INDICES:
+        return _INDICES[temporada]
+    cargado = None
+    if _habilitado():
+        try:
+            with open(_index_file(temporada), "r", encoding="utf-8") as f:
+                estado = json.load(f)
+            if estado.get("version") == INDEX_VERSION and estado.get("temporada") == temporada:
+                cargado = IndicePilotos.desde_estado(estado)
+        except (OSError, ValueError, KeyError, TypeError):
+            cargado = None
+    _INDICES[temporada] = cargado or IndicePilotos(temporada)
+    return _INDICES[temporada]
+
+
+def main():
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import generar_resultados_generales as generales
+
+    for champ in generales.CHAMPIONSHIPS:
+        generales.build_general_table(champ)
+    ind = indice(generales.TEMPORADA)
+    ids = ind.identidades()
+    variantes = sorted(
+        (sorted(ind.nombres(pid)) for pid in ids if len(ind.nombres(pid)) > 1),
+        key=lambda ns: ns[0],
+    )
+    print(f"Temporada {ind.temporada}: {len(ind.fuentes)} fuentes, {len(ids)} pilotos, "
+          f"{len(variantes)} con variantes de nombre")
+    for nombres in variantes:
+        print("  " + " | ".join(nombres))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Simulador del cierre del campeonato: qué necesita cada piloto para ser campeón de su categoría.
+
+Parte de la tabla general actual (build_general_table) y de las válidas que faltan por correr:
+las `pendientes` del campeonato en el registro (temporada_2026.json) o `--validas N`. La última
+de ellas pasa a ser la última del campeonato: el bono de asistencia a la última válida
+(`final_valida_bonus`) se mueve a quienes la corran y el desempate por válida más reciente la
+mira primero a ella (standings_key). Los puntos que da cada válida por puesto se toman de la
+válida más reciente de la categoría (puntos ya obtenidos, de mayor a menor) o de `--puntos`.
+
+Para cada piloto y cada puesto posible, repetido en todas las válidas que faltan:
+  - asegura el título si ningún rival, tomando en cada válida el mejor puesto que queda libre,
+    lo supera;
+  - conserva opción si, con los rivales sin correr, queda primero.
+Ganar todas es lo mejor que le puede pasar a un piloto y que un rival no corra ninguna, lo peor
+para ese rival, así que las dos condiciones son exactas. Antes se descartan por cotas los pilotos
+sin opción aun ganando todas (N × (puntos del 1° + bono)) y los que ya son campeones sin correr;
+los rivales se recorren de mayor a menor puntaje y se corta apenas ninguno alcanza. Así cada
+categoría se responde en milisegundos sin volver a generar nada.
+
+Uso:
+    python "Resultados generales/simulador_final.py" velotierra_2s "125 CC"
+    python "Resultados generales/simulador_final.py" motocross_1s MX2 --validas 1 --numero 714
+    python "Resultados generales/simulador_final.py" motocross_1s MX2 --validas 1 --puntos 50,44,40,36,32
+    python "Resultados generales/simulador_final.py" velotierra_2s "125 CC" --resultado 714=50,44 --resultado 12=-,50
+"""
+
+import argparse
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import generar_resultados_generales as generales
+from generar_resultados_generales import fmt_points, normalize_key, standings_key, sum_valida_points
+import tabla_puntos
+
+
+def validas_pendientes(champ):
+    """Etiquetas de las válidas que faltan por correr (`pendientes` del registro)."""
+    return list(champ.get("pendientes", ()))
+
+
+def puntos_valida_reciente(filas):
+    """Puntos por puesto de la válida más reciente con datos en la categoría (mayor a menor)."""
+    n = max((len(r["por_valida"]) for r in filas), default=0)
+    for i in range(n - 1, -1, -1):
+        puntos = [r["por_valida"][i] for r in filas if i < len(r["por_valida"]) and r["por_valida"][i] is not None]
+        if puntos:
+            return sorted((float(p) for p in puntos), reverse=True)
+    return []
+
+
+def _restantes(champ, validas):
+    n = len(validas_pendientes(champ)) if validas is None else int(validas)
+    if n < 1:
+        raise ValueError(f"{champ.get('id', 'el campeonato')}: no quedan válidas por correr (pendientes en el registro o --validas)")
+    return n
+
+
+def _llave(rider, puntos, bonus):
+    """Llave de orden del piloto con las válidas que faltan (`puntos`, una por válida; None = no la corre)."""
+    por_valida = list(rider["por_valida"]) + list(puntos)
+    total = sum_valida_points(por_valida) + (float(bonus) if puntos[-1] is not None and bonus else 0.0)
+    return standings_key(total, por_valida, rider["nombre"])
+
+
+def simular(champ, filas, resultados, validas=None):
+    """
+    Tabla de la categoría con las válidas que faltan simuladas. `resultados`: N° → puntos en
+    cada una, en orden (None o una lista más corta = no la corre). Retorna filas como las de
+    build_general_table.
+    """
+    n = _restantes(champ, validas)
+    bonus = champ.get("final_valida_bonus", 0)
+    simuladas = []
+    for r in filas:
+        ps = [float(p) if p is not None else None for p in resultados.get(r["numero"], ())]
+        if len(ps) > n:
+            raise ValueError(f"#{r['numero']}: {len(ps)} resultados para {n} válidas")
+        por_valida = list(r["por_valida"]) + ps + [None] * (n - len(ps))
+        row = dict(r, por_valida=por_valida)
+        row["total"] = sum_valida_points(por_valida)
+        if bonus:
+            row["bonificacion_asistencia"] = float(bonus) if por_valida[-1] is not None else None
+            row["total"] += row["bonificacion_asistencia"] or 0.0
+        simuladas.append(row)
+    return sorted(simuladas, key=generales.standings_sort_key)
+
+
+def escenarios_final(champ, filas, puntos=None, validas=None):
+    """
+    Para cada piloto de la categoría (en el orden de `filas`) retorna un dict con:
+      numero, nombre, total (actual), base (sin bono), estado ('campeón', 'en disputa' o
+      'sin opción'), asegura (peor puesto que, repetido en cada válida que falta, le da el título
+      pase lo que pase; 0 = aunque no corra ninguna; None = depende de otros) y opcion (peor
+      puesto con el que, repetido, aún puede ser campeón; None = ninguno).
+    `validas`: cuántas faltan (por defecto las pendientes del registro). `puntos` por puesto,
+    de mayor a menor (ValueError si no lo están).
+    """
+    n = _restantes(champ, validas)
+    bonus = champ.get("final_valida_bonus", 0)
+    puntos = [float(p) for p in puntos] if puntos is not None else puntos_valida_reciente(filas)
+    if any(a < b for a, b in zip(puntos, puntos[1:])):
+        raise ValueError("los puntos por puesto deben ir de mayor a menor")
+    # Un puesto más allá de la tabla corre la válida sin sumar puntos (solo el bono).
+    slots = puntos + [0.0]
+    maximo = n * slots[0] + (float(bonus) if bonus else 0.0)
+    base = [sum_valida_points(r["por_valida"]) for r in filas]
+    orden = sorted(range(len(filas)), key=lambda i: -base[i])
+    ausente = [_llave(r, [None] * n, bonus) for r in filas]
+
+    def asegura(i, p):
+        """Con el puesto p en cada válida (None = no corre), ¿ningún rival lo supera?"""
+        propia = _llave(filas[i], [None if p is None else slots[p]] * n, bonus)
+        mejor = (slots[1] if len(slots) > 1 else 0.0) if p == 0 else slots[0]
+        for j in orden:
+            if j == i:
+                continue
+            if base[j] + maximo < -propia[0]:
+                break
+            if _llave(filas[j], [mejor] * n, bonus) < propia:
+                return False
+        return True
+
+    def opcion(i, p):
+        """Con el puesto p en cada válida y los rivales sin correr, ¿queda primero?"""
+        propia = _llave(filas[i], [slots[p]] * n, bonus)
+        for j in orden:
+            if j == i:
+                continue
+            if base[j] < -propia[0]:
+                break
+            if ausente[j] < propia:
+                return False
+        return True
+
+    lider = base[orden[0]] if orden else 0.0
+    out = []
+    for i, r in enumerate(filas):
+        info = {
+            "numero": r["numero"],
+            "nombre": r["nombre"],
+            "total": r["total"],
+            "base": base[i],
+            "estado": "sin opción",
+            "asegura": None,
+            "opcion": None,
+        }
+        out.append(info)
+        # Cota: ni ganando todas alcanza al que más puntos tiene.
+        if base[i] + maximo < lider:
+            continue
+        if asegura(i, None):
+            info.update(estado="campeón", asegura=0, opcion=len(slots))
+            continue
+        # Ambas condiciones son monótonas en el puesto: se busca el peor que las cumple.
+        for p in range(len(slots) - 1, -1, -1):
+            if opcion(i, p):
+                info["opcion"] = p + 1
+                break
+        if info["opcion"] is None:
+            continue
+        info["estado"] = "en disputa"
+        for p in range(info["opcion"] - 1, -1, -1):
+            if asegura(i, p):
+                info["asegura"] = p + 1
+                break
+    return out
+
+
+def buscar_categoria(tabla, categoria):
+    if categoria in tabla:
+        return categoria
+    clave = normalize_key(categoria)
+    for c in tabla:
+        if normalize_key(c) == clave:
+            return c
+    return None
+
+
+def _puesto(p, ultimo):
+    if p is None:
+        return "-"
+    if p == 0:
+        return "sin correr"
+    if p >= ultimo:
+        return "corriendo"
+    return f"{p}°"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Qué necesita cada piloto en las válidas que faltan para ser campeón.")
+    parser.add_argument("campeonato", help="id del campeonato en CHAMPIONSHIPS (p. ej. motocross_1s).")
+    parser.add_argument("categoria")
+    parser.add_argument("--numero", help="Solo este N°.")
+    parser.add_argument("--validas", type=int, help="Válidas que faltan (por defecto las `pendientes` del campeonato en el registro).")
+    parser.add_argument("--puntos", help="Puntos de cada válida por puesto, de mayor a menor y separados por coma (por defecto los de la válida más reciente).")
+    parser.add_argument("--resultado", action="append", default=[], metavar="N°=PUNTOS,...", help="Puntos hipotéticos del N° en cada válida que falta, en orden ('-' = no la corre; repetible); muestra la tabla resultante.")
+    args = parser.parse_args(argv)
+
+    champ = next((c for c in generales.CHAMPIONSHIPS if c.get("id") == args.campeonato), None)
+    if champ is None:
+        parser.error(f"campeonato desconocido: {args.campeonato} ({', '.join(c['id'] for c in generales.CHAMPIONSHIPS)})")
+    tabla = generales.build_general_table(champ)
+    categoria = buscar_categoria(tabla, args.categoria)
+    if categoria is None:
+        parser.error(f"categoría desconocida: {args.categoria} ({', '.join(sorted(tabla))})")
+    filas = tabla[categoria]
+    pendientes = validas_pendientes(champ)
+    n = len(pendientes) if args.validas is None else args.validas
+    nombres = ", ".join(pendientes) if args.validas is None else f"{n} válida" + ("s" if n != 1 else "")
+
+    if args.resultado:
+        resultados = {}
+        for item in args.resultado:
+            numero, _, puntos = item.partition("=")
+            resultados[numero.strip()] = [None if p.strip() in ("", "-") else tabla_puntos.puntos(p) for p in puntos.split(",")]
+        try:
+            simuladas = simular(champ, filas, resultados, n)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"{champ['modalidad']} - {champ['campeonato']} - {categoria} (simulando {nombres})")
+        for i, r in enumerate(simuladas, start=1):
+            print(f"{i:>3}. #{r['numero']:<5} {r['nombre']:<40} {fmt_points(r['total']):>6}")
+        return 0
+
+    puntos = [tabla_puntos.puntos(p) for p in args.puntos.split(",")] if args.puntos else None
+    try:
+        escenarios = escenarios_final(champ, filas, puntos, n)
+    except ValueError as e:
+        parser.error(str(e))
+    ultimo = len(puntos if puntos is not None else puntos_valida_reciente(filas)) + 1
+    print(f"{champ['modalidad']} - {champ['campeonato']} - {categoria} (faltan {nombres})")
+    print("El puesto se repite en cada válida que falta.")
+    print("Pos. N°     Nombre                                   Total  Estado       Asegura con  Opción con")
+    for i, e in enumerate(escenarios, start=1):
+        if args.numero and e["numero"] != args.numero:
+            continue
+        print(
+            f"{i:>3}. #{e['numero']:<5} {e['nombre']:<40} {fmt_points(e['total']):>6}  {e['estado']:<11}  "
+            f"{_puesto(e['asegura'], ultimo):<11}  {_puesto(e['opcion'], ultimo)}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de las reglas de identidad_pilotos: umbrales de nombres parecidos (0.8 y los mismos
+apellidos con el mismo N°, 0.92 solo por nombre), candidatos ambiguos y cuándo cambia la revisión
+de una modalidad.
+
+    python -m unittest discover -s "Resultados generales" -p "test_*.py"
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import identidad_pilotos
+from identidad_pilotos import IndicePilotos, clave_nombre
+
+
+def _similitud(a, b):
+    return identidad_pilotos._similitud(clave_nombre(a), clave_nombre(b))
+
+
+def _filas(*pilotos):
+    """Filas de una fuente con una sola categoría: (numero, nombre) → dicts como los de generales."""
+    return {"Open": [{"numero": numero, "nombre": nombre} for numero, nombre in pilotos]}
+
+
+class MismoNumeroTest(unittest.TestCase):
+    """Con el mismo N° en la modalidad basta un nombre compatible (prefijo, o similitud ≥ 0.8 y los mismos apellidos)."""
+
+    def test_nombre_parecido_une(self):
+        self.assertGreaterEqual(_similitud("Jhon Restrepo", "John Restrepo"), identidad_pilotos.SIMILITUD_MISMO_NUMERO)
+        ind = IndicePilotos("t")
+        self.assertEqual(ind.resolver("MX", "7", "Jhon Restrepo"), ind.resolver("MX", "7", "John Restrepo"))
+
+    def test_apellido_parecido_une(self):
+        ind = IndicePilotos("t")
+        self.assertEqual(ind.resolver("MX", "7", "Andres Gomez Rios"), ind.resolver("MX", "7", "Andres Gomes"))
+
+    def test_apellido_distinto_no_une(self):
+        # Caso real: dos pilotas con el mismo N° y primer apellido; 0.81 de similitud en el nombre completo.
+        a, b = "Saraliseth Varon Ulloa", "Saraliseth Varon Urrutia"
+        self.assertGreaterEqual(_similitud(a, b), identidad_pilotos.SIMILITUD_MISMO_NUMERO)
+        ind = IndicePilotos("t")
+        self.assertNotEqual(ind.resolver("MX", "7", a), ind.resolver("MX", "7", b))
+
+    def test_nombre_distinto_no_une(self):
+        self.assertLess(_similitud("Ivan Rios", "Ivon Rias"), identidad_pilotos.SIMILITUD_MISMO_NUMERO)
+        ind = IndicePilotos("t")
+        self.assertNotEqual(ind.resolver("MX", "7", "Ivan Rios"), ind.resolver("MX", "7", "Ivon Rias"))
+
+    def test_prefijo_une_bajo_el_umbral(self):
+        self.assertLess(_similitud("Juan Perez", "Juan Perez Gomez"), identidad_pilotos.SIMILITUD_MISMO_NUMERO)
+        ind = IndicePilotos("t")
+        self.assertEqual(ind.resolver("MX", "7", "Juan Perez"), ind.resolver("MX", "7", "Juan Perez Gomez"))
+
+    def test_numero_solo_cuenta_en_su_modalidad(self):
+        ind = IndicePilotos("t")
+        self.assertNotEqual(ind.resolver("MX", "7", "Luis Perez"), ind.resolver("Enduro", "7", "Luis Paez"))
+
+    def test_nombre_exacto_une_entre_modalidades(self):
+        ind = IndicePilotos("t")
+        self.assertEqual(ind.resolver("MX", "7", "Luis Pérez"), ind.resolver("Enduro", "21", "LUIS PEREZ"))
+
+
+class SoloNombreTest(unittest.TestCase):
+    """Sin N° en común solo se une con similitud ≥ 0.92, los mismos dígitos y un único candidato."""
+
+    def test_sobre_el_umbral_une(self):
+        self.assertGreaterEqual(_similitud("Alejandro Munoz", "Alejandra Munoz"), identidad_pilotos.SIMILITUD_SOLO_NOMBRE)
+        ind = IndicePilotos("t")
+        self.assertEqual(ind.resolver("MX", "1", "Alejandro Munoz"), ind.resolver("MX", "2", "Alejandra Munoz"))
+
+    def test_bajo_el_umbral_no_une(self):
+        sim = _similitud("Juan Esteban Diaz", "Juana Estefan Diaz")
+        self.assertGreaterEqual(sim, identidad_pilotos.SIMILITUD_MISMO_NUMERO)
+        self.assertLess(sim, identidad_pilotos.SIMILITUD_SOLO_NOMBRE)
+        ind = IndicePilotos("t")
+        self.assertNotEqual(ind.resolver("MX", "1", "Juan Esteban Diaz"), ind.resolver("MX", "2", "Juana Estefan Diaz"))
+
+    def test_digitos_distintos_no_une(self):
+        self.assertGreaterEqual(_similitud("Santiago Lopez 2", "Santiago Lopez 3"), identidad_pilotos.SIMILITUD_SOLO_NOMBRE)
+        ind = IndicePilotos("t")
+        self.assertNotEqual(ind.resolver("MX", "1", "Santiago Lopez 2"), ind.resolver("MX", "2", "Santiago Lopez 3"))
+
+    def test_candidatos_ambiguos_no_une(self):
+        ind = IndicePilotos("t")
+        a = ind.resolver("MX", "1", "Luisa Arango")
+        b = ind.resolver("MX", "2", "Luis Arango M")
+        self.assertNotEqual(a, b)
+        self.assertNotIn(ind.resolver("MX", "3", "Luis Arango"), (a, b))
+
+
+class RevisionTest(unittest.TestCase):
+    """La revisión de una modalidad cambia solo si se agrupan distinto pilotos que ya existían."""
+
+    def setUp(self):
+        self.ind = IndicePilotos("t")
+        # "Carlitos Ruiz" (0.909 con "Carlos Ruiz") no se une por nombre; sí con el N° 10.
+        self.ind.actualizar_fuente("mx/1", "f1", "MX", _filas(("10", "Carlos Ruiz"), ("20", "Carlitos Ruiz")))
+        self.ind.actualizar_fuente("vel/1", "f1", "Velocidad", _filas(("5", "Ana Lopez")))
+
+    def test_misma_firma_no_cambia(self):
+        self.assertFalse(self.ind.actualizar_fuente("mx/1", "f1", "MX", {}))
+
+    def test_firma_nueva_mismas_filas(self):
+        ids = list(self.ind.fuentes["mx/1"]["ids"])
+        self.assertTrue(
+            self.ind.actualizar_fuente("mx/1", "f2", "MX", _filas(("10", "Carlos Ruiz"), ("20", "Carlitos Ruiz")))
+        )
+        self.assertEqual(self.ind.fuentes["mx/1"]["ids"], ids)
+        self.assertEqual(self.ind.revisiones, {})
+
+    def test_pilotos_nuevos_no_suben_revision(self):
+        self.ind.actualizar_fuente("mx/2", "f1", "MX", _filas(("10", "Carlos Ruiz"), ("33", "Pedro Gomez")))
+        self.assertEqual(self.ind.revisiones, {})
+
+    def test_unir_existentes_sube_solo_su_modalidad(self):
+        carlos = self.ind.piloto("MX", "10", "Carlos Ruiz")
+        carlitos = self.ind.piloto("MX", "20", "Carlitos Ruiz")
+        self.assertNotEqual(carlos, carlitos)
+        self.ind.actualizar_fuente("mx/2", "f1", "MX", _filas(("10", "Carlitos Ruiz")))
+        self.assertEqual(self.ind.piloto("MX", "10", "Carlos Ruiz"), self.ind.piloto("MX", "20", "Carlitos Ruiz"))
+        self.assertEqual(self.ind.revision("MX"), 1)
+        self.assertEqual(self.ind.revision("Velocidad"), 0)
+
+    def test_fuente_que_conserva_sus_filas_no_rearma(self):
+        self.ind.actualizar_fuente("mx/1", "f2", "MX", _filas(("10", "Carlos Ruiz"), ("20", "Carlitos Ruiz"), ("33", "Pedro Gomez")))
+        self.assertEqual(self.ind.revisiones, {})
+        self.assertIsNotNone(self.ind.piloto("MX", "33", "Pedro Gomez"))
+
+    def test_quitar_fuente_separa_y_olvida_alias(self):
+        self.ind.actualizar_fuente("mx/2", "f1", "MX", _filas(("10", "Carlitos Ruiz"), ("44", "Alejandro Munoz")))
+        self.ind.quitar_fuentes(["mx/2"])
+        self.assertNotEqual(self.ind.piloto("MX", "10", "Carlos Ruiz"), self.ind.piloto("MX", "20", "Carlitos Ruiz"))
+        self.assertIsNone(self.ind.piloto("MX", "44", "Alejandro Munoz"))
+        self.assertEqual(self.ind.revision("MX"), 2)
+        self.assertEqual(self.ind.revision("Velocidad"), 0)
+        # Sin el alias quitado, un nombre parecido ya no se une a él.
+        self.ind.actualizar_fuente("mx/3", "f1", "MX", _filas(("45", "Alejandra Munoz")))
+        self.assertEqual(self.ind.revision("MX"), 2)
+
+    def test_fuente_que_pierde_filas_rearma(self):
+        self.ind.actualizar_fuente("mx/2", "f1", "MX", _filas(("10", "Carlitos Ruiz")))
+        self.ind.actualizar_fuente("mx/2", "f2", "MX", _filas(("77", "Pedro Gomez")))
+        self.assertNotEqual(self.ind.piloto("MX", "10", "Carlos Ruiz"), self.ind.piloto("MX", "20", "Carlitos Ruiz"))
+        self.assertEqual(self.ind.revision("MX"), 2)
+
+    def test_quitar_fuente_sin_efecto_no_sube_revision(self):
+        self.ind.quitar_fuentes(["vel/1"])
+        self.assertEqual(self.ind.revisiones, {})
+        self.assertFalse(self.ind.quitar_fuentes(["no/existe"]))
+
+    def test_estado_conserva_ids_y_revisiones(self):
+        self.ind.actualizar_fuente("mx/2", "f1", "MX", _filas(("10", "Carlitos Ruiz")))
+        copia = IndicePilotos.desde_estado(self.ind.estado())
+        self.assertEqual(copia.revisiones, self.ind.revisiones)
+        for modalidad, numero, nombre in (("MX", "10", "Carlos Ruiz"), ("MX", "20", "Carlitos Ruiz"), ("Velocidad", "5", "Ana Lopez")):
+            self.assertEqual(copia.piloto(modalidad, numero, nombre), self.ind.piloto(modalidad, numero, nombre))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de simulador_final: estados, "asegura" y "opción" de escenarios_final comparados con
+recorrer todos los resultados posibles de las válidas que faltan en categorías pequeñas.
+
+    python -m unittest discover -s "Resultados generales" -p "test_*.py"
+"""
+import itertools
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from simulador_final import escenarios_final, simular
+
+
+def _filas(*pilotos):
+    """Filas de la tabla general: (numero, por_valida); el total no incluye bono."""
+    return [
+        {"numero": numero, "nombre": f"Piloto {numero}", "por_valida": list(por_valida), "total": sum(p or 0 for p in por_valida)}
+        for numero, por_valida in pilotos
+    ]
+
+
+def _resultados_valida(n_pilotos, puntos):
+    """
+    Todos los resultados de una válida: por piloto None (no corre), 0.0 (corre fuera de la
+    tabla) o el índice de un puesto de `puntos`, cada puesto para un solo piloto.
+    """
+    opciones = [None, len(puntos)] + list(range(len(puntos)))
+    for combo in itertools.product(opciones, repeat=n_pilotos):
+        puestos = [c for c in combo if c is not None and c < len(puntos)]
+        if len(puestos) == len(set(puestos)):
+            yield combo
+
+
+def _fuerza_bruta(champ, filas, puntos, validas):
+    """Por piloto: {estado, asegura, opcion} recorriendo todas las combinaciones de resultados."""
+    slots = list(puntos) + [0.0]
+    por_valida = list(_resultados_valida(len(filas), puntos))
+    # ganador de cada escenario, con el puesto (índice de slot o None) de cada piloto por válida
+    escenarios = []
+    for combo in itertools.product(por_valida, repeat=validas):
+        resultados = {
+            r["numero"]: [None if c[i] is None else slots[c[i]] for c in combo]
+            for i, r in enumerate(filas)
+        }
+        ganador = simular(champ, filas, resultados, validas)[0]["numero"]
+        escenarios.append((combo, ganador))
+
+    out = []
+    for i, r in enumerate(filas):
+        def gana_siempre(p):
+            return all(g == r["numero"] for combo, g in escenarios if all(c[i] == p for c in combo))
+
+        def gana_alguna(p):
+            return any(g == r["numero"] for combo, g in escenarios if all(c[i] == p for c in combo))
+
+        info = {"estado": "sin opción", "asegura": None, "opcion": None}
+        if gana_siempre(None):
+            info = {"estado": "campeón", "asegura": 0, "opcion": len(slots)}
+        else:
+            opciones = [p + 1 for p in range(len(slots)) if gana_alguna(p)]
+            if opciones:
+                aseguran = [p + 1 for p in range(len(slots)) if gana_siempre(p)]
+                info = {"estado": "en disputa", "asegura": max(aseguran, default=None), "opcion": max(opciones)}
+        out.append(info)
+    return out
+
+
+class FuerzaBrutaTest(unittest.TestCase):
+    """escenarios_final coincide con recorrer todos los resultados posibles."""
+
+    def comparar(self, champ, filas, puntos, validas):
+        esperado = _fuerza_bruta(champ, filas, puntos, validas)
+        obtenido = [
+            {k: e[k] for k in ("estado", "asegura", "opcion")}
+            for e in escenarios_final(champ, filas, puntos, validas)
+        ]
+        self.assertEqual(obtenido, esperado)
+        return obtenido
+
+    def test_campeon_asegurado(self):
+        filas = _filas(("1", [20, 20]), ("2", [10, 8]), ("3", [5, 5]))
+        estados = self.comparar({"final_valida_bonus": 2}, filas, [5, 3], 2)
+        self.assertEqual([e["estado"] for e in estados], ["campeón", "sin opción", "sin opción"])
+
+    def test_sin_opcion_y_en_disputa(self):
+        filas = _filas(("1", [10, 10]), ("2", [9, 8]), ("3", [8, 6]), ("4", [2, 1]))
+        estados = self.comparar({"final_valida_bonus": 2}, filas, [5, 3], 2)
+        self.assertEqual([e["estado"] for e in estados], ["en disputa", "en disputa", "en disputa", "sin opción"])
+
+    def test_desempate_por_valida_reciente(self):
+        # Mismo puntaje: las válidas que faltan y luego la más reciente deciden.
+        filas = _filas(("1", [6, 4]), ("2", [4, 6]), ("3", [5, None]))
+        self.comparar({}, filas, [3, 2], 2)
+
+    def test_una_valida_con_bono(self):
+        filas = _filas(("1", [10, 12]), ("2", [12, 5]), ("3", [3, 9]), ("4", [0, 1]))
+        self.comparar({"final_valida_bonus": 8}, filas, [10, 6, 3], 1)
+
+    def test_tres_validas(self):
+        filas = _filas(("1", [9]), ("2", [7]), ("3", [1]))
+        self.comparar({"final_valida_bonus": 1}, filas, [3, 1], 3)
+
+
+class ValidacionTest(unittest.TestCase):
+    def test_puntos_desordenados(self):
+        with self.assertRaises(ValueError):
+            escenarios_final({}, _filas(("1", [1])), [1, 3], 1)
+
+    def test_sin_validas_pendientes(self):
+        with self.assertRaises(ValueError):
+            escenarios_final({"id": "x"}, _filas(("1", [1])), [3, 1])
+
+    def test_pendientes_del_registro(self):
+        champ = {"pendientes": ["II", "III"]}
+        filas = _filas(("1", [5]), ("2", [4]))
+        self.assertEqual(escenarios_final(champ, filas, [3]), escenarios_final({}, filas, [3], 2))
+        tabla = simular(champ, filas, {"2": [3, 3]})
+        self.assertEqual([r["por_valida"] for r in tabla], [[4, 3.0, 3.0], [5, None, None]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,26 @@
 # -*- coding: utf-8 -*-
 """Genera valida_iii_enduro_san_jeronimo.html desde los CSV en FILES EXPORTED."""
-import csv
 import html
+import sys
 from pathlib import Path
 from urllib.parse import quote
 
 ROOT = Path(__file__).resolve().parent
-CSV_DIR = ROOT / "FILES EXPORTED"
-OUT = ROOT / "valida_iii_enduro_san_jeronimo.html"
-PDF_FOLDER = "Vuelta a vueltla"
+
+_RV_ROOT = str(ROOT.parents[1])
+if _RV_ROOT not in sys.path:
+    sys.path.insert(0, _RV_ROOT)
+import paginas_html
+import plantillas
+import recursos_estaticos
+import registro_temporada
+import tablas_csv
+
+# Rutas de la válida en el registro de la temporada (temporada_2026.json).
+_REGISTRO = registro_temporada.valida("valida_iii_enduro_san_jeronimo")
+CSV_DIR = Path(_REGISTRO["files_dir"])
+OUT = Path(_REGISTRO["output_html"])
+PDF_FOLDER = _REGISTRO["vuelta_folder_url"]
 
 ORDER = [
     ("scratch", "Scratch"),
@@ -71,10 +83,6 @@ INF_E1_CARRERAS = {
 }
 
 
-def norm_key(k):
-    return k.strip() if k else k
-
-
 def row_val(row, *keys):
     for k in keys:
         if k in row and row[k]:
@@ -82,21 +90,11 @@ def row_val(row, *keys):
     return ""
 
 
-def read_csv_rows(name):
-    path = CSV_DIR / name
+def read_csv_rows(csv_dir, name):
+    path = Path(csv_dir) / name
     if not path.is_file():
         return None
-    sample = path.read_text(encoding="utf-8-sig")
-    first = sample.splitlines()[0] if sample else ""
-    delim = ";" if first.count(";") > first.count(",") else ","
-    with path.open(encoding="utf-8-sig", newline="") as f:
-        r = csv.DictReader(f, delimiter=delim)
-        rows = []
-        for row in r:
-            rows.append(
-                {norm_key(k): (v or "").strip() for k, v in row.items() if k is not None}
-            )
-        return rows
+    return tablas_csv.read_table(path).dicts()
 
 
 def esc(s):
@@ -211,12 +209,11 @@ def session_row(title, pdf_name):
     )
 
 
-def read_scratch_raw():
-    path = CSV_DIR / "Scratch - Resultados.csv"
+def read_scratch_raw(csv_dir):
+    path = Path(csv_dir) / "Scratch - Resultados.csv"
     if not path.is_file():
         return []
-    with path.open(encoding="utf-8-sig", newline="") as f:
-        return list(csv.DictReader(f, delimiter=";"))
+    return tablas_csv.read_table(path, ";").dicts(strip=False)
 
 
 def tr_scratch(row):
@@ -270,8 +267,8 @@ def table_scratch(rows):
     return f"<table>{thead}{body}</table>"
 
 
-def block_scratch():
-    rows = read_scratch_raw()
+def block_scratch(csv_dir):
+    rows = read_scratch_raw(csv_dir)
     return (
         '<div class="final-block"><h3>Resultados</h3><div class="table-wrapper">'
         + table_scratch(rows)
@@ -279,8 +276,8 @@ def block_scratch():
     )
 
 
-def block_infantil_e1():
-    final_rows = read_csv_rows("infantil enduro 1 - final - resultados.csv") or []
+def block_infantil_e1(csv_dir):
+    final_rows = read_csv_rows(csv_dir, "infantil enduro 1 - final - resultados.csv") or []
     parts = [
         '<div class="final-block">',
         '<div class="session-title-row"><h3>Final</h3></div>',
@@ -291,7 +288,7 @@ def block_infantil_e1():
 
     desglose_parts = []
     for title, csv_name in INF_E1_CARRERAS.items():
-        rows = read_csv_rows(csv_name)
+        rows = read_csv_rows(csv_dir, csv_name)
         if rows:
             desglose_parts.append(session_row(title, INF_E1_PDFS.get(title)))
             desglose_parts.append('<div class="table-wrapper">')
@@ -306,9 +303,9 @@ def block_infantil_e1():
     return "".join(parts)
 
 
-def block_simple_carrera(cat_id):
-    rows = read_csv_rows(CSV_FILES[cat_id]) or []
-    pdf = PDFS.get(cat_id)
+def block_simple_carrera(cat_id, csv_dir, csv_files, pdfs):
+    rows = read_csv_rows(csv_dir, csv_files[cat_id]) or []
+    pdf = pdfs.get(cat_id)
     return (
         '<div class="final-block">'
         + session_row("Carrera", pdf)
@@ -318,13 +315,13 @@ def block_simple_carrera(cat_id):
     )
 
 
-def section(cat_id, title_h2):
+def section(cat_id, title_h2, csv_dir=CSV_DIR, csv_files=CSV_FILES, pdfs=PDFS):
     if cat_id == "scratch":
-        body = block_scratch()
+        body = block_scratch(csv_dir)
     elif cat_id == "infantil-enduro-1-final":
-        body = block_infantil_e1()
+        body = block_infantil_e1(csv_dir)
     else:
-        body = block_simple_carrera(cat_id)
+        body = block_simple_carrera(cat_id, csv_dir, csv_files, pdfs)
 
     return f"""            <div class="categoria-section" id="{cat_id}" data-categoria-id="{cat_id}">
                 <div class="categoria-header">
@@ -338,163 +335,44 @@ def section(cat_id, title_h2):
 """
 
 
-def index_cards():
+def index_cards(order=ORDER):
     return "\n".join(
         f'            <a href="#{cid}" class="index-card" data-categoria-id="{cid}">{esc(title)}</a>'
-        for cid, title in ORDER
+        for cid, title in order
     )
 
 
-def modal_labels():
+def modal_labels(order=ORDER):
     return "\n".join(
         f'                <label class="modal-cat-item"><input type="checkbox" value="{cid}" checked> {esc(title)}</label>'
-        for cid, title in ORDER
+        for cid, title in order
     )
 
 
-def main():
-    sections_html = "\n".join(section(cid, t) for cid, t in ORDER)
-
-    page = f"""<!DOCTYPE html>
-<html lang="es">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>III Válida Nacional de Enduro - San Jerónimo, Antioquia | FEDEMOTO</title>
-    <link rel="icon" type="image/png" href="../../../fedemoto-logo.png">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@500;600;700;800&family=Source+Sans+3:wght@400;500;600;700&family=Barlow+Condensed:wght@500;600;700&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="../../../fedemoto-theme.css">
-    
-</head>
-<body>
-    <div id="menu-container"></div>
-    <div id="contenido-exportar" class="container">
-        <header>
-            <h1>III Válida Nacional de Enduro</h1>
-            <p>San Jerónimo, Antioquia - Resultados por categoría</p>
-        </header>
-        <div class="toolbar">
-            <input type="text" id="buscador" class="search-box" placeholder="Buscar por nombre o N° del piloto..." />
-        </div>
-        <div class="index-cards">
-{index_cards()}
-        </div>
-        <div class="content-section">
-
-{sections_html}
-        </div>
-        <div class="pdf-section">
-            <button id="descargarPDF" class="btn-pdf">Exportar a PDF</button>
-            <p class="pdf-hint">En el diálogo de impresión, elige "Guardar como PDF" o "Microsoft Print to PDF" como destino.</p>
-        </div>
-        <footer>
-            <p><span class="developer">Developed by Mauricio Sánchez Aguilar - Fedemoto</span></p>
-            <p>Este proyecto es de uso interno de FEDEMOTO.</p>
-        </footer>
-    </div>
-    <div id="modalExportar" class="modal-overlay">
-        <div class="modal-box">
-            <h3>Exportar a PDF</h3>
-            <p style="margin-bottom: 16px; font-size: 0.95em; color: #374151;">Selecciona las categorías que deseas incluir:</p>
-            <div class="modal-categorias" id="modalCategorias">
-{modal_labels()}
-            </div>
-            <div class="modal-actions">
-                <button type="button" class="modal-btn modal-btn-link" id="modalSelectAll">Seleccionar todo</button>
-                <button type="button" class="modal-btn modal-btn-link" id="modalDeselectAll">Deseleccionar todo</button>
-            </div>
-            <div class="modal-actions" style="margin-top: 20px;">
-                <button type="button" class="modal-btn modal-btn-primary" id="modalExportarBtn">Exportar</button>
-                <button type="button" class="modal-btn modal-btn-secondary" id="modalCancelar">Cancelar</button>
-            </div>
-        </div>
-    </div>
-    <div id="modalComentario" class="modal-overlay">
-        <div class="modal-box">
-            <h3>Comentario</h3>
-            <p id="modalComentarioTexto" style="margin-bottom: 20px; font-size: 1em; color: #111827; white-space: pre-wrap;"></p>
-            <div class="modal-actions">
-                <button type="button" class="modal-btn modal-btn-primary" id="modalComentarioCerrar">Cerrar</button>
-            </div>
-        </div>
-    </div>
-    <script src="../../../load-menu.js"></script>
-    <script>
-        document.getElementById('descargarPDF').addEventListener('click', function() {{
-            document.querySelectorAll('.search-no-results').forEach(function(el){{ el.classList.remove('search-no-results'); }});
-            document.querySelectorAll('.search-hidden').forEach(function(el){{ el.classList.remove('search-hidden'); }});
-            document.getElementById('modalExportar').classList.add('open');
-        }});
-        document.getElementById('modalSelectAll').addEventListener('click', function() {{ document.querySelectorAll('#modalCategorias input').forEach(function(cb){{ cb.checked = true; }}); }});
-        document.getElementById('modalDeselectAll').addEventListener('click', function() {{ document.querySelectorAll('#modalCategorias input').forEach(function(cb){{ cb.checked = false; }}); }});
-        document.getElementById('modalCancelar').addEventListener('click', function() {{ document.getElementById('modalExportar').classList.remove('open'); }});
-        document.getElementById('modalExportar').addEventListener('click', function(e) {{ if (e.target === this) this.classList.remove('open'); }});
-        var modalComentario = document.getElementById('modalComentario');
-        var modalComentarioTexto = document.getElementById('modalComentarioTexto');
-        document.addEventListener('click', function(e) {{
-            var btn = e.target.closest('.comentario-btn');
-            if (!btn) return;
-            modalComentarioTexto.textContent = btn.getAttribute('data-comentario') || '';
-            modalComentario.classList.add('open');
-        }});
-        document.getElementById('modalComentarioCerrar').addEventListener('click', function() {{
-            modalComentario.classList.remove('open');
-        }});
-        modalComentario.addEventListener('click', function(e) {{
-            if (e.target === this) this.classList.remove('open');
-        }});
-        document.getElementById('modalExportarBtn').addEventListener('click', function() {{
-            var selected = [];
-            document.querySelectorAll('#modalCategorias input[type="checkbox"]').forEach(function(cb) {{ if (cb.checked) selected.push(cb.value); }});
-            if (selected.length === 0) {{ alert('Selecciona al menos una categoría.'); return; }}
-            document.querySelectorAll('.categoria-section').forEach(function(section) {{
-                section.classList.toggle('pdf-exclude', selected.indexOf(section.getAttribute('data-categoria-id')) === -1);
-            }});
-            document.getElementById('modalExportar').classList.remove('open');
-            void document.body.offsetHeight;
-            setTimeout(function() {{ window.print(); }}, 150);
-        }});
-        window.addEventListener('afterprint', function() {{
-            document.querySelectorAll('.categoria-section').forEach(function(section) {{ section.classList.remove('pdf-exclude'); }});
-        }});
-        document.querySelectorAll('.btn-top').forEach(function(btn) {{
-            btn.addEventListener('click', function() {{ window.scrollTo({{ top: 0, behavior: 'smooth' }}); }});
-        }});
-        var buscador = document.getElementById('buscador');
-        buscador.addEventListener('input', function() {{
-            var q = this.value.trim().toLowerCase();
-            var sections = document.querySelectorAll('.categoria-section');
-            var cards = document.querySelectorAll('.index-card');
-            cards.forEach(function(c){{ c.classList.remove('search-match', 'search-no-results'); }});
-            sections.forEach(function(s){{ s.classList.remove('search-match', 'search-no-results'); }});
-            if (!q) {{
-                document.querySelectorAll('.search-hidden').forEach(function(tr){{ tr.classList.remove('search-hidden'); }});
-                return;
-            }}
-            sections.forEach(function(section) {{
-                var rows = section.querySelectorAll('tbody tr[data-numero], tbody tr[data-nombre]');
-                var visible = 0;
-                rows.forEach(function(tr) {{
-                    var num = (tr.getAttribute('data-numero') || '').toLowerCase();
-                    var nom = (tr.getAttribute('data-nombre') || '').toLowerCase();
-                    var match = num.indexOf(q) >= 0 || nom.indexOf(q) >= 0;
-                    tr.classList.toggle('search-hidden', !match);
-                    if (match) visible++;
-                }});
-                var id = section.getAttribute('data-categoria-id');
-                var card = document.querySelector('.index-card[data-categoria-id="' + id + '"]');
-                if (visible > 0) {{ section.classList.add('search-match'); if (card) card.classList.add('search-match'); }}
-                else {{ section.classList.add('search-no-results'); if (card) card.classList.add('search-no-results'); }}
-            }});
-        }});
-    </script>
-</body>
-</html>
-"""
-    OUT.write_text(page, encoding="utf-8")
-    print("Wrote", OUT)
+def main(csv_dir=CSV_DIR, out=OUT, order=ORDER, csv_files=CSV_FILES, pdfs=PDFS):
+    """
+    Escribe la página en `out` con los CSV de `csv_dir`; `order` lista las secciones y
+    `csv_files`/`pdfs` el archivo de cada una (por defecto, los de esta válida).
+    """
+    out = Path(out)
+    sections_html = "\n".join(section(cid, t, csv_dir, csv_files, pdfs) for cid, t in order)
+
+    root = paginas_html.site_prefix(out)
+    page = plantillas.render(
+        "valida.html",
+        title="III Válida Nacional de Enduro - San Jerónimo, Antioquia | FEDEMOTO",
+        root=root,
+        estilos=recursos_estaticos.estilos_head(("valida_tema_fedemoto.html",), root),
+        heading="III Válida Nacional de Enduro",
+        subtitle="San Jerónimo, Antioquia - Resultados por categoría",
+        index_cards=index_cards(order) + "\n",
+        sections=sections_html,
+        modal_categorias=modal_labels(order) + "\n",
+        modal_comentario=plantillas.bloque("valida_modal_comentario.html"),
+        script=recursos_estaticos.url("valida.js", root),
+    )
+    out.write_text(page, encoding="utf-8")
+    print("Wrote", out)
 
 
 if __name__ == "__main__":
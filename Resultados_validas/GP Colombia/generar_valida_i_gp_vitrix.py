@@ -5,32 +5,50 @@ Femenina: clasificatoria conjunta; carrera en Expertas y Novatas.
 Super Stock y X-Bikes se publican en subcategorías por columna Clase.
 """
 
-import csv
 import os
 import html
 import re
 import sys
-import unicodedata
 from collections import defaultdict
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-FILES_DIR = os.path.join(SCRIPT_DIR, "FILES EXPORTED_Gran Premio Vitrix")
-OUTPUT_FILE = os.path.join(SCRIPT_DIR, "valida_i_gp_colombia_vitrix.html")
-VUELTA_DIR = os.path.join(SCRIPT_DIR, "VUELTA A VUELTA_Gran Premio Vitrix")
-VUELTA_FOLDER_URL = "VUELTA A VUELTA_Gran Premio Vitrix"
-
 _RV_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
 if _RV_ROOT not in sys.path:
     sys.path.insert(0, _RV_ROOT)
+import escaneo_validas
+import normalizacion
+import paginas_html
+import plantillas
+import recursos_estaticos
+import registro_temporada
+import tabla_puntos
+import tablas_csv
 import vuelta_a_vuelta as vv
 
+# Rutas de la válida en el registro de la temporada (temporada_2026.json).
+_REGISTRO = registro_temporada.valida("valida_i_gp_colombia_vitrix")
+FILES_DIR = _REGISTRO["files_dir"]
+OUTPUT_FILE = _REGISTRO["output_html"]
+VUELTA_DIR = _REGISTRO["vuelta_dir"]
+VUELTA_FOLDER_URL = _REGISTRO["vuelta_folder_url"]
+
 _MX_DIR = os.path.join(_RV_ROOT, "Motocross", "Primer semestre")
 if _MX_DIR not in sys.path:
     sys.path.insert(0, _MX_DIR)
 import generar_valida_girardota as gmx
 
-VUELTA_A_VUELTA_FOLDER = VUELTA_FOLDER_URL
-VUELTA_A_VUELTA_MAP = None
+# Configuración por defecto de generate_html(valida).
+VALIDA = {
+    "files_dir": FILES_DIR,
+    "output_file": OUTPUT_FILE,
+    "vuelta_dir": VUELTA_DIR,
+    "vuelta_folder_url": VUELTA_FOLDER_URL,
+    "title": "I Válida GP Colombia - Gran Premio Vitrix | FEDEMOTO",
+    "heading": "I Válida GP Colombia",
+    "subtitle": "Gran Premio Vitrix — Resultados por categoría",
+    # <head>: bloques .html de plantillas_html/ y hojas .css publicadas en estaticos/.
+    "estilos": ("fuentes_sitio.html", "valida_velotierra.css"),
+}
 
 FEMENINA = "Femenina"
 FEMENINA_EXPERTAS = "Femenina Expertas"
@@ -53,12 +71,7 @@ SESSION_SORT_KEY = {
 }
 
 
-def _fold_accents(text):
-    return "".join(
-        c
-        for c in unicodedata.normalize("NFD", str(text))
-        if unicodedata.category(c) != "Mn"
-    )
+_fold_accents = normalizacion.sin_tildes
 
 
 def canonical_session_tipo(tipo):
@@ -303,18 +316,14 @@ def _append_clase_split_categories(categorias_data, pending, bucket_fn, display_
             categorias_data[display_name] = sessions
 
 
-def load_categorias_data():
+def load_categorias_data(files_dir=None):
+    files_dir = files_dir or FILES_DIR
     categorias_data = {}
     femenina_pending = []
     super_stock_pending = []
     xbikes_pending = []
 
-    for filename in os.listdir(FILES_DIR):
-        if not filename.lower().endswith(".csv"):
-            continue
-        filepath = os.path.join(FILES_DIR, filename)
-        if not os.path.isfile(filepath):
-            continue
+    for filename, filepath in escaneo_validas.archivos(files_dir):
         headers_raw, rows_raw = parse_csv(filepath)
         categoria, tipo, sort_key = parse_filename(filename)
         tipo = canonical_session_tipo(tipo)
@@ -406,12 +415,6 @@ def load_categorias_data():
     return categorias_data
 
 
-def csv_delimiter(first_line):
-    if not first_line:
-        return ","
-    return ";" if first_line.count(";") > first_line.count(",") else ","
-
-
 def _expand_merged_headers(parts):
     out = []
     for p in parts:
@@ -443,16 +446,10 @@ def _normalize_csv_table(headers, rows):
 
 
 def parse_csv(filepath):
-    with open(filepath, "r", encoding="utf-8-sig") as f:
-        raw = f.read()
-    if not raw.strip():
-        return [], []
-    lines = raw.splitlines()
-    delim = csv_delimiter(lines[0])
-    rows = list(csv.reader(lines, delimiter=delim))
-    if not rows:
+    table = tablas_csv.read_table(filepath)
+    if not table.headers:
         return [], []
-    headers, body = _normalize_csv_table(rows[0], rows[1:])
+    headers, body = _normalize_csv_table(table.headers, table.rows())
     return headers, body
 
 
@@ -555,13 +552,13 @@ def build_vuelta_a_vuelta_map(pdf_dir):
                     m[(sub.lower(), ses)] = fn
     return m
 
-def session_title_block(categoria, tipo_sesion):
+def session_title_block(categoria, tipo_sesion, vuelta_map=None, vuelta_folder=None):
     return vv.session_title_block(
         categoria,
         tipo_sesion,
         escape_html,
-        VUELTA_A_VUELTA_MAP,
-        VUELTA_A_VUELTA_FOLDER,
+        vuelta_map,
+        vuelta_folder,
     )
 
 def slugify(text):
@@ -628,11 +625,159 @@ def render_row(row, comentario, col_count, search_attrs):
     html_parts.append('</tr>')
     return ''.join(html_parts)
 
-def generate_html():
-    global VUELTA_A_VUELTA_MAP
-    VUELTA_A_VUELTA_MAP = build_vuelta_a_vuelta_map(VUELTA_DIR)
+def iter_categoria_section(categoria, section_id, tablas, vuelta_map=None, vuelta_folder=None):
+    """Fragmentos HTML de la sección de una categoría (encabezado, resumen de tiempos, tablas)."""
+    final_data = None
+    clasif_data = None
+    clasif_final_data = None
+    c1_data = None
+    c2_data = None
+    carrera_data = None
+    for item in tablas:
+        tipo, headers, rows, comentarios = item[0], item[1], item[2], item[3]
+        if tipo == "Final":
+            final_data = (headers, rows, comentarios)
+        elif tipo == "Clasificación final":
+            clasif_final_data = (headers, rows, comentarios)
+        elif tipo == "Clasificatoria":
+            clasif_data = (headers, rows, comentarios)
+        elif tipo == "Carrera 1":
+            c1_data = (headers, rows)
+        elif tipo == "Carrera 2":
+            c2_data = (headers, rows)
+        elif tipo == "Carrera":
+            carrera_data = (headers, rows, comentarios)
+
+    yield f'''
+            <div class="categoria-section" id="{section_id}" data-categoria-id="{section_id}">
+                <div class="categoria-header">
+                    <h2>{escape_html(categoria)}</h2>
+                    <button type="button" class="btn-top" title="Ir al inicio" aria-label="Ir al inicio">
+                        <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor"><path d="M12 4l-8 8h5v8h6v-8h5L12 4z"/></svg>
+                    </button>
+                </div>'''
+    
+    if clasif_data:
+        clasif_src = clasif_data
+        clasif_label = "Mejor tiempo Clasificatoria:"
+    elif clasif_final_data:
+        clasif_src = clasif_final_data
+        clasif_label = "Mejor tiempo Clasificación final:"
+    else:
+        clasif_src = None
+        clasif_label = "Mejor tiempo Clasificatoria:"
+
+    if clasif_src or c1_data or c2_data or carrera_data:
+        best_clasif = None
+        if clasif_src:
+            ch, cr = clasif_src[0], clasif_src[1]
+            tm_idx = find_mejor_tm_index(ch)
+            if tm_idx >= 0:
+                best_clasif = get_mejor_tm_absoluto(cr, 1, tm_idx, 2)
+        best_carreras = get_mejor_tm_carreras(c1_data, c2_data) if (c1_data or c2_data) else None
+        if not best_carreras and carrera_data:
+            ch, cr = carrera_data[0], carrera_data[1]
+            tm_idx = find_mejor_tm_index(ch)
+            best_one = get_mejor_tm_absoluto(cr, 1, tm_idx, 2) if tm_idx >= 0 else None
+            if best_one:
+                best_carreras = (best_one[0], best_one[1], best_one[2], "Carrera")
+        if best_clasif or best_carreras:
+            yield '''
+                <div class="times-summary">
+                    <h4>Mejores tiempos - Clasificatoria y carreras</h4>
+                    <div class="times-summary-items">'''
+            if best_clasif:
+                num, nombre, tm = best_clasif
+                yield f'''
+                        <p><strong>{clasif_label}</strong> {escape_html(tm)} — N° {escape_html(num)} {escape_html(nombre)}</p>'''
+            if best_carreras:
+                num, nombre, tm, carrera = best_carreras
+                yield f'''
+                        <p><strong>Mejor tiempo Carrera:</strong> {escape_html(tm)} ({escape_html(carrera)}) — N° {escape_html(num)} {escape_html(nombre)}</p>'''
+            yield '</div></div>'
+    
+    main_tipo, main_table = pick_main_session(
+        tablas, final_data, clasif_final_data, clasif_data, carrera_data, c1_data, c2_data
+    )
+    if main_table:
+        headers, rows, comentarios = main_table
+        yield '\n                <div class="final-block">'
+        yield session_title_block(categoria, main_tipo, vuelta_map, vuelta_folder)
+        yield '''
+                <div class="table-wrapper">
+                    <table>
+                        <thead><tr>'''
+        for h in headers:
+            yield f'<th>{escape_html(h)}</th>'
+        yield '</tr></thead><tbody>'
+        for i, row in enumerate(rows):
+            com = comentarios[i] if i < len(comentarios) else ''
+            search_attrs = f' data-numero="{escape_html(row[1] if len(row) > 1 else "")}" data-nombre="{escape_html(row[2] if len(row) > 2 else "")}"'
+            yield render_row(row, com, len(headers), search_attrs)
+        yield '</tbody></table></div></div>'
+    
+    desglose = sort_tablas(
+        [(t[0], t[1], t[2], t[3]) for t in tablas if t[0] != main_tipo]
+    )
+    if len(tablas) > 1 and desglose:
+        yield '\n                <div class="desglose-block">'
+        yield '\n                    <h3>Desglose por sesión</h3>'
+        for tipo, headers, rows, comentarios in desglose:
+            yield session_title_block(categoria, tipo, vuelta_map, vuelta_folder)
+            yield '''
+                    <div class="table-wrapper">
+                        <table>
+                            <thead><tr>'''
+            for h in headers:
+                yield f'<th>{escape_html(h)}</th>'
+            yield '</tr></thead><tbody>'
+            for i, row in enumerate(rows):
+                com = comentarios[i] if i < len(comentarios) else ''
+                search_attrs = f' data-numero="{escape_html(row[1] if len(row) > 1 else "")}" data-nombre="{escape_html(row[2] if len(row) > 2 else "")}"'
+                yield render_row(row, com, len(headers), search_attrs)
+            yield '</tbody></table></div>'
+        yield '</div>'
+    
+    yield '\n            </div>'
+
+
+
+def iter_page(valida, categorias_para_html, vuelta_map=None, vuelta_folder=None):
+    """Fragmentos HTML de la página completa (layout plantillas_html/valida.html), en orden."""
+    root = paginas_html.site_prefix(valida["output_file"])
+    return plantillas.iter_render(
+        "valida.html",
+        title=escape_html(valida["title"]),
+        root=root,
+        estilos=recursos_estaticos.estilos_head(valida.get("estilos", VALIDA["estilos"]), root),
+        heading=escape_html(valida["heading"]),
+        subtitle=escape_html(valida["subtitle"]),
+        index_cards=(
+            f'            <a href="#{section_id}" class="index-card" data-categoria-id="{section_id}">{escape_html(cat)}</a>\n'
+            for cat, section_id, _ in categorias_para_html
+        ),
+        sections=(
+            chunk
+            for categoria, section_id, tablas in categorias_para_html
+            for chunk in iter_categoria_section(categoria, section_id, tablas, vuelta_map, vuelta_folder)
+        ),
+        modal_categorias=(
+            f'                <label class="modal-cat-item"><input type="checkbox" value="{section_id}" checked> {escape_html(cat)}</label>\n'
+            for cat, section_id, _ in categorias_para_html
+        ),
+        modal_comentario=plantillas.bloque("valida_modal_comentario.html"),
+        script=recursos_estaticos.url("valida.js", root),
+    )
+
 
-    categorias_data = load_categorias_data()
+def generate_html(valida=None):
+    valida = valida or VALIDA
+    files_dir = valida["files_dir"]
+    output_file = valida["output_file"]
+    vuelta_folder = valida.get("vuelta_folder_url")
+    vuelta_map = build_vuelta_a_vuelta_map(valida["vuelta_dir"]) if valida.get("vuelta_dir") else None
+
+    categorias_data = load_categorias_data(files_dir)
     sorted_categorias = sorted(categorias_data.keys(), key=get_category_sort_key)
     
     categorias_para_html = []
@@ -658,390 +803,10 @@ def generate_html():
         main_tipo, _ = pick_main_session(tablas, fd, cf, cl, cr, c1, c2)
         section_id = slugify(f"{categoria} {main_tipo}" if main_tipo else f"{categoria} final")
         categorias_para_html.append((categoria, section_id, tablas))
-    
-    html_content = '''<!DOCTYPE html>
-<html lang="es">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>I Válida GP Colombia - Gran Premio Vitrix | FEDEMOTO</title>
-    <link rel="icon" type="image/png" href="../../fedemoto-logo.png">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Bebas+Neue&family=Roboto+Condensed:wght@300;400;700&family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { font-family: 'Inter', sans-serif; background: #f5f5f5; color: #000; line-height: 1.6; padding: 20px; padding-top: 120px; min-height: 100vh; }
-        .fixed-header { position: fixed; top: 0; left: 0; right: 0; background: #123E92; color: white; z-index: 1000; box-shadow: 0 4px 10px rgba(0,0,0,0.2); }
-        .header-content { max-width: 1400px; margin: 0 auto; display: flex; align-items: center; justify-content: space-between; padding: 15px 30px; }
-        .logo-container { display: flex; align-items: center; gap: 15px; }
-        .logo-container a { display: flex; align-items: center; gap: 15px; text-decoration: none; color: inherit; }
-        .logo-container img { height: 50px; width: auto; }
-        .nav-menu { display: flex; gap: 0; list-style: none; margin: 0; padding: 0; }
-        .nav-menu li { margin: 0; position: relative; }
-        .nav-menu > li > a { display: block; padding: 12px 25px; color: white; text-decoration: none; font-family: 'Roboto Condensed', sans-serif; font-weight: 400; font-size: 1.1em; transition: all 0.2s ease; border-radius: 8px; }
-        .nav-menu > li > a:hover { background: rgba(255,255,255,0.1); transform: translateY(-2px); }
-        .dropdown { position: relative; }
-        .dropdown > a::after { content: ' ▼'; font-size: 0.8em; margin-left: 5px; }
-        .dropdown-menu { display: none; position: absolute; top: calc(100% + 5px); left: 0; background: white; min-width: 200px; box-shadow: 0 8px 16px rgba(0,0,0,0.2); border-radius: 8px; z-index: 10001; list-style: none; padding: 0; margin: 0; border: 1px solid #d1d5db; }
-        .nav-menu > .dropdown:hover > .dropdown-menu { display: block; }
-        .dropdown-menu a { display: block; padding: 12px 20px; color: #000; text-decoration: none; font-family: 'Inter', sans-serif; font-size: 1em; transition: all 0.2s ease; border-bottom: 1px solid #f0f0f0; }
-        .dropdown-menu a:hover { background: #f8f9fa; color: #123E92; }
-        .container { max-width: 1400px; margin: 0 auto; background: white; border-radius: 12px; box-shadow: 0 20px 60px rgba(0,0,0,0.3); overflow: hidden; margin-bottom: 40px; }
-        .container > header { background: linear-gradient(135deg, #123E92 0%, #0f3377 100%); color: white; padding: 40px; text-align: center; }
-        .container > header h1 { font-family: 'Bebas Neue', sans-serif; font-size: 2.2em; margin-bottom: 10px; letter-spacing: 2px; }
-        .container > header p { font-family: 'Roboto Condensed', sans-serif; font-size: 1.2em; opacity: 0.95; }
-        .toolbar { padding: 25px 40px; background: #f8f9fa; border-bottom: 1px solid #C0C0C0; }
-        .search-box { width: 100%; padding: 12px 20px; font-family: 'Inter', sans-serif; font-size: 1em; border: 2px solid #d1d5db; border-radius: 8px; }
-        .search-box:focus { outline: none; border-color: #123E92; box-shadow: 0 0 0 3px rgba(18, 62, 146, 0.2); }
-        .index-cards { display: flex; flex-wrap: wrap; gap: 12px; padding: 25px 40px; background: #f8f9fa; border-bottom: 1px solid #C0C0C0; }
-        .index-card { display: inline-block; padding: 10px 20px; background: white; color: #123E92; border: 2px solid #123E92; border-radius: 8px; font-family: 'Roboto Condensed', sans-serif; font-weight: 700; text-decoration: none; transition: all 0.2s ease; }
-        .index-card:hover { background: #123E92; color: white; transform: translateY(-2px); }
-        .index-card.search-match { background: #F7C31D; color: #123E92; border-color: #F7C31D; }
-        .index-card.search-no-results { display: none !important; }
-        .content-section { padding: 40px; }
-        .categoria-section { margin-bottom: 50px; scroll-margin-top: 120px; border: 2px solid #e0e0e0; border-radius: 12px; overflow: hidden; }
-        .categoria-section:last-child { margin-bottom: 0; }
-        .categoria-section.search-match { border-color: #F7C31D; box-shadow: 0 0 0 3px rgba(247, 195, 29, 0.4); }
-        .categoria-section.search-no-results { display: none !important; }
-        .categoria-header { background: linear-gradient(135deg, #123E92 0%, #0f3377 100%); color: white; padding: 25px 30px; display: flex; align-items: center; justify-content: space-between; gap: 15px; }
-        .categoria-header h2 { font-family: 'Bebas Neue', sans-serif; font-size: 2em; letter-spacing: 2px; }
-        .btn-top { display: inline-flex; align-items: center; justify-content: center; width: 40px; height: 40px; background: rgba(255,255,255,0.2); color: white; border: 2px solid rgba(255,255,255,0.6); border-radius: 8px; cursor: pointer; transition: all 0.2s ease; flex-shrink: 0; }
-        .btn-top:hover { background: #F7C31D; color: #123E92; border-color: #F7C31D; }
-        .btn-top svg { width: 20px; height: 20px; }
-        .times-summary { margin: 20px 30px; padding: 20px; background: #f8f9fa; border-radius: 8px; border-left: 5px solid #123E92; }
-        .times-summary h4 { font-family: 'Roboto Condensed', sans-serif; color: #123E92; margin-bottom: 15px; font-size: 1.1em; }
-        .times-summary-items p { margin-bottom: 10px; font-size: 1em; }
-        .times-summary-items p:last-child { margin-bottom: 0; }
-        .final-block { padding: 0 30px 30px; }
-        .final-block h3 { font-family: 'Bebas Neue', sans-serif; font-size: 1.8em; color: #123E92; margin: 25px 0 15px; padding-bottom: 8px; border-bottom: 3px solid #F7C31D; letter-spacing: 1px; }
-''' + vv.CSS_PLACEHOLDER + r'''
-        .desglose-block { padding: 0 30px 30px; background: #fafafa; border-top: 1px solid #e0e0e0; }
-        .desglose-block h3 { font-family: 'Roboto Condensed', sans-serif; font-size: 1.2em; color: #666; margin: 20px 0 12px; padding-bottom: 6px; border-bottom: 1px solid #C0C0C0; font-weight: 700; }
-        .table-wrapper { overflow-x: auto; margin-bottom: 20px; border-radius: 8px; border: 1px solid #d1d5db; }
-        table { width: 100%; border-collapse: collapse; font-size: 0.9em; }
-        th, td { padding: 12px 15px; text-align: left; border-bottom: 1px solid #e0e0e0; }
-        th { background: #123E92; color: white; font-family: 'Roboto Condensed', sans-serif; font-weight: 700; }
-        tr:hover { background: #f8f9fa; }
-        tr.search-hidden { display: none !important; }
-        .pos-1 { background: rgba(247, 195, 29, 0.15) !important; }
-        .pos-2 { background: rgba(192, 192, 192, 0.2) !important; }
-        .pos-3 { background: rgba(139, 90, 43, 0.1) !important; }
-        .pos-cell { display: inline-block; margin-right: 4px; }
-        .comentario-btn { display: inline-flex; align-items: center; justify-content: center; width: 24px; height: 24px; margin-left: 6px; border: 1px solid #123E92; border-radius: 999px; background: #e8eef8; color: #123E92; font-size: 14px; font-weight: 700; cursor: pointer; vertical-align: middle; }
-        .comentario-btn:hover, .comentario-btn:focus { background: #123E92; color: white; outline: none; }
-        .pdf-section { text-align: center; padding: 40px 20px; border-top: 1px solid #C0C0C0; background: #f8f9fa; }
-        .btn-pdf { display: inline-block; padding: 14px 32px; background: #123E92; color: white; border: none; border-radius: 8px; font-family: 'Roboto Condensed', sans-serif; font-size: 1.1em; font-weight: 700; cursor: pointer; transition: all 0.2s ease; }
-        .btn-pdf:hover { background: #0f3377; transform: translateY(-2px); }
-        .pdf-hint { margin-top: 12px; font-size: 0.9em; color: #666; }
-        .modal-overlay { display: none; position: fixed; top: 0; left: 0; right: 0; bottom: 0; background: rgba(0,0,0,0.5); z-index: 10000; align-items: center; justify-content: center; }
-        .modal-overlay.open { display: flex; }
-        .modal-box { background: white; border-radius: 12px; padding: 30px; max-width: 450px; width: 90%; max-height: 80vh; overflow-y: auto; box-shadow: 0 20px 60px rgba(0,0,0,0.3); }
-        .modal-box h3 { font-family: 'Bebas Neue', sans-serif; font-size: 1.6em; color: #123E92; margin-bottom: 20px; }
-        .modal-categorias { display: flex; flex-wrap: wrap; gap: 8px 16px; margin-bottom: 20px; }
-        .modal-cat-item { display: flex; align-items: center; gap: 8px; cursor: pointer; }
-        .modal-cat-item input { cursor: pointer; width: 18px; height: 18px; accent-color: #123E92; }
-        .modal-actions { display: flex; gap: 12px; flex-wrap: wrap; }
-        .modal-btn { padding: 10px 20px; border-radius: 8px; font-family: 'Roboto Condensed', sans-serif; font-weight: 700; cursor: pointer; border: none; font-size: 1em; transition: all 0.2s ease; }
-        .modal-btn-primary { background: #123E92; color: white; }
-        .modal-btn-primary:hover { background: #0f3377; }
-        .modal-btn-secondary { background: #e5e7eb; color: #374151; }
-        .modal-btn-secondary:hover { background: #d1d5db; }
-        .modal-btn-link { background: transparent; color: #123E92; text-decoration: underline; }
-        .modal-btn-link:hover { color: #0f3377; }
-        .categoria-section.pdf-exclude { display: none !important; }
-        footer { background: #f8f9fa; padding: 30px 40px; text-align: center; border-top: 1px solid #C0C0C0; color: #000; font-family: 'Inter', sans-serif; font-size: 0.9em; font-weight: 400; line-height: 1.8; }
-        footer .developer { font-family: 'Roboto Condensed', sans-serif; font-weight: 700; color: #123E92; }
-        @media print {
-            @page { size: A4 landscape; margin: 15mm; }
-            body { padding: 0 !important; padding-top: 0 !important; background: white !important; }
-            #menu-container, .fixed-header, .pdf-section, .toolbar, .index-cards, .btn-top, footer { display: none !important; }
-            .container { box-shadow: none !important; max-width: 100% !important; }
-            .categoria-section { break-before: page; page-break-before: always; }
-            .categoria-section:first-child { break-before: auto; page-break-before: auto; }
-            .modal-overlay { display: none !important; }
-            .container > header, .categoria-header, th { -webkit-print-color-adjust: exact; print-color-adjust: exact; }
-            table { font-size: 0.75em; }
-        }
-    </style>
-</head>
-<body>
-    <div id="menu-container"></div>
-    <div id="contenido-exportar" class="container">
-        <header>
-            <h1>I Válida GP Colombia</h1>
-            <p>Gran Premio Vitrix — Resultados por categoría</p>
-        </header>
-        <div class="toolbar">
-            <input type="text" id="buscador" class="search-box" placeholder="Buscar por nombre o N° del piloto..." />
-        </div>
-        <div class="index-cards">
-'''
-    
-    for cat, section_id, _ in categorias_para_html:
-        html_content += f'            <a href="#{section_id}" class="index-card" data-categoria-id="{section_id}">{escape_html(cat)}</a>\n'
-    
-    html_content += '        </div>\n        <div class="content-section">\n'
-    
-    for categoria, section_id, tablas in categorias_para_html:
-        final_data = None
-        clasif_data = None
-        clasif_final_data = None
-        c1_data = None
-        c2_data = None
-        carrera_data = None
-        for item in tablas:
-            tipo, headers, rows, comentarios = item[0], item[1], item[2], item[3]
-            if tipo == "Final":
-                final_data = (headers, rows, comentarios)
-            elif tipo == "Clasificación final":
-                clasif_final_data = (headers, rows, comentarios)
-            elif tipo == "Clasificatoria":
-                clasif_data = (headers, rows, comentarios)
-            elif tipo == "Carrera 1":
-                c1_data = (headers, rows)
-            elif tipo == "Carrera 2":
-                c2_data = (headers, rows)
-            elif tipo == "Carrera":
-                carrera_data = (headers, rows, comentarios)
-
-        html_content += f'''
-            <div class="categoria-section" id="{section_id}" data-categoria-id="{section_id}">
-                <div class="categoria-header">
-                    <h2>{escape_html(categoria)}</h2>
-                    <button type="button" class="btn-top" title="Ir al inicio" aria-label="Ir al inicio">
-                        <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor"><path d="M12 4l-8 8h5v8h6v-8h5L12 4z"/></svg>
-                    </button>
-                </div>'''
-        
-        if clasif_data:
-            clasif_src = clasif_data
-            clasif_label = "Mejor tiempo Clasificatoria:"
-        elif clasif_final_data:
-            clasif_src = clasif_final_data
-            clasif_label = "Mejor tiempo Clasificación final:"
-        else:
-            clasif_src = None
-            clasif_label = "Mejor tiempo Clasificatoria:"
-
-        if clasif_src or c1_data or c2_data or carrera_data:
-            best_clasif = None
-            if clasif_src:
-                ch, cr = clasif_src[0], clasif_src[1]
-                tm_idx = find_mejor_tm_index(ch)
-                if tm_idx >= 0:
-                    best_clasif = get_mejor_tm_absoluto(cr, 1, tm_idx, 2)
-            best_carreras = get_mejor_tm_carreras(c1_data, c2_data) if (c1_data or c2_data) else None
-            if not best_carreras and carrera_data:
-                ch, cr = carrera_data[0], carrera_data[1]
-                tm_idx = find_mejor_tm_index(ch)
-                best_one = get_mejor_tm_absoluto(cr, 1, tm_idx, 2) if tm_idx >= 0 else None
-                if best_one:
-                    best_carreras = (best_one[0], best_one[1], best_one[2], "Carrera")
-            if best_clasif or best_carreras:
-                html_content += '''
-                <div class="times-summary">
-                    <h4>Mejores tiempos - Clasificatoria y carreras</h4>
-                    <div class="times-summary-items">'''
-                if best_clasif:
-                    num, nombre, tm = best_clasif
-                    html_content += f'''
-                        <p><strong>{clasif_label}</strong> {escape_html(tm)} — N° {escape_html(num)} {escape_html(nombre)}</p>'''
-                if best_carreras:
-                    num, nombre, tm, carrera = best_carreras
-                    html_content += f'''
-                        <p><strong>Mejor tiempo Carrera:</strong> {escape_html(tm)} ({escape_html(carrera)}) — N° {escape_html(num)} {escape_html(nombre)}</p>'''
-                html_content += '</div></div>'
-        
-        main_tipo, main_table = pick_main_session(
-            tablas, final_data, clasif_final_data, clasif_data, carrera_data, c1_data, c2_data
-        )
-        if main_table:
-            headers, rows, comentarios = main_table
-            html_content += '\n                <div class="final-block">'
-            html_content += session_title_block(categoria, main_tipo)
-            html_content += '''
-                <div class="table-wrapper">
-                    <table>
-                        <thead><tr>'''
-            for h in headers:
-                html_content += f'<th>{escape_html(h)}</th>'
-            html_content += '</tr></thead><tbody>'
-            for i, row in enumerate(rows):
-                com = comentarios[i] if i < len(comentarios) else ''
-                search_attrs = f' data-numero="{escape_html(row[1] if len(row) > 1 else "")}" data-nombre="{escape_html(row[2] if len(row) > 2 else "")}"'
-                html_content += render_row(row, com, len(headers), search_attrs)
-            html_content += '</tbody></table></div></div>'
-        
-        desglose = sort_tablas(
-            [(t[0], t[1], t[2], t[3]) for t in tablas if t[0] != main_tipo]
-        )
-        if len(tablas) > 1 and desglose:
-            html_content += '\n                <div class="desglose-block">'
-            html_content += '\n                    <h3>Desglose por sesión</h3>'
-            for tipo, headers, rows, comentarios in desglose:
-                html_content += session_title_block(categoria, tipo)
-                html_content += '''
-                    <div class="table-wrapper">
-                        <table>
-                            <thead><tr>'''
-                for h in headers:
-                    html_content += f'<th>{escape_html(h)}</th>'
-                html_content += '</tr></thead><tbody>'
-                for i, row in enumerate(rows):
-                    com = comentarios[i] if i < len(comentarios) else ''
-                    search_attrs = f' data-numero="{escape_html(row[1] if len(row) > 1 else "")}" data-nombre="{escape_html(row[2] if len(row) > 2 else "")}"'
-                    html_content += render_row(row, com, len(headers), search_attrs)
-                html_content += '</tbody></table></div>'
-            html_content += '</div>'
-        
-        html_content += '\n            </div>'
-    
-    html_content += '''
-        </div>
-        <div class="pdf-section">
-            <button id="descargarPDF" class="btn-pdf">Exportar a PDF</button>
-            <p class="pdf-hint">En el diálogo de impresión, elige "Guardar como PDF" o "Microsoft Print to PDF" como destino.</p>
-        </div>
-        <footer>
-            <p><span class="developer">Developed by Mauricio Sánchez Aguilar - Fedemoto</span></p>
-            <p>Este proyecto es de uso interno de FEDEMOTO.</p>
-        </footer>
-    </div>
-    <div id="modalExportar" class="modal-overlay">
-        <div class="modal-box">
-            <h3>Exportar a PDF</h3>
-            <p style="margin-bottom: 16px; font-size: 0.95em; color: #374151;">Selecciona las categorías que deseas incluir:</p>
-            <div class="modal-categorias" id="modalCategorias">
-'''
-    
-    for cat, section_id, _ in categorias_para_html:
-        html_content += f'                <label class="modal-cat-item"><input type="checkbox" value="{section_id}" checked> {escape_html(cat)}</label>\n'
-    
-    html_content += '''            </div>
-            <div class="modal-actions">
-                <button type="button" class="modal-btn modal-btn-link" id="modalSelectAll">Seleccionar todo</button>
-                <button type="button" class="modal-btn modal-btn-link" id="modalDeselectAll">Deseleccionar todo</button>
-            </div>
-            <div class="modal-actions" style="margin-top: 20px;">
-                <button type="button" class="modal-btn modal-btn-primary" id="modalExportarBtn">Exportar</button>
-                <button type="button" class="modal-btn modal-btn-secondary" id="modalCancelar">Cancelar</button>
-            </div>
-        </div>
-    </div>
-    <div id="modalComentario" class="modal-overlay">
-        <div class="modal-box">
-            <h3>Comentario</h3>
-            <p id="modalComentarioTexto" style="margin-bottom: 20px; font-size: 1em; color: #111827; white-space: pre-wrap;"></p>
-            <div class="modal-actions">
-                <button type="button" class="modal-btn modal-btn-primary" id="modalComentarioCerrar">Cerrar</button>
-            </div>
-        </div>
-    </div>
-    <script src="../../load-menu.js"></script>
-    <script>
-        document.getElementById('descargarPDF').addEventListener('click', function() {
-            document.querySelectorAll('.search-no-results').forEach(function(el){ el.classList.remove('search-no-results'); });
-            document.querySelectorAll('.search-hidden').forEach(function(el){ el.classList.remove('search-hidden'); });
-            document.getElementById('modalExportar').classList.add('open');
-        });
-        document.getElementById('modalSelectAll').addEventListener('click', function() {
-            document.querySelectorAll('#modalCategorias input').forEach(function(cb){ cb.checked = true; });
-        });
-        document.getElementById('modalDeselectAll').addEventListener('click', function() {
-            document.querySelectorAll('#modalCategorias input').forEach(function(cb){ cb.checked = false; });
-        });
-        document.getElementById('modalCancelar').addEventListener('click', function() {
-            document.getElementById('modalExportar').classList.remove('open');
-        });
-        document.getElementById('modalExportar').addEventListener('click', function(e) {
-            if (e.target === this) this.classList.remove('open');
-        });
-        var modalComentario = document.getElementById('modalComentario');
-        var modalComentarioTexto = document.getElementById('modalComentarioTexto');
-        document.addEventListener('click', function(e) {
-            var btn = e.target.closest('.comentario-btn');
-            if (!btn) return;
-            modalComentarioTexto.textContent = btn.getAttribute('data-comentario') || '';
-            modalComentario.classList.add('open');
-        });
-        document.getElementById('modalComentarioCerrar').addEventListener('click', function() {
-            modalComentario.classList.remove('open');
-        });
-        modalComentario.addEventListener('click', function(e) {
-            if (e.target === this) this.classList.remove('open');
-        });
-        document.getElementById('modalExportarBtn').addEventListener('click', function() {
-            var selected = [];
-            document.querySelectorAll('#modalCategorias input[type="checkbox"]').forEach(function(cb) {
-                if (cb.checked) selected.push(cb.value);
-            });
-            if (selected.length === 0) {
-                alert('Selecciona al menos una categoría.');
-                return;
-            }
-            document.querySelectorAll('.categoria-section').forEach(function(section) {
-                var id = section.getAttribute('data-categoria-id');
-                section.classList.toggle('pdf-exclude', selected.indexOf(id) === -1);
-            });
-            document.getElementById('modalExportar').classList.remove('open');
-            void document.body.offsetHeight;
-            setTimeout(function() { window.print(); }, 150);
-        });
-        window.addEventListener('afterprint', function() {
-            document.querySelectorAll('.categoria-section').forEach(function(section) {
-                section.classList.remove('pdf-exclude');
-            });
-        });
-        document.querySelectorAll('.btn-top').forEach(function(btn) {
-            btn.addEventListener('click', function() { window.scrollTo({ top: 0, behavior: 'smooth' }); });
-        });
-        var buscador = document.getElementById('buscador');
-        buscador.addEventListener('input', function() {
-            var q = this.value.trim().toLowerCase();
-            var sections = document.querySelectorAll('.categoria-section');
-            var cards = document.querySelectorAll('.index-card');
-            cards.forEach(function(c){ c.classList.remove('search-match', 'search-no-results'); });
-            sections.forEach(function(s){ s.classList.remove('search-match', 'search-no-results'); });
-            if (!q) {
-                document.querySelectorAll('.search-hidden').forEach(function(tr){ tr.classList.remove('search-hidden'); });
-                return;
-            }
-            sections.forEach(function(section) {
-                var rows = section.querySelectorAll('tbody tr[data-numero], tbody tr[data-nombre]');
-                var visible = 0;
-                rows.forEach(function(tr) {
-                    var num = (tr.getAttribute('data-numero') || '').toLowerCase();
-                    var nom = (tr.getAttribute('data-nombre') || '').toLowerCase();
-                    var match = num.indexOf(q) >= 0 || nom.indexOf(q) >= 0;
-                    tr.classList.toggle('search-hidden', !match);
-                    if (match) visible++;
-                });
-                var id = section.getAttribute('data-categoria-id');
-                var card = document.querySelector('.index-card[data-categoria-id="' + id + '"]');
-                if (visible > 0) {
-                    section.classList.add('search-match');
-                    if (card) card.classList.add('search-match');
-                } else {
-                    section.classList.add('search-no-results');
-                    if (card) card.classList.add('search-no-results');
-                }
-            });
-        });
-    </script>
-</body>
-</html>
-'''
-
-    html_content = vv.inject_vuelta_css(
-        html_content,
-        bool(VUELTA_A_VUELTA_MAP and VUELTA_A_VUELTA_FOLDER),
-    )
 
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    paginas_html.write_page(output_file, iter_page(valida, categorias_para_html, vuelta_map, vuelta_folder))
     
-    print("Página generada: " + OUTPUT_FILE)
+    print("Página generada: " + output_file)
 
 
 def _norm_cell_header(h):
@@ -1124,42 +889,23 @@ def _pick_main_session_items(items):
     return None, None, None
 
 
-def _parse_pos_int(val):
-    s = str(val or "").strip().upper()
-    if s in ("NT", "EX", "DNF"):
-        return 0
-    m = re.search(r"\d+", s)
-    return int(m.group(0)) if m else 0
-
-
-def _puntos_fedemoto_pos(pos):
-    if pos <= 0:
-        return 0.0
-    tabla = {
-        1: 15, 2: 13, 3: 11, 4: 10, 5: 9, 6: 8, 7: 7, 8: 6, 9: 5, 10: 4, 11: 3, 12: 2,
-    }
-    if pos in tabla:
-        return float(tabla[pos])
-    if 13 <= pos <= 15:
-        return 1.0
-    return 0.0
+_CATEGORIAS_EXPORTE = {}
 
 
-def _parse_puntos_cell(val):
-    s = str(val or "").strip().replace(",", ".")
-    m = re.search(r"-?\d+(\.\d+)?", s)
-    return float(m.group(0)) if m else 0.0
+def _categorias_exporte(files_dir):
+    """
+    Sesiones por categoría para los exportes (solo lectura): se arman una vez por carpeta y
+    firma, y las comparten las filas del resultado general y las del informe.
+    """
+    files_dir = os.path.abspath(files_dir or FILES_DIR)
+    key = (files_dir, escaneo_validas.firma(files_dir))
+    if key not in _CATEGORIAS_EXPORTE:
+        _CATEGORIAS_EXPORTE[key] = load_categorias_data(files_dir)
+    return _CATEGORIAS_EXPORTE[key]
 
 
 def _export_valida_rows(files_dir, pick_session_fn):
-    global FILES_DIR
-    prev = FILES_DIR
-    if files_dir:
-        FILES_DIR = files_dir
-    try:
-        categorias = load_categorias_data()
-    finally:
-        FILES_DIR = prev
+    categorias = _categorias_exporte(files_dir)
 
     out = {}
     for categoria, items in categorias.items():
@@ -1169,20 +915,23 @@ def _export_valida_rows(files_dir, pick_session_fn):
         idx = _find_stats_indexes(headers)
         if idx["numero"] is None:
             continue
+        # Puntos de toda la sesión de una vez: columna Puntos o posición → tabla de GP Colombia.
+        col = idx["puntos"] if mode == "puntos" else idx["pos"]
+        celdas = [row[col] if col is not None and col < len(row) else "" for row in rows]
+        if mode == "puntos":
+            pts_col = tabla_puntos.puntos_columna(celdas)
+        else:
+            pts_col = tabla_puntos.puntos_posiciones_columna(celdas, tabla_puntos.tabla_modalidad("GP Colombia"))
         cat_rows = []
-        for row in rows:
+        for k, row in enumerate(rows):
             if len(row) <= idx["numero"]:
                 continue
             numero = str(row[idx["numero"]]).strip()
             if not numero:
                 continue
-            if mode == "puntos":
-                if idx["puntos"] is None or len(row) <= idx["puntos"]:
-                    continue
-                pts = _parse_puntos_cell(row[idx["puntos"]])
-            else:
-                pos_val = row[idx["pos"]] if idx["pos"] is not None and idx["pos"] < len(row) else ""
-                pts = _puntos_fedemoto_pos(_parse_pos_int(pos_val))
+            if mode == "puntos" and (idx["puntos"] is None or len(row) <= idx["puntos"]):
+                continue
+            pts = pts_col[k]
             cat_rows.append({
                 "numero": numero,
                 "nombre": (
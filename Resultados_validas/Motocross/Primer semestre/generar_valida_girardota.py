@@ -2,24 +2,41 @@
 Script para generar la página HTML de resultados de la I Válida Nacional de Motocross - Girardota
 """
 
-import csv
 import os
 import html
 import re
 import sys
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-FILES_DIR = os.path.join(SCRIPT_DIR, "FILES EXPORTED-girardota")
-OUTPUT_FILE = os.path.join(SCRIPT_DIR, "valida_i_mx_girardota.html")
 
 _RV_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", ".."))
 if _RV_ROOT not in sys.path:
     sys.path.insert(0, _RV_ROOT)
+import paginas_html
+import plantillas
+import recursos_estaticos
+import registro_temporada
+import tablas_csv
 import vuelta_a_vuelta as vv
 
-# Válidas con PDFs Laptimes: asignar carpeta (relativa al HTML) y mapa antes de generate_html()
-VUELTA_A_VUELTA_FOLDER = None
-VUELTA_A_VUELTA_MAP = None
+# Rutas de la válida en el registro de la temporada (temporada_2026.json).
+_REGISTRO = registro_temporada.valida("valida_i_mx_girardota")
+FILES_DIR = _REGISTRO["files_dir"]
+OUTPUT_FILE = _REGISTRO["output_html"]
+
+# Configuración explícita de la válida; los wrappers (II Barranquilla, III Tocancipá, ...)
+# pasan la suya a generate_html() en lugar de modificar variables del módulo.
+VALIDA = {
+    "files_dir": FILES_DIR,
+    "output_file": OUTPUT_FILE,
+    "vuelta_dir": None,
+    "vuelta_folder_url": None,
+    "title": "I Válida Nacional de Motocross - Girardota, Antioquia | FEDEMOTO",
+    "heading": "I Válida Nacional de Motocross",
+    "subtitle": "Girardota, Antioquia - Resultados por categoría",
+    # <head>: bloques .html de plantillas_html/ y hojas .css publicadas en estaticos/.
+    "estilos": ("fuentes_sitio.html", "valida_motocross.css"),
+}
 
 def format_header(header):
     if not header:
@@ -69,9 +86,7 @@ def get_category_sort_key(categoria):
     return (order.get(categoria.lower(), 99), categoria)
 
 def parse_csv(filepath):
-    with open(filepath, 'r', encoding='utf-8-sig') as f:
-        rows = list(csv.reader(f))
-    return (rows[0], rows[1:]) if rows else ([], [])
+    return tablas_csv.read_rows(filepath, ',')
 
 def remove_clase_column(headers, rows):
     idx = next((i for i, h in enumerate(headers) if str(h).strip().lower() == 'clase'), None)
@@ -141,13 +156,13 @@ def build_vuelta_a_vuelta_map(pdf_dir):
         lambda p: vv.tipo_motocross_velotierra(p, format_categoria_name),
     )
 
-def session_title_block(categoria, tipo_sesion):
+def session_title_block(categoria, tipo_sesion, vuelta_map=None, vuelta_folder=None):
     return vv.session_title_block(
         categoria,
         tipo_sesion,
         escape_html,
-        VUELTA_A_VUELTA_MAP,
-        VUELTA_A_VUELTA_FOLDER,
+        vuelta_map,
+        vuelta_folder,
     )
 
 def slugify(text):
@@ -332,12 +347,141 @@ def render_row(row, comentario, search_attrs):
     html_parts.append('</tr>')
     return ''.join(html_parts)
 
-def generate_html():
+def iter_categoria_section(categoria, section_id, tablas, vuelta_map=None, vuelta_folder=None):
+    """Fragmentos HTML de la sección de una categoría (encabezado, resumen de tiempos, tablas)."""
+    final_data = None
+    clasif_data = None
+    c1_data = None
+    c2_data = None
+    for tipo, headers, rows, comentarios in tablas:
+        if tipo == 'Final':
+            final_data = (headers, rows, comentarios)
+        elif tipo == 'Clasificatoria':
+            clasif_data = (headers, rows)
+        elif tipo == 'Carrera 1':
+            c1_data = (headers, rows)
+        elif tipo == 'Carrera 2':
+            c2_data = (headers, rows)
+    
+    # Si no hay Final (ej. 50cc), la primera tabla es la principal
+    if categoria.lower() == "inicio":
+        inicio_built = build_inicio_final_from_sessions(clasif_data, c1_data, c2_data)
+        if inicio_built:
+            final_data = inicio_built
+    if not final_data and tablas:
+        final_data = (tablas[0][1], tablas[0][2], tablas[0][3])
+    
+    yield f'''
+            <div class="categoria-section" id="{section_id}" data-categoria-id="{section_id}">
+                <div class="categoria-header">
+                    <h2>{escape_html(categoria)}</h2>
+                    <button type="button" class="btn-top" title="Ir al inicio" aria-label="Ir al inicio">
+                        <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor"><path d="M12 4l-8 8h5v8h6v-8h5L12 4z"/></svg>
+                    </button>
+                </div>'''
+    
+    # Resumen de tiempos: solo el mejor en clasificatoria y el mejor en carreras (indicando en cuál)
+    if final_data and (clasif_data or c1_data or c2_data):
+        best_clasif = get_mejor_tm_absoluto(clasif_data[1], 1, find_mejor_tm_index(clasif_data[0]), 2) if clasif_data else None
+        best_carreras = get_mejor_tm_carreras(c1_data, c2_data) if (c1_data or c2_data) else None
+        if best_clasif or best_carreras:
+            yield '''
+                <div class="times-summary">
+                    <h4>Mejores tiempos - Clasificatoria y carreras</h4>
+                    <div class="times-summary-items">'''
+            if best_clasif:
+                num, nombre, tm = best_clasif
+                yield f'''
+                        <p><strong>Mejor tiempo Clasificatoria:</strong> {escape_html(tm)} — N° {escape_html(num)} {escape_html(nombre)}</p>'''
+            if best_carreras:
+                num, nombre, tm, carrera = best_carreras
+                yield f'''
+                        <p><strong>Mejor tiempo Carrera:</strong> {escape_html(tm)} ({escape_html(carrera)}) — N° {escape_html(num)} {escape_html(nombre)}</p>'''
+            yield '</div></div>'
+    
+    # Bloque principal (Final o primera tabla)
+    main_tipo = 'Final' if final_data and any(t == 'Final' for t, _, _, _ in tablas) else (tablas[0][0] if tablas else 'Resultados')
+    main_table = final_data if final_data else (tablas[0][1], tablas[0][2], tablas[0][3]) if tablas else (None, None, None)
+    if main_table:
+        headers, rows, comentarios = main_table
+        yield '\n                <div class="final-block">'
+        yield session_title_block(categoria, main_tipo, vuelta_map, vuelta_folder)
+        yield '''
+                <div class="table-wrapper">
+                    <table>
+                        <thead><tr>'''
+        for h in headers:
+            yield f'<th>{escape_html(h)}</th>'
+        yield '</tr></thead><tbody>'
+        for i, row in enumerate(rows):
+            com = comentarios[i] if i < len(comentarios) else ''
+            search_attrs = f' data-numero="{escape_html(row[1] if len(row) > 1 else "")}" data-nombre="{escape_html(row[2] if len(row) > 2 else "")}"'
+            yield render_row(row, com, search_attrs)
+        yield '</tbody></table></div></div>'
+    
+    # Bloque Desglose: solo si hay más de una tabla (evitar repetir info en 50cc, etc.)
+    main_tipo_for_desglose = main_tipo
+    desglose = [(t, h, r, c) for t, h, r, c in tablas if t != main_tipo_for_desglose]
+    if len(tablas) > 1 and desglose:
+        yield '\n                <div class="desglose-block">'
+        yield '\n                    <h3>Desglose por sesión</h3>'
+        for tipo, headers, rows, comentarios in desglose:
+            yield session_title_block(categoria, tipo, vuelta_map, vuelta_folder)
+            yield f'''
+                    <div class="table-wrapper">
+                        <table>
+                            <thead><tr>'''
+            for h in headers:
+                yield f'<th>{escape_html(h)}</th>'
+            yield '</tr></thead><tbody>'
+            for i, row in enumerate(rows):
+                com = comentarios[i] if i < len(comentarios) else ''
+                search_attrs = f' data-numero="{escape_html(row[1] if len(row) > 1 else "")}" data-nombre="{escape_html(row[2] if len(row) > 2 else "")}"'
+                yield render_row(row, com, search_attrs)
+            yield '</tbody></table></div>'
+        yield '</div>'
+    
+    yield '\n            </div>'
+
+
+def iter_page(valida, categorias_para_html, vuelta_map=None, vuelta_folder=None):
+    """Fragmentos HTML de la página completa (layout plantillas_html/valida.html), en orden."""
+    root = paginas_html.site_prefix(valida["output_file"])
+    return plantillas.iter_render(
+        "valida.html",
+        title=escape_html(valida["title"]),
+        root=root,
+        estilos=recursos_estaticos.estilos_head(valida.get("estilos", VALIDA["estilos"]), root),
+        heading=escape_html(valida["heading"]),
+        subtitle=escape_html(valida["subtitle"]),
+        index_cards=(
+            f'            <a href="#{section_id}" class="index-card" data-categoria-id="{section_id}">{escape_html(cat)}</a>\n'
+            for cat, section_id, _ in categorias_para_html
+        ),
+        sections=(
+            chunk
+            for categoria, section_id, tablas in categorias_para_html
+            for chunk in iter_categoria_section(categoria, section_id, tablas, vuelta_map, vuelta_folder)
+        ),
+        modal_categorias=(
+            f'                <label class="modal-cat-item"><input type="checkbox" value="{section_id}" checked> {escape_html(cat)}</label>\n'
+            for cat, section_id, _ in categorias_para_html
+        ),
+        modal_comentario=plantillas.bloque("valida_modal_comentario.html"),
+        script=recursos_estaticos.url("valida.js", root),
+    )
+
+def generate_html(valida=None):
+    valida = valida or VALIDA
+    files_dir = valida["files_dir"]
+    output_file = valida["output_file"]
+    vuelta_folder = valida.get("vuelta_folder_url")
+    vuelta_map = build_vuelta_a_vuelta_map(valida["vuelta_dir"]) if valida.get("vuelta_dir") else None
     categorias_data = {}
-    for filename in os.listdir(FILES_DIR):
+    for filename in os.listdir(files_dir):
         if not filename.lower().endswith('.csv'):
             continue
-        filepath = os.path.join(FILES_DIR, filename)
+        filepath = os.path.join(files_dir, filename)
         if not os.path.isfile(filepath):
             continue
         headers, rows = parse_csv(filepath)
@@ -362,391 +506,10 @@ def generate_html():
         first_tipo = tablas[0][0] if tablas else "Final"
         section_id = slugify(f"{categoria} {first_tipo}")
         categorias_para_html.append((categoria, section_id, tablas))
-    
-    html_content = '''<!DOCTYPE html>
-<html lang="es">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>I Válida Nacional de Motocross - Girardota, Antioquia | FEDEMOTO</title>
-    <link rel="icon" type="image/png" href="../../../fedemoto-logo.png">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Bebas+Neue&family=Roboto+Condensed:wght@300;400;700&family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { font-family: 'Inter', sans-serif; background: #f5f5f5; color: #000; line-height: 1.6; padding: 20px; padding-top: 120px; min-height: 100vh; }
-        .fixed-header { position: fixed; top: 0; left: 0; right: 0; background: #123E92; color: white; z-index: 1000; box-shadow: 0 4px 10px rgba(0,0,0,0.2); }
-        .header-content { max-width: 1400px; margin: 0 auto; display: flex; align-items: center; justify-content: space-between; padding: 15px 30px; }
-        .logo-container { display: flex; align-items: center; gap: 15px; }
-        .logo-container a { display: flex; align-items: center; gap: 15px; text-decoration: none; color: inherit; }
-        .logo-container img { height: 50px; width: auto; }
-        .logo-container h1 { font-family: 'Bebas Neue', sans-serif; font-size: 1.8em; margin: 0; text-shadow: 2px 2px 4px rgba(0,0,0,0.2); letter-spacing: 1px; }
-        .logo-container a:hover h1 { opacity: 0.9; }
-        .nav-menu { display: flex; gap: 0; list-style: none; margin: 0; padding: 0; }
-        .nav-menu li { margin: 0; position: relative; }
-        .nav-menu > li > a { display: block; padding: 12px 25px; color: white; text-decoration: none; font-family: 'Roboto Condensed', sans-serif; font-weight: 400; font-size: 1.1em; transition: all 0.2s ease; border-radius: 8px; position: relative; cursor: pointer; }
-        .nav-menu > li > a:hover { background: rgba(255,255,255,0.1); transform: translateY(-2px); }
-        .nav-menu > li > a.active { background: #F7C31D; color: #123E92; font-weight: 700; }
-        .dropdown { position: relative; }
-        .dropdown > a::after { content: ' ▼'; font-size: 0.8em; margin-left: 5px; }
-        .nav-menu > .dropdown::before, .dropdown::before { content: ''; position: absolute; top: 100%; left: 0; right: 0; height: 5px; background: transparent; z-index: 1001; }
-        .dropdown-menu { display: none; position: absolute; top: calc(100% + 5px); left: 0; background: white; min-width: 200px; width: 220px; box-shadow: 0 8px 16px rgba(0,0,0,0.2); border-radius: 8px; z-index: 10001; list-style: none; padding: 0; margin: 0; overflow: visible; border: 1px solid #d1d5db; }
-        .dropdown-menu .dropdown { position: relative; }
-        .dropdown-menu .dropdown::before { content: ''; position: absolute; top: 0; left: 100%; width: 10px; height: 100%; background: transparent; z-index: 10004; }
-        .dropdown-menu .dropdown > a { position: relative; padding-right: 35px; }
-        .dropdown-menu .dropdown > a::after { content: ' ▶'; position: absolute; right: 15px; top: 50%; transform: translateY(-50%); font-size: 0.8em; margin: 0; float: none; }
-        .dropdown-menu .dropdown .dropdown-menu { display: none !important; position: absolute; left: 100%; top: 0; margin-left: 5px; z-index: 10003; min-width: 180px; background: white; box-shadow: 0 8px 16px rgba(0,0,0,0.2); border-radius: 8px; overflow: visible; border: 1px solid #d1d5db; }
-        .nav-menu > .dropdown:nth-child(3) .dropdown-menu .dropdown .dropdown-menu, .nav-menu > .dropdown:nth-child(4) .dropdown-menu .dropdown .dropdown-menu, .nav-menu > .dropdown:nth-child(5) .dropdown-menu .dropdown .dropdown-menu { left: auto !important; right: 100% !important; margin-left: 0 !important; margin-right: 5px !important; }
-        .dropdown-menu .dropdown:hover > .dropdown-menu { display: block !important; }
-        .nav-menu > .dropdown:hover > .dropdown-menu, .nav-menu > .dropdown.active > .dropdown-menu { display: block; animation: fadeInDown 0.3s ease; }
-        @keyframes fadeInDown { from { opacity: 0; transform: translateY(-10px); } to { opacity: 1; transform: translateY(0); } }
-        .dropdown-menu li { margin: 0; position: relative; }
-        .dropdown-menu a { display: block; padding: 12px 20px; color: #000; text-decoration: none; font-family: 'Inter', sans-serif; font-size: 1em; font-weight: 400; transition: all 0.2s ease; border-bottom: 1px solid #f0f0f0; }
-        .dropdown-menu a:last-child { border-bottom: none; }
-        .dropdown-menu a:hover { background: #f8f9fa; color: #123E92; }
-        .dropdown-menu .dropdown > a:hover { padding-left: 20px; }
-        .dropdown-menu a.active { background: #F7C31D; color: #123E92; font-weight: 600; }
-        .dropdown.active > a { background: rgba(255,255,255,0.15); }
-        .container { max-width: 1400px; margin: 0 auto; background: white; border-radius: 12px; box-shadow: 0 20px 60px rgba(0,0,0,0.3); overflow: hidden; margin-bottom: 40px; }
-        .container > header { background: linear-gradient(135deg, #123E92 0%, #0f3377 100%); color: white; padding: 40px; text-align: center; }
-        .container > header h1 { font-family: 'Bebas Neue', sans-serif; font-size: 2.2em; margin-bottom: 10px; letter-spacing: 2px; }
-        .container > header p { font-family: 'Roboto Condensed', sans-serif; font-size: 1.2em; opacity: 0.95; }
-        .toolbar { padding: 25px 40px; background: #f8f9fa; border-bottom: 1px solid #C0C0C0; }
-        .search-box { width: 100%; padding: 12px 20px; font-family: 'Inter', sans-serif; font-size: 1em; border: 2px solid #d1d5db; border-radius: 8px; }
-        .search-box:focus { outline: none; border-color: #123E92; box-shadow: 0 0 0 3px rgba(18, 62, 146, 0.2); }
-        .index-cards { display: flex; flex-wrap: wrap; gap: 12px; padding: 25px 40px; background: #f8f9fa; border-bottom: 1px solid #C0C0C0; }
-        .index-card { display: inline-block; padding: 10px 20px; background: white; color: #123E92; border: 2px solid #123E92; border-radius: 8px; font-family: 'Roboto Condensed', sans-serif; font-weight: 700; text-decoration: none; transition: all 0.2s ease; }
-        .index-card:hover { background: #123E92; color: white; transform: translateY(-2px); }
-        .index-card.search-match { background: #F7C31D; color: #123E92; border-color: #F7C31D; }
-        .index-card.search-no-results { display: none !important; }
-        .content-section { padding: 40px; }
-        .categoria-section { margin-bottom: 50px; scroll-margin-top: 120px; border: 2px solid #e0e0e0; border-radius: 12px; overflow: hidden; }
-        .categoria-section:last-child { margin-bottom: 0; }
-        .categoria-section.search-match { border-color: #F7C31D; box-shadow: 0 0 0 3px rgba(247, 195, 29, 0.4); }
-        .categoria-section.search-no-results { display: none !important; }
-        .categoria-header { background: linear-gradient(135deg, #123E92 0%, #0f3377 100%); color: white; padding: 25px 30px; display: flex; align-items: center; justify-content: space-between; gap: 15px; }
-        .categoria-header h2 { font-family: 'Bebas Neue', sans-serif; font-size: 2em; letter-spacing: 2px; }
-        .btn-top { display: inline-flex; align-items: center; justify-content: center; width: 40px; height: 40px; background: rgba(255,255,255,0.2); color: white; border: 2px solid rgba(255,255,255,0.6); border-radius: 8px; cursor: pointer; transition: all 0.2s ease; flex-shrink: 0; }
-        .btn-top:hover { background: #F7C31D; color: #123E92; border-color: #F7C31D; }
-        .btn-top svg { width: 20px; height: 20px; }
-        .times-summary { margin: 20px 30px; padding: 20px; background: #f8f9fa; border-radius: 8px; border-left: 5px solid #123E92; }
-        .times-summary h4 { font-family: 'Roboto Condensed', sans-serif; color: #123E92; margin-bottom: 15px; font-size: 1.1em; }
-        .times-summary table { width: 100%; border-collapse: collapse; font-size: 0.9em; }
-        .times-summary th, .times-summary td { padding: 8px 12px; text-align: left; border-bottom: 1px solid #e0e0e0; }
-        .times-summary th { background: #123E92; color: white; font-family: 'Roboto Condensed', sans-serif; }
-        .times-summary-items p { margin-bottom: 10px; font-size: 1em; }
-        .times-summary-items p:last-child { margin-bottom: 0; }
-        .final-block { padding: 0 30px 30px; }
-        .final-block h3 { font-family: 'Bebas Neue', sans-serif; font-size: 1.8em; color: #123E92; margin: 25px 0 15px; padding-bottom: 8px; border-bottom: 3px solid #F7C31D; letter-spacing: 1px; }
-        /*__VUELTA_CSS__*/
-        .desglose-block { padding: 0 30px 30px; background: #fafafa; border-top: 1px solid #e0e0e0; }
-        .desglose-block h3 { font-family: 'Roboto Condensed', sans-serif; font-size: 1.2em; color: #666; margin: 20px 0 12px; padding-bottom: 6px; border-bottom: 1px solid #C0C0C0; font-weight: 700; }
-        .table-wrapper { overflow-x: auto; margin-bottom: 20px; border-radius: 8px; border: 1px solid #d1d5db; }
-        table { width: 100%; border-collapse: collapse; font-size: 0.9em; }
-        th, td { padding: 12px 15px; text-align: left; border-bottom: 1px solid #e0e0e0; }
-        th { background: #123E92; color: white; font-family: 'Roboto Condensed', sans-serif; font-weight: 700; }
-        tr:hover { background: #f8f9fa; }
-        tr.search-hidden { display: none !important; }
-        .pos-1 { background: rgba(247, 195, 29, 0.15) !important; }
-        .pos-2 { background: rgba(192, 192, 192, 0.2) !important; }
-        .pos-3 { background: rgba(139, 90, 43, 0.1) !important; }
-        .pos-cell { display: inline-block; margin-right: 4px; }
-        .comentario-btn { display: inline-flex; align-items: center; justify-content: center; width: 24px; height: 24px; margin-left: 6px; border: 1px solid #123E92; border-radius: 999px; background: #e8eef8; color: #123E92; font-size: 14px; font-weight: 700; cursor: pointer; vertical-align: middle; }
-        .comentario-btn:hover, .comentario-btn:focus { background: #123E92; color: white; outline: none; }
-        .pdf-section { text-align: center; padding: 40px 20px; border-top: 1px solid #C0C0C0; background: #f8f9fa; }
-        .btn-pdf { display: inline-block; padding: 14px 32px; background: #123E92; color: white; border: none; border-radius: 8px; font-family: 'Roboto Condensed', sans-serif; font-size: 1.1em; font-weight: 700; cursor: pointer; transition: all 0.2s ease; }
-        .btn-pdf:hover { background: #0f3377; transform: translateY(-2px); }
-        .pdf-hint { margin-top: 12px; font-size: 0.9em; color: #666; }
-        .modal-overlay { display: none; position: fixed; top: 0; left: 0; right: 0; bottom: 0; background: rgba(0,0,0,0.5); z-index: 10000; align-items: center; justify-content: center; }
-        .modal-overlay.open { display: flex; }
-        .modal-box { background: white; border-radius: 12px; padding: 30px; max-width: 450px; width: 90%; max-height: 80vh; overflow-y: auto; box-shadow: 0 20px 60px rgba(0,0,0,0.3); }
-        .modal-box h3 { font-family: 'Bebas Neue', sans-serif; font-size: 1.6em; color: #123E92; margin-bottom: 20px; }
-        .modal-categorias { display: flex; flex-wrap: wrap; gap: 8px 16px; margin-bottom: 20px; }
-        .modal-cat-item { display: flex; align-items: center; gap: 8px; cursor: pointer; }
-        .modal-cat-item input { cursor: pointer; width: 18px; height: 18px; accent-color: #123E92; }
-        .modal-actions { display: flex; gap: 12px; flex-wrap: wrap; }
-        .modal-btn { padding: 10px 20px; border-radius: 8px; font-family: 'Roboto Condensed', sans-serif; font-weight: 700; cursor: pointer; border: none; font-size: 1em; transition: all 0.2s ease; }
-        .modal-btn-primary { background: #123E92; color: white; }
-        .modal-btn-primary:hover { background: #0f3377; }
-        .modal-btn-secondary { background: #e5e7eb; color: #374151; }
-        .modal-btn-secondary:hover { background: #d1d5db; }
-        .modal-btn-link { background: transparent; color: #123E92; text-decoration: underline; }
-        .modal-btn-link:hover { color: #0f3377; }
-        .categoria-section.pdf-exclude { display: none !important; }
-        footer { background: #f8f9fa; padding: 30px 40px; text-align: center; border-top: 1px solid #C0C0C0; color: #000; font-family: 'Inter', sans-serif; font-size: 0.9em; font-weight: 400; line-height: 1.8; }
-        footer .developer { font-family: 'Roboto Condensed', sans-serif; font-weight: 700; color: #123E92; }
-        @media print {
-            @page { size: A4 landscape; margin: 15mm; }
-            body { padding: 0 !important; padding-top: 0 !important; background: white !important; }
-            #menu-container, .fixed-header, .pdf-section, .toolbar, .index-cards, .btn-top, footer { display: none !important; }
-            .container { box-shadow: none !important; max-width: 100% !important; }
-            .categoria-section { break-before: page; page-break-before: always; }
-            .categoria-section:first-child { break-before: auto; page-break-before: auto; }
-            .modal-overlay { display: none !important; }
-            .container > header, .categoria-header, th { -webkit-print-color-adjust: exact; print-color-adjust: exact; }
-            table { font-size: 0.75em; }
-        }
-    </style>
-</head>
-<body>
-    <div id="menu-container"></div>
-    <div id="contenido-exportar" class="container">
-        <header>
-            <h1>I Válida Nacional de Motocross</h1>
-            <p>Girardota, Antioquia - Resultados por categoría</p>
-        </header>
-        <div class="toolbar">
-            <input type="text" id="buscador" class="search-box" placeholder="Buscar por nombre o N° del piloto..." />
-        </div>
-        <div class="index-cards">
-'''
-    
-    for cat, section_id, _ in categorias_para_html:
-        html_content += f'            <a href="#{section_id}" class="index-card" data-categoria-id="{section_id}">{escape_html(cat)}</a>\n'
-    
-    html_content += '        </div>\n        <div class="content-section">\n'
-    
-    for categoria, section_id, tablas in categorias_para_html:
-        final_data = None
-        clasif_data = None
-        c1_data = None
-        c2_data = None
-        for tipo, headers, rows, comentarios in tablas:
-            if tipo == 'Final':
-                final_data = (headers, rows, comentarios)
-            elif tipo == 'Clasificatoria':
-                clasif_data = (headers, rows)
-            elif tipo == 'Carrera 1':
-                c1_data = (headers, rows)
-            elif tipo == 'Carrera 2':
-                c2_data = (headers, rows)
-        
-        # Si no hay Final (ej. 50cc), la primera tabla es la principal
-        if categoria.lower() == "inicio":
-            inicio_built = build_inicio_final_from_sessions(clasif_data, c1_data, c2_data)
-            if inicio_built:
-                final_data = inicio_built
-        if not final_data and tablas:
-            final_data = (tablas[0][1], tablas[0][2], tablas[0][3])
-        
-        html_content += f'''
-            <div class="categoria-section" id="{section_id}" data-categoria-id="{section_id}">
-                <div class="categoria-header">
-                    <h2>{escape_html(categoria)}</h2>
-                    <button type="button" class="btn-top" title="Ir al inicio" aria-label="Ir al inicio">
-                        <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor"><path d="M12 4l-8 8h5v8h6v-8h5L12 4z"/></svg>
-                    </button>
-                </div>'''
-        
-        # Resumen de tiempos: solo el mejor en clasificatoria y el mejor en carreras (indicando en cuál)
-        if final_data and (clasif_data or c1_data or c2_data):
-            best_clasif = get_mejor_tm_absoluto(clasif_data[1], 1, find_mejor_tm_index(clasif_data[0]), 2) if clasif_data else None
-            best_carreras = get_mejor_tm_carreras(c1_data, c2_data) if (c1_data or c2_data) else None
-            if best_clasif or best_carreras:
-                html_content += '''
-                <div class="times-summary">
-                    <h4>Mejores tiempos - Clasificatoria y carreras</h4>
-                    <div class="times-summary-items">'''
-                if best_clasif:
-                    num, nombre, tm = best_clasif
-                    html_content += f'''
-                        <p><strong>Mejor tiempo Clasificatoria:</strong> {escape_html(tm)} — N° {escape_html(num)} {escape_html(nombre)}</p>'''
-                if best_carreras:
-                    num, nombre, tm, carrera = best_carreras
-                    html_content += f'''
-                        <p><strong>Mejor tiempo Carrera:</strong> {escape_html(tm)} ({escape_html(carrera)}) — N° {escape_html(num)} {escape_html(nombre)}</p>'''
-                html_content += '</div></div>'
-        
-        # Bloque principal (Final o primera tabla)
-        main_tipo = 'Final' if final_data and any(t == 'Final' for t, _, _, _ in tablas) else (tablas[0][0] if tablas else 'Resultados')
-        main_table = final_data if final_data else (tablas[0][1], tablas[0][2], tablas[0][3]) if tablas else (None, None, None)
-        if main_table:
-            headers, rows, comentarios = main_table
-            html_content += '\n                <div class="final-block">'
-            html_content += session_title_block(categoria, main_tipo)
-            html_content += '''
-                <div class="table-wrapper">
-                    <table>
-                        <thead><tr>'''
-            for h in headers:
-                html_content += f'<th>{escape_html(h)}</th>'
-            html_content += '</tr></thead><tbody>'
-            for i, row in enumerate(rows):
-                com = comentarios[i] if i < len(comentarios) else ''
-                search_attrs = f' data-numero="{escape_html(row[1] if len(row) > 1 else "")}" data-nombre="{escape_html(row[2] if len(row) > 2 else "")}"'
-                html_content += render_row(row, com, search_attrs)
-            html_content += '</tbody></table></div></div>'
-        
-        # Bloque Desglose: solo si hay más de una tabla (evitar repetir info en 50cc, etc.)
-        main_tipo_for_desglose = main_tipo
-        desglose = [(t, h, r, c) for t, h, r, c in tablas if t != main_tipo_for_desglose]
-        if len(tablas) > 1 and desglose:
-            html_content += '\n                <div class="desglose-block">'
-            html_content += '\n                    <h3>Desglose por sesión</h3>'
-            for tipo, headers, rows, comentarios in desglose:
-                html_content += session_title_block(categoria, tipo)
-                html_content += f'''
-                    <div class="table-wrapper">
-                        <table>
-                            <thead><tr>'''
-                for h in headers:
-                    html_content += f'<th>{escape_html(h)}</th>'
-                html_content += '</tr></thead><tbody>'
-                for i, row in enumerate(rows):
-                    com = comentarios[i] if i < len(comentarios) else ''
-                    search_attrs = f' data-numero="{escape_html(row[1] if len(row) > 1 else "")}" data-nombre="{escape_html(row[2] if len(row) > 2 else "")}"'
-                    html_content += render_row(row, com, search_attrs)
-                html_content += '</tbody></table></div>'
-            html_content += '</div>'
-        
-        html_content += '\n            </div>'
-    
-    html_content += '''
-        </div>
-        <div class="pdf-section">
-            <button id="descargarPDF" class="btn-pdf">Exportar a PDF</button>
-            <p class="pdf-hint">En el dialogo de impresion, elige "Guardar como PDF" o "Microsoft Print to PDF" como destino.</p>
-        </div>
-        <footer>
-            <p><span class="developer">Developed by Mauricio Sánchez Aguilar - Fedemoto</span></p>
-            <p>Este proyecto es de uso interno de FEDEMOTO.</p>
-        </footer>
-    </div>
-    <div id="modalExportar" class="modal-overlay">
-        <div class="modal-box">
-            <h3>Exportar a PDF</h3>
-            <p style="margin-bottom: 16px; font-size: 0.95em; color: #374151;">Selecciona las categorías que deseas incluir:</p>
-            <div class="modal-categorias" id="modalCategorias">
-'''
-    
-    for cat, section_id, _ in categorias_para_html:
-        html_content += f'                <label class="modal-cat-item"><input type="checkbox" value="{section_id}" checked> {escape_html(cat)}</label>\n'
-    
-    html_content += '''            </div>
-            <div class="modal-actions">
-                <button type="button" class="modal-btn modal-btn-link" id="modalSelectAll">Seleccionar todo</button>
-                <button type="button" class="modal-btn modal-btn-link" id="modalDeselectAll">Deseleccionar todo</button>
-            </div>
-            <div class="modal-actions" style="margin-top: 20px;">
-                <button type="button" class="modal-btn modal-btn-primary" id="modalExportarBtn">Exportar</button>
-                <button type="button" class="modal-btn modal-btn-secondary" id="modalCancelar">Cancelar</button>
-            </div>
-        </div>
-    </div>
-    <div id="modalComentario" class="modal-overlay">
-        <div class="modal-box">
-            <h3>Comentario</h3>
-            <p id="modalComentarioTexto" style="margin-bottom: 20px; font-size: 1em; color: #111827; white-space: pre-wrap;"></p>
-            <div class="modal-actions">
-                <button type="button" class="modal-btn modal-btn-primary" id="modalComentarioCerrar">Cerrar</button>
-            </div>
-        </div>
-    </div>
-    <script src="../../../load-menu.js"></script>
-    <script>
-        document.getElementById('descargarPDF').addEventListener('click', function() {
-            document.querySelectorAll('.search-no-results').forEach(function(el){ el.classList.remove('search-no-results'); });
-            document.querySelectorAll('.search-hidden').forEach(function(el){ el.classList.remove('search-hidden'); });
-            document.getElementById('modalExportar').classList.add('open');
-        });
-        document.getElementById('modalSelectAll').addEventListener('click', function() {
-            document.querySelectorAll('#modalCategorias input').forEach(function(cb){ cb.checked = true; });
-        });
-        document.getElementById('modalDeselectAll').addEventListener('click', function() {
-            document.querySelectorAll('#modalCategorias input').forEach(function(cb){ cb.checked = false; });
-        });
-        document.getElementById('modalCancelar').addEventListener('click', function() {
-            document.getElementById('modalExportar').classList.remove('open');
-        });
-        document.getElementById('modalExportar').addEventListener('click', function(e) {
-            if (e.target === this) this.classList.remove('open');
-        });
-        var modalComentario = document.getElementById('modalComentario');
-        var modalComentarioTexto = document.getElementById('modalComentarioTexto');
-        document.addEventListener('click', function(e) {
-            var btn = e.target.closest('.comentario-btn');
-            if (!btn) return;
-            modalComentarioTexto.textContent = btn.getAttribute('data-comentario') || '';
-            modalComentario.classList.add('open');
-        });
-        document.getElementById('modalComentarioCerrar').addEventListener('click', function() {
-            modalComentario.classList.remove('open');
-        });
-        modalComentario.addEventListener('click', function(e) {
-            if (e.target === this) this.classList.remove('open');
-        });
-        document.getElementById('modalExportarBtn').addEventListener('click', function() {
-            var selected = [];
-            document.querySelectorAll('#modalCategorias input[type="checkbox"]').forEach(function(cb) {
-                if (cb.checked) selected.push(cb.value);
-            });
-            if (selected.length === 0) {
-                alert('Selecciona al menos una categoria.');
-                return;
-            }
-            document.querySelectorAll('.categoria-section').forEach(function(section) {
-                var id = section.getAttribute('data-categoria-id');
-                section.classList.toggle('pdf-exclude', selected.indexOf(id) === -1);
-            });
-            document.getElementById('modalExportar').classList.remove('open');
-            void document.body.offsetHeight;
-            setTimeout(function() { window.print(); }, 150);
-        });
-        window.addEventListener('afterprint', function() {
-            document.querySelectorAll('.categoria-section').forEach(function(section) {
-                section.classList.remove('pdf-exclude');
-            });
-        });
-        document.querySelectorAll('.btn-top').forEach(function(btn) {
-            btn.addEventListener('click', function() { window.scrollTo({ top: 0, behavior: 'smooth' }); });
-        });
-        var buscador = document.getElementById('buscador');
-        buscador.addEventListener('input', function() {
-            var q = this.value.trim().toLowerCase();
-            var sections = document.querySelectorAll('.categoria-section');
-            var cards = document.querySelectorAll('.index-card');
-            cards.forEach(function(c){ c.classList.remove('search-match', 'search-no-results'); });
-            sections.forEach(function(s){ s.classList.remove('search-match', 'search-no-results'); });
-            if (!q) {
-                document.querySelectorAll('.search-hidden').forEach(function(tr){ tr.classList.remove('search-hidden'); });
-                return;
-            }
-            sections.forEach(function(section) {
-                var rows = section.querySelectorAll('tbody tr[data-numero], tbody tr[data-nombre]');
-                var visible = 0;
-                rows.forEach(function(tr) {
-                    var num = (tr.getAttribute('data-numero') || '').toLowerCase();
-                    var nom = (tr.getAttribute('data-nombre') || '').toLowerCase();
-                    var match = num.indexOf(q) >= 0 || nom.indexOf(q) >= 0;
-                    tr.classList.toggle('search-hidden', !match);
-                    if (match) visible++;
-                });
-                var id = section.getAttribute('data-categoria-id');
-                var card = document.querySelector('.index-card[data-categoria-id="' + id + '"]');
-                if (visible > 0) {
-                    section.classList.add('search-match');
-                    if (card) card.classList.add('search-match');
-                } else {
-                    section.classList.add('search-no-results');
-                    if (card) card.classList.add('search-no-results');
-                }
-            });
-        });
-    </script>
-</body>
-</html>
-'''
-
-    html_content = vv.inject_vuelta_css(
-        html_content,
-        bool(VUELTA_A_VUELTA_MAP and VUELTA_A_VUELTA_FOLDER),
-    )
 
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    paginas_html.write_page(output_file, iter_page(valida, categorias_para_html, vuelta_map, vuelta_folder))
     
-    print("Pagina generada: " + OUTPUT_FILE)
+    print("Pagina generada: " + output_file)
 
 if __name__ == '__main__':
     generate_html()
@@ -1,16 +1,28 @@
 # -*- coding: utf-8 -*-
 """Genera valida_iii_velocidad_popayan.html desde FILES EXPORTED_POPAYAN."""
 
-import csv
 import html
 import re
-import unicodedata
+import sys
 from pathlib import Path
 from urllib.parse import quote
 
 ROOT = Path(__file__).resolve().parent
-CSV_DIR = ROOT / "FILES EXPORTED_POPAYAN"
-OUT = ROOT / "valida_iii_velocidad_popayan.html"
+
+_RV_ROOT = str(ROOT.parents[1])
+if _RV_ROOT not in sys.path:
+    sys.path.insert(0, _RV_ROOT)
+import normalizacion
+import paginas_html
+import plantillas
+import recursos_estaticos
+import registro_temporada
+import tablas_csv
+
+# Rutas de la válida en el registro de la temporada (temporada_2026.json).
+_REGISTRO = registro_temporada.valida("valida_iii_velocidad_popayan")
+CSV_DIR = Path(_REGISTRO["files_dir"])
+OUT = Path(_REGISTRO["output_html"])
 
 ORDER = [
     ("50-cc", "50 CC", "50 CC"),
@@ -30,28 +42,12 @@ ORDER = [
 ]
 
 
-def normalize_text(value):
-    s = str(value or "").strip()
-    s = "".join(c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn")
-    s = re.sub(r"\s+", " ", s)
-    return s.upper()
-
-
-def detect_delimiter(first_line):
-    if not first_line:
-        return ","
-    return ";" if first_line.count(";") > first_line.count(",") else ","
+# Mayúsculas sin tildes y con espacios simples (normalizacion.py, memorizada).
+normalize_text = normalizacion.mayusculas
 
 
 def read_csv(path):
-    raw = path.read_text(encoding="utf-8-sig")
-    lines = raw.splitlines()
-    delim = detect_delimiter(lines[0] if lines else "")
-    reader = csv.DictReader(lines, delimiter=delim)
-    out = []
-    for row in reader:
-        out.append({(k or "").strip(): (v or "").strip() for k, v in row.items()})
-    return out
+    return tablas_csv.read_table(path).dicts()
 
 
 def normalize_header(h):
@@ -438,221 +434,20 @@ def main():
         sections.append(section_html(section_id, title, cat, all_data, vuelta_map, vuelta_folder, source_files))
     sections_html = "\n".join(sections)
 
-    page = f"""<!DOCTYPE html>
-<html lang="es">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>III Válida Nacional de Velocidad - Popayán, Cauca | FEDEMOTO</title>
-    <link rel="icon" type="image/png" href="../../../fedemoto-logo.png">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Bebas+Neue&family=Roboto+Condensed:wght@300;400;700&family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: 'Inter', sans-serif; background: #f5f5f5; color: #000; line-height: 1.6; padding: 20px; padding-top: 120px; min-height: 100vh; }}
-        .container {{ max-width: 1400px; margin: 0 auto; background: white; border-radius: 12px; box-shadow: 0 20px 60px rgba(0,0,0,0.3); overflow: hidden; margin-bottom: 40px; }}
-        .container > header {{ background: linear-gradient(135deg, #123E92 0%, #0f3377 100%); color: white; padding: 40px; text-align: center; }}
-        .container > header h1 {{ font-family: 'Bebas Neue', sans-serif; font-size: 2.2em; margin-bottom: 10px; letter-spacing: 2px; }}
-        .container > header p {{ font-family: 'Roboto Condensed', sans-serif; font-size: 1.2em; opacity: 0.95; }}
-        .toolbar {{ padding: 25px 40px; background: #f8f9fa; border-bottom: 1px solid #C0C0C0; }}
-        .search-box {{ width: 100%; padding: 12px 20px; font-family: 'Inter', sans-serif; font-size: 1em; border: 2px solid #d1d5db; border-radius: 8px; }}
-        .search-box:focus {{ outline: none; border-color: #123E92; box-shadow: 0 0 0 3px rgba(18, 62, 146, 0.2); }}
-        .index-cards {{ display: flex; flex-wrap: wrap; gap: 12px; padding: 25px 40px; background: #f8f9fa; border-bottom: 1px solid #C0C0C0; }}
-        .index-card {{ display: inline-block; padding: 10px 20px; background: white; color: #123E92; border: 2px solid #123E92; border-radius: 8px; font-family: 'Roboto Condensed', sans-serif; font-weight: 700; text-decoration: none; transition: all 0.2s ease; }}
-        .index-card:hover {{ background: #123E92; color: white; transform: translateY(-2px); }}
-        .index-card.search-match {{ background: #F7C31D; color: #123E92; border-color: #F7C31D; }}
-        .index-card.search-no-results {{ display: none !important; }}
-        .content-section {{ padding: 40px; }}
-        .categoria-section {{ margin-bottom: 50px; scroll-margin-top: 120px; border: 2px solid #e0e0e0; border-radius: 12px; overflow: hidden; }}
-        .categoria-section:last-child {{ margin-bottom: 0; }}
-        .categoria-section.search-match {{ border-color: #F7C31D; box-shadow: 0 0 0 3px rgba(247, 195, 29, 0.4); }}
-        .categoria-section.search-no-results {{ display: none !important; }}
-        .categoria-header {{ background: linear-gradient(135deg, #123E92 0%, #0f3377 100%); color: white; padding: 25px 30px; display: flex; align-items: center; justify-content: space-between; gap: 15px; }}
-        .categoria-header h2 {{ font-family: 'Bebas Neue', sans-serif; font-size: 2em; letter-spacing: 2px; }}
-        .btn-top {{ display: inline-flex; align-items: center; justify-content: center; width: 40px; height: 40px; background: rgba(255,255,255,0.2); color: white; border: 2px solid rgba(255,255,255,0.6); border-radius: 8px; cursor: pointer; transition: all 0.2s ease; flex-shrink: 0; }}
-        .btn-top:hover {{ background: #F7C31D; color: #123E92; border-color: #F7C31D; }}
-        .btn-top svg {{ width: 20px; height: 20px; }}
-        .times-summary {{ margin: 20px 30px; padding: 20px; background: #f8f9fa; border-radius: 8px; border-left: 5px solid #123E92; }}
-        .times-summary h4 {{ font-family: 'Roboto Condensed', sans-serif; color: #123E92; margin-bottom: 15px; font-size: 1.1em; }}
-        .times-summary-items p {{ margin-bottom: 10px; font-size: 1em; }}
-        .times-summary-items p:last-child {{ margin-bottom: 0; }}
-        .session-title-row {{ display: flex; flex-wrap: wrap; align-items: center; justify-content: space-between; gap: 12px; margin: 20px 0 12px; padding-bottom: 8px; border-bottom: 3px solid #F7C31D; }}
-        .session-title-row h3 {{ margin: 0; padding: 0; border: none; font-family: 'Bebas Neue', sans-serif; font-size: 1.8em; color: #123E92; letter-spacing: 1px; }}
-        .btn-vuelta-a-vuelta {{ display: inline-block; padding: 8px 16px; background: #123E92; color: white; text-decoration: none; border-radius: 8px; font-family: 'Roboto Condensed', sans-serif; font-weight: 700; font-size: 0.9em; white-space: nowrap; transition: all 0.2s ease; }}
-        .btn-vuelta-a-vuelta:hover {{ background: #0f3377; color: white; }}
-        .final-block {{ padding: 0 30px 30px; }}
-        .table-wrapper {{ overflow-x: auto; margin-bottom: 20px; border-radius: 8px; border: 1px solid #d1d5db; }}
-        table {{ width: 100%; border-collapse: collapse; font-size: 0.9em; }}
-        th, td {{ padding: 12px 15px; text-align: left; border-bottom: 1px solid #e0e0e0; }}
-        th {{ background: #123E92; color: white; font-family: 'Roboto Condensed', sans-serif; font-weight: 700; }}
-        tr:hover {{ background: #f8f9fa; }}
-        tr.search-hidden {{ display: none !important; }}
-        .pos-1 {{ background: rgba(247, 195, 29, 0.15) !important; }}
-        .pos-2 {{ background: rgba(192, 192, 192, 0.2) !important; }}
-        .pos-3 {{ background: rgba(139, 90, 43, 0.1) !important; }}
-        .pos-cell {{ display: inline-block; margin-right: 4px; }}
-        .comentario-btn {{ display: inline-flex; align-items: center; justify-content: center; width: 24px; height: 24px; margin-left: 6px; border: 1px solid #123E92; border-radius: 999px; background: #e8eef8; color: #123E92; font-size: 14px; font-weight: 700; cursor: pointer; vertical-align: middle; }}
-        .comentario-btn:hover, .comentario-btn:focus {{ background: #123E92; color: white; outline: none; }}
-        .pdf-section {{ text-align: center; padding: 40px 20px; border-top: 1px solid #C0C0C0; background: #f8f9fa; }}
-        .btn-pdf {{ display: inline-block; padding: 14px 32px; background: #123E92; color: white; border: none; border-radius: 8px; font-family: 'Roboto Condensed', sans-serif; font-size: 1.1em; font-weight: 700; cursor: pointer; transition: all 0.2s ease; }}
-        .btn-pdf:hover {{ background: #0f3377; transform: translateY(-2px); }}
-        .pdf-hint {{ margin-top: 12px; font-size: 0.9em; color: #666; }}
-        .modal-overlay {{ display: none; position: fixed; top: 0; left: 0; right: 0; bottom: 0; background: rgba(0,0,0,0.5); z-index: 10000; align-items: center; justify-content: center; }}
-        .modal-overlay.open {{ display: flex; }}
-        .modal-box {{ background: white; border-radius: 12px; padding: 30px; max-width: 450px; width: 90%; max-height: 80vh; overflow-y: auto; box-shadow: 0 20px 60px rgba(0,0,0,0.3); }}
-        .modal-box h3 {{ font-family: 'Bebas Neue', sans-serif; font-size: 1.6em; color: #123E92; margin-bottom: 20px; }}
-        .modal-categorias {{ display: flex; flex-wrap: wrap; gap: 8px 16px; margin-bottom: 20px; }}
-        .modal-cat-item {{ display: flex; align-items: center; gap: 8px; cursor: pointer; }}
-        .modal-cat-item input {{ cursor: pointer; width: 18px; height: 18px; accent-color: #123E92; }}
-        .modal-actions {{ display: flex; gap: 12px; flex-wrap: wrap; }}
-        .modal-btn {{ padding: 10px 20px; border-radius: 8px; font-family: 'Roboto Condensed', sans-serif; font-weight: 700; cursor: pointer; border: none; font-size: 1em; transition: all 0.2s ease; }}
-        .modal-btn-primary {{ background: #123E92; color: white; }}
-        .modal-btn-primary:hover {{ background: #0f3377; }}
-        .modal-btn-secondary {{ background: #e5e7eb; color: #374151; }}
-        .modal-btn-secondary:hover {{ background: #d1d5db; }}
-        .modal-btn-link {{ background: transparent; color: #123E92; text-decoration: underline; }}
-        .modal-btn-link:hover {{ color: #0f3377; }}
-        .categoria-section.pdf-exclude {{ display: none !important; }}
-        footer {{ background: #f8f9fa; padding: 30px 40px; text-align: center; border-top: 1px solid #C0C0C0; color: #000; font-family: 'Inter', sans-serif; font-size: 0.9em; font-weight: 400; line-height: 1.8; }}
-        footer .developer {{ font-family: 'Roboto Condensed', sans-serif; font-weight: 700; color: #123E92; }}
-        @media print {{
-            @page {{ size: A4 landscape; margin: 15mm; }}
-            body {{ padding: 0 !important; padding-top: 0 !important; background: white !important; }}
-            #menu-container, .pdf-section, .toolbar, .index-cards, .btn-top, footer {{ display: none !important; }}
-            .container {{ box-shadow: none !important; max-width: 100% !important; }}
-            .categoria-section {{ break-before: page; page-break-before: always; }}
-            .categoria-section:first-child {{ break-before: auto; page-break-before: auto; }}
-            .modal-overlay {{ display: none !important; }}
-            .container > header, .categoria-header, th {{ -webkit-print-color-adjust: exact; print-color-adjust: exact; }}
-            table {{ font-size: 0.75em; }}
-        }}
-    </style>
-</head>
-<body>
-    <div id="menu-container"></div>
-    <div id="contenido-exportar" class="container">
-        <header>
-            <h1>III Válida Nacional de Velocidad</h1>
-            <p>Popayán, Cauca - Resultados por categoría</p>
-        </header>
-        <div class="toolbar">
-            <input type="text" id="buscador" class="search-box" placeholder="Buscar por nombre o N° del piloto..." />
-        </div>
-        <div class="index-cards">
-{index_cards_html()}
-        </div>
-        <div class="content-section">
-
-{sections_html}
-        </div>
-        <div class="pdf-section">
-            <button id="descargarPDF" class="btn-pdf">Exportar a PDF</button>
-            <p class="pdf-hint">En el diálogo de impresión, elige "Guardar como PDF" o "Microsoft Print to PDF" como destino.</p>
-        </div>
-        <footer>
-            <p><span class="developer">Developed by Mauricio Sánchez Aguilar - Fedemoto</span></p>
-            <p>Este proyecto es de uso interno de FEDEMOTO.</p>
-        </footer>
-    </div>
-    <div id="modalExportar" class="modal-overlay">
-        <div class="modal-box">
-            <h3>Exportar a PDF</h3>
-            <p style="margin-bottom: 16px; font-size: 0.95em; color: #374151;">Selecciona las categorías que deseas incluir:</p>
-            <div class="modal-categorias" id="modalCategorias">
-{modal_labels_html()}
-            </div>
-            <div class="modal-actions">
-                <button type="button" class="modal-btn modal-btn-link" id="modalSelectAll">Seleccionar todo</button>
-                <button type="button" class="modal-btn modal-btn-link" id="modalDeselectAll">Deseleccionar todo</button>
-            </div>
-            <div class="modal-actions" style="margin-top: 20px;">
-                <button type="button" class="modal-btn modal-btn-primary" id="modalExportarBtn">Exportar</button>
-                <button type="button" class="modal-btn modal-btn-secondary" id="modalCancelar">Cancelar</button>
-            </div>
-        </div>
-    </div>
-    <div id="modalComentario" class="modal-overlay">
-        <div class="modal-box">
-            <h3>Comentario</h3>
-            <p id="modalComentarioTexto" style="margin-bottom: 20px; font-size: 1em; color: #111827; white-space: pre-wrap;"></p>
-            <div class="modal-actions">
-                <button type="button" class="modal-btn modal-btn-primary" id="modalComentarioCerrar">Cerrar</button>
-            </div>
-        </div>
-    </div>
-    <script src="../../../load-menu.js"></script>
-    <script>
-        document.getElementById('descargarPDF').addEventListener('click', function() {{
-            document.querySelectorAll('.search-no-results').forEach(function(el){{ el.classList.remove('search-no-results'); }});
-            document.querySelectorAll('.search-hidden').forEach(function(el){{ el.classList.remove('search-hidden'); }});
-            document.getElementById('modalExportar').classList.add('open');
-        }});
-        document.getElementById('modalSelectAll').addEventListener('click', function() {{ document.querySelectorAll('#modalCategorias input').forEach(function(cb){{ cb.checked = true; }}); }});
-        document.getElementById('modalDeselectAll').addEventListener('click', function() {{ document.querySelectorAll('#modalCategorias input').forEach(function(cb){{ cb.checked = false; }}); }});
-        document.getElementById('modalCancelar').addEventListener('click', function() {{ document.getElementById('modalExportar').classList.remove('open'); }});
-        document.getElementById('modalExportar').addEventListener('click', function(e) {{ if (e.target === this) this.classList.remove('open'); }});
-        var modalComentario = document.getElementById('modalComentario');
-        var modalComentarioTexto = document.getElementById('modalComentarioTexto');
-        document.addEventListener('click', function(e) {{
-            var btn = e.target.closest('.comentario-btn');
-            if (!btn) return;
-            modalComentarioTexto.textContent = btn.getAttribute('data-comentario') || '';
-            modalComentario.classList.add('open');
-        }});
-        document.getElementById('modalComentarioCerrar').addEventListener('click', function() {{
-            modalComentario.classList.remove('open');
-        }});
-        modalComentario.addEventListener('click', function(e) {{
-            if (e.target === this) this.classList.remove('open');
-        }});
-        document.getElementById('modalExportarBtn').addEventListener('click', function() {{
-            var selected = [];
-            document.querySelectorAll('#modalCategorias input[type="checkbox"]').forEach(function(cb) {{ if (cb.checked) selected.push(cb.value); }});
-            if (selected.length === 0) {{ alert('Selecciona al menos una categoría.'); return; }}
-            document.querySelectorAll('.categoria-section').forEach(function(section) {{
-                section.classList.toggle('pdf-exclude', selected.indexOf(section.getAttribute('data-categoria-id')) === -1);
-            }});
-            document.getElementById('modalExportar').classList.remove('open');
-            void document.body.offsetHeight;
-            setTimeout(function() {{ window.print(); }}, 150);
-        }});
-        window.addEventListener('afterprint', function() {{
-            document.querySelectorAll('.categoria-section').forEach(function(section) {{ section.classList.remove('pdf-exclude'); }});
-        }});
-        document.querySelectorAll('.btn-top').forEach(function(btn) {{
-            btn.addEventListener('click', function() {{ window.scrollTo({{ top: 0, behavior: 'smooth' }}); }});
-        }});
-        var buscador = document.getElementById('buscador');
-        buscador.addEventListener('input', function() {{
-            var q = this.value.trim().toLowerCase();
-            var sections = document.querySelectorAll('.categoria-section');
-            var cards = document.querySelectorAll('.index-card');
-            cards.forEach(function(c){{ c.classList.remove('search-match', 'search-no-results'); }});
-            sections.forEach(function(s){{ s.classList.remove('search-match', 'search-no-results'); }});
-            if (!q) {{
-                document.querySelectorAll('.search-hidden').forEach(function(tr){{ tr.classList.remove('search-hidden'); }});
-                return;
-            }}
-            sections.forEach(function(section) {{
-                var rows = section.querySelectorAll('tbody tr[data-numero], tbody tr[data-nombre]');
-                var visible = 0;
-                rows.forEach(function(tr) {{
-                    var num = (tr.getAttribute('data-numero') || '').toLowerCase();
-                    var nom = (tr.getAttribute('data-nombre') || '').toLowerCase();
-                    var match = num.indexOf(q) >= 0 || nom.indexOf(q) >= 0;
-                    tr.classList.toggle('search-hidden', !match);
-                    if (match) visible++;
-                }});
-                var id = section.getAttribute('data-categoria-id');
-                var card = document.querySelector('.index-card[data-categoria-id="' + id + '"]');
-                if (visible > 0) {{ section.classList.add('search-match'); if (card) card.classList.add('search-match'); }}
-                else {{ section.classList.add('search-no-results'); if (card) card.classList.add('search-no-results'); }}
-            }});
-        }});
-    </script>
-</body>
-</html>"""
+    root = paginas_html.site_prefix(OUT)
+    page = plantillas.render(
+        "valida.html",
+        title="III Válida Nacional de Velocidad - Popayán, Cauca | FEDEMOTO",
+        root=root,
+        estilos=recursos_estaticos.estilos_head(("fuentes_sitio.html", "valida_velocidad.css"), root),
+        heading="III Válida Nacional de Velocidad",
+        subtitle="Popayán, Cauca - Resultados por categoría",
+        index_cards=index_cards_html() + "\n",
+        sections=sections_html,
+        modal_categorias=modal_labels_html() + "\n",
+        modal_comentario=plantillas.bloque("valida_modal_comentario.html"),
+        script=recursos_estaticos.url("valida.js", root),
+    )
     OUT.write_text(page, encoding="utf-8")
     print("Wrote", OUT)
 
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Recorrido compartido de las carpetas FILES EXPORTED.
+
+Cada carpeta se lista una sola vez por proceso (`os.scandir`) y queda con sus CSV (nombre,
+ruta, tamaño y mtime) en el orden del directorio. De ese único recorrido salen la firma de la
+carpeta del almacén de resultados generales, los archivos por categoría de las tablas
+generales, los del informe estadístico de la válida y los del exporte de GP Colombia. Las
+tablas se leen con tablas_csv, que también las memoriza por proceso: en generar_sitio.py el
+informe de una válida y las tablas generales que la incluyen leen cada CSV una vez.
+`firma_archivos` firma el código con que las cachés de generales e informes arman sus filas.
+
+Si los CSV cambian mientras el proceso sigue vivo, `olvidar()` descarta los recorridos.
+"""
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+
+_ESCANEOS = {}
+
+
+def escanear(files_dir):
+    """
+    CSV de la carpeta como tuplas (nombre, ruta, tamaño, mtime_ns), en el orden del directorio
+    (el mismo de os.listdir); None si la carpeta no existe.
+    """
+    files_dir = os.path.abspath(files_dir)
+    if files_dir in _ESCANEOS:
+        return _ESCANEOS[files_dir]
+    try:
+        entradas = list(os.scandir(files_dir))
+    except OSError:
+        return None
+    csvs = []
+    for e in entradas:
+        if not e.name.lower().endswith(".csv"):
+            continue
+        try:
+            if not e.is_file():
+                continue
+            st = e.stat()
+        except OSError:
+            continue
+        csvs.append((e.name, e.path, st.st_size, st.st_mtime_ns))
+    escaneo = tuple(csvs)
+    _ESCANEOS[files_dir] = escaneo
+    return escaneo
+
+
+def archivos(files_dir):
+    """(nombre, ruta) de cada CSV de la carpeta; lista vacía si no existe."""
+    return [(nombre, ruta) for nombre, ruta, _tam, _mtime in escanear(files_dir) or ()]
+
+
+def firma(files_dir):
+    """(nombre, tamaño, mtime) de cada CSV de la carpeta, ordenados; None si no existe."""
+    escaneo = escanear(files_dir)
+    if escaneo is None:
+        return None
+    return tuple(sorted((nombre, tam, mtime) for nombre, _ruta, tam, mtime in escaneo))
+
+
+def firma_archivos(paths):
+    """
+    (nombre, tamaño, mtime) de cada archivo, en el orden dado: firma del código que arma las
+    filas de una caché (almacén de resultados generales, bocetos de informes).
+    """
+    firma = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            firma.append((os.path.basename(path), None, None))
+            continue
+        firma.append((os.path.basename(path), st.st_size, st.st_mtime_ns))
+    return tuple(firma)
+
+
+def por_categoria(files_dir, parse_filename, canonical=None):
+    """
+    CSV agrupados por categoría: categoría → [(tipo de sesión, ruta)]. `parse_filename` es el
+    del consumidor (nombre → (categoría, tipo)); `canonical`, si se pasa, unifica la categoría.
+    """
+    by_cat_files = defaultdict(list)
+    for nombre, ruta in archivos(files_dir):
+        categoria, tipo = parse_filename(nombre)
+        if canonical is not None:
+            categoria = canonical(categoria)
+        by_cat_files[categoria].append((tipo, ruta))
+    return by_cat_files
+
+
+def olvidar():
+    """Descarta los recorridos memorizados (p. ej. si los CSV cambian durante el proceso)."""
+    _ESCANEOS.clear()
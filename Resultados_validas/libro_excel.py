@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Lectura compartida de los libros Excel (.xlsx) de inscripciones: el Excel anual
+(analizar_excel_completo.py, importar-excel del archivo histórico) y los de cada válida
+(Informes/analizar_valida.py y los scripts de inspección y verificación).
+
+Abrir un .xlsx con pandas recorre el XML de cada hoja con openpyxl, que es lo más lento del
+análisis. La primera vez que se lee un libro se guardan todas sus hojas ya convertidas a
+DataFrame (pickle, pandas las guarda por columnas) en `.cache/libros_excel/`, con ruta,
+tamaño, mtime y hash SHA-1 del libro. Si tamaño y mtime coinciden no se abre el .xlsx; si
+cambió el mtime pero no el contenido se reutiliza igual. La instantánea se descarta si cambia
+la versión de pandas. Dentro del proceso cada libro se lee una sola vez.
+`FEDEMOTO_EXCEL_CACHE=0` desactiva la caché en disco.
+
+Las hojas son las mismas de `pd.read_excel(path, sheet_name=hoja)` (encabezados en la primera
+fila); cada lectura entrega una copia que el consumidor puede modificar.
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import pickle
+import threading
+
+import pandas as pd
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+CACHE_DIR = os.path.join(ROOT_DIR, ".cache", "libros_excel")
+CACHE_VERSION = 1
+
+_LIBROS = {}
+
+
+def _disk_cache_enabled():
+    return os.environ.get("FEDEMOTO_EXCEL_CACHE", "1") != "0"
+
+
+def _cache_file(path):
+    name = hashlib.sha1(path.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, name + ".pickle")
+
+
+def _load_entry(cache_file):
+    try:
+        with open(cache_file, "rb") as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError):
+        return None
+    if (
+        not isinstance(entry, dict)
+        or entry.get("version") != CACHE_VERSION
+        or entry.get("pandas") != pd.__version__
+    ):
+        return None
+    return entry
+
+
+def _store_entry(cache_file, entry):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+def _parse(data):
+    """Todas las hojas del libro (en su orden) leídas una vez con pandas/openpyxl."""
+    return pd.read_excel(io.BytesIO(data), sheet_name=None)
+
+
+def _leer(path):
+    """Entrada del libro: sha1 del contenido y hojas {nombre: DataFrame}. Consulta la caché en disco."""
+    if not _disk_cache_enabled():
+        with open(path, "rb") as f:
+            data = f.read()
+        return {"sha1": hashlib.sha1(data).hexdigest(), "hojas": _parse(data)}
+
+    st = os.stat(path)
+    cache_file = _cache_file(path)
+    entry = _load_entry(cache_file)
+    if entry is not None and entry["path"] != path:
+        entry = None
+    if entry is not None and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+        return entry
+
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha1(data).hexdigest()
+    if entry is None or entry["sha1"] != digest:
+        entry = {
+            "version": CACHE_VERSION,
+            "pandas": pd.__version__,
+            "path": path,
+            "sha1": digest,
+            "hojas": _parse(data),
+        }
+    entry["size"] = st.st_size
+    entry["mtime_ns"] = st.st_mtime_ns
+    _store_entry(cache_file, entry)
+    return entry
+
+
+def _libro(path):
+    path = os.path.abspath(path)
+    entry = _LIBROS.get(path)
+    if entry is None:
+        entry = _leer(path)
+        _LIBROS[path] = entry
+    return entry
+
+
+def hojas(path):
+    """Nombres de las hojas del libro, en su orden (como `pd.ExcelFile(path).sheet_names`)."""
+    return list(_libro(path)["hojas"])
+
+
+def leer_hoja(path, hoja):
+    """DataFrame de la hoja (copia), como `pd.read_excel(path, sheet_name=hoja)`."""
+    try:
+        return _libro(path)["hojas"][hoja].copy()
+    except KeyError:
+        raise ValueError(f"Worksheet named '{hoja}' not found") from None
+
+
+def leer_libro(path):
+    """Todas las hojas: {nombre: DataFrame (copia)}, en el orden del libro."""
+    return {nombre: df.copy() for nombre, df in _libro(path)["hojas"].items()}
+
+
+def firma(path):
+    """Hash SHA-1 del contenido del libro (el mismo que valida la instantánea)."""
+    return _libro(path)["sha1"]
+
+
+def clear_cache(disk=False):
+    """Olvida los libros leídos (p. ej. si el .xlsx cambia durante el proceso); con `disk` borra también la caché en disco."""
+    _LIBROS.clear()
+    if disk and os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            if name.endswith(".pickle") or name.endswith(".tmp"):
+                try:
+                    os.remove(os.path.join(CACHE_DIR, name))
+                except OSError:
+                    pass
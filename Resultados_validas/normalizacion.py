@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Normalización compartida de textos de los exportes: nombres, ligas, clubes, marcas y
+categorías.
+
+El vocabulario es pequeño (unas 30 ligas, algunos cientos de clubes, una docena de marcas y
+de categorías) y se repite en cada fila de cada CSV, así que cada función se memoriza por
+valor distinto (LRU acotada): después de la primera vez, normalizar es una consulta en un
+diccionario. Las variantes conocidas de una liga o de un club se unifican con mapas
+canónicos (LIGA_CANONICAL, CLUB_CANONICAL) ya indexados por la forma normalizada.
+
+Las cachés distinguen el tipo del valor (`typed=True`): 1 y 1.0 no son la misma celda.
+"""
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# Liga (en mayúsculas) → nombre para mostrar en informes.
+LIGA_CANONICAL = {
+    "VALLE": "Valle del Cauca",
+    "ANTIOQUIA": "Antioquia",
+}
+
+# Variantes de nombre de club (minúsculas, espacios simples) → nombre canónico.
+CLUB_CANONICAL = {
+    "carasucias": "Carasucias",
+    "club motocross de yarumal": "Club Motocross Yarumal",
+    "club motocross yarumal": "Club Motocross Yarumal",
+    "club valle": "Club Valle",
+    "villavicencio racing club": "Villavicencio Racing Club",
+}
+
+_RE_NO_ALFANUM = re.compile(r"[^a-z0-9]+")
+_RE_ESPACIOS = re.compile(r"\s+")
+_RE_GSX = (
+    re.compile(r"(?i)\bGsc\s+R\s+S\b"),
+    re.compile(r"(?i)\bGsx\s+R/s\b"),
+)
+
+
+@lru_cache(maxsize=8192, typed=True)
+def sin_tildes(texto):
+    """Texto sin marcas diacríticas (á → a, ñ → n)."""
+    return "".join(c for c in unicodedata.normalize("NFD", str(texto)) if unicodedata.category(c) != "Mn")
+
+
+@lru_cache(maxsize=8192, typed=True)
+def clave(texto):
+    """Clave de comparación: minúsculas, sin tildes, solo letras y números ('Enduro 1' → 'enduro1')."""
+    return _RE_NO_ALFANUM.sub("", sin_tildes(str(texto or "").strip().lower()))
+
+
+@lru_cache(maxsize=8192, typed=True)
+def espacios(texto):
+    """Texto sin espacios al inicio ni al final y con espacios internos simples ('' si es None)."""
+    return " ".join(str(texto).strip().split()) if texto is not None else ""
+
+
+@lru_cache(maxsize=4096, typed=True)
+def mayusculas(texto):
+    """Mayúsculas sin tildes y con espacios simples (encabezados y ligas entre temporadas)."""
+    return _RE_ESPACIOS.sub(" ", sin_tildes(str(texto or "").strip())).strip().upper()
+
+
+@lru_cache(maxsize=4096, typed=True)
+def etiqueta_grafico(texto):
+    """Etiqueta de gráfico: primera letra de cada palabra (y de cada tramo entre puntos) en mayúscula."""
+    s = espacios(texto)
+    if not s:
+        return ""
+    words = []
+    for word in s.split():
+        if "." in word:
+            word = ".".join((seg[0].upper() + seg[1:].lower()) if seg else "" for seg in word.split("."))
+        else:
+            word = word[0].upper() + word[1:].lower()
+        words.append(word)
+    out = " ".join(words)
+    for patron in _RE_GSX:
+        out = patron.sub("GSX R/S", out)
+    return out
+
+
+@lru_cache(maxsize=1024, typed=True)
+def liga(texto):
+    """Liga tal como viene (espacios simples), salvo las variantes de LIGA_CANONICAL."""
+    s = espacios(texto)
+    if not s:
+        return ""
+    return LIGA_CANONICAL.get(s.upper(), s)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def club(texto):
+    """Club en formato título."""
+    s = espacios(texto)
+    return s.title() if s else ""
+
+
+@lru_cache(maxsize=4096, typed=True)
+def club_canonico(texto):
+    """Club con las variantes conocidas (CLUB_CANONICAL) unificadas; el resto en formato título."""
+    if not texto:
+        return ""
+    s = espacios(texto)
+    return CLUB_CANONICAL.get(s.lower(), s.title())
+
+
+@lru_cache(maxsize=1024, typed=True)
+def marca(texto):
+    """Marca de la moto en formato título."""
+    s = espacios(texto)
+    return s.title() if s else ""
+
+
+def limpiar_caches():
+    """Vacía las cachés (solo para medir o si cambian los mapas canónicos en caliente)."""
+    for f in (sin_tildes, clave, espacios, mayusculas, etiqueta_grafico, liga, club, club_canonico, marca):
+        f.cache_clear()
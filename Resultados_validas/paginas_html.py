@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Escritura de las páginas HTML de válidas por fragmentos.
+
+Los generadores arman la página como una secuencia de cadenas (cabecera, una sección por
+categoría, pie y scripts) en lugar de concatenar todo en un solo `str`: `write_page` las
+vuelca a un archivo con buffer a medida que se producen, así el tiempo y la memoria crecen
+de forma lineal con la cantidad de pilotos y sesiones.
+
+Se escribe primero a un temporal junto al destino y luego se reemplaza, de modo que un
+error a mitad de la generación no deja la página publicada truncada.
+"""
+from __future__ import annotations
+
+import os
+import threading
+
+SITE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def site_prefix(output_file):
+    """Prefijo relativo desde la carpeta de la página hasta la raíz del sitio (logo, menú, tema)."""
+    rel = os.path.relpath(SITE_ROOT, os.path.dirname(os.path.abspath(output_file)))
+    return rel.replace(os.sep, "/") + "/"
+
+
+def write_page(path, chunks):
+    """Escribe en `path` (UTF-8) los fragmentos del iterable `chunks`, en orden."""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(chunks)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
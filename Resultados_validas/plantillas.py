@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Plantillas precompiladas de las páginas del sitio (válidas, informes y resultados generales).
+
+Las plantillas viven en `Resultados_validas/plantillas_html/` y usan dos marcas:
+
+  {{ campo }}            hueco que se llena al renderizar (cadena o iterable de cadenas)
+  {% incluir bloque %}   otro archivo de la carpeta, insertado al compilar
+
+Un layout base (p. ej. `valida.html`) trae cabecera, modales y scripts comunes. Los estilos y
+scripts de cada modalidad no van en la plantilla: son hojas `.css`/`.js` de la misma carpeta
+que `recursos_estaticos` publica en `estaticos/` con hash y el generador enlaza en el campo
+`{{ estilos }}` (`valida_motocross.css`, ...); `bloque()` entrega fragmentos HTML fijos
+(`valida_modal_comentario.html`, `fuentes_sitio.html`). Cada plantilla se lee y se compila una
+sola vez por proceso en una tupla (texto fijo, campo, texto fijo, ...): renderizar una página
+es solo intercalar los datos entre fragmentos ya armados.
+
+Los valores no se escapan: el generador pasa el HTML ya escapado, como antes con los f-strings.
+"""
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plantillas_html")
+
+_INCLUDE = re.compile(r"\{%\s*incluir\s+([\w.\-]+)\s*%\}")
+_FIELD = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+class Plantilla:
+    """Plantilla compilada: `partes` alterna texto fijo y nombres de campo (None al final)."""
+
+    __slots__ = ("nombre", "partes", "campos")
+
+    def __init__(self, nombre, texto):
+        self.nombre = nombre
+        partes = []
+        pos = 0
+        for m in _FIELD.finditer(texto):
+            partes.append((texto[pos:m.start()], m.group(1)))
+            pos = m.end()
+        partes.append((texto[pos:], None))
+        self.partes = tuple(partes)
+        self.campos = frozenset(c for _t, c in partes if c)
+
+    def iter_render(self, valores):
+        """Fragmentos de la página en orden (para `paginas_html.write_page`)."""
+        faltan = self.campos.difference(valores)
+        if faltan:
+            raise KeyError(f"La plantilla {self.nombre} necesita: {', '.join(sorted(faltan))}")
+        for texto, campo in self.partes:
+            if texto:
+                yield texto
+            if campo is None:
+                continue
+            valor = valores[campo]
+            if isinstance(valor, str):
+                yield valor
+            else:
+                yield from valor
+
+    def render(self, valores):
+        return "".join(self.iter_render(valores))
+
+
+def _read(nombre, pila=()):
+    """Texto de la plantilla con los `{% incluir %}` ya resueltos."""
+    if nombre in pila:
+        raise ValueError(f"Inclusión circular de plantillas: {' -> '.join(pila + (nombre,))}")
+    with open(os.path.join(TEMPLATE_DIR, nombre), "r", encoding="utf-8") as f:
+        texto = f.read()
+    return _INCLUDE.sub(lambda m: _read(m.group(1), pila + (nombre,)), texto)
+
+
+@lru_cache(maxsize=None)
+def get(nombre):
+    """Plantilla compilada (se lee y compila una vez por proceso)."""
+    return Plantilla(nombre, _read(nombre))
+
+
+def iter_render(nombre, **valores):
+    return get(nombre).iter_render(valores)
+
+
+def render(nombre, **valores):
+    return get(nombre).render(valores)
+
+
+def bloque(nombre, **valores):
+    """Bloque renderizado como cadena; sin campos, el resultado también queda en caché."""
+    if valores:
+        return render(nombre, **valores)
+    return _bloque_fijo(nombre)
+
+
+@lru_cache(maxsize=None)
+def _bloque_fijo(nombre):
+    return render(nombre)
@@ -0,0 +1,64 @@
+(function() {
+    var datos = window.datosInforme;
+    var stats = [
+        { num: datos.participaciones_totales, label: 'Participaciones totales' },
+        { num: datos.pilotos_unicos, label: 'Pilotos participantes' },
+        { num: Object.keys(datos.pilotos_por_liga).length, label: 'Ligas' },
+        { num: Object.keys(datos.pilotos_por_club).length, label: 'Clubes' },
+        { num: Object.keys(datos.inscripciones_por_marca).length, label: 'Marcas' }
+    ];
+    var grid = document.getElementById('statsGrid');
+    stats.forEach(function(s) {
+        var card = document.createElement('div');
+        card.className = 'stat-card';
+        card.innerHTML = '<div class="number">' + s.num + '</div><div class="label">' + s.label + '</div>';
+        grid.appendChild(card);
+    });
+    function escapeHtml(t) { return (t+'').replace(/&/g,'&amp;').replace(/</g,'&lt;').replace(/>/g,'&gt;').replace(/"/g,'&quot;'); }
+    function fillChart(id, obj) {
+        var el = document.getElementById(id);
+        var entries = Object.keys(obj).map(function(k) { return [k, obj[k]]; }).sort(function(a, b) { return b[1] - a[1]; });
+        var maxVal = entries.length ? Math.max.apply(null, entries.map(function(e) { return e[1]; })) : 1;
+        entries.forEach(function(e) {
+            var row = document.createElement('div');
+            row.className = 'chart-row';
+            var pct = maxVal > 0 ? (e[1] / maxVal * 100) : 0;
+            row.innerHTML = '<span class="label" title="' + escapeHtml(e[0]) + '">' + escapeHtml(e[0]) + '</span><div class="bar-wrap"><div class="bar" style="width:' + pct + '%"></div></div><span class="value">' + e[1] + '</span>';
+            el.appendChild(row);
+        });
+    }
+    if (document.getElementById('destacados')) {
+        var cat = datos.participaciones_por_categoria;
+        function keysWithMax(obj) {
+            var keys = Object.keys(obj);
+            if (!keys.length) return [];
+            var maxVal = Math.max.apply(null, keys.map(function(k) { return obj[k]; }));
+            return keys.filter(function(k) { return obj[k] === maxVal; });
+        }
+        var catMaxList = keysWithMax(cat);
+        var liga = datos.pilotos_por_liga;
+        var ligaMaxList = keysWithMax(liga);
+        var marca = datos.inscripciones_por_marca;
+        var marcaMaxList = keysWithMax(marca);
+        var club = datos.pilotos_por_club;
+        var clubMaxList = keysWithMax(club);
+        var destacados = [
+            'Categoría más concurrida: ' + catMaxList.join(', ') + ' (' + (cat[catMaxList[0]] || 0) + ' participantes)',
+            'Liga con más pilotos: ' + ligaMaxList.join(', ') + ' (' + (liga[ligaMaxList[0]] || 0) + ' pilotos únicos)',
+            'Marca líder: ' + marcaMaxList.join(', ') + ' (' + (marca[marcaMaxList[0]] || 0) + ' inscripciones)',
+            'Club con más pilotos: ' + clubMaxList.join(', ') + ' (' + (club[clubMaxList[0]] || 0) + ' pilotos)',
+            'Promedio participantes por categoría: ' + (datos.participaciones_totales / Object.keys(cat).length).toFixed(1)
+        ];
+        var destEl = document.getElementById('destacados');
+        destacados.forEach(function(t) {
+            var item = document.createElement('div');
+            item.className = 'data-item';
+            item.innerHTML = '<span class="name">' + escapeHtml(t) + '</span>';
+            destEl.appendChild(item);
+        });
+    }
+    fillChart('porLiga', datos.pilotos_por_liga);
+    fillChart('porCategoria', datos.participaciones_por_categoria);
+    fillChart('porMarca', datos.inscripciones_por_marca);
+    fillChart('porClub', datos.pilotos_por_club);
+})();
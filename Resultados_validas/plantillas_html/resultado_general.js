@@ -0,0 +1,150 @@
+(function() {
+    function escapeHtml(t) {
+        return (t + '').replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+    }
+    function renderLigaDetails(list) {
+        if (!Array.isArray(list) || list.length === 0) return '<p>Sin detalles disponibles.</p>';
+        var html = '<ul>';
+        list.forEach(function(item) {
+            var cat = (item[0] || '');
+            var pil = (item[1] || '');
+            var pts = (item[2] || 0);
+            html += '<li><strong>' + escapeHtml(cat) + '</strong> — ' + escapeHtml(pil) + ' (' + pts + ' pts)</li>';
+        });
+        html += '</ul>';
+        return html;
+    }
+    var modal = document.getElementById('modalLigaDetalle');
+    var modalTitle = document.getElementById('modalLigaDetalleTitle');
+    var modalBody = document.getElementById('modalLigaDetalleBody');
+    var resumen = document.querySelector('.liga-summary');
+    var medallero = null;
+    function cargarMedallero() {
+        if (!medallero) {
+            medallero = fetch(resumen.getAttribute('data-medallero')).then(function(r) {
+                if (!r.ok) throw new Error(r.status);
+                return r.json();
+            });
+            medallero.catch(function() { medallero = null; });
+        }
+        return medallero;
+    }
+    document.querySelectorAll('.info-btn').forEach(function(btn) {
+        btn.addEventListener('click', function() {
+            var liga = this.getAttribute('data-liga');
+            var puesto = this.getAttribute('data-puesto');
+            modalTitle.textContent = this.getAttribute('data-title') || 'Detalle';
+            modalBody.innerHTML = '<p>Cargando...</p>';
+            modal.classList.add('open');
+            cargarMedallero().then(function(detalles) {
+                modalBody.innerHTML = renderLigaDetails((detalles[liga] || {})[puesto]);
+            }, function() {
+                modalBody.innerHTML = '<p>No se pudo cargar el detalle.</p>';
+            });
+        });
+    });
+    document.getElementById('modalLigaDetalleClose').addEventListener('click', function() {
+        modal.classList.remove('open');
+    });
+    modal.addEventListener('click', function(e) {
+        if (e.target === this) this.classList.remove('open');
+    });
+    document.querySelectorAll('.btn-top').forEach(function(btn) {
+        btn.addEventListener('click', function() { window.scrollTo({ top: 0, behavior: 'smooth' }); });
+    });
+    function renderFilas(tbody, filas) {
+        var html = '';
+        filas.forEach(function(fila, i) {
+            var pos = i + 1;
+            html += '<tr class="' + (pos <= 3 ? 'pos-' + pos : '') + '" data-numero="' + escapeHtml(fila[0]) + '" data-nombre="' + escapeHtml(fila[1]) + '">';
+            html += '<td>' + pos + '</td>';
+            fila.forEach(function(v, j) {
+                html += (j === fila.length - 1 ? '<td class="col-total">' : '<td>') + escapeHtml(v) + '</td>';
+            });
+            html += '</tr>';
+        });
+        tbody.innerHTML = html;
+    }
+    var categorias = {};
+    function cargarCategoria(section) {
+        var id = section.getAttribute('data-categoria-id');
+        if (!categorias[id]) {
+            var tbody = section.querySelector('tbody[data-src]');
+            categorias[id] = fetch(tbody.getAttribute('data-src')).then(function(r) {
+                if (!r.ok) throw new Error(r.status);
+                return r.json();
+            }).then(function(filas) {
+                renderFilas(tbody, filas);
+            }, function() {
+                delete categorias[id];
+                tbody.querySelector('td').textContent = 'No se pudo cargar la categoría.';
+            });
+        }
+        return categorias[id];
+    }
+    function cargarTodas() {
+        return Promise.all(Array.prototype.map.call(document.querySelectorAll('.categoria-section'), cargarCategoria));
+    }
+    if ('IntersectionObserver' in window) {
+        var observer = new IntersectionObserver(function(entries) {
+            entries.forEach(function(entry) {
+                if (entry.isIntersecting) {
+                    observer.unobserve(entry.target);
+                    cargarCategoria(entry.target);
+                }
+            });
+        }, { rootMargin: '300px 0px' });
+        document.querySelectorAll('.categoria-section').forEach(function(s) { observer.observe(s); });
+    } else {
+        cargarTodas();
+    }
+    document.querySelectorAll('.index-card').forEach(function(card) {
+        card.addEventListener('click', function() {
+            var section = document.getElementById(this.getAttribute('href').slice(1));
+            if (section) cargarCategoria(section);
+        });
+    });
+    if (location.hash) {
+        var inicial = document.getElementById(location.hash.slice(1));
+        if (inicial && inicial.classList.contains('categoria-section')) cargarCategoria(inicial);
+    }
+    var buscador = document.getElementById('buscador');
+    buscador.addEventListener('input', function() {
+        var q = this.value.trim().toLowerCase();
+        if (q) {
+            cargarTodas().then(function() { filtrar(buscador.value.trim().toLowerCase()); });
+            return;
+        }
+        filtrar(q);
+    });
+    function filtrar(q) {
+        var sections = document.querySelectorAll('.categoria-section');
+        var cards = document.querySelectorAll('.index-card');
+        cards.forEach(function(c){ c.classList.remove('search-match', 'search-no-results'); });
+        sections.forEach(function(s){ s.classList.remove('search-match', 'search-no-results'); });
+        if (!q) {
+            document.querySelectorAll('.search-hidden').forEach(function(tr){ tr.classList.remove('search-hidden'); });
+            return;
+        }
+        sections.forEach(function(section) {
+            var rows = section.querySelectorAll('tbody tr[data-numero], tbody tr[data-nombre]');
+            var visible = 0;
+            rows.forEach(function(tr) {
+                var num = (tr.getAttribute('data-numero') || '').toLowerCase();
+                var nom = (tr.getAttribute('data-nombre') || '').toLowerCase();
+                var match = num.indexOf(q) >= 0 || nom.indexOf(q) >= 0;
+                tr.classList.toggle('search-hidden', !match);
+                if (match) visible++;
+            });
+            var id = section.getAttribute('data-categoria-id');
+            var card = document.querySelector('.index-card[href="#' + id + '"]');
+            if (visible > 0) {
+                section.classList.add('search-match');
+                if (card) card.classList.add('search-match');
+            } else {
+                section.classList.add('search-no-results');
+                if (card) card.classList.add('search-no-results');
+            }
+        });
+    }
+})();
@@ -0,0 +1,92 @@
+(function() {
+    document.getElementById('descargarPDF').addEventListener('click', function() {
+        document.querySelectorAll('.search-no-results').forEach(function(el){ el.classList.remove('search-no-results'); });
+        document.querySelectorAll('.search-hidden').forEach(function(el){ el.classList.remove('search-hidden'); });
+        document.getElementById('modalExportar').classList.add('open');
+    });
+    document.getElementById('modalSelectAll').addEventListener('click', function() {
+        document.querySelectorAll('#modalCategorias input').forEach(function(cb){ cb.checked = true; });
+    });
+    document.getElementById('modalDeselectAll').addEventListener('click', function() {
+        document.querySelectorAll('#modalCategorias input').forEach(function(cb){ cb.checked = false; });
+    });
+    document.getElementById('modalCancelar').addEventListener('click', function() {
+        document.getElementById('modalExportar').classList.remove('open');
+    });
+    document.getElementById('modalExportar').addEventListener('click', function(e) {
+        if (e.target === this) this.classList.remove('open');
+    });
+    var modalComentario = document.getElementById('modalComentario');
+    var modalComentarioTexto = document.getElementById('modalComentarioTexto');
+    if (modalComentario) {
+        document.addEventListener('click', function(e) {
+            var btn = e.target.closest('.comentario-btn');
+            if (!btn) return;
+            modalComentarioTexto.textContent = btn.getAttribute('data-comentario') || '';
+            modalComentario.classList.add('open');
+        });
+        document.getElementById('modalComentarioCerrar').addEventListener('click', function() {
+            modalComentario.classList.remove('open');
+        });
+        modalComentario.addEventListener('click', function(e) {
+            if (e.target === this) this.classList.remove('open');
+        });
+    }
+    document.getElementById('modalExportarBtn').addEventListener('click', function() {
+        var selected = [];
+        document.querySelectorAll('#modalCategorias input[type="checkbox"]').forEach(function(cb) {
+            if (cb.checked) selected.push(cb.value);
+        });
+        if (selected.length === 0) {
+            alert('Selecciona al menos una categoría.');
+            return;
+        }
+        document.querySelectorAll('.categoria-section').forEach(function(section) {
+            var id = section.getAttribute('data-categoria-id');
+            section.classList.toggle('pdf-exclude', selected.indexOf(id) === -1);
+        });
+        document.getElementById('modalExportar').classList.remove('open');
+        void document.body.offsetHeight;
+        setTimeout(function() { window.print(); }, 150);
+    });
+    window.addEventListener('afterprint', function() {
+        document.querySelectorAll('.categoria-section').forEach(function(section) {
+            section.classList.remove('pdf-exclude');
+        });
+    });
+    document.querySelectorAll('.btn-top').forEach(function(btn) {
+        btn.addEventListener('click', function() { window.scrollTo({ top: 0, behavior: 'smooth' }); });
+    });
+    var buscador = document.getElementById('buscador');
+    buscador.addEventListener('input', function() {
+        var q = this.value.trim().toLowerCase();
+        var sections = document.querySelectorAll('.categoria-section');
+        var cards = document.querySelectorAll('.index-card');
+        cards.forEach(function(c){ c.classList.remove('search-match', 'search-no-results'); });
+        sections.forEach(function(s){ s.classList.remove('search-match', 'search-no-results'); });
+        if (!q) {
+            document.querySelectorAll('.search-hidden').forEach(function(tr){ tr.classList.remove('search-hidden'); });
+            return;
+        }
+        sections.forEach(function(section) {
+            var rows = section.querySelectorAll('tbody tr[data-numero], tbody tr[data-nombre]');
+            var visible = 0;
+            rows.forEach(function(tr) {
+                var num = (tr.getAttribute('data-numero') || '').toLowerCase();
+                var nom = (tr.getAttribute('data-nombre') || '').toLowerCase();
+                var match = num.indexOf(q) >= 0 || nom.indexOf(q) >= 0;
+                tr.classList.toggle('search-hidden', !match);
+                if (match) visible++;
+            });
+            var id = section.getAttribute('data-categoria-id');
+            var card = document.querySelector('.index-card[data-categoria-id="' + id + '"]');
+            if (visible > 0) {
+                section.classList.add('search-match');
+                if (card) card.classList.add('search-match');
+            } else {
+                section.classList.add('search-no-results');
+                if (card) card.classList.add('search-no-results');
+            }
+        });
+    });
+})();
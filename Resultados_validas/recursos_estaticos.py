@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Hojas de estilo y scripts compartidos de las páginas generadas (válidas, informes y
+resultados generales).
+
+Las fuentes viven en `plantillas_html/` (`valida_motocross.css`, `valida.js`, ...). Al
+renderizar una página, `url()` publica una copia en `estaticos/` (raíz del sitio) con el hash
+del contenido en el nombre (`estaticos/valida_motocross.1a2b3c4d5e.css`) y devuelve la ruta
+relativa para el `<link>`/`<script>`. El nombre solo cambia cuando cambia el contenido: el
+navegador puede guardar estos archivos sin volver a pedirlos, y quien recorre varias
+categorías o válidas descarga el CSS y el JS una sola vez en lugar de con cada página.
+
+Las hojas son plantillas como las demás: el campo `{{ vuelta_css }}` recibe siempre las reglas
+de vuelta_a_vuelta (solo aplican a `.session-title-row`, que aparece cuando hay PDF).
+
+FEDEMOTO_ESTATICOS=<carpeta> publica en otra carpeta (benchmark_generadores.py la usa para no
+tocar el sitio); las rutas de las páginas siguen siendo `estaticos/...`.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import textwrap
+import threading
+from functools import lru_cache
+
+import paginas_html
+import plantillas
+import vuelta_a_vuelta as vv
+
+STATIC_DIR = os.environ.get("FEDEMOTO_ESTATICOS") or os.path.join(paginas_html.SITE_ROOT, "estaticos")
+
+# Campos comunes de las hojas .css de plantillas_html/.
+CAMPOS = {"vuelta_css": textwrap.dedent(vv.VUELTA_CSS).strip("\n")}
+
+
+@lru_cache(maxsize=None)
+def publicar(nombre):
+    """
+    Publica `nombre` (de plantillas_html/) en estaticos/ con el hash del contenido y devuelve
+    la ruta desde la raíz del sitio. Se calcula una vez por proceso; si el archivo ya existe no
+    se reescribe.
+    """
+    data = plantillas.render(nombre, **CAMPOS).encode("utf-8")
+    base, ext = os.path.splitext(nombre)
+    archivo = f"{base}.{hashlib.sha1(data).hexdigest()[:10]}{ext}"
+    path = os.path.join(STATIC_DIR, archivo)
+    if not os.path.exists(path):
+        os.makedirs(STATIC_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+    return f"estaticos/{archivo}"
+
+
+def url(nombre, root):
+    """Ruta relativa a la página (`root` = prefijo hasta la raíz del sitio) del recurso publicado."""
+    return root + publicar(nombre)
+
+
+def estilos_head(estilos, root):
+    """
+    Líneas del <head> para `estilos`, en orden: bloques `.html` de plantillas_html/ (fuentes,
+    tema) y hojas `.css` publicadas como <link>.
+    """
+    partes = []
+    for nombre in estilos:
+        if nombre.endswith(".css"):
+            partes.append(f'    <link rel="stylesheet" href="{url(nombre, root)}">\n')
+        else:
+            partes.append(plantillas.bloque(nombre, root=root))
+    return "".join(partes)
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Registro de la temporada: válidas y campeonatos declarados una sola vez en
+`temporada_2026.json` (raíz del repositorio).
+
+Cada válida declara su modalidad, su carpeta, la carpeta FILES EXPORTED, la de vuelta a
+vuelta (si hay), el script y la salida de su página y, si tiene, los textos y la salida de su
+informe. Cada campeonato declara sus válidas (por id, con la etiqueta de la columna), el bono
+de la última válida, su salida y, si faltan fechas, `pendientes` (etiquetas de las válidas que
+quedan por correr, en orden; las usa el simulador de la final); `informe_temporada` (opcional), los textos y la salida del
+informe de toda la temporada. De aquí salen las rutas de los scripts de válidas, los informes
+(REPORT_CONFIGS y el de temporada), los resultados generales (CHAMPIONSHIPS) y los destinos de
+generar_sitio.py.
+
+El archivo se lee y se valida una vez por proceso; un registro con errores detiene todo con
+la lista completa de problemas. Las rutas del JSON son relativas a la raíz del repositorio
+(la página y la carpeta de datos, relativas a la carpeta de la válida).
+"""
+from __future__ import annotations
+
+import json
+import os
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+REGISTRO = os.path.join(ROOT_DIR, "temporada_2026.json")
+
+CAMPOS_INFORME = ("salida", "title", "heading", "subtitle", "intro")
+
+_REGISTROS = {}
+
+
+class RegistroInvalido(ValueError):
+    """El registro de la temporada no cumple el formato; `errores` lista cada problema."""
+
+    def __init__(self, path, errores):
+        self.errores = errores
+        super().__init__(f"{os.path.relpath(path, ROOT_DIR)}:\n  - " + "\n  - ".join(errores))
+
+
+def _abs(rel):
+    return os.path.normpath(os.path.join(ROOT_DIR, *rel.split("/")))
+
+
+def _texto(d, campo):
+    return isinstance(d.get(campo), str) and d[campo].strip() != ""
+
+
+def validar(datos):
+    """Lista de errores del registro (vacía si es válido)."""
+    errores = []
+    if not isinstance(datos, dict):
+        return ["el registro debe ser un objeto JSON"]
+    if not _texto(datos, "temporada"):
+        errores.append("falta `temporada`")
+    validas = datos.get("validas")
+    campeonatos = datos.get("campeonatos")
+    if not isinstance(validas, list) or not validas:
+        errores.append("`validas` debe ser una lista no vacía")
+        validas = []
+    if not isinstance(campeonatos, list):
+        errores.append("`campeonatos` debe ser una lista")
+        campeonatos = []
+    informe_temporada = datos.get("informe_temporada")
+    if informe_temporada is not None:
+        if not isinstance(informe_temporada, dict):
+            errores.append("`informe_temporada` debe ser un objeto")
+        else:
+            for campo in CAMPOS_INFORME:
+                if not _texto(informe_temporada, campo):
+                    errores.append(f"falta `informe_temporada.{campo}`")
+
+    modalidades = {}
+    for i, v in enumerate(validas):
+        vid = v.get("id") if isinstance(v, dict) else None
+        donde = f"validas[{i}]" + (f" ({vid})" if vid else "")
+        if not isinstance(v, dict):
+            errores.append(f"{donde}: debe ser un objeto")
+            continue
+        for campo in ("id", "modalidad", "carpeta", "files_exported"):
+            if not _texto(v, campo):
+                errores.append(f"{donde}: falta `{campo}`")
+        if vid in modalidades:
+            errores.append(f"{donde}: id repetido")
+        modalidades[vid] = v.get("modalidad")
+        if "vuelta_a_vuelta" in v and not _texto(v, "vuelta_a_vuelta"):
+            errores.append(f"{donde}: `vuelta_a_vuelta` vacío")
+        pagina = v.get("pagina")
+        if not isinstance(pagina, dict) or not _texto(pagina, "script") or not _texto(pagina, "salida"):
+            errores.append(f"{donde}: `pagina` necesita `script` y `salida`")
+        informe = v.get("informe")
+        if informe is not None:
+            if not isinstance(informe, dict):
+                errores.append(f"{donde}: `informe` debe ser un objeto")
+            else:
+                for campo in CAMPOS_INFORME:
+                    if not _texto(informe, campo):
+                        errores.append(f"{donde}: falta `informe.{campo}`")
+                prioridad = informe.get("session_priority")
+                if prioridad is not None and not (isinstance(prioridad, list) and all(isinstance(s, str) for s in prioridad)):
+                    errores.append(f"{donde}: `informe.session_priority` debe ser una lista de textos")
+    for i, v in enumerate(validas):
+        if isinstance(v, dict) and isinstance(v.get("pagina"), dict):
+            for base in v["pagina"].get("base", []):
+                if base not in modalidades:
+                    errores.append(f"validas[{i}] ({v.get('id')}): `pagina.base` desconocida: {base}")
+
+    ids = set()
+    for i, c in enumerate(campeonatos):
+        cid = c.get("id") if isinstance(c, dict) else None
+        donde = f"campeonatos[{i}]" + (f" ({cid})" if cid else "")
+        if not isinstance(c, dict):
+            errores.append(f"{donde}: debe ser un objeto")
+            continue
+        for campo in ("id", "modalidad", "campeonato", "salida"):
+            if not _texto(c, campo):
+                errores.append(f"{donde}: falta `{campo}`")
+        if cid in ids:
+            errores.append(f"{donde}: id repetido")
+        ids.add(cid)
+        bono = c.get("final_valida_bonus", 0)
+        if not isinstance(bono, (int, float)) or isinstance(bono, bool) or bono < 0:
+            errores.append(f"{donde}: `final_valida_bonus` debe ser un número >= 0")
+        fechas = c.get("validas")
+        if not isinstance(fechas, list) or not fechas:
+            errores.append(f"{donde}: `validas` debe ser una lista no vacía")
+            continue
+        for j, f in enumerate(fechas):
+            if not isinstance(f, dict) or not _texto(f, "valida") or not _texto(f, "label"):
+                errores.append(f"{donde}: validas[{j}] necesita `valida` y `label`")
+            elif f["valida"] not in modalidades:
+                errores.append(f"{donde}: válida desconocida: {f['valida']}")
+            elif modalidades[f["valida"]] != c.get("modalidad"):
+                errores.append(f"{donde}: {f['valida']} es de {modalidades[f['valida']]}, no de {c.get('modalidad')}")
+        pendientes = c.get("pendientes", [])
+        if not isinstance(pendientes, list) or not all(isinstance(p, str) and p.strip() for p in pendientes):
+            errores.append(f"{donde}: `pendientes` debe ser una lista de etiquetas")
+    return errores
+
+
+def _resolver(datos):
+    validas = {}
+    for v in datos["validas"]:
+        carpeta = _abs(v["carpeta"])
+        vuelta = v.get("vuelta_a_vuelta")
+        validas[v["id"]] = {
+            "id": v["id"],
+            "modalidad": v["modalidad"],
+            "carpeta": carpeta,
+            "files_dir": os.path.join(carpeta, v["files_exported"]),
+            "vuelta_dir": os.path.join(carpeta, vuelta) if vuelta else None,
+            "vuelta_folder_url": vuelta,
+            "script": os.path.join(carpeta, v["pagina"]["script"]),
+            "output_html": os.path.join(carpeta, v["pagina"]["salida"]),
+            "base": list(v["pagina"].get("base", [])),
+            "informe": v.get("informe"),
+        }
+    for v in validas.values():
+        v["base_scripts"] = [validas[b]["script"] for b in v["base"]]
+    campeonatos = []
+    for c in datos["campeonatos"]:
+        champ = {
+            "id": c["id"],
+            "temporada": datos["temporada"],
+            "modalidad": c["modalidad"],
+            "campeonato": c["campeonato"],
+            "validas": [{"label": f["label"], "files_dir": validas[f["valida"]]["files_dir"]} for f in c["validas"]],
+            "output_html": _abs(c["salida"]),
+        }
+        if c.get("final_valida_bonus"):
+            champ["final_valida_bonus"] = c["final_valida_bonus"]
+        if c.get("pendientes"):
+            champ["pendientes"] = list(c["pendientes"])
+        if c["modalidad"] == "GP Colombia":
+            champ["gp_colombia"] = True
+        campeonatos.append(champ)
+    informe_temporada = datos.get("informe_temporada")
+    if informe_temporada:
+        informe_temporada = dict(informe_temporada, output_html=_abs(informe_temporada["salida"]))
+        del informe_temporada["salida"]
+    return {
+        "temporada": datos["temporada"],
+        "validas": validas,
+        "campeonatos": campeonatos,
+        "informe_temporada": informe_temporada,
+    }
+
+
+def cargar(path=None):
+    """Registro leído, validado y con rutas absolutas; una vez por proceso y archivo."""
+    path = os.path.abspath(path or REGISTRO)
+    if path not in _REGISTROS:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                datos = json.load(f)
+        except ValueError as e:
+            raise RegistroInvalido(path, [f"JSON inválido: {e}"]) from e
+        errores = validar(datos)
+        if errores:
+            raise RegistroInvalido(path, errores)
+        _REGISTROS[path] = _resolver(datos)
+    return _REGISTROS[path]
+
+
+def temporada():
+    return cargar()["temporada"]
+
+
+def valida(valida_id):
+    """Rutas de una válida: files_dir, vuelta_dir, vuelta_folder_url, script, output_html..."""
+    try:
+        return cargar()["validas"][valida_id]
+    except KeyError:
+        raise KeyError(f"válida no registrada en {os.path.basename(REGISTRO)}: {valida_id}") from None
+
+
+def validas():
+    """Válidas en el orden del registro."""
+    return list(cargar()["validas"].values())
+
+
+def championships():
+    """Campeonatos en el formato de CHAMPIONSHIPS (generar_resultados_generales.py)."""
+    return [dict(c, validas=[dict(v) for v in c["validas"]]) for c in cargar()["campeonatos"]]
+
+
+def _lectura_informe(v):
+    """Cómo leen la válida las estadísticas: id, modalidad, carpeta, prioridad de sesión y GP."""
+    cfg = {"id": v["id"], "modalidad": v["modalidad"], "files_dir": v["files_dir"]}
+    informe = v["informe"] or {}
+    if informe.get("session_priority"):
+        cfg["session_priority"] = list(informe["session_priority"])
+    if v["modalidad"] == "GP Colombia":
+        cfg["gp_colombia"] = True
+    return cfg
+
+
+def report_configs():
+    """Informes por válida en el formato de REPORT_CONFIGS (Informes/generar_informes_validas.py)."""
+    configs = []
+    for v in validas():
+        informe = v["informe"]
+        if not informe:
+            continue
+        cfg = {"output_html": _abs(informe["salida"]), **_lectura_informe(v)}
+        for campo in ("title", "heading", "subtitle", "intro"):
+            cfg[campo] = informe[campo]
+        configs.append(cfg)
+    return configs
+
+
+def lecturas_informe():
+    """Lectura de cada válida del registro para estadísticas (tenga o no informe propio)."""
+    return [_lectura_informe(v) for v in validas()]
+
+
+def informe_temporada():
+    """Textos y salida (`output_html`) del informe de la temporada; None si no está declarado."""
+    informe = cargar()["informe_temporada"]
+    return dict(informe) if informe else None
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Tablas de puntos y lectura de celdas de posición / puntos.
+
+Cada tabla (posición → puntos) se compila una vez en un arreglo plano indexado por posición
+(índice 0 y posiciones fuera de la tabla = 0 puntos), así asignar puntos es un acceso por
+índice. Las celdas de posición y de puntos se interpretan una sola vez por valor distinto
+(los exportes repiten "1", "2", "DNF"... en cada categoría), y las funciones `*_columna`
+convierten una columna completa de una tabla (`CsvTable.column`) de una vez.
+
+Modalidades que asignan puntos por posición (cuando el exporte no trae columna Puntos):
+Enduro Scratch y GP Colombia, ambas con la tabla Fedemoto de carrera.
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+TABLAS = {
+    # Tabla Fedemoto carrera: 1° a 12° según la tabla, 13° a 15° un punto.
+    "fedemoto_carrera": (15, 13, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1, 1, 1),
+}
+
+TABLA_POR_MODALIDAD = {
+    "Enduro": "fedemoto_carrera",
+    "GP Colombia": "fedemoto_carrera",
+}
+
+# Posiciones sin clasificar en los exportes de cronometraje.
+SIN_POSICION = ("NT", "EX", "DNF")
+
+_RE_ENTERO = re.compile(r"-?\d+")
+_RE_DECIMAL = re.compile(r"-?\d+(\.\d+)?")
+_RE_POSICION = re.compile(r"\d+")
+
+
+@lru_cache(maxsize=None)
+def compilada(nombre="fedemoto_carrera"):
+    """Arreglo plano de la tabla: `arreglo[pos]` = puntos (0.0 en el índice 0)."""
+    return (0.0,) + tuple(float(p) for p in TABLAS[nombre])
+
+
+def tabla_modalidad(modalidad):
+    """Tabla compilada con la que la modalidad asigna puntos por posición."""
+    return compilada(TABLA_POR_MODALIDAD.get(modalidad, "fedemoto_carrera"))
+
+
+@lru_cache(maxsize=4096)
+def posicion(valor):
+    """Primera cifra entera de la celda de posición; 0 si no hay o es NT/EX/DNF."""
+    s = str(valor or "").strip()
+    if s.upper() in SIN_POSICION:
+        return 0
+    m = _RE_POSICION.search(s)
+    return int(m.group(0)) if m else 0
+
+
+@lru_cache(maxsize=4096)
+def puntos(valor):
+    """Puntos de la celda (admite coma decimal); 0.0 si está vacía o no tiene número."""
+    s = str(valor or "").strip().replace(",", ".")
+    if not s:
+        return 0.0
+    m = _RE_DECIMAL.search(s)
+    return float(m.group(0)) if m else 0.0
+
+
+@lru_cache(maxsize=4096)
+def puntos_entero(valor):
+    """Primera cifra entera de la celda de puntos (sumas de sesiones de MX Inicio)."""
+    m = _RE_ENTERO.search(str(valor or "").strip())
+    return int(m.group(0)) if m else 0
+
+
+def puntos_por_posicion(pos, tabla=None):
+    """Puntos de la posición `pos` (entero) en la tabla compilada (por defecto Fedemoto carrera)."""
+    arreglo = tabla or compilada()
+    return arreglo[pos] if 0 < pos < len(arreglo) else 0.0
+
+
+def puntos_posiciones_columna(valores, tabla=None):
+    """Columna de celdas de posición → lista de puntos, en una pasada sobre el arreglo."""
+    arreglo = tabla or compilada()
+    n = len(arreglo)
+    return [arreglo[p] if p < n else 0.0 for p in map(posicion, valores)]
+
+
+def puntos_columna(valores):
+    """Columna de celdas de puntos → lista de floats."""
+    return list(map(puntos, valores))
+
+
+def puntos_entero_columna(valores):
+    """Columna de celdas de puntos → lista de enteros."""
+    return list(map(puntos_entero, valores))
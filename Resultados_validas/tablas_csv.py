@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Lectura compartida de los CSV exportados por el cronometraje (carpetas FILES EXPORTED).
+
+Cada archivo se lee y se separa en columnas una sola vez por proceso: los generadores de
+válidas, los informes y los resultados generales consumen la misma tabla. Los índices de
+encabezados (alias como N°/No/Numero) se resuelven una vez por tabla con la función de
+búsqueda de cada consumidor (`table.indexes(find_indexes)`).
+
+Entre ejecuciones, las tablas ya parseadas se guardan en `.cache/tablas_csv/` (pickle, un
+archivo por CSV) junto con ruta, tamaño, mtime y hash SHA-1 del contenido: si tamaño y mtime
+coinciden no se vuelve a leer el CSV; si cambió el mtime pero no el contenido se reutiliza
+igual. `FEDEMOTO_CSV_CACHE=0` desactiva la caché en disco.
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import os
+import pickle
+import threading
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+CACHE_DIR = os.path.join(ROOT_DIR, ".cache", "tablas_csv")
+CACHE_VERSION = 2
+
+_TABLES = {}
+_DETECTED = {}
+
+
+def csv_delimiter(first_line):
+    """`;` si la primera línea tiene más `;` que `,` (exportes de Enduro/Scratch)."""
+    if not first_line:
+        return ","
+    return ";" if first_line.count(";") > first_line.count(",") else ","
+
+
+class CsvTable:
+    """
+    Tabla en columnas: `headers` (primera fila), `columns` (una tupla por columna,
+    rellenada con "") y `lengths` (largo original de cada fila, para no perder filas cortas).
+    """
+
+    __slots__ = ("path", "headers", "columns", "lengths", "_indexes")
+
+    def __init__(self, path, headers, body):
+        self.path = path
+        self.headers = headers
+        self.lengths = tuple(len(r) for r in body)
+        width = max(self.lengths, default=0)
+        if width:
+            padded = [r if len(r) == width else r + [""] * (width - len(r)) for r in body]
+            self.columns = list(zip(*padded))
+        else:
+            self.columns = []
+        self._indexes = {}
+
+    @classmethod
+    def from_state(cls, path, state):
+        """Reconstruye la tabla desde `state()` (caché en disco) sin volver a parsear."""
+        table = cls.__new__(cls)
+        table.path = path
+        table.headers, table.columns, table.lengths = state
+        table._indexes = {}
+        return table
+
+    def state(self):
+        return (self.headers, self.columns, self.lengths)
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def rows(self):
+        """Filas como listas nuevas (el consumidor puede modificarlas), con su largo original."""
+        if not self.columns:
+            return [[] for _ in self.lengths]
+        return [list(r[:n]) for r, n in zip(zip(*self.columns), self.lengths)]
+
+    def column(self, index):
+        """Valores de una columna (None si el índice no existe)."""
+        if index is None or index >= len(self.columns):
+            return None
+        return self.columns[index]
+
+    def indexes(self, find_fn):
+        """Resultado de `find_fn(headers)`, calculado una sola vez por tabla."""
+        if find_fn not in self._indexes:
+            self._indexes[find_fn] = find_fn(self.headers)
+        return self._indexes[find_fn]
+
+    def dicts(self, strip=True):
+        """
+        Filas como dicts encabezado → valor (equivalente a csv.DictReader: omite filas vacías;
+        celdas faltantes quedan en "" / None). Con `strip`, claves y valores sin espacios.
+        """
+        out = []
+        headers = self.headers
+        for row in self.rows():
+            if not row:
+                continue
+            if strip:
+                d = {}
+                for i, h in enumerate(headers):
+                    d[h.strip()] = row[i].strip() if i < len(row) else ""
+            else:
+                d = {h: (row[i] if i < len(row) else None) for i, h in enumerate(headers)}
+            out.append(d)
+        return out
+
+
+def _parse_text(path, raw, delimiter):
+    if raw.startswith("\ufeff"):
+        raw = raw[1:]
+    if delimiter is None:
+        delimiter = csv_delimiter(raw.partition("\n")[0])
+    # Como leer el archivo con newline="": las celdas entre comillas pueden tener saltos de línea.
+    rows = list(csv.reader(io.StringIO(raw, newline=""), delimiter=delimiter))
+    if not rows:
+        return delimiter, CsvTable(path, [], [])
+    return delimiter, CsvTable(path, rows[0], rows[1:])
+
+
+def _disk_cache_enabled():
+    return os.environ.get("FEDEMOTO_CSV_CACHE", "1") != "0"
+
+
+def _cache_file(path):
+    name = hashlib.sha1(path.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, name + ".pickle")
+
+
+def _load_entry(cache_file):
+    try:
+        with open(cache_file, "rb") as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION:
+        return None
+    return entry
+
+
+def _store_entry(cache_file, entry):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+def _parse(path, delimiter):
+    """
+    (delimitador efectivo, tabla). Consulta la caché en disco; `delimiter=None` se guarda
+    como clave "auto" junto al delimitador detectado.
+    """
+    if not _disk_cache_enabled():
+        with open(path, "rb") as f:
+            data = f.read()
+        return _parse_text(path, data.decode("utf-8"), delimiter)
+
+    st = os.stat(path)
+    cache_file = _cache_file(path)
+    entry = _load_entry(cache_file)
+    if entry is not None and entry["path"] != path:
+        entry = None
+    slot = "auto" if delimiter is None else delimiter
+    stat_ok = entry is not None and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns
+    if stat_ok and slot in entry["tables"]:
+        delim, state = entry["tables"][slot]
+        return delim, CsvTable.from_state(path, state)
+
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha1(data).hexdigest()
+    if entry is None or entry["sha1"] != digest:
+        entry = {"version": CACHE_VERSION, "path": path, "sha1": digest, "tables": {}}
+    entry["size"] = st.st_size
+    entry["mtime_ns"] = st.st_mtime_ns
+    if slot in entry["tables"]:
+        delim, state = entry["tables"][slot]
+        table = CsvTable.from_state(path, state)
+    else:
+        delim, table = _parse_text(path, data.decode("utf-8"), delimiter)
+        entry["tables"][slot] = (delim, table.state())
+    _store_entry(cache_file, entry)
+    return delim, table
+
+
+def read_table(path, delimiter=None):
+    """
+    Tabla del CSV en `path`. `delimiter=None` detecta `;`/`,` por la primera línea.
+    Se memoriza por (ruta, delimitador) durante todo el proceso.
+    """
+    path = os.path.abspath(path)
+    if delimiter is None:
+        delimiter = _DETECTED.get(path)
+        if delimiter is None:
+            delimiter, table = _parse(path, None)
+            _DETECTED[path] = delimiter
+            _TABLES[(path, delimiter)] = table
+            return table
+    key = (path, delimiter)
+    table = _TABLES.get(key)
+    if table is None:
+        _delim, table = _parse(path, delimiter)
+        _TABLES[key] = table
+    return table
+
+
+def read_rows(path, delimiter=None):
+    """(headers, filas) como en los antiguos `parse_csv` de cada generador."""
+    table = read_table(path, delimiter)
+    return list(table.headers), table.rows()
+
+
+def clear_cache(disk=False):
+    """Olvida las tablas leídas (p. ej. si los CSV cambian durante el proceso); con `disk` borra también la caché en disco."""
+    _TABLES.clear()
+    _DETECTED.clear()
+    if disk and os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            if name.endswith(".pickle") or name.endswith(".tmp"):
+                try:
+                    os.remove(os.path.join(CACHE_DIR, name))
+                except OSError:
+                    pass
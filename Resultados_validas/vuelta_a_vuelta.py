@@ -5,16 +5,20 @@ Convención de archivos (misma idea que los CSV):
   CATEGORIA - TIPO_SESION - Laptimes.pdf
 
 En cada script generador:
-  1. Tras .final-block h3 { ... } en el <style>, insertar el comentario CSS_PLACEHOLDER.
-  2. Variables de módulo (por defecto None):
-       VUELTA_A_VUELTA_FOLDER = "carpeta_relativa_al_html"  # sin barras inicial/final
-       VUELTA_A_VUELTA_MAP = build_laptimes_pdf_map(ruta_absoluta_carpeta_pdf, format_categoria_name, tipo_fn)
+  1. Tras .final-block h3 { ... } en el <style>, insertar el comentario CSS_PLACEHOLDER
+     (en las hojas .css de plantillas_html/ es el campo {{ vuelta_css }}, que recursos_estaticos
+     llena siempre: las reglas solo aplican cuando la página trae .session-title-row).
+  2. La configuración de la válida (dict VALIDA que recibe generate_html) trae
+       "vuelta_dir": ruta absoluta de la carpeta de PDF (o None)
+       "vuelta_folder_url": carpeta relativa al HTML, sin barras inicial/final (o None)
+     y generate_html arma localmente, sin tocar variables del módulo:
+       pdf_map = build_laptimes_pdf_map(vuelta_dir, format_categoria_name, tipo_fn)
   3. Donde hoy va <h3>salida</h3> antes de cada tabla de sesión, usar:
        session_title_block(categoria, tipo_sesion, escape_html, pdf_map, folder_url)
      (no añadir botón al título "Desglose por sesión" ni a modales).
   4. Antes de escribir el HTML:
-       html_content = inject_vuelta_css(html_content, bool(VUELTA_A_VUELTA_MAP and VUELTA_A_VUELTA_FOLDER))
-  5. Tras generar, limpiar: VUELTA_A_VUELTA_MAP = None; VUELTA_A_VUELTA_FOLDER = None
+       html_content = inject_vuelta_css(html_content, bool(pdf_map and folder_url))
+     (las páginas renderizadas con plantillas.py enlazan la hoja publicada y no necesitan este paso).
 
 tipo_fn: función (ultimo_segmento_pdf: str) -> str que coincida con el texto de sesión
 en la página (p. ej. "Final", "Clasificatoria", "Carrera 1"). Usar los resolutores
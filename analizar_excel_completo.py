@@ -1,110 +1,127 @@
 import pandas as pd
-import unicodedata
 import re
 import json
-from collections import defaultdict
+import os
+import sys
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Resultados_validas")))
+import libro_excel
+import normalizacion
 
 def normalizar_liga(nombre):
     """
     Normaliza el nombre de la liga: quita tildes, convierte a mayúsculas,
-    y limpia espacios extra.
+    y limpia espacios extra. Memorizada por valor (normalizacion.sin_tildes).
     """
     if pd.isna(nombre) or nombre == '':
         return None
-    
-    # Convertir a string y limpiar
-    nombre = str(nombre).strip()
-    
-    # Quitar tildes
-    nombre = unicodedata.normalize('NFD', nombre)
-    nombre = ''.join(c for c in nombre if unicodedata.category(c) != 'Mn')
-    
-    # Convertir a mayúsculas para unificar
-    nombre = nombre.upper()
-    
-    return nombre
+    return normalizacion.sin_tildes(str(nombre).strip()).upper()
 
-def extraer_datos_excel(excel_path):
+def pares_categoria(columnas):
     """
-    Extrae todos los datos del Excel, procesando todas las hojas.
+    Pares de columnas (número + departamento) de una hoja: (categoría, índice del número,
+    índice del departamento o None si la hoja termina ahí).
     """
-    excel_file = pd.ExcelFile(excel_path)
-    
-    resultados = {
-        'modalidades': {},
-        'total_pilotos_unicos': set(),
-        'total_participaciones': 0,  # Total de participaciones (incluyendo repetidos)
-        'pilotos_por_categoria': defaultdict(set),
-        'deportistas_por_liga_total': defaultdict(set),
-        'deportistas_por_liga_categoria': defaultdict(lambda: defaultdict(set))
+    categorias = []
+    i = 0
+    while i < len(columnas):
+        col_num = columnas[i]
+        col_dep = columnas[i + 1] if i + 1 < len(columnas) else None
+
+        # Si la columna de número tiene un nombre válido (no "Unnamed")
+        if not str(col_num).startswith('Unnamed'):
+            categoria = str(col_num)
+            categorias.append((categoria, i, i + 1 if col_dep else None))
+            i += 2
+        else:
+            i += 1
+    return categorias
+
+def numeros_piloto(serie):
+    """
+    Número del piloto como en la lectura celda a celda: enteros y decimales pasan a int
+    (columna completa de una vez si es numérica); textos quedan igual.
+    """
+    if pd.api.types.is_numeric_dtype(serie):
+        return serie.astype('int64')
+    return serie.map(lambda v: int(v) if isinstance(v, (int, float)) else v)
+
+def ligas_normalizadas(serie):
+    """normalizar_liga sobre cada valor distinto de la columna (no por fila)."""
+    codigos, unicas = pd.factorize(serie)
+    normalizadas = pd.array([normalizar_liga(v) for v in unicas], dtype=object)
+    return pd.Series(normalizadas[codigos], index=serie.index, dtype=object)
+
+def participaciones_hoja(df):
+    """
+    Participaciones de una hoja en formato largo (categoria, numero, liga): los pares de
+    columnas de cada categoría se apilan (melt de los pares) y se descartan las filas sin
+    número, sin departamento o con liga vacía.
+    """
+    partes = []
+    for categoria, idx_num, idx_dep in pares_categoria(list(df.columns)):
+        if idx_dep is None:
+            continue
+        print(f"  - Categoría: {categoria}")
+        par = pd.DataFrame({
+            'numero': df.iloc[:, idx_num],
+            'departamento': df.iloc[:, idx_dep],
+        }).dropna()
+        partes.append(pd.DataFrame({
+            'categoria': categoria,
+            'numero': numeros_piloto(par['numero']),
+            'departamento': par['departamento'],
+        }))
+    if not partes:
+        return pd.DataFrame({'categoria': [], 'numero': [], 'liga': []}, dtype=object)
+
+    largo = pd.concat(partes, ignore_index=True)
+    largo['liga'] = ligas_normalizadas(largo['departamento'])
+    largo = largo[largo['liga'].notna() & (largo['liga'] != '')]
+    return largo[['categoria', 'numero', 'liga']]
+
+def _conteos(serie):
+    """Serie de groupby().nunique() → dict ordenado {clave: int}."""
+    return {k: int(v) for k, v in sorted(serie.items())}
+
+def resumir(largo):
+    """
+    Conteos de un conjunto de participaciones con groupby().nunique(): pilotos únicos,
+    participaciones (filas), pilotos por categoría, deportistas por liga y por liga en cada
+    categoría.
+    """
+    por_liga_categoria = {}
+    for (categoria, liga), n in largo.groupby(['categoria', 'liga'])['numero'].nunique().items():
+        por_liga_categoria.setdefault(categoria, {})[liga] = int(n)
+    return {
+        'pilotos_unicos': int(largo['numero'].nunique()),
+        'total_participaciones': len(largo),
+        'pilotos_por_categoria': _conteos(largo.groupby('categoria')['numero'].nunique()),
+        'deportistas_por_liga': _conteos(largo.groupby('liga')['numero'].nunique()),
+        'deportistas_por_liga_categoria': {
+            cat: dict(sorted(ligas.items()))
+            for cat, ligas in sorted(por_liga_categoria.items())
+        },
     }
-    
-    print(f"Procesando {len(excel_file.sheet_names)} modalidades...")
-    
-    for sheet_name in excel_file.sheet_names:
+
+def extraer_datos_excel(excel_path):
+    """
+    Extrae todos los datos del Excel, procesando todas las hojas (una por modalidad).
+    Retorna los conteos totales y por modalidad (ver resumir).
+    """
+    # Hojas desde la instantánea del libro (libro_excel): el .xlsx solo se abre si cambió
+    sheet_names = libro_excel.hojas(excel_path)
+
+    print(f"Procesando {len(sheet_names)} modalidades...")
+
+    hojas = {}
+    for sheet_name in sheet_names:
         print(f"\nProcesando modalidad: {sheet_name}")
-        df = pd.read_excel(excel_file, sheet_name=sheet_name)
-        
-        modalidad_data = {
-            'pilotos_unicos': set(),
-            'total_participaciones': 0,  # Participaciones en esta modalidad (incluyendo repetidos)
-            'pilotos_por_categoria': defaultdict(set),
-            'deportistas_por_liga': defaultdict(set),
-            'deportistas_por_liga_categoria': defaultdict(lambda: defaultdict(set))
-        }
-        
-        # Identificar pares de columnas (número + departamento)
-        categorias = []
-        i = 0
-        while i < len(df.columns):
-            col_num = df.columns[i]
-            col_dep = df.columns[i + 1] if i + 1 < len(df.columns) else None
-            
-            # Si la columna de número tiene un nombre válido (no "Unnamed")
-            if not str(col_num).startswith('Unnamed'):
-                categoria = str(col_num)
-                categorias.append((categoria, i, i + 1 if col_dep else None))
-                i += 2
-            else:
-                i += 1
-        
-        # Procesar cada categoría
-        for categoria, idx_num, idx_dep in categorias:
-            if idx_dep is None:
-                continue
-                
-            col_num = df.columns[idx_num]
-            col_dep = df.columns[idx_dep]
-            
-            print(f"  - Categoría: {categoria}")
-            
-            # Extraer datos de esta categoría
-            for idx, row in df.iterrows():
-                numero = row[col_num]
-                departamento = row[col_dep]
-                
-                # Validar que ambos valores existan
-                if pd.notna(numero) and pd.notna(departamento):
-                    numero = int(numero) if isinstance(numero, (int, float)) else numero
-                    liga_normalizada = normalizar_liga(departamento)
-                    
-                    if liga_normalizada:
-                        # Agregar a totales
-                        resultados['total_pilotos_unicos'].add(numero)
-                        resultados['total_participaciones'] += 1  # Contar todas las participaciones
-                        resultados['pilotos_por_categoria'][categoria].add(numero)
-                        resultados['deportistas_por_liga_total'][liga_normalizada].add(numero)
-                        resultados['deportistas_por_liga_categoria'][categoria][liga_normalizada].add(numero)
-                        
-                        # Agregar a modalidad específica
-                        modalidad_data['pilotos_unicos'].add(numero)
-                        modalidad_data['total_participaciones'] += 1  # Contar participaciones en esta modalidad
-                        modalidad_data['pilotos_por_categoria'][categoria].add(numero)
-                        modalidad_data['deportistas_por_liga'][liga_normalizada].add(numero)
-                        modalidad_data['deportistas_por_liga_categoria'][categoria][liga_normalizada].add(numero)
-        
-        resultados['modalidades'][sheet_name] = modalidad_data
-    
+        df = libro_excel.leer_hoja(excel_path, sheet_name)
+        hojas[sheet_name] = participaciones_hoja(df)
+
+    resultados = resumir(pd.concat(list(hojas.values()), ignore_index=True))
+    resultados['modalidades'] = {sheet_name: resumir(largo) for sheet_name, largo in hojas.items()}
     return resultados
 
 def generar_informe(resultados, output_file='informe_resultados.txt'):
@@ -119,7 +136,7 @@ def generar_informe(resultados, output_file='informe_resultados.txt'):
         # 1. Total de pilotos únicos participantes
         f.write("1. CANTIDAD TOTAL DE PILOTOS ÚNICOS PARTICIPANTES\n")
         f.write("-" * 80 + "\n")
-        total_unicos = len(resultados['total_pilotos_unicos'])
+        total_unicos = resultados['pilotos_unicos']
         f.write(f"Total: {total_unicos} pilotos únicos\n\n")
         
         # 1.1. Total de participaciones (incluyendo repetidos)
@@ -131,26 +148,23 @@ def generar_informe(resultados, output_file='informe_resultados.txt'):
         # 2. Cantidad de pilotos por cada categoría
         f.write("2. CANTIDAD DE PILOTOS POR CADA CATEGORÍA\n")
         f.write("-" * 80 + "\n")
-        for categoria in sorted(resultados['pilotos_por_categoria'].keys()):
-            cantidad = len(resultados['pilotos_por_categoria'][categoria])
+        for categoria, cantidad in resultados['pilotos_por_categoria'].items():
             f.write(f"{categoria}: {cantidad} pilotos únicos\n")
         f.write("\n")
         
         # 3. Cantidad de deportistas únicos por ligas totales
         f.write("3. CANTIDAD DE DEPORTISTAS ÚNICOS POR LIGAS TOTALES\n")
         f.write("-" * 80 + "\n")
-        for liga in sorted(resultados['deportistas_por_liga_total'].keys()):
-            cantidad = len(resultados['deportistas_por_liga_total'][liga])
+        for liga, cantidad in resultados['deportistas_por_liga'].items():
             f.write(f"{liga}: {cantidad} deportistas únicos\n")
         f.write("\n")
         
         # 4. Cantidad de deportistas únicos por ligas por categoría
         f.write("4. CANTIDAD DE DEPORTISTAS ÚNICOS POR LIGAS POR CATEGORÍA\n")
         f.write("-" * 80 + "\n")
-        for categoria in sorted(resultados['deportistas_por_liga_categoria'].keys()):
+        for categoria, ligas in resultados['deportistas_por_liga_categoria'].items():
             f.write(f"\n{categoria}:\n")
-            for liga in sorted(resultados['deportistas_por_liga_categoria'][categoria].keys()):
-                cantidad = len(resultados['deportistas_por_liga_categoria'][categoria][liga])
+            for liga, cantidad in ligas.items():
                 f.write(f"  {liga}: {cantidad} deportistas únicos\n")
         f.write("\n")
         
@@ -162,17 +176,15 @@ def generar_informe(resultados, output_file='informe_resultados.txt'):
         for modalidad, data in resultados['modalidades'].items():
             f.write(f"\nMODALIDAD: {modalidad}\n")
             f.write("-" * 80 + "\n")
-            f.write(f"Pilotos únicos en esta modalidad: {len(data['pilotos_unicos'])}\n")
+            f.write(f"Pilotos únicos en esta modalidad: {data['pilotos_unicos']}\n")
             f.write(f"Total de participaciones en esta modalidad: {data['total_participaciones']}\n\n")
             
             f.write("Pilotos por categoría:\n")
-            for cat in sorted(data['pilotos_por_categoria'].keys()):
-                cantidad = len(data['pilotos_por_categoria'][cat])
+            for cat, cantidad in data['pilotos_por_categoria'].items():
                 f.write(f"  {cat}: {cantidad}\n")
             
             f.write("\nDeportistas por liga:\n")
-            for liga in sorted(data['deportistas_por_liga'].keys()):
-                cantidad = len(data['deportistas_por_liga'][liga])
+            for liga, cantidad in data['deportistas_por_liga'].items():
                 f.write(f"  {liga}: {cantidad}\n")
     
     print(f"\nInforme generado en: {output_file}")
@@ -182,42 +194,18 @@ def generar_json(resultados, output_file='datos_informe.json'):
     Genera un archivo JSON con los datos estructurados para la página web.
     """
     datos_json = {
-        'total_pilotos_unicos': len(resultados['total_pilotos_unicos']),
+        'total_pilotos_unicos': resultados['pilotos_unicos'],
         'total_participaciones': resultados['total_participaciones'],
-        'pilotos_por_categoria': {
-            cat: len(pilotos) 
-            for cat, pilotos in sorted(resultados['pilotos_por_categoria'].items())
-        },
-        'deportistas_por_liga_total': {
-            liga: len(deportistas) 
-            for liga, deportistas in sorted(resultados['deportistas_por_liga_total'].items())
-        },
-        'deportistas_por_liga_categoria': {
-            cat: {
-                liga: len(deportistas)
-                for liga, deportistas in sorted(ligas.items())
-            }
-            for cat, ligas in sorted(resultados['deportistas_por_liga_categoria'].items())
-        },
+        'pilotos_por_categoria': resultados['pilotos_por_categoria'],
+        'deportistas_por_liga_total': resultados['deportistas_por_liga'],
+        'deportistas_por_liga_categoria': resultados['deportistas_por_liga_categoria'],
         'modalidades': {
             modalidad: {
-                'pilotos_unicos': len(data['pilotos_unicos']),
+                'pilotos_unicos': data['pilotos_unicos'],
                 'total_participaciones': data['total_participaciones'],
-                'pilotos_por_categoria': {
-                    cat: len(pilotos)
-                    for cat, pilotos in sorted(data['pilotos_por_categoria'].items())
-                },
-                'deportistas_por_liga': {
-                    liga: len(deportistas)
-                    for liga, deportistas in sorted(data['deportistas_por_liga'].items())
-                },
-                'deportistas_por_liga_categoria': {
-                    cat: {
-                        liga: len(deportistas)
-                        for liga, deportistas in sorted(ligas.items())
-                    }
-                    for cat, ligas in sorted(data['deportistas_por_liga_categoria'].items())
-                }
+                'pilotos_por_categoria': data['pilotos_por_categoria'],
+                'deportistas_por_liga': data['deportistas_por_liga'],
+                'deportistas_por_liga_categoria': data['deportistas_por_liga_categoria'],
             }
             for modalidad, data in resultados['modalidades'].items()
         }
@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark del pipeline de generación con eventos sintéticos grandes.
+
+A partir de carpetas FILES EXPORTED reales (semillas) se arman eventos sintéticos escalados
+— categorías, sesiones y pilotos multiplicados — y sobre ellos se mide cada etapa:
+
+  valida    página de la válida: generate_html de la base de la modalidad (Motocross,
+            Velotierra, Enduro I, GP) o main() de los generadores de Velocidad y Enduro II/III
+            con su carpeta y salida apuntando al evento sintético
+  general   build_general_table + render_html de resultados generales (--validas copias)
+  informe   analyze / analyze_gp_colombia + build_html de Informes/generar_informes_validas.py
+
+Cada medición corre en un proceso propio (como los trabajos de generar_sitio.py), con las
+cachés en disco (tablas_csv, almacén de resultados generales) desactivadas, y reporta tiempo de pared de la etapa, pico de
+memoria del proceso (RSS máximo; no disponible en Windows) y tamaño de la salida. Las
+salidas y los datos sintéticos van a una carpeta temporal; el sitio no se modifica.
+
+Escalado de la semilla:
+  --categorias N   cada categoría se repite N veces ("150CC", "150CC B2", ...)
+  --sesiones S     S sesiones extra por categoría ("MANGA 1".."MANGA S", sin chocar con
+                   los tipos que ya reconocen los generadores)
+  --pilotos P      cada archivo repite sus filas P veces con N° y nombre distintos
+
+Uso:
+    python benchmark_generadores.py                          # 10× categorías de cada semilla
+    python benchmark_generadores.py gp --categorias 10 --pilotos 3 --sesiones 2
+    python benchmark_generadores.py --etapa general --validas 6 --repeticiones 3
+    python benchmark_generadores.py --json bench.json        # resultados para comparar después
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+RV = os.path.join(ROOT_DIR, "Resultados_validas")
+INFORMES_DIR = os.path.join(ROOT_DIR, "Informes")
+GENERALES_DIR = os.path.join(ROOT_DIR, "Resultados generales")
+
+# Semillas: carpeta FILES EXPORTED real, base que genera la página y datos del campeonato.
+EVENTOS = {
+    "gp": {
+        "files_dir": os.path.join(RV, "GP Colombia", "FILES EXPORTED_Gran Premio Vitrix"),
+        "modulo": (os.path.join(RV, "GP Colombia"), "generar_valida_i_gp_vitrix"),
+        "modalidad": "GP Colombia",
+        "gp_colombia": True,
+    },
+    "mx": {
+        "files_dir": os.path.join(RV, "Motocross", "Primer semestre", "FILES EXPORTED-girardota"),
+        "modulo": (os.path.join(RV, "Motocross", "Primer semestre"), "generar_valida_girardota"),
+        "modalidad": "Motocross",
+        "final_valida_bonus": 8,
+    },
+    "vt": {
+        "files_dir": os.path.join(RV, "Velotierra", "Primer semestre", "FILES EXPORTED_tulua"),
+        "modulo": (os.path.join(RV, "Velotierra", "Primer semestre"), "generar_valida_vt_tulua"),
+        "modalidad": "Velotierra",
+        "final_valida_bonus": 8,
+    },
+    "enduro": {
+        "files_dir": os.path.join(RV, "Enduro", "Primera valida", "FILES EXPORTED"),
+        "modulo": (os.path.join(RV, "Enduro", "Primera valida"), "generar_valida_enduro_2026"),
+        "modalidad": "Enduro",
+    },
+    # Generadores con main(csv_dir, out, order, ...): `pagina` indica cómo armar el orden de
+    # secciones con las categorías copiadas.
+    "velocidad": {
+        "files_dir": os.path.join(RV, "Velocidad", "Primer semestre", "FILES EXPORTED_CHACHAGUI"),
+        "modulo": (os.path.join(RV, "Velocidad", "Primer semestre"), "generar_valida_ii_velocidad_chachagui"),
+        "modalidad": "Velocidad",
+        "pagina": "velocidad",
+    },
+    "enduro2": {
+        "files_dir": os.path.join(RV, "Enduro", "Segunda valida", "FILES EXPORTED"),
+        "modulo": (os.path.join(RV, "Enduro", "Segunda valida"), "_build_valida_ii_html"),
+        "modalidad": "Enduro",
+        "pagina": "enduro_por_archivo",
+    },
+    "enduro3": {
+        "files_dir": os.path.join(RV, "Enduro", "Tercera valida", "FILES EXPORTED"),
+        "modulo": (os.path.join(RV, "Enduro", "Tercera valida"), "_build_valida_iii_html"),
+        "modalidad": "Enduro",
+        "pagina": "enduro_por_archivo",
+    },
+}
+ETAPAS = ("valida", "general", "informe")
+
+NUMERO_HEADERS = {"n°", "nº", "no", "no.", "numero", "número", "#"}
+
+
+def _import_from(folder, module_name):
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    import importlib
+    return importlib.import_module(module_name)
+
+
+# --- Datos sintéticos -------------------------------------------------------------------
+
+def _column(headers, pred):
+    for i, h in enumerate(headers):
+        if pred(h.strip().lower()):
+            return i
+    return None
+
+
+def escribir_escalado(origen, destino, pilotos):
+    """Copia el CSV `origen` en `destino` con sus filas repetidas `pilotos` veces. Retorna filas."""
+    import tablas_csv
+
+    with open(origen, "rb") as f:
+        raw = f.read()
+    bom = raw.startswith(b"\xef\xbb\xbf")
+    text = raw.decode("utf-8-sig")
+    first_line = text.splitlines()[0] if text.strip() else ""
+    if not first_line:
+        shutil.copyfile(origen, destino)
+        return 0
+    delimiter = tablas_csv.csv_delimiter(first_line)
+    # Con newline="" los campos entre comillas pueden tener saltos de línea.
+    rows = list(csv.reader(io.StringIO(text, newline=""), delimiter=delimiter))
+    headers, body = rows[0], rows[1:]
+    pos_idx = _column(headers, lambda h: h.startswith("pos"))
+    num_idx = _column(headers, lambda h: h in NUMERO_HEADERS)
+    nombre_idx = _column(headers, lambda h: h.startswith("nombre"))
+
+    out = [headers]
+    for copia in range(pilotos):
+        for row in body:
+            row = list(row)
+            if copia:
+                if pos_idx is not None and pos_idx < len(row) and row[pos_idx].strip().isdigit():
+                    row[pos_idx] = str(int(row[pos_idx]) + copia * len(body))
+                if num_idx is not None and num_idx < len(row) and row[num_idx].strip():
+                    numero = row[num_idx].strip()
+                    row[num_idx] = str(int(numero) + 1000 * copia) if numero.isdigit() else f"{numero}-{copia + 1}"
+                if nombre_idx is not None and nombre_idx < len(row) and row[nombre_idx].strip():
+                    row[nombre_idx] = f"{row[nombre_idx]} {copia + 1}"
+            out.append(row)
+
+    buf = io.StringIO()
+    quoting = csv.QUOTE_ALL if first_line.startswith('"') else csv.QUOTE_MINIMAL
+    lineterminator = "\r\n" if "\r\n" in text else "\n"
+    csv.writer(buf, delimiter=delimiter, quoting=quoting, lineterminator=lineterminator).writerows(out)
+    with open(destino, "w", encoding="utf-8-sig" if bom else "utf-8", newline="") as f:
+        f.write(buf.getvalue())
+    return len(out) - 1
+
+
+def nombre_copia(categoria, c):
+    """Nombre de la copia `c` (0 = la original) de una categoría en el evento sintético."""
+    return categoria if c == 0 else f"{categoria} B{c + 1}"
+
+
+def archivo_copia(nombre, c):
+    """Nombre del CSV `nombre` ("categoría - resto") en la copia `c` de su categoría."""
+    categoria, resto = nombre.split(" - ", 1)
+    return f"{nombre_copia(categoria, c)} - {resto}"
+
+
+def sintetizar(semilla, destino, categorias, sesiones, pilotos):
+    """
+    Evento sintético en `destino` a partir de la carpeta `semilla`.
+    Retorna {"categorias", "archivos", "filas"} del evento generado.
+    """
+    por_categoria = defaultdict(list)
+    for nombre in sorted(os.listdir(semilla)):
+        if not nombre.lower().endswith(".csv") or " - " not in nombre:
+            continue
+        categoria, resto = nombre.split(" - ", 1)
+        por_categoria[categoria].append(resto)
+
+    os.makedirs(destino, exist_ok=True)
+    archivos = filas = 0
+    for categoria, restos in por_categoria.items():
+        copias = [(resto, resto) for resto in restos]
+        copias += [(restos[0], f"MANGA {k + 1} - Resultados.csv") for k in range(sesiones)]
+        for c in range(categorias):
+            nombre_cat = nombre_copia(categoria, c)
+            for origen, resto in copias:
+                filas += escribir_escalado(
+                    os.path.join(semilla, f"{categoria} - {origen}"),
+                    os.path.join(destino, f"{nombre_cat} - {resto}"),
+                    pilotos,
+                )
+                archivos += 1
+    return {"categorias": len(por_categoria) * categorias, "archivos": archivos, "filas": filas}
+
+
+# --- Medición (proceso hijo) ------------------------------------------------------------
+
+def _peak_rss_kb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def _champ(evento, datos, salida):
+    cfg = EVENTOS[evento]
+    champ = {
+        "id": f"benchmark_{evento}",
+        "modalidad": cfg["modalidad"],
+        "campeonato": "Benchmark",
+        "validas": [{"label": f"Válida {i + 1}", "files_dir": d} for i, d in enumerate(datos)],
+        "output_html": salida,
+    }
+    for key in ("gp_colombia", "final_valida_bonus"):
+        if key in cfg:
+            champ[key] = cfg[key]
+    return champ
+
+
+def _orden_velocidad(mod, categorias):
+    """Argumentos de main() de Velocidad: ORDER (id, título, categoría normalizada) con cada copia como sección."""
+    orden = list(mod.ORDER)
+    for c in range(1, categorias):
+        orden += [(f"{cid}-b{c + 1}", nombre_copia(titulo, c), mod.normalize_text(nombre_copia(cat, c)))
+                  for cid, titulo, cat in mod.ORDER]
+    return {"order": orden}
+
+
+def _orden_enduro_por_archivo(mod, categorias):
+    """
+    Argumentos de main() de Enduro II/III: ORDER, CSV_FILES y PDFS con cada copia de las
+    categorías de un archivo (Scratch e Infantil Enduro 1 leen nombres fijos y quedan una sola vez).
+    """
+    orden, csv_files, pdfs = list(mod.ORDER), dict(mod.CSV_FILES), dict(mod.PDFS)
+    for c in range(1, categorias):
+        for cid, titulo in mod.ORDER:
+            if cid not in mod.CSV_FILES:
+                continue
+            copia = f"{cid}-b{c + 1}"
+            csv_files[copia] = archivo_copia(mod.CSV_FILES[cid], c)
+            if cid in mod.PDFS:
+                pdfs[copia] = mod.PDFS[cid]
+            orden.append((copia, nombre_copia(titulo, c)))
+    return {"order": orden, "csv_files": csv_files, "pdfs": pdfs}
+
+
+PAGINAS = {"velocidad": _orden_velocidad, "enduro_por_archivo": _orden_enduro_por_archivo}
+
+
+def medir(evento, etapa, datos, salida, categorias=1):
+    """
+    Ejecuta una etapa sobre `datos` (carpetas sintéticas) y retorna {segundos, rss_kb}. Las
+    rutas llegan por los argumentos de cada generador; ningún módulo se modifica.
+    """
+    sys.path.insert(0, RV)
+    cfg = EVENTOS[evento]
+
+    if etapa == "valida" and cfg.get("pagina"):
+        mod = _import_from(*cfg["modulo"])
+        kwargs = PAGINAS[cfg["pagina"]](mod, categorias)
+        run = lambda: mod.main(csv_dir=Path(datos[0]), out=Path(salida), **kwargs)
+    elif etapa == "valida":
+        mod = _import_from(*cfg["modulo"])
+        valida = {**mod.VALIDA, "files_dir": datos[0], "output_file": salida,
+                  "vuelta_dir": None, "vuelta_folder_url": None}
+        run = lambda: mod.generate_html(valida)
+    elif etapa == "general":
+        gen = _import_from(GENERALES_DIR, "generar_resultados_generales")
+        champ = _champ(evento, datos, salida)
+
+        def run():
+            table = gen.build_general_table(champ)
+            with open(salida, "w", encoding="utf-8") as f:
+                f.write(gen.render_html(champ, table))
+    else:
+        inf = _import_from(INFORMES_DIR, "generar_informes_validas")
+
+        def run():
+            if cfg.get("gp_colombia"):
+                datos_informe = inf.analyze_gp_colombia(datos[0])
+            else:
+                datos_informe = inf.analyze(datos[0])
+            html = inf.build_html(datos_informe, "Benchmark", "Benchmark", evento, "Informe sintético.", "../")
+            with open(salida, "w", encoding="utf-8") as f:
+                f.write(html)
+
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run()
+    return {"segundos": time.perf_counter() - t0, "rss_kb": _peak_rss_kb()}
+
+
+# --- Orquestación -----------------------------------------------------------------------
+
+def correr_medicion(evento, etapa, datos, salida, categorias):
+    cmd = [sys.executable, os.path.abspath(__file__), "--medir", evento, etapa, "--salida", salida,
+           "--categorias", str(categorias), "--datos", *datos]
+    # Las hojas y scripts publicados van a la carpeta temporal, junto a la salida.
+    env = dict(os.environ, FEDEMOTO_CSV_CACHE="0", FEDEMOTO_GENERALES_CACHE="0", PYTHONHASHSEED="0",
+               FEDEMOTO_ESTATICOS=os.path.join(os.path.dirname(salida), "estaticos"))
+    proc = subprocess.run(cmd, cwd=ROOT_DIR, env=env, capture_output=True, text=True, encoding="utf-8")
+    if proc.returncode != 0:
+        raise RuntimeError(f"{evento}/{etapa} falló:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _fmt_mb(kb):
+    return "n/d" if kb is None else f"{kb / 1024:.1f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark del pipeline de generación con eventos sintéticos.")
+    parser.add_argument("eventos", nargs="*", metavar="evento",
+                        help=f"Semillas a escalar ({', '.join(EVENTOS)}); por defecto todas.")
+    parser.add_argument("--etapa", choices=ETAPAS, action="append", help="Solo esta etapa (se puede repetir).")
+    parser.add_argument("--categorias", type=int, default=10, help="Copias de cada categoría (por defecto 10).")
+    parser.add_argument("--sesiones", type=int, default=0, help="Sesiones extra por categoría.")
+    parser.add_argument("--pilotos", type=int, default=1, help="Copias de las filas de cada archivo.")
+    parser.add_argument("--validas", type=int, default=4, help="Válidas del campeonato en la etapa general.")
+    parser.add_argument("--repeticiones", type=int, default=1, help="Mediciones por etapa (se informa la mejor).")
+    parser.add_argument("--json", help="Escribe los resultados en este archivo.")
+    parser.add_argument("--conservar", action="store_true", help="No borra la carpeta temporal al terminar.")
+    parser.add_argument("--medir", nargs=2, metavar=("EVENTO", "ETAPA"), help=argparse.SUPPRESS)
+    parser.add_argument("--datos", nargs="+", help=argparse.SUPPRESS)
+    parser.add_argument("--salida", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.medir:
+        print(json.dumps(medir(args.medir[0], args.medir[1], args.datos, args.salida, args.categorias)))
+        return 0
+
+    desconocidos = [e for e in args.eventos if e not in EVENTOS]
+    if desconocidos:
+        parser.error(f"evento desconocido: {', '.join(desconocidos)} (opciones: {', '.join(EVENTOS)})")
+
+    sys.path.insert(0, RV)
+    eventos = args.eventos or list(EVENTOS)
+    etapas = args.etapa or list(ETAPAS)
+    tmp = tempfile.mkdtemp(prefix="benchmark_fedemoto_")
+    resultados = []
+    try:
+        for evento in eventos:
+            semilla = EVENTOS[evento]["files_dir"]
+            n_validas = args.validas if "general" in etapas else 1
+            datos = []
+            for i in range(n_validas):
+                destino = os.path.join(tmp, evento, f"FILES EXPORTED {i + 1}")
+                dims = sintetizar(semilla, destino, args.categorias, args.sesiones, args.pilotos)
+                datos.append(destino)
+            print(f"{evento}: {dims['categorias']} categorías, {dims['archivos']} archivos, "
+                  f"{dims['filas']} filas por válida")
+            for etapa in etapas:
+                salida = os.path.join(tmp, evento, "salida", f"{etapa}.html")
+                os.makedirs(os.path.dirname(salida), exist_ok=True)
+                usa = datos if etapa == "general" else datos[:1]
+                medidas = [correr_medicion(evento, etapa, usa, salida, args.categorias) for _ in range(max(1, args.repeticiones))]
+                rss = [m["rss_kb"] for m in medidas if m["rss_kb"] is not None]
+                resultados.append({
+                    "evento": evento,
+                    "etapa": etapa,
+                    "validas": len(usa),
+                    **dims,
+                    "segundos": min(m["segundos"] for m in medidas),
+                    "rss_kb": max(rss) if rss else None,
+                    "salida_bytes": os.path.getsize(salida),
+                })
+    finally:
+        if args.conservar:
+            print(f"Datos y salidas en: {tmp}")
+        else:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    print()
+    print(f"{'evento':<8} {'etapa':<8} {'válidas':>7} {'tiempo (s)':>11} {'pico RSS (MB)':>14} {'salida (KB)':>12}")
+    for r in resultados:
+        print(f"{r['evento']:<8} {r['etapa']:<8} {r['validas']:>7} {r['segundos']:>11.3f} "
+              f"{_fmt_mb(r['rss_kb']):>14} {r['salida_bytes'] / 1024:>12.1f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "parametros": {k: getattr(args, k) for k in ("categorias", "sesiones", "pilotos", "validas", "repeticiones")},
+                "resultados": resultados,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"Resultados en {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
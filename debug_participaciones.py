@@ -1,18 +1,18 @@
 import pandas as pd
-import unicodedata
+import os
+import sys
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Resultados_validas")))
+import libro_excel
+import normalizacion
 
 def normalizar_liga(nombre):
     if pd.isna(nombre) or nombre == '':
         return None
-    nombre = str(nombre).strip()
-    nombre = unicodedata.normalize('NFD', nombre)
-    nombre = ''.join(c for c in nombre if unicodedata.category(c) != 'Mn')
-    nombre = nombre.upper()
-    return nombre
+    return normalizacion.sin_tildes(str(nombre).strip()).upper()
 
 excel_path = "Informes/Valida de ejemplo/valejempo.xlsx"
-excel_file = pd.ExcelFile(excel_path)
-df = pd.read_excel(excel_file, sheet_name='Hoja1')
+df = libro_excel.leer_hoja(excel_path, 'Hoja1')
 
 columnas_info = ['Consecutivo', 'Licencia', 'TX', 'Nombre', 'Apellido', 'Liga', 
                 'Club', 'FN', 'RH', 'MOTO', 'Documento', 'EPS', 'Pago Licencia', 
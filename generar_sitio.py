@@ -0,0 +1,415 @@
+# -*- coding: utf-8 -*-
+"""
+Regeneración incremental del sitio FEDEMOTO 2026.
+
+Los destinos (página de válida, informe por válida, resultado general) salen del registro
+de la temporada (temporada_2026.json, registro_temporada.py), sin importar los generadores.
+Cada uno declara sus entradas (carpetas FILES EXPORTED / vuelta a vuelta, scripts
+generadores, módulos compartidos y menu.html), su entrada en el registro y sus salidas. Solo
+se regeneran los destinos cuyas entradas cambiaron desde la última generación correcta o
+cuyas salidas no existen, incluidas las hojas y scripts de estaticos/ que enlaza cada página
+(si uno se borró o no se publicó, la página se regenera y lo vuelve a publicar). La firma de
+entradas de cada destino se guarda en .cache/build_state.json.
+
+Uso:
+    python generar_sitio.py               # regenera solo lo desactualizado
+    python generar_sitio.py --dry-run     # lista lo desactualizado y el motivo, sin generar
+    python generar_sitio.py --todo        # regenera todo
+    python generar_sitio.py tocancipa     # limita a destinos cuyo id contenga el texto
+    python generar_sitio.py --todo --grupo validas -j 8   # todas las válidas, 8 procesos
+
+Las páginas de válida son independientes entre sí: se generan en paralelo en un pool de
+procesos (`-j`, por defecto un proceso por núcleo), cada una en su propio proceso, con
+tiempo por trabajo y sin que el fallo de una detenga a las demás. Informes y resultados
+generales se generan después, en serie.
+
+Requiere Python 3.8 o posterior. El pool con un proceso nuevo por trabajo
+(`max_tasks_per_child`) es de Python 3.11; con versiones anteriores cada válida corre como
+`python script` en un subproceso lanzado desde un pool de hilos (mismo aislamiento, algo más
+de arranque por válida).
+"""
+
+import argparse
+import contextlib
+import hashlib
+import importlib
+import io
+import json
+import os
+import re
+import runpy
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+STATE_FILE = os.path.join(ROOT_DIR, ".cache", "build_state.json")
+
+RV = os.path.join(ROOT_DIR, "Resultados_validas")
+INFORMES_DIR = os.path.join(ROOT_DIR, "Informes")
+GENERALES_DIR = os.path.join(ROOT_DIR, "Resultados generales")
+
+MENU_HTML = os.path.join(ROOT_DIR, "menu.html")
+TABLAS_CSV = os.path.join(RV, "tablas_csv.py")
+ESCANEO_VALIDAS = os.path.join(RV, "escaneo_validas.py")
+NORMALIZACION = os.path.join(RV, "normalizacion.py")
+TABLA_PUNTOS = os.path.join(RV, "tabla_puntos.py")
+VUELTA_A_VUELTA = os.path.join(RV, "vuelta_a_vuelta.py")
+PAGINAS_HTML = os.path.join(RV, "paginas_html.py")
+# Motor y carpeta de plantillas (y hojas/scripts publicados en estaticos/): cualquier cambio
+# de layout, estilos o scripts regenera la página con el nuevo hash.
+PLANTILLAS = [
+    os.path.join(RV, "plantillas.py"),
+    os.path.join(RV, "recursos_estaticos.py"),
+    os.path.join(RV, "plantillas_html"),
+]
+ENDURO_CATEGORIAS = os.path.join(GENERALES_DIR, "enduro_categorias.py")
+ALMACEN_POSICIONES = os.path.join(GENERALES_DIR, "almacen_posiciones.py")
+IDENTIDAD_PILOTOS = os.path.join(GENERALES_DIR, "identidad_pilotos.py")
+GIRARDOTA = os.path.join(RV, "Motocross", "Primer semestre", "generar_valida_girardota.py")
+GP_VITRIX = os.path.join(RV, "GP Colombia", "generar_valida_i_gp_vitrix.py")
+REGISTRO_TEMPORADA = os.path.join(RV, "registro_temporada.py")
+INFORMES_SCRIPT = os.path.join(INFORMES_DIR, "generar_informes_validas.py")
+INFORME_TEMPORADA_SCRIPT = os.path.join(INFORMES_DIR, "generar_informe_temporada.py")
+GENERALES_SCRIPT = os.path.join(GENERALES_DIR, "generar_resultados_generales.py")
+
+
+def _import_from(folder, module_name):
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    return importlib.import_module(module_name)
+
+
+def _target_id(output_path):
+    return os.path.splitext(os.path.basename(output_path))[0]
+
+
+def _run_script(script):
+    def run():
+        subprocess.run([sys.executable, script], cwd=ROOT_DIR, check=True)
+    return run
+
+
+def _registro():
+    return _import_from(RV, "registro_temporada")
+
+
+def valida_targets():
+    targets = []
+    for v in _registro().validas():
+        data_dirs = [v["files_dir"]] + ([v["vuelta_dir"]] if v["vuelta_dir"] else [])
+        targets.append({
+            "id": v["id"],
+            "grupo": "validas",
+            "inputs": data_dirs
+            + [v["script"], *v["base_scripts"], ESCANEO_VALIDAS, NORMALIZACION, TABLAS_CSV, TABLA_PUNTOS, VUELTA_A_VUELTA, PAGINAS_HTML, REGISTRO_TEMPORADA, *PLANTILLAS, MENU_HTML],
+            "config": v,
+            "outputs": [v["output_html"]],
+            "script": v["script"],
+        })
+    return targets
+
+
+def render_script_job(target_id, script):
+    """
+    Trabajo del pool: ejecuta un generador como `python script` dentro del proceso hijo.
+    Retorna (id, ok, segundos, salida capturada, error) sin propagar excepciones.
+    """
+    t0 = time.perf_counter()
+    out = io.StringIO()
+    sys.path.insert(0, os.path.dirname(script))
+    try:
+        with contextlib.redirect_stdout(out):
+            runpy.run_path(script, run_name="__main__")
+    except BaseException:  # incluye SystemExit: el fallo queda aislado en este trabajo
+        return target_id, False, time.perf_counter() - t0, out.getvalue(), traceback.format_exc()
+    return target_id, True, time.perf_counter() - t0, out.getvalue(), ""
+
+
+def render_script_subprocess(target_id, script):
+    """`render_script_job` en un subproceso (pool de hilos, Python anterior a 3.11)."""
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, script], cwd=ROOT_DIR, capture_output=True, text=True, encoding="utf-8", errors="replace"
+    )
+    ok = proc.returncode == 0
+    error = "" if ok else (proc.stderr or f"código de salida {proc.returncode}")
+    return target_id, ok, time.perf_counter() - t0, proc.stdout, error
+
+
+def _pool(workers):
+    """Pool de las válidas y su trabajo: un proceso nuevo por válida (ver docstring del módulo)."""
+    if sys.version_info >= (3, 11):
+        return ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1), render_script_job
+    return ThreadPoolExecutor(max_workers=workers), render_script_subprocess
+
+
+def _generate_report(cfg):
+    _import_from(INFORMES_DIR, "generar_informes_validas").generate_report(cfg)
+
+
+def _generate_season_report(cfg):
+    _import_from(INFORMES_DIR, "generar_informe_temporada").generate(cfg)
+
+
+def informe_targets():
+    targets = []
+    for cfg in _registro().report_configs():
+        inputs = [cfg["files_dir"], INFORMES_SCRIPT, ENDURO_CATEGORIAS, ESCANEO_VALIDAS, NORMALIZACION, TABLAS_CSV, TABLA_PUNTOS, REGISTRO_TEMPORADA, *PLANTILLAS, MENU_HTML]
+        if cfg.get("gp_colombia"):
+            inputs += [GP_VITRIX, GIRARDOTA]
+        targets.append({
+            "id": _target_id(cfg["output_html"]),
+            "grupo": "informes",
+            "inputs": inputs,
+            "config": cfg,
+            "outputs": [cfg["output_html"]],
+            "run": (lambda c=cfg: _generate_report(c)),
+        })
+
+    # Informe de la temporada: combina los bocetos por válida (.cache/informes/); solo se
+    # releen las carpetas que cambiaron.
+    temporada = _registro().informe_temporada()
+    if temporada:
+        lecturas = _registro().lecturas_informe()
+        inputs = [cfg["files_dir"] for cfg in lecturas]
+        inputs += [INFORME_TEMPORADA_SCRIPT, INFORMES_SCRIPT, ENDURO_CATEGORIAS, ESCANEO_VALIDAS, NORMALIZACION,
+                   TABLAS_CSV, REGISTRO_TEMPORADA, GP_VITRIX, GIRARDOTA, *PLANTILLAS, MENU_HTML]
+        targets.append({
+            "id": _target_id(temporada["output_html"]),
+            "grupo": "informes",
+            "inputs": inputs,
+            "config": {"informe": temporada, "validas": lecturas},
+            "outputs": [temporada["output_html"]],
+            "run": (lambda c=temporada: _generate_season_report(c)),
+        })
+
+    mx_dir = os.path.join(INFORMES_DIR, "Motocross", "Primer semestre")
+    json_path = os.path.join(mx_dir, "datos_informe_valida.json")
+    targets.append({
+        "id": "datos_informe_valida_girardota",
+        "grupo": "informes",
+        "inputs": [os.path.join(RV, "Motocross", "Primer semestre", "FILES EXPORTED-girardota"),
+                   os.path.join(mx_dir, "analizar_valida_csv.py"), NORMALIZACION],
+        "outputs": [json_path],
+        "run": _run_script(os.path.join(mx_dir, "analizar_valida_csv.py")),
+    })
+    targets.append({
+        "id": "informe_valida_girardota",
+        "grupo": "informes",
+        "inputs": [json_path, os.path.join(mx_dir, "generar_informe_html.py"), *PLANTILLAS, MENU_HTML],
+        "outputs": [os.path.join(mx_dir, "informe_valida_girardota.html")],
+        "run": _run_script(os.path.join(mx_dir, "generar_informe_html.py")),
+    })
+    return targets
+
+
+def _generales():
+    return _import_from(GENERALES_DIR, "generar_resultados_generales")
+
+
+def general_targets():
+    targets = []
+    for champ in _registro().championships():
+        inputs = [v["files_dir"] for v in champ["validas"]]
+        inputs += [GENERALES_SCRIPT, ALMACEN_POSICIONES, IDENTIDAD_PILOTOS, ENDURO_CATEGORIAS, ESCANEO_VALIDAS, NORMALIZACION, TABLAS_CSV, TABLA_PUNTOS, REGISTRO_TEMPORADA, *PLANTILLAS, MENU_HTML]
+        if champ.get("gp_colombia"):
+            inputs += [GP_VITRIX, GIRARDOTA]
+        base = os.path.splitext(champ["output_html"])[0]
+        targets.append({
+            "id": _target_id(champ["output_html"]),
+            "grupo": "generales",
+            "inputs": inputs,
+            "config": champ,
+            # Página, detalle del medallero y filas por categoría (generales.medallero_path / categorias_dir).
+            "outputs": [champ["output_html"], base + ".medallero.json", base + ".categorias"],
+            "run": (lambda c=champ: _generales().generate_championship(c)),
+        })
+    return targets
+
+
+def all_targets():
+    return valida_targets() + informe_targets() + general_targets()
+
+
+def _iter_files(path):
+    if os.path.isfile(path):
+        yield path
+        return
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        for name in sorted(filenames):
+            yield os.path.join(dirpath, name)
+
+
+def _relativo(valor):
+    """Config con las rutas absolutas del repositorio como relativas (firma independiente de la copia)."""
+    if isinstance(valor, dict):
+        return {k: _relativo(v) for k, v in valor.items()}
+    if isinstance(valor, list):
+        return [_relativo(v) for v in valor]
+    if isinstance(valor, str) and os.path.isabs(valor) and valor.startswith(ROOT_DIR):
+        return os.path.relpath(valor, ROOT_DIR).replace("\\", "/")
+    return valor
+
+
+def inputs_signature(inputs, config=None):
+    """
+    Firma de las entradas: ruta relativa, tamaño y mtime de cada archivo, más la entrada del
+    destino en el registro de la temporada (`config`), así editar una válida o un campeonato
+    en temporada_2026.json solo regenera lo que la usa.
+    """
+    h = hashlib.sha1()
+    h.update(json.dumps(_relativo(config), ensure_ascii=False, sort_keys=True).encode("utf-8"))
+    for path in inputs:
+        if not os.path.exists(path):
+            h.update(f"missing:{os.path.relpath(path, ROOT_DIR)}\n".encode("utf-8"))
+            continue
+        for f in _iter_files(path):
+            st = os.stat(f)
+            rel = os.path.relpath(f, ROOT_DIR).replace("\\", "/")
+            h.update(f"{rel}|{st.st_size}|{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_state():
+    try:
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state):
+    os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+    tmp = STATE_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp, STATE_FILE)
+
+
+_RE_RECURSO = re.compile(r'(?:href|src)="([^"#?]*estaticos/[^"#?]+)"')
+
+
+def recursos_publicados(output):
+    """
+    Hojas y scripts de estaticos/ que enlaza una página generada (rutas absolutas). Sus
+    nombres llevan el hash del contenido, así que se leen de la página y no de la plantilla.
+    """
+    if not output.endswith(".html"):
+        return []
+    try:
+        with open(output, "r", encoding="utf-8") as f:
+            html = f.read()
+    except (OSError, ValueError):
+        return []
+    base = os.path.dirname(output)
+    return sorted({os.path.normpath(os.path.join(base, *ref.split("/"))) for ref in _RE_RECURSO.findall(html)})
+
+
+def stale_reason(target, state, signature):
+    missing = [p for p in target["outputs"] if not os.path.exists(p)]
+    if missing:
+        return "salida inexistente: " + os.path.relpath(missing[0], ROOT_DIR)
+    for output in target["outputs"]:
+        missing = [p for p in recursos_publicados(output) if not os.path.exists(p)]
+        if missing:
+            return "recurso publicado inexistente: " + os.path.relpath(missing[0], ROOT_DIR).replace("\\", "/")
+    previous = state.get(target["id"])
+    if previous is None:
+        return "sin generación registrada"
+    if previous != signature:
+        return "entradas modificadas"
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regeneración incremental del sitio FEDEMOTO 2026.")
+    parser.add_argument("filtros", nargs="*", help="Solo destinos cuyo id contenga alguno de estos textos.")
+    parser.add_argument("--dry-run", action="store_true", help="Lista los destinos desactualizados sin generar.")
+    parser.add_argument("--todo", action="store_true", help="Regenera todos los destinos.")
+    parser.add_argument("--grupo", choices=("validas", "informes", "generales"), action="append",
+                        help="Solo destinos de este grupo (se puede repetir).")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Procesos para generar páginas de válida en paralelo (por defecto: núcleos).")
+    args = parser.parse_args(argv)
+
+    targets = all_targets()
+    if args.grupo:
+        targets = [t for t in targets if t["grupo"] in args.grupo]
+    if args.filtros:
+        targets = [t for t in targets if any(f.lower() in t["id"].lower() for f in args.filtros)]
+
+    state = load_state()
+    pending = []
+    pending_outputs = {}
+    for target in targets:
+        signature = inputs_signature(target["inputs"], target.get("config"))
+        reason = "forzado (--todo)" if args.todo else stale_reason(target, state, signature)
+        if not reason:
+            upstream = next((pending_outputs[p] for p in target["inputs"] if p in pending_outputs), None)
+            if upstream:
+                reason = f"depende de {upstream}"
+        if reason:
+            pending.append((target, signature, reason))
+            for p in target["outputs"]:
+                pending_outputs[p] = target["id"]
+
+    if not pending:
+        print("Todo al día: no hay destinos para regenerar.")
+        return 0
+
+    print(f"Destinos desactualizados: {len(pending)} de {len(targets)}")
+    for target, _sig, reason in pending:
+        print(f"  [{target['grupo']}] {target['id']}: {reason}")
+    if args.dry_run:
+        return 0
+
+    failed = []
+    # Las válidas declaran `script` y van al pool; el resto declara `run` y corre en serie.
+    pooled = [target for target, _sig, _reason in pending if target.get("script")]
+    if pooled:
+        by_id = {t["id"]: t for t in pooled}
+        t_pool = time.perf_counter()
+        workers = max(1, min(args.jobs, len(pooled)))
+        pool, job = _pool(workers)
+        with pool:
+            futures = [pool.submit(job, t["id"], t["script"]) for t in pooled]
+            for fut in as_completed(futures):
+                target_id, ok, seconds, output, error = fut.result()
+                if output:
+                    print(output, end="")
+                if not ok:
+                    failed.append(target_id)
+                    print(f"[ERROR] {target_id} ({seconds:.2f} s)\n{error}")
+                    continue
+                state[target_id] = inputs_signature(by_id[target_id]["inputs"], by_id[target_id].get("config"))
+                save_state(state)
+                print(f"[OK] {target_id} ({seconds:.2f} s)")
+        print(f"Válidas: {len(pooled)} en {time.perf_counter() - t_pool:.2f} s con {workers} procesos")
+
+    for target, _sig, _reason in pending:
+        if target.get("script"):
+            continue
+        t0 = time.perf_counter()
+        try:
+            target["run"]()
+        except Exception as e:  # un destino fallido no detiene el resto
+            failed.append(target["id"])
+            print(f"[ERROR] {target['id']}: {e}")
+            continue
+        # Firma tomada después de generar: cubre destinos cuyas entradas son salidas de otro.
+        state[target["id"]] = inputs_signature(target["inputs"], target.get("config"))
+        save_state(state)
+        print(f"[OK] {target['id']} ({time.perf_counter() - t0:.2f} s)")
+
+    if failed:
+        print(f"[ERROR] Fallaron {len(failed)} destinos: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
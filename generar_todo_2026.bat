@@ -29,6 +29,7 @@ python "Resultados_validas\Enduro\Primera valida\generar_valida_enduro_2026.py"
 
 echo [2/4] Generando informes por valida...
 python "Informes\generar_informes_validas.py" || goto :error
+python "Informes\generar_informe_temporada.py" || goto :error
 python "Informes\Motocross\Primer semestre\analizar_valida_csv.py" || goto :error
 python "Informes\Motocross\Primer semestre\generar_informe_html.py" || goto :error
 
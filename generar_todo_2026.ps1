@@ -30,6 +30,7 @@ try {
     Invoke-Step "" @("Resultados_validas\Enduro\Primera valida\generar_valida_enduro_2026.py")
 
     Invoke-Step "[2/4] Generando informes por válida..." @("Informes\generar_informes_validas.py")
+    Invoke-Step "" @("Informes\generar_informe_temporada.py")
     Invoke-Step "" @("Informes\Motocross\Primer semestre\analizar_valida_csv.py")
     Invoke-Step "" @("Informes\Motocross\Primer semestre\generar_informe_html.py")
 
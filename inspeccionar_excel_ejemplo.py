@@ -1,16 +1,17 @@
-import pandas as pd
+import os
 import sys
 
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Resultados_validas")))
+import libro_excel
+
 excel_path = "Informes/Valida de ejemplo/valejempo.xlsx"
 
 print("Analizando estructura del Excel...")
-excel_file = pd.ExcelFile(excel_path)
-
-for sheet_name in excel_file.sheet_names:
+for sheet_name in libro_excel.hojas(excel_path):
     print(f"\n{'='*80}")
     print(f"Hoja: {sheet_name}")
     print(f"{'='*80}")
-    df = pd.read_excel(excel_file, sheet_name=sheet_name)
+    df = libro_excel.leer_hoja(excel_path, sheet_name)
     
     print(f"\nDimensiones: {df.shape[0]} filas x {df.shape[1]} columnas")
     print(f"\nNombres de columnas:")
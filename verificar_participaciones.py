@@ -1,10 +1,14 @@
 import pandas as pd
+import os
+import sys
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Resultados_validas")))
+import libro_excel
 
 excel_path = "Informes/Valida de ejemplo/valejempo.xlsx"
 print("Analizando Excel para verificar participaciones...")
 
-excel_file = pd.ExcelFile(excel_path)
-df = pd.read_excel(excel_file, sheet_name='Hoja1')
+df = libro_excel.leer_hoja(excel_path, 'Hoja1')
 
 print(f"\nTotal de filas: {len(df)}")
 